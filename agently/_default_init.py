@@ -14,7 +14,7 @@
 
 from pathlib import Path
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from agently.core import PluginManager, EventCenter
@@ -22,72 +22,75 @@ if TYPE_CHECKING:
 
 
 def _load_default_plugins(plugin_manager: "PluginManager"):
-    from agently.builtins.plugins.ActionFlow import DAGActionFlow, TriggerFlowActionFlow
-    from agently.builtins.plugins.ActionRuntime import AgentlyActionRuntime
-    from agently.builtins.plugins.ActionExecutor import (
-        BashSandboxActionExecutor,
-        BrowseActionExecutor,
-        CodeExecutionActionExecutor,
-        DockerActionExecutor,
-        LocalFunctionActionExecutor,
-        MCPActionExecutor,
-        SQLiteActionExecutor,
-        SearchActionExecutor,
-    )
-    from agently.builtins.plugins.ExecutionResourceProvider import (
-        ACPExecutionResourceProvider,
-        BashExecutionResourceProvider,
-        BrowserExecutionResourceProvider,
-        DockerExecutionResourceProvider,
-        GVisorDockerExecutionResourceProvider,
-        LandlockExecutionResourceProvider,
-        SeatbeltExecutionResourceProvider,
-        MCPExecutionResourceProvider,
-        SQLiteExecutionResourceProvider,
-        TrustedLocalExecutionResourceProvider,
-    )
-
-    plugin_manager.register("ActionRuntime", AgentlyActionRuntime)
-    plugin_manager.register("ActionFlow", TriggerFlowActionFlow)
-    plugin_manager.register("ActionFlow", DAGActionFlow, activate=False)
-    plugin_manager.register("ActionExecutor", LocalFunctionActionExecutor, activate=False)
-    plugin_manager.register("ActionExecutor", MCPActionExecutor, activate=False)
-    plugin_manager.register("ActionExecutor", BashSandboxActionExecutor, activate=False)
-    plugin_manager.register("ActionExecutor", SearchActionExecutor, activate=False)
-    plugin_manager.register("ActionExecutor", BrowseActionExecutor, activate=False)
-    plugin_manager.register("ActionExecutor", CodeExecutionActionExecutor, activate=False)
-    plugin_manager.register("ActionExecutor", DockerActionExecutor, activate=False)
-    plugin_manager.register("ActionExecutor", SQLiteActionExecutor, activate=False)
-    plugin_manager.register("ExecutionResourceProvider", ACPExecutionResourceProvider, activate=False)
-    plugin_manager.register("ExecutionResourceProvider", MCPExecutionResourceProvider, activate=False)
-    plugin_manager.register("ExecutionResourceProvider", BashExecutionResourceProvider, activate=False)
-    plugin_manager.register("ExecutionResourceProvider", DockerExecutionResourceProvider, activate=False)
-    plugin_manager.register("ExecutionResourceProvider", GVisorDockerExecutionResourceProvider, activate=False)
-    plugin_manager.register("ExecutionResourceProvider", LandlockExecutionResourceProvider, activate=False)
-    plugin_manager.register("ExecutionResourceProvider", SeatbeltExecutionResourceProvider, activate=False)
-    plugin_manager.register("ExecutionResourceProvider", BrowserExecutionResourceProvider, activate=False)
-    plugin_manager.register("ExecutionResourceProvider", SQLiteExecutionResourceProvider, activate=False)
-    plugin_manager.register("ExecutionResourceProvider", TrustedLocalExecutionResourceProvider, activate=False)
-
-    from agently.builtins.plugins.SkillSourceProvider import (
-        GitSkillSourceProvider,
-        LocalPathSkillSourceProvider,
-    )
-
-    plugin_manager.register("SkillSourceProvider", LocalPathSkillSourceProvider, activate=False)
-    plugin_manager.register("SkillSourceProvider", GitSkillSourceProvider, activate=False)
-
-    from agently.builtins.plugins.CodeRuntimeAdapter import (
-        CppCodeRuntimeAdapter,
-        GoCodeRuntimeAdapter,
-        NodeCodeRuntimeAdapter,
-        PythonCodeRuntimeAdapter,
-    )
-
-    plugin_manager.register("CodeRuntimeAdapter", PythonCodeRuntimeAdapter, activate=False)
-    plugin_manager.register("CodeRuntimeAdapter", NodeCodeRuntimeAdapter, activate=False)
-    plugin_manager.register("CodeRuntimeAdapter", GoCodeRuntimeAdapter, activate=False)
-    plugin_manager.register("CodeRuntimeAdapter", CppCodeRuntimeAdapter, activate=False)
+    from agently.types.options import ExecutionOptions
+    from agently.types.plugins import LazyPlugin
+
+    plugins_package = "agently.builtins.plugins"
+
+    def lazy(family: str, module_name: str, class_name: str | None = None, **metadata):
+        class_name = class_name or module_name
+        return LazyPlugin(f"{ plugins_package }.{ family }.{ module_name }:{ class_name }", **metadata)
+
+    # These plugins are registered as import references, so their modules load
+    # on the first `get_plugin()`. Their defaults and schemas are declared here
+    # because registration applies them before the class is imported.
+    plugin_manager.register("ActionRuntime", lazy("ActionRuntime", "AgentlyActionRuntime"))
+    plugin_manager.register("ActionFlow", lazy("ActionFlow", "TriggerFlowActionFlow"))
+    plugin_manager.register("ActionFlow", lazy("ActionFlow", "DAGActionFlow"), activate=False)
+    executor_metadata: dict[str, dict[str, Any]] = {
+        "MCPActionExecutor": {
+            "default_settings": {
+                "session_pool": {
+                    "enabled": True,
+                    "max_concurrency": 8,
+                    "idle_timeout": 300.0,
+                    "health_check_interval": 30.0,
+                    "health_check_timeout": 5.0,
+                },
+            },
+        },
+    }
+    for executor_name in (
+        "LocalFunctionActionExecutor",
+        "MCPActionExecutor",
+        "BashSandboxActionExecutor",
+        "SearchActionExecutor",
+        "BrowseActionExecutor",
+        "CodeExecutionActionExecutor",
+        "DockerActionExecutor",
+        "SQLiteActionExecutor",
+    ):
+        plugin_manager.register(
+            "ActionExecutor",
+            lazy("ActionExecutor", executor_name, **executor_metadata.get(executor_name, {})),
+            activate=False,
+        )
+    for provider_name in (
+        "ACPExecutionResourceProvider",
+        "MCPExecutionResourceProvider",
+        "BashExecutionResourceProvider",
+        "DockerExecutionResourceProvider",
+        "GVisorDockerExecutionResourceProvider",
+        "LandlockExecutionResourceProvider",
+        "SeatbeltExecutionResourceProvider",
+        "BrowserExecutionResourceProvider",
+        "SQLiteExecutionResourceProvider",
+        "TrustedLocalExecutionResourceProvider",
+    ):
+        plugin_manager.register(
+            "ExecutionResourceProvider",
+            lazy("ExecutionResourceProvider", provider_name),
+            activate=False,
+        )
+    for source_name in ("LocalPathSkillSourceProvider", "GitSkillSourceProvider"):
+        plugin_manager.register("SkillSourceProvider", lazy("SkillSourceProvider", source_name), activate=False)
+    for adapter_name in (
+        "PythonCodeRuntimeAdapter",
+        "NodeCodeRuntimeAdapter",
+        "GoCodeRuntimeAdapter",
+        "CppCodeRuntimeAdapter",
+    ):
+        plugin_manager.register("CodeRuntimeAdapter", lazy("CodeRuntimeAdapter", adapter_name), activate=False)
 
     from agently.builtins.plugins.PromptGenerator.AgentlyPromptGenerator import (
         AgentlyPromptGenerator,
@@ -101,13 +104,15 @@ def _load_default_plugins(plugin_manager: "PluginManager"):
 
     plugin_manager.register("TaskDAGPlanner", AgentlyTaskDAGPlanner)
 
-    from agently.builtins.plugins.Blocks import AgentlyBlocks
-
-    plugin_manager.register("Blocks", AgentlyBlocks)
-
-    from agently.builtins.plugins.AgentOrchestrator import AgentlyAgentOrchestrator
-
-    plugin_manager.register("AgentOrchestrator", AgentlyAgentOrchestrator)
+    plugin_manager.register("Blocks", lazy("Blocks", "AgentlyBlocks"))
+    plugin_manager.register(
+        "AgentOrchestrator",
+        lazy(
+            "AgentOrchestrator",
+            "AgentlyAgentOrchestrator",
+            options_schemas={"execution": ExecutionOptions},
+        ),
+    )
 
     from agently.builtins.plugins.ModelRequester.OpenAICompatible import (
         OpenAICompatible,
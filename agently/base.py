@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
 import logging
 from collections.abc import Mapping
 from pathlib import Path
@@ -20,7 +21,11 @@ from typing import Any, Literal, Type, TYPE_CHECKING, TypeVar, Generic, cast
 from agently.builtins.hookers.RuntimeConsoleSinkHooker import coerce_runtime_log_profile
 from agently._version import __version__ as package_version
 from agently.utils import DeprecationWarnings, LazyImport, Settings, create_logger
+from agently.utils.HTTPClientPool import HTTPClientPool
+from agently.utils.MCPSessionPool import MCPSessionPool
+from agently.utils.RequestHedger import RequestHedger
 from agently.utils.RequestScheduler import RequestScheduler
+from agently.utils.ResponseCache import ResponseCache
 from agently.core import (
     Action,
     DynamicTask,
@@ -90,6 +95,17 @@ execution_exchange: ExecutionExchangeManager = ExecutionExchangeManager(
     event_center=event_center,
 )
 request_scheduler: RequestScheduler = RequestScheduler()
+# Opt-in exact-match model response cache, see model_request.cache settings.
+response_cache: ResponseCache = ResponseCache()
+atexit.register(response_cache.close)
+# Opt-in hedging of slow model requests, see model_request.hedge settings.
+request_hedger: RequestHedger = RequestHedger()
+# Shared keep-alive HTTP clients for the builtin ModelRequester transports.
+http_client_pool: HTTPClientPool = HTTPClientPool()
+atexit.register(http_client_pool.close)
+# Shared initialized MCP sessions for MCPActionExecutor.
+mcp_session_pool: MCPSessionPool = MCPSessionPool()
+atexit.register(mcp_session_pool.close)
 action_registry: Any = action.action_registry
 _load_default_actions(action_registry)
 action_dispatcher: Any = action.action_dispatcher
@@ -282,6 +298,8 @@ class AgentlyMain(Generic[A]):
         self.skills_executor = skills_executor
         self.skill_library = skill_library
         self.blocks = blocks
+        self.http_client_pool = http_client_pool
+        self.mcp_session_pool = mcp_session_pool
         self.AgentType = AgentType
 
         def refresh_httpx_log_level() -> None:
@@ -9,7 +9,6 @@ from dataclasses import dataclass
 from pathlib import PurePosixPath
 from typing import Any
 
-from agently.builtins.plugins.ActionExecutor import CodeExecutionActionExecutor
 from agently.core.application.SkillLibrary import SkillBinding, SkillLibrary
 from agently.types.data import (
     SkillScriptAuthorization,
@@ -70,6 +69,8 @@ class SkillActionBinder:
         resource_path: str,
         authorization: SkillScriptAuthorization,
     ) -> BoundSkillAction:
+        from agently.builtins.plugins.ActionExecutor import CodeExecutionActionExecutor
+
         if str(getattr(execution, "id", "")) != skill_binding.task_id:
             raise PermissionError("Skill binding belongs to another task execution.")
         if not isinstance(authorization, SkillScriptAuthorization) or not authorization.auto_allow:
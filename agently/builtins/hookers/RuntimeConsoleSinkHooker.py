@@ -193,6 +193,27 @@ def is_simple_runtime_event(event: "ObservationEvent") -> bool:
     return event_type in _SIMPLE_EVENT_TYPES[family]
 
 
+def console_may_render(event_type: str, level: str, settings: Settings) -> bool:
+    """Whether ``should_render_console_event`` can be true for this type and level.
+
+    Payload-dependent checks (compat aliases, agent execution stream kinds) are
+    assumed to pass, so a ``False`` here means the console sink ignores every
+    such event.
+    """
+    family = resolve_runtime_event_family(event_type)
+    if family not in _CONSOLE_EVENT_FAMILIES:
+        return False
+    profile = resolve_runtime_log_profile(settings, event_type)
+    if profile == "off":
+        return False
+    if profile == "detail" or level in _ALWAYS_VISIBLE_LEVELS:
+        return True
+    simple_event_type: str | None = event_type
+    if family == "triggerflow":
+        simple_event_type = normalize_triggerflow_event_type(event_type)
+    return simple_event_type is not None and simple_event_type in _SIMPLE_EVENT_TYPES[family]
+
+
 def should_render_console_event(event: "ObservationEvent", settings: Settings) -> bool:
     if (
         _is_compat_alias_event(event)
@@ -212,21 +233,20 @@ def should_render_console_event(event: "ObservationEvent", settings: Settings) -
     return is_simple_runtime_event(event)
 
 
-def should_render_storage_event(event: "ObservationEvent", settings: Settings) -> bool:
-    if _is_compat_alias_event(event):
-        return False
-    if event.event_type in _RUNTIME_PRINT_EVENTS:
-        return resolve_runtime_log_profile(settings, event.event_type) == "off"
+def storage_may_render(event_type: str, level: str, settings: Settings) -> bool:
+    """Whether ``should_render_storage_event`` can be true for this type and level."""
+    if event_type in _RUNTIME_PRINT_EVENTS:
+        return resolve_runtime_log_profile(settings, event_type) == "off"
 
-    family = resolve_runtime_event_family(event.event_type)
-    profile = resolve_runtime_log_profile(settings, event.event_type)
+    family = resolve_runtime_event_family(event_type)
+    profile = resolve_runtime_log_profile(settings, event_type)
 
     if family in _CONSOLE_EVENT_FAMILIES:
         if profile == "off":
-            return event.level in _ALWAYS_VISIBLE_LEVELS
+            return level in _ALWAYS_VISIBLE_LEVELS
         return False
 
-    if event.level in _ALWAYS_VISIBLE_LEVELS:
+    if level in _ALWAYS_VISIBLE_LEVELS:
         return True
 
     if profile == "detail":
@@ -235,6 +255,12 @@ def should_render_storage_event(event: "ObservationEvent", settings: Settings) -
     return False
 
 
+def should_render_storage_event(event: "ObservationEvent", settings: Settings) -> bool:
+    if _is_compat_alias_event(event):
+        return False
+    return storage_may_render(event.event_type, event.level, settings)
+
+
 COLORS = {
     "black": 30,
     "red": 31,
@@ -772,6 +798,14 @@ class RuntimeConsoleSinkHooker(EventHooker):
             color = "green"
         _render_line(prefix, detail, color=color)
 
+    @staticmethod
+    def observes(event_type: str, level: str) -> bool:
+        from agently.base import settings
+        from agently.core.runtime.RuntimeContext import get_current_settings
+
+        current_settings = get_current_settings()
+        return console_may_render(event_type, level, current_settings if current_settings is not None else settings)
+
     @staticmethod
     async def handler(event: "ObservationEvent"):
         from agently.base import settings
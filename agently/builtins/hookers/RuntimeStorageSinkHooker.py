@@ -15,7 +15,7 @@
 import json
 from typing import TYPE_CHECKING, Any
 
-from agently.builtins.hookers.RuntimeConsoleSinkHooker import should_render_storage_event
+from agently.builtins.hookers.RuntimeConsoleSinkHooker import should_render_storage_event, storage_may_render
 from agently.types.plugins import EventHooker
 from agently.utils import DataFormatter
 
@@ -52,6 +52,12 @@ class RuntimeStorageSinkHooker(EventHooker):
     def _on_unregister():
         pass
 
+    @staticmethod
+    def observes(event_type: str, level: str) -> bool:
+        from agently.base import settings
+
+        return storage_may_render(event_type, level, settings)
+
     @staticmethod
     async def handler(event: "ObservationEvent"):
         from agently.base import logger, settings
@@ -16,11 +16,20 @@ import json
 from typing import Any
 
 from agently.utils import LazyImport
+from agently.utils.MCPSessionPool import MCPSessionPoolConfig
 
 
 class MCPActionExecutor:
     name = "MCPActionExecutor"
-    DEFAULT_SETTINGS = {}
+    DEFAULT_SETTINGS = {
+        "session_pool": {
+            "enabled": True,
+            "max_concurrency": 8,
+            "idle_timeout": 300.0,
+            "health_check_interval": 30.0,
+            "health_check_timeout": 5.0,
+        },
+    }
 
     kind = "mcp"
     sandboxed = False
@@ -111,8 +120,19 @@ class MCPActionExecutor:
                 result["artifacts"] = [*artifacts, *data["artifacts"]]
         return result
 
+    @classmethod
+    def _get_session_pool_config(cls, settings: Any) -> MCPSessionPoolConfig:
+        getter = getattr(settings, "get", None)
+        if not callable(getter):
+            return MCPSessionPoolConfig()
+        try:
+            value = getter(f"plugins.ActionExecutor.{ cls.name }.session_pool", None)
+        except Exception:
+            return MCPSessionPoolConfig()
+        return MCPSessionPoolConfig.from_settings(value)
+
     async def execute(self, *, spec, action_call, policy, settings) -> Any:
-        _ = (spec, policy, settings)
+        _ = (spec, policy)
         LazyImport.import_package("fastmcp", version_constraint=">=3", auto_install=False)
         LazyImport.import_package("mcp", auto_install=False)
         from fastmcp import Client
@@ -126,37 +146,43 @@ class MCPActionExecutor:
         if isinstance(environment_resources, dict) and self.action_id in environment_resources:
             transport = environment_resources[self.action_id]
 
-        async with Client(transport) as client:  # type: ignore[arg-type]
-            mcp_result = await client.call_tool(
+        from agently.base import mcp_session_pool
+
+        mcp_result = await mcp_session_pool.call(
+            transport,
+            Client,
+            lambda client: client.call_tool(
                 name=self.action_id,
                 arguments=action_input,
                 raise_on_error=False,
+            ),
+            self._get_session_pool_config(settings),
+        )
+        if mcp_result.is_error:
+            return {"error": mcp_result.content[0].text}  # type: ignore[index]
+        artifacts = [
+            artifact
+            for artifact in (
+                self._artifact_from_content_block(block)
+                for block in list(mcp_result.content or [])
             )
-            if mcp_result.is_error:
-                return {"error": mcp_result.content[0].text}  # type: ignore[index]
-            artifacts = [
-                artifact
-                for artifact in (
-                    self._artifact_from_content_block(block)
-                    for block in list(mcp_result.content or [])
-                )
-                if artifact is not None
-            ]
-            if mcp_result.structured_content:
-                return self._result_with_artifacts(mcp_result.structured_content, artifacts)
-            try:
-                content = list(mcp_result.content or [])
-                if not content:
-                    return self._result_with_artifacts(None, artifacts)
-                result = content[0]
-                if isinstance(result, TextContent):
-                    try:
-                        parsed = json.loads(result.text)
-                        return self._result_with_artifacts(parsed, artifacts)
-                    except json.JSONDecodeError:
-                        return self._result_with_artifacts(result.text, artifacts)
-                if isinstance(result, (ImageContent, AudioContent, ResourceLink, EmbeddedResource)):
-                    data = result.model_dump()
-                    return self._result_with_artifacts(data, artifacts)
-            except Exception:
-                return None
+            if artifact is not None
+        ]
+        if mcp_result.structured_content:
+            return self._result_with_artifacts(mcp_result.structured_content, artifacts)
+        try:
+            content = list(mcp_result.content or [])
+            if not content:
+                return self._result_with_artifacts(None, artifacts)
+            result = content[0]
+            if isinstance(result, TextContent):
+                try:
+                    parsed = json.loads(result.text)
+                    return self._result_with_artifacts(parsed, artifacts)
+                except json.JSONDecodeError:
+                    return self._result_with_artifacts(result.text, artifacts)
+            if isinstance(result, (ImageContent, AudioContent, ResourceLink, EmbeddedResource)):
+                data = result.model_dump()
+                return self._result_with_artifacts(data, artifacts)
+        except Exception:
+            return None
@@ -48,9 +48,15 @@ class MCPExecutionResourceProvider(BuiltinExecutionResourceProvider):
     ) -> "ExecutionResourceHandle":
         _ = (policy, existing_handle)
         config = requirement.get("config", {})
+        transport = config.get("transport")
+        if transport is not None:
+            from agently.base import mcp_session_pool
+
+            # Executions with equal transports share one pooled session.
+            mcp_session_pool.hold(transport)
         return {
             "handle_id": f"mcp:{ uuid.uuid4().hex }",
-            "resource": config.get("transport"),
+            "resource": transport,
             "status": "ready",
             "meta": {"provider": self.name},
         }
@@ -59,5 +65,9 @@ class MCPExecutionResourceProvider(BuiltinExecutionResourceProvider):
         return "ready" if handle.get("resource") is not None else "unhealthy"
 
     async def async_release(self, handle: "ExecutionResourceHandle") -> None:
-        _ = handle
-        return None
+        transport = handle.get("resource")
+        if transport is None:
+            return None
+        from agently.base import mcp_session_pool
+
+        await mcp_session_pool.release(transport)
@@ -24,6 +24,8 @@ from agently.utils import DataFormatter
 if TYPE_CHECKING:
     from httpx import Timeout
 
+    from agently.utils.HTTPClientPool import HTTPClientPoolConfig
+
 
 class AnthropicCompatibleRequestBuilderMixin:
     name: str
@@ -33,6 +35,8 @@ class AnthropicCompatibleRequestBuilderMixin:
     if TYPE_CHECKING:
         def _get_http_timeout(self, *, disable_read: bool = False) -> "Timeout": ...
 
+        def _get_client_pool_config(self) -> "HTTPClientPoolConfig": ...
+
     @staticmethod
     def _build_simple_type_schema(type_name: str) -> dict[str, Any]:
         normalized = type_name.strip()
@@ -417,10 +421,10 @@ class AnthropicCompatibleRequestBuilderMixin:
         )
         headers.update(
             {
-                "Connection": "close",
                 "anthropic-version": str(self.plugin_settings.get("anthropic_version", "2023-06-01")),
             }
         )
+        headers.update({"Connection": "keep-alive" if self._get_client_pool_config().enabled else "close"})
         anthropic_beta = self.plugin_settings.get("anthropic_beta", None)
         if isinstance(anthropic_beta, list):
             beta_items = [
@@ -64,6 +64,13 @@ class AnthropicCompatible(
             "after_output": True,
         },
         "client_options": {},
+        "client_pool": {
+            "enabled": True,
+            "http2": False,
+            "max_connections": 100,
+            "max_keepalive_connections": 20,
+            "keepalive_expiry": 30.0,
+        },
         "headers": {},
         "proxy": None,
         "request_options": {},
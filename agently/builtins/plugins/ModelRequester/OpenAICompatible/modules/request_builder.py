@@ -21,6 +21,9 @@ from typing import TYPE_CHECKING, Any
 from agently.types.data import AgentlyRequestData, AgentlyRequestDataDict
 from agently.utils import DataFormatter
 
+if TYPE_CHECKING:
+    from agently.utils.HTTPClientPool import HTTPClientPoolConfig
+
 
 class OpenAICompatibleRequestBuilderMixin:
     name: str
@@ -31,6 +34,8 @@ class OpenAICompatibleRequestBuilderMixin:
     if TYPE_CHECKING:
         def _get_http_timeout(self, *, disable_read: bool = False) -> Any: ...
 
+        def _get_client_pool_config(self) -> "HTTPClientPoolConfig": ...
+
     def generate_request_data(self) -> "AgentlyRequestData":
         agently_request_dict: AgentlyRequestDataDict = {
             "client_options": {},
@@ -95,7 +100,8 @@ class OpenAICompatibleRequestBuilderMixin:
             value_format="str",
             default_value={},
         )
-        headers.update({"Connection": "close"})
+        # pooled clients keep the connection alive for the next request
+        headers.update({"Connection": "keep-alive" if self._get_client_pool_config().enabled else "close"})
         ## set
         agently_request_dict["headers"] = headers
 
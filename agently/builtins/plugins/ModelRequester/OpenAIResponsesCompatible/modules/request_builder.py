@@ -23,6 +23,8 @@ from agently.utils import DataFormatter
 if TYPE_CHECKING:
     from httpx import Timeout
 
+    from agently.utils.HTTPClientPool import HTTPClientPoolConfig
+
 
 class OpenAIResponsesCompatibleRequestBuilderMixin:
     name: str
@@ -32,6 +34,8 @@ class OpenAIResponsesCompatibleRequestBuilderMixin:
     if TYPE_CHECKING:
         def _get_http_timeout(self, *, disable_read: bool = False) -> "Timeout": ...
 
+        def _get_client_pool_config(self) -> "HTTPClientPoolConfig": ...
+
     @staticmethod
     def _build_simple_type_schema(type_name: str) -> dict[str, Any]:
         normalized = type_name.strip()
@@ -317,7 +321,8 @@ class OpenAIResponsesCompatibleRequestBuilderMixin:
             value_format="str",
             default_value={},
         )
-        headers.update({"Connection": "close"})
+        # pooled clients keep the connection alive for the next request
+        headers.update({"Connection": "keep-alive" if self._get_client_pool_config().enabled else "close"})
         agently_request_dict["headers"] = headers
 
         client_options = DataFormatter.to_str_key_dict(self.plugin_settings.get("client_options"), default_value={})
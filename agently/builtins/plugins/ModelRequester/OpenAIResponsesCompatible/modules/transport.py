@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import asyncio
 import sys
+import time
 from typing import TYPE_CHECKING, Any, AsyncGenerator, Literal, cast
 
 from httpx import AsyncClient, HTTPStatusError, RequestError, Timeout
@@ -24,6 +25,8 @@ from httpx_sse import SSEError, aconnect_sse
 from agently.core.application.AgentExecution import RuntimeStageStallError
 from agently.types.data import AgentlyRequestData, SerializableValue
 from agently.utils import DataFormatter
+from agently.utils.HTTPClientPool import HTTPClientPoolConfig
+from agently.utils.ModelPool import record_api_key_outcome
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -47,14 +50,36 @@ class OpenAIResponsesCompatibleTransportMixin:
         ) -> dict[str, Any] | None: ...
         def _build_full_request_data(self, request_data: "AgentlyRequestData") -> dict[str, Any]: ...
 
-    def _create_async_client(self, **client_options: Any):
+    def _get_async_client_factory(self) -> Any:
         from .. import plugin as plugin_module
 
         package_module = sys.modules.get(plugin_module.__package__ or "")
         package_client = getattr(package_module, "AsyncClient", AsyncClient)
         plugin_client = getattr(plugin_module, "AsyncClient", AsyncClient)
-        client_factory = package_client if package_client is not AsyncClient else plugin_client
-        return client_factory(**client_options)
+        return package_client if package_client is not AsyncClient else plugin_client
+
+    def _create_async_client(self, **client_options: Any):
+        return self._get_async_client_factory()(**client_options)
+
+    def _get_client_pool_config(self) -> HTTPClientPoolConfig:
+        return HTTPClientPoolConfig.from_settings(self.plugin_settings.get("client_pool", None))
+
+    def _open_async_client(self, request_url: str, **client_options: Any):
+        """Return an async context manager yielding the client for one request.
+
+        The stock ``httpx.AsyncClient`` is leased from the process-wide
+        ``http_client_pool`` so keep-alive connections survive across requests.
+        A patched ``AsyncClient`` factory, or ``client_pool.enabled=False``,
+        keeps the dedicated per-request client.
+        """
+
+        client_factory = self._get_async_client_factory()
+        pool_config = self._get_client_pool_config()
+        if client_factory is not AsyncClient or not pool_config.enabled:
+            return client_factory(**client_options)
+        from agently.base import http_client_pool
+
+        return http_client_pool.lease(request_url, pool_config, **client_options)
 
     def _get_timeout_mode(self) -> Literal["http", "first_token"]:
         timeout_mode = self.plugin_settings.get("timeout_mode", "first_token")
@@ -104,6 +129,8 @@ class OpenAIResponsesCompatibleTransportMixin:
         return self._get_stream_idle_timeout_seconds()
 
     async def _await_non_streaming_response(self, post_coroutine: Any, *, timeout_seconds: float | None) -> Any:
+        self._provider_request_started_at = time.perf_counter()
+        self._provider_response_status = None
         if timeout_seconds is None:
             return await post_coroutine
         try:
@@ -194,6 +221,45 @@ class OpenAIResponsesCompatibleTransportMixin:
                 ) from e
             yield item
 
+    def _observe_provider_response(self, response: Any) -> None:
+        """Report a provider response to the request scheduler and the selected API key's health.
+
+        The scheduler reads the status and rate limit headers; the key pool also
+        gets the latency up to the response headers.
+        """
+        if response is None:
+            return
+        from agently.base import request_scheduler
+
+        status_code = getattr(response, "status_code", None)
+        self._provider_response_status = status_code
+        request_scheduler.observe_response(
+            self.name,
+            status_code=status_code,
+            headers=getattr(response, "headers", None),
+        )
+        started_at = getattr(self, "_provider_request_started_at", None)
+        record_api_key_outcome(
+            self.plugin_settings,
+            status_code=status_code if isinstance(status_code, int) else None,
+            latency=time.perf_counter() - started_at if started_at is not None else None,
+        )
+
+    def _observe_provider_error(self, error: BaseException) -> None:
+        """Report a failed attempt, unless its error status was already observed.
+
+        A throttled or rejected stream first reports its 429/4xx response and
+        then fails again, e.g. with SSEError for the non-event-stream body;
+        both describe the same attempt, which is recorded once.
+        """
+        status_code = getattr(self, "_provider_response_status", None)
+        if isinstance(status_code, int) and status_code >= 400:
+            return
+        from agently.base import request_scheduler
+
+        request_scheduler.observe_error(self.name, error)
+        record_api_key_outcome(self.plugin_settings, error=error)
+
     async def _aiter_sse_with_retry(
         self,
         client: AsyncClient,
@@ -208,6 +274,8 @@ class OpenAIResponsesCompatibleTransportMixin:
         async def _aiter_sse():
             request_headers = dict(headers)
             request_headers["Accept"] = "text/event-stream"
+            self._provider_request_started_at = time.perf_counter()
+            self._provider_response_status = None
             async with aconnect_sse(
                 client,
                 method,
@@ -215,6 +283,7 @@ class OpenAIResponsesCompatibleTransportMixin:
                 headers=request_headers,
                 json=json,
             ) as event_source:
+                self._observe_provider_response(getattr(event_source, "response", None))
                 try:
                     async for sse in event_source.aiter_sse():
                         yield sse
@@ -232,8 +301,7 @@ class OpenAIResponsesCompatibleTransportMixin:
             if self._should_use_first_token_timeout(request_data):
                 client_options.update({"timeout": self._get_http_timeout(disable_read=True)})
 
-            async with self._create_async_client(**client_options) as client:
-                client.headers.update(headers_with_auth)
+            async with self._open_async_client(request_data.request_url, **client_options) as client:
                 stream_started = False
                 while True:
                     try:
@@ -282,13 +350,13 @@ class OpenAIResponsesCompatibleTransportMixin:
                             )
                             if failover_headers is not None:
                                 headers_with_auth = failover_headers
-                                client.headers.update(headers_with_auth)
                                 continue
                             yield "error", error
                         else:
                             yield "response.completed", response.content.decode()
                         break
                     except HTTPStatusError as e:
+                        self._observe_provider_error(e)
                         failover_headers = self._build_failover_headers(
                             request_data,
                             error=e,
@@ -299,11 +367,11 @@ class OpenAIResponsesCompatibleTransportMixin:
                         )
                         if failover_headers is not None:
                             headers_with_auth = failover_headers
-                            client.headers.update(headers_with_auth)
                             continue
                         yield "error", e
                         break
                     except TimeoutError as e:
+                        self._observe_provider_error(e)
                         failover_headers = self._build_failover_headers(
                             request_data,
                             error=e,
@@ -314,11 +382,11 @@ class OpenAIResponsesCompatibleTransportMixin:
                         )
                         if failover_headers is not None:
                             headers_with_auth = failover_headers
-                            client.headers.update(headers_with_auth)
                             continue
                         yield "error", e
                         break
                     except RequestError as e:
+                        self._observe_provider_error(e)
                         failover_headers = self._build_failover_headers(
                             request_data,
                             error=e,
@@ -329,17 +397,16 @@ class OpenAIResponsesCompatibleTransportMixin:
                         )
                         if failover_headers is not None:
                             headers_with_auth = failover_headers
-                            client.headers.update(headers_with_auth)
                             continue
                         yield "error", e
                         break
                     except Exception as e:
+                        self._observe_provider_error(e)
                         yield "error", e
                         break
             return
 
-        async with self._create_async_client(**request_data.client_options) as client:
-            client.headers.update(headers_with_auth)
+        async with self._open_async_client(request_data.request_url, **request_data.client_options) as client:
             response_timeout = self._get_non_streaming_response_timeout_seconds()
             while True:
                 try:
@@ -351,6 +418,7 @@ class OpenAIResponsesCompatibleTransportMixin:
                         ),
                         timeout_seconds=response_timeout,
                     )
+                    self._observe_provider_response(response)
                     if response.status_code >= 400:
                         error = RequestError(
                             f"Status Code: { response.status_code }\n"
@@ -366,13 +434,13 @@ class OpenAIResponsesCompatibleTransportMixin:
                         )
                         if failover_headers is not None:
                             headers_with_auth = failover_headers
-                            client.headers.update(headers_with_auth)
                             continue
                         yield "error", error
                     else:
                         yield "response.completed", response.content.decode()
                     break
                 except HTTPStatusError as e:
+                    self._observe_provider_error(e)
                     failover_headers = self._build_failover_headers(
                         request_data,
                         error=e,
@@ -383,11 +451,11 @@ class OpenAIResponsesCompatibleTransportMixin:
                     )
                     if failover_headers is not None:
                         headers_with_auth = failover_headers
-                        client.headers.update(headers_with_auth)
                         continue
                     yield "error", e
                     break
                 except RuntimeStageStallError as e:
+                    self._observe_provider_error(e)
                     failover_headers = self._build_failover_headers(
                         request_data,
                         error=e,
@@ -398,10 +466,10 @@ class OpenAIResponsesCompatibleTransportMixin:
                     )
                     if failover_headers is not None:
                         headers_with_auth = failover_headers
-                        client.headers.update(headers_with_auth)
                         continue
                     raise
                 except RequestError as e:
+                    self._observe_provider_error(e)
                     failover_headers = self._build_failover_headers(
                         request_data,
                         error=e,
@@ -412,10 +480,10 @@ class OpenAIResponsesCompatibleTransportMixin:
                     )
                     if failover_headers is not None:
                         headers_with_auth = failover_headers
-                        client.headers.update(headers_with_auth)
                         continue
                     yield "error", e
                     break
                 except Exception as e:
+                    self._observe_provider_error(e)
                     yield "error", e
                     break
@@ -171,6 +171,12 @@ class AgentlyResponseParser(ResponseParser):
             "response": {
                 "streaming_parse": False,
                 "streaming_parse_path_style": "dot",
+                "stream_buffer": {
+                    "max_queue_size": None,
+                    "overflow": "block",
+                    "history": "full",
+                    "expected_listeners": None,
+                },
             },
         },
     }
@@ -743,7 +749,24 @@ class AgentlyResponseParser(ResponseParser):
         if self._response_consumer is None:
             async with self._consumer_lock:
                 if self._response_consumer is None:
-                    self._response_consumer = GeneratorConsumer(self._extract())
+                    self._response_consumer = GeneratorConsumer(
+                        self._extract(),
+                        **self._stream_buffer_options(),
+                    )
+
+    def _stream_buffer_options(self) -> dict[str, Any]:
+        options = self.settings.get("response.stream_buffer", {})
+        if not isinstance(options, dict):
+            options = {}
+        max_queue_size = options.get("max_queue_size")
+        expected_listeners = options.get("expected_listeners")
+        history = options.get("history", "full")
+        return {
+            "max_queue_size": int(max_queue_size) if max_queue_size else None,
+            "overflow": str(options.get("overflow") or "block"),
+            "history": history if isinstance(history, int) else str(history or "full"),
+            "expected_listeners": int(expected_listeners) if expected_listeners else None,
+        }
 
     async def _wait_for_consumer_result(self):
         await self._ensure_consumer()
@@ -12,27 +12,89 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .ActionFlow import TriggerFlowActionFlow
-from .ActionExecutor import (
-    BashSandboxActionExecutor,
-    CodeExecutionActionExecutor,
-    LocalFunctionActionExecutor,
-    MCPActionExecutor,
-)
-from .ActionRuntime import AgentlyActionRuntime
-from .ExecutionResourceProvider import (
-    ACPExecutionResourceProvider,
-    BashExecutionResourceProvider,
-    GVisorDockerExecutionResourceProvider,
-    LandlockExecutionResourceProvider,
-    SeatbeltExecutionResourceProvider,
-    MCPExecutionResourceProvider,
-)
-from .PromptGenerator.AgentlyPromptGenerator import AgentlyPromptGenerator
-from .TaskDAGPlanner import AgentlyTaskDAGPlanner
-from .Blocks import AgentlyBlocks
-from .AgentOrchestrator import AgentlyAgentOrchestrator
-from .ModelRequester.AnthropicCompatible import AnthropicCompatible
-from .ModelRequester.OpenAICompatible import OpenAICompatible
-from .ModelRequester.OpenAIResponsesCompatible import OpenAIResponsesCompatible
-from .ResponseParser.AgentlyResponseParser import AgentlyResponseParser
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .ActionFlow import TriggerFlowActionFlow
+    from .ActionExecutor import (
+        BashSandboxActionExecutor,
+        CodeExecutionActionExecutor,
+        LocalFunctionActionExecutor,
+        MCPActionExecutor,
+    )
+    from .ActionRuntime import AgentlyActionRuntime
+    from .ExecutionResourceProvider import (
+        ACPExecutionResourceProvider,
+        BashExecutionResourceProvider,
+        GVisorDockerExecutionResourceProvider,
+        LandlockExecutionResourceProvider,
+        SeatbeltExecutionResourceProvider,
+        MCPExecutionResourceProvider,
+    )
+    from .PromptGenerator.AgentlyPromptGenerator import AgentlyPromptGenerator
+    from .TaskDAGPlanner import AgentlyTaskDAGPlanner
+    from .Blocks import AgentlyBlocks
+    from .AgentOrchestrator import AgentlyAgentOrchestrator
+    from .ModelRequester.AnthropicCompatible import AnthropicCompatible
+    from .ModelRequester.OpenAICompatible import OpenAICompatible
+    from .ModelRequester.OpenAIResponsesCompatible import OpenAIResponsesCompatible
+    from .ResponseParser.AgentlyResponseParser import AgentlyResponseParser
+
+# Builtin plugins are resolved on attribute access so importing one plugin
+# module does not import every other builtin with it.
+_LAZY_EXPORTS = {
+    "TriggerFlowActionFlow": ".ActionFlow",
+    "BashSandboxActionExecutor": ".ActionExecutor",
+    "CodeExecutionActionExecutor": ".ActionExecutor",
+    "LocalFunctionActionExecutor": ".ActionExecutor",
+    "MCPActionExecutor": ".ActionExecutor",
+    "AgentlyActionRuntime": ".ActionRuntime",
+    "ACPExecutionResourceProvider": ".ExecutionResourceProvider",
+    "BashExecutionResourceProvider": ".ExecutionResourceProvider",
+    "GVisorDockerExecutionResourceProvider": ".ExecutionResourceProvider",
+    "LandlockExecutionResourceProvider": ".ExecutionResourceProvider",
+    "SeatbeltExecutionResourceProvider": ".ExecutionResourceProvider",
+    "MCPExecutionResourceProvider": ".ExecutionResourceProvider",
+    "AgentlyPromptGenerator": ".PromptGenerator.AgentlyPromptGenerator",
+    "AgentlyTaskDAGPlanner": ".TaskDAGPlanner",
+    "AgentlyBlocks": ".Blocks",
+    "AgentlyAgentOrchestrator": ".AgentOrchestrator",
+    "AnthropicCompatible": ".ModelRequester.AnthropicCompatible",
+    "OpenAICompatible": ".ModelRequester.OpenAICompatible",
+    "OpenAIResponsesCompatible": ".ModelRequester.OpenAIResponsesCompatible",
+    "AgentlyResponseParser": ".ResponseParser.AgentlyResponseParser",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module { __name__ !r} has no attribute { name !r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = [
+    "TriggerFlowActionFlow",
+    "BashSandboxActionExecutor",
+    "CodeExecutionActionExecutor",
+    "LocalFunctionActionExecutor",
+    "MCPActionExecutor",
+    "AgentlyActionRuntime",
+    "ACPExecutionResourceProvider",
+    "BashExecutionResourceProvider",
+    "GVisorDockerExecutionResourceProvider",
+    "LandlockExecutionResourceProvider",
+    "SeatbeltExecutionResourceProvider",
+    "MCPExecutionResourceProvider",
+    "AgentlyPromptGenerator",
+    "AgentlyTaskDAGPlanner",
+    "AgentlyBlocks",
+    "AgentlyAgentOrchestrator",
+    "AnthropicCompatible",
+    "OpenAICompatible",
+    "OpenAIResponsesCompatible",
+    "AgentlyResponseParser",
+]
@@ -0,0 +1,290 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Callable, Sequence
+
+from .Identity import _write_json_atomic
+
+
+_INDEX_VERSION = 1
+DEFAULT_MAX_DISK_BYTES = 256 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class _ExtractedUnit:
+    label: str
+    start: int
+    end: int
+
+
+@dataclass(frozen=True)
+class _ExtractedDocument:
+    """Extracted text of one document version plus its unit byte-offset index.
+
+    Units (PDF pages, sheets, slides, paragraph groups) are joined with
+    ``separator``; ``units`` records where each one starts and ends in the
+    joined UTF-8 text, so a byte range maps to the units it overlaps.
+    """
+
+    sha256: str
+    method: str
+    separator: str
+    units: tuple[_ExtractedUnit, ...]
+    total_bytes: int
+    has_text: bool
+    text_path: Path | None = None
+    text: bytes | None = None
+
+    def units_in_range(self, start: int, end: int) -> tuple[_ExtractedUnit, ...]:
+        return tuple(unit for unit in self.units if unit.start < end and unit.end > start)
+
+    def read_range(self, start: int, max_bytes: int) -> bytes:
+        start = max(0, start)
+        end = min(self.total_bytes, start + max(0, max_bytes))
+        if end <= start:
+            return b""
+        if self.text is not None:
+            return self.text[start:end]
+        assert self.text_path is not None
+        with self.text_path.open("rb") as file:
+            file.seek(start)
+            return file.read(end - start)
+
+
+class _TaskWorkspaceExtractionCache:
+    """Content-addressed cache of extracted document text.
+
+    Documents are keyed by file sha256 and extraction method. With a ``root``
+    (the TaskWorkspace system area) the joined text and its unit index are
+    persisted, so later reads, executions and processes seek into the stored
+    text instead of parsing the document again. Recently used documents are
+    also kept in memory; without a root that is the only tier.
+
+    With ``persist=False`` (read-only workspaces) stored documents are still
+    read but nothing is written. The stored texts are capped at
+    ``max_disk_bytes``; the least recently used documents are deleted first.
+    """
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        *,
+        persist: bool = True,
+        max_memory_documents: int = 8,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+    ):
+        self.root = root
+        self.persist = persist
+        self.max_memory_documents = max_memory_documents
+        self.max_disk_bytes = max_disk_bytes
+        self._documents: OrderedDict[tuple[str, str], _ExtractedDocument] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.extractions = 0
+
+    async def get_or_extract(
+        self,
+        *,
+        sha256: str,
+        method: str,
+        separator: str,
+        extract: Callable[[], Sequence[tuple[str, str]]],
+    ) -> _ExtractedDocument:
+        """Return the cached extraction, or run ``extract`` in a worker thread.
+
+        ``extract`` returns ``(label, text)`` units in document order. Exceptions
+        raised by it propagate and nothing is cached.
+        """
+        document = self.get(sha256=sha256, method=method)
+        if document is not None:
+            return document
+        units = await asyncio.to_thread(extract)
+        document = self._build(sha256=sha256, method=method, separator=separator, units=units)
+        self.extractions += 1
+        return document
+
+    def get(self, *, sha256: str, method: str) -> _ExtractedDocument | None:
+        if not sha256:
+            return None
+        key = (sha256, method)
+        with self._lock:
+            document = self._documents.get(key)
+            if document is not None:
+                self._documents.move_to_end(key)
+                self.hits += 1
+                return document
+        document = self._load(sha256=sha256, method=method)
+        if document is not None:
+            self._remember(document)
+            with self._lock:
+                self.hits += 1
+        return document
+
+    def _paths(self, sha256: str, method: str) -> tuple[Path, Path] | None:
+        if self.root is None or not sha256:
+            return None
+        directory = self.root / sha256[:2]
+        stem = f"{sha256}.{method}"
+        return directory / f"{stem}.json", directory / f"{stem}.txt"
+
+    def _load(self, *, sha256: str, method: str) -> _ExtractedDocument | None:
+        paths = self._paths(sha256, method)
+        if paths is None:
+            return None
+        index_path, text_path = paths
+        try:
+            index = json.loads(index_path.read_text(encoding="utf-8"))
+            total_bytes = int(index["total_bytes"])
+            if int(index.get("version", 0)) != _INDEX_VERSION or text_path.stat().st_size != total_bytes:
+                return None
+            units = tuple(
+                _ExtractedUnit(label=str(label), start=int(start), end=int(end))
+                for label, start, end in index["units"]
+            )
+            separator = str(index["separator"])
+            has_text = bool(index["has_text"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if self.persist:
+            # The modification time orders documents for eviction.
+            try:
+                os.utime(text_path)
+            except OSError:
+                pass
+        return _ExtractedDocument(
+            sha256=sha256,
+            method=method,
+            separator=separator,
+            units=units,
+            total_bytes=total_bytes,
+            has_text=has_text,
+            text_path=text_path,
+        )
+
+    def _build(
+        self,
+        *,
+        sha256: str,
+        method: str,
+        separator: str,
+        units: Sequence[tuple[str, str]],
+    ) -> _ExtractedDocument:
+        separator_bytes = separator.encode("utf-8")
+        chunks: list[bytes] = []
+        index: list[_ExtractedUnit] = []
+        position = 0
+        has_text = False
+        for label, text in units:
+            has_text = has_text or bool(text.strip())
+            if chunks:
+                chunks.append(separator_bytes)
+                position += len(separator_bytes)
+            encoded = text.encode("utf-8")
+            chunks.append(encoded)
+            index.append(_ExtractedUnit(label=label, start=position, end=position + len(encoded)))
+            position += len(encoded)
+        text_bytes = b"".join(chunks)
+        document = _ExtractedDocument(
+            sha256=sha256,
+            method=method,
+            separator=separator,
+            units=tuple(index),
+            total_bytes=len(text_bytes),
+            has_text=has_text,
+            text=text_bytes,
+        )
+        if not sha256:
+            return document
+        text_path = self._persist(document, text_bytes)
+        # Persisted documents are remembered by path so large texts do not stay resident.
+        self._remember(replace(document, text=None, text_path=text_path) if text_path is not None else document)
+        return document
+
+    def _persist(self, document: _ExtractedDocument, text_bytes: bytes) -> Path | None:
+        paths = self._paths(document.sha256, document.method)
+        if paths is None or not self.persist:
+            return None
+        index_path, text_path = paths
+        try:
+            text_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = text_path.with_name(f".{text_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                with temporary.open("wb") as file:
+                    file.write(text_bytes)
+                os.replace(temporary, text_path)
+            finally:
+                temporary.unlink(missing_ok=True)
+            _write_json_atomic(
+                index_path,
+                {
+                    "version": _INDEX_VERSION,
+                    "sha256": document.sha256,
+                    "method": document.method,
+                    "separator": document.separator,
+                    "total_bytes": document.total_bytes,
+                    "has_text": document.has_text,
+                    "units": [[unit.label, unit.start, unit.end] for unit in document.units],
+                },
+            )
+        except OSError:
+            # A read-only or full system area only loses the persistent tier.
+            return None
+        self._evict_stored(keep=text_path)
+        return text_path
+
+    def _evict_stored(self, *, keep: Path) -> None:
+        assert self.root is not None
+        stored: list[tuple[float, int, Path]] = []
+        for text_path in self.root.glob("*/*.txt"):
+            try:
+                stat = text_path.stat()
+            except OSError:
+                continue
+            stored.append((stat.st_mtime, stat.st_size, text_path))
+        total = sum(size for _, size, _ in stored)
+        evicted: set[Path] = set()
+        for _, size, text_path in sorted(stored):
+            if total <= self.max_disk_bytes:
+                break
+            if text_path == keep:
+                continue
+            try:
+                text_path.with_suffix(".json").unlink(missing_ok=True)
+                text_path.unlink(missing_ok=True)
+            except OSError:
+                continue
+            evicted.add(text_path)
+            total -= size
+        if evicted:
+            with self._lock:
+                for key, document in list(self._documents.items()):
+                    if document.text_path in evicted:
+                        del self._documents[key]
+
+    def _remember(self, document: _ExtractedDocument) -> None:
+        key = (document.sha256, document.method)
+        with self._lock:
+            self._documents[key] = document
+            self._documents.move_to_end(key)
+            while len(self._documents) > self.max_memory_documents:
+                self._documents.popitem(last=False)
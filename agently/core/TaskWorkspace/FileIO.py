@@ -14,8 +14,13 @@
 
 from __future__ import annotations
 
+import codecs
 import hashlib
 import mimetypes
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, cast
 
@@ -34,6 +39,8 @@ from agently.types.data.task_workspace import (
 )
 from agently.utils import LazyImport
 
+from .ExtractionCache import _ExtractedDocument, _TaskWorkspaceExtractionCache
+
 
 TEXT_EXTENSIONS = {
     "",
@@ -173,6 +180,52 @@ def _slice_text_bytes(
     return segment.decode(encoding, errors="ignore"), len(segment), truncated
 
 
+_PDF_EXTRACTION_METHOD = "pypdf.extract_text"
+# python-docx exposes no pages; paragraphs are grouped into page-sized units.
+_DOCX_PARAGRAPHS_PER_UNIT = 100
+
+
+class _EncryptedDocumentError(Exception):
+    pass
+
+
+def _extracted_read_result(
+    document: _ExtractedDocument,
+    *,
+    file_info: TaskWorkspaceFileInfo,
+    handler_id: str,
+    content_kind: str,
+    media_type: str | None,
+    max_bytes: int,
+    offset: int,
+) -> TaskWorkspaceReadResult:
+    safe_offset = max(0, int(offset))
+    safe_max = max(0, int(max_bytes))
+    segment = document.read_range(safe_offset, safe_max)
+    path_text = str(file_info.get("path", ""))
+    return {
+        "ok": True,
+        "readable": True,
+        "path": path_text,
+        "content": segment.decode("utf-8", errors="ignore"),
+        "truncated": document.total_bytes > safe_offset + safe_max,
+        "bytes": int(file_info.get("bytes", 0)),
+        "offset": safe_offset,
+        "read_bytes": len(segment),
+        "sha256": str(file_info.get("sha256", "")),
+        "media_type": media_type,
+        "content_kind": content_kind,
+        "encoding": "utf-8",
+        "handler_id": handler_id,
+        "extraction_method": document.method,
+        "diagnostics": [],
+        "file_refs": [_file_ref(path_text, file_info, role="source")] if path_text else [],
+        "source_units": [
+            unit.label for unit in document.units_in_range(safe_offset, safe_offset + len(segment))
+        ],
+    }
+
+
 def unsupported_read_result(
     *,
     file_info: TaskWorkspaceFileInfo,
@@ -261,31 +314,141 @@ def unsupported_export_result(
     }
 
 
+_HEADER_BYTES = 4096
+_SCAN_CHUNK_BYTES = 1024 * 1024
+_UTF8_BOM = b"\xef\xbb\xbf"
+# Files modified this recently can change again within the same mtime tick, so
+# their fingerprints are recomputed instead of reused (git's "racy" rule).
+_RACY_WINDOW_NS = 2_000_000_000
+_EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+
+
+@dataclass
+class _FileFingerprint:
+    stat_key: tuple[int, int, int, int]
+    header: bytes
+    racy: bool
+    sha256: str | None = None
+    utf8_valid: bool | None = None
+
+    @property
+    def size(self) -> int:
+        return self.stat_key[2]
+
+
+class _TaskWorkspaceFileInspectionCache:
+    """Stat-keyed cache of file headers, digests and UTF-8 validity.
+
+    Entries are keyed by path and validated against ``(device, inode, size,
+    mtime_ns)``, so paging through a large file stats it instead of re-reading
+    it. The digest and UTF-8 check share one chunked pass, run only when first
+    needed.
+    """
+
+    def __init__(self, *, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, _FileFingerprint] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.scans = 0
+
+    def fingerprint(self, path: Path) -> _FileFingerprint | None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        if not path.is_file():
+            return None
+        stat_key = (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        cache_key = str(path)
+        with self._lock:
+            cached = self._entries.get(cache_key)
+            if cached is not None and cached.stat_key == stat_key and not cached.racy:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return cached
+        with path.open("rb") as file:
+            header = file.read(_HEADER_BYTES)
+        fingerprint = _FileFingerprint(
+            stat_key=stat_key,
+            header=header,
+            racy=time.time_ns() - stat.st_mtime_ns < _RACY_WINDOW_NS,
+        )
+        with self._lock:
+            self._entries[cache_key] = fingerprint
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return fingerprint
+
+    def scan(self, path: Path, fingerprint: _FileFingerprint) -> _FileFingerprint:
+        """Fill in the streamed sha256 and UTF-8 validity of ``fingerprint``."""
+        if fingerprint.sha256 is not None:
+            return fingerprint
+        digest = hashlib.sha256()
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        utf8_valid = True
+        with path.open("rb") as file:
+            while chunk := file.read(_SCAN_CHUNK_BYTES):
+                digest.update(chunk)
+                if utf8_valid:
+                    try:
+                        decoder.decode(chunk)
+                    except UnicodeDecodeError:
+                        utf8_valid = False
+        if utf8_valid:
+            try:
+                decoder.decode(b"", final=True)
+            except UnicodeDecodeError:
+                utf8_valid = False
+        fingerprint.utf8_valid = utf8_valid
+        fingerprint.sha256 = digest.hexdigest()
+        self.scans += 1
+        return fingerprint
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_FILE_INSPECTION_CACHE = _TaskWorkspaceFileInspectionCache()
+
+
+def _read_text_range(path: Path, *, start: int, max_bytes: int) -> bytes:
+    if max_bytes <= 0:
+        return b""
+    with path.open("rb") as file:
+        file.seek(start)
+        return file.read(max_bytes)
+
+
 def inspect_task_workspace_file(path: Path, *, relative_path: str) -> TaskWorkspaceFileInfo:
     extension = path.suffix.lower()
     guessed_type = mimetypes.guess_type(str(path))[0]
     media_type = guessed_type
     exists = path.exists()
-    raw = b""
-    if exists and path.is_file():
-        raw = path.read_bytes()
+    fingerprint = _FILE_INSPECTION_CACHE.fingerprint(path) if exists else None
+    header = fingerprint.header if fingerprint is not None else b""
     signatures: list[str] = []
-    if raw.startswith(b"%PDF-"):
+    if header.startswith(b"%PDF-"):
         signatures.append("pdf")
         media_type = media_type or "application/pdf"
-    if raw.startswith(b"PK\x03\x04"):
+    if header.startswith(b"PK\x03\x04"):
         signatures.append("zip")
     image_media_type = None
-    if exists and path.is_file() and (extension in IMAGE_EXTENSIONS or str(guessed_type or "").startswith("image/")):
+    if fingerprint is not None and (extension in IMAGE_EXTENSIONS or str(guessed_type or "").startswith("image/")):
         detected_image_type = detect_image_mime_type(path)
         if detected_image_type in SUPPORTED_IMAGE_MIME_TYPES:
             image_media_type = detected_image_type
     if image_media_type:
         signatures.append("image")
         media_type = image_media_type
-    if b"\x00" in raw[:4096]:
+    if b"\x00" in header:
         signatures.append("nul_byte")
-    sha256 = hashlib.sha256(raw).hexdigest()
+    if fingerprint is not None:
+        _FILE_INSPECTION_CACHE.scan(path, fingerprint)
+    size = fingerprint.size if fingerprint is not None else 0
+    sha256 = str(fingerprint.sha256) if fingerprint is not None else _EMPTY_SHA256
 
     content_kind = "unknown"
     readable = False
@@ -303,10 +466,8 @@ def inspect_task_workspace_file(path: Path, *, relative_path: str) -> TaskWorksp
         content_kind = "text"
         writable = True
         readable = True
-    elif exists and raw:
-        try:
-            raw.decode("utf-8-sig")
-        except UnicodeDecodeError:
+    elif fingerprint is not None and size:
+        if not fingerprint.utf8_valid:
             content_kind = "binary" if "nul_byte" in signatures else "unknown"
             readable = False
         else:
@@ -321,7 +482,7 @@ def inspect_task_workspace_file(path: Path, *, relative_path: str) -> TaskWorksp
         "extension": extension,
         "media_type": media_type,
         "content_kind": content_kind,
-        "bytes": len(raw),
+        "bytes": size,
         "sha256": sha256,
         "signatures": signatures,
         "readable": readable,
@@ -361,19 +522,27 @@ class DefaultTextTaskWorkspaceFileIOHandler:
         options: dict[str, Any] | None = None,
     ) -> TaskWorkspaceReadResult:
         _ = options
-        raw = path.read_bytes()
-        try:
-            text = raw.decode("utf-8-sig")
-            encoding = "utf-8-sig" if raw.startswith(b"\xef\xbb\xbf") else "utf-8"
-            content, read_bytes, truncated = _slice_text_bytes(text, max_bytes=max_bytes, offset=offset)
-        except UnicodeDecodeError:
+        fingerprint = _FILE_INSPECTION_CACHE.fingerprint(path)
+        if fingerprint is None:
+            raise FileNotFoundError(path)
+        _FILE_INSPECTION_CACHE.scan(path, fingerprint)
+        if not fingerprint.utf8_valid:
             return unsupported_read_result(
                 file_info=file_info,
                 handler_id=self.name,
                 code="task_workspace.file.text_decode_failed",
                 message="File is not valid UTF-8 text.",
             )
+        # Offsets count bytes of the decoded text, which excludes a leading BOM.
+        bom_bytes = len(_UTF8_BOM) if fingerprint.header.startswith(_UTF8_BOM) else 0
+        encoding = "utf-8-sig" if bom_bytes else "utf-8"
         safe_offset = max(0, int(offset))
+        safe_max = max(0, int(max_bytes))
+        segment = _read_text_range(path, start=bom_bytes + safe_offset, max_bytes=safe_max)
+        # Characters split by the range edges are dropped, as slicing always did.
+        content = segment.decode("utf-8", errors="ignore")
+        read_bytes = len(segment)
+        truncated = fingerprint.size - bom_bytes > safe_offset + safe_max
         path_text = str(file_info.get("path", ""))
         return {
             "ok": True,
@@ -381,10 +550,10 @@ class DefaultTextTaskWorkspaceFileIOHandler:
             "path": path_text,
             "content": content,
             "truncated": truncated,
-            "bytes": len(raw),
+            "bytes": fingerprint.size,
             "offset": safe_offset,
             "read_bytes": read_bytes,
-            "sha256": hashlib.sha256(raw).hexdigest(),
+            "sha256": str(fingerprint.sha256),
             "media_type": file_info.get("media_type"),
             "content_kind": "text",
             "encoding": encoding,
@@ -417,14 +586,17 @@ class DefaultTextTaskWorkspaceFileIOHandler:
                 file.write(content)
         else:
             path.write_text(content, encoding="utf-8")
-        raw = path.read_bytes()
+        fingerprint = _FILE_INSPECTION_CACHE.fingerprint(path)
+        if fingerprint is None:
+            raise FileNotFoundError(path)
+        _FILE_INSPECTION_CACHE.scan(path, fingerprint)
         path_text = str(file_info.get("path", ""))
         return {
             "ok": True,
             "writable": True,
             "path": path_text,
-            "bytes": len(raw),
-            "sha256": hashlib.sha256(raw).hexdigest(),
+            "bytes": fingerprint.size,
+            "sha256": str(fingerprint.sha256),
             "media_type": file_info.get("media_type"),
             "content_kind": "text",
             "encoding": "utf-8",
@@ -436,8 +608,8 @@ class DefaultTextTaskWorkspaceFileIOHandler:
                     TaskWorkspaceFileRef,
                     {
                     "path": path_text,
-                    "bytes": len(raw),
-                    "sha256": hashlib.sha256(raw).hexdigest(),
+                    "bytes": fingerprint.size,
+                    "sha256": str(fingerprint.sha256),
                     "media_type": file_info.get("media_type"),
                     "content_kind": "text",
                     "role": "output",
@@ -472,6 +644,9 @@ class PdfTaskWorkspaceFileIOHandler:
     priority = 200
     DEFAULT_SETTINGS: dict[str, Any] = {}
 
+    def __init__(self, extraction_cache: _TaskWorkspaceExtractionCache | None = None):
+        self.extraction_cache = extraction_cache or _TaskWorkspaceExtractionCache()
+
     @staticmethod
     def _on_register():
         return None
@@ -494,61 +669,68 @@ class PdfTaskWorkspaceFileIOHandler:
         options: dict[str, Any] | None = None,
     ) -> TaskWorkspaceReadResult:
         _ = options
-        try:
-            pypdf = LazyImport.import_package("pypdf", auto_install=False)
-        except ImportError:
-            return unsupported_read_result(
-                file_info=file_info,
-                handler_id=self.name,
-                code="task_workspace.file.pdf_dependency_missing",
-                message="PDF text extraction requires optional dependency 'pypdf'.",
-                dependency="pypdf",
-            )
-        try:
-            reader = pypdf.PdfReader(str(path))
-            if getattr(reader, "is_encrypted", False):
+        sha256 = str(file_info.get("sha256", ""))
+        document = self.extraction_cache.get(sha256=sha256, method=_PDF_EXTRACTION_METHOD)
+        if document is None:
+            try:
+                pypdf = LazyImport.import_package("pypdf", auto_install=False)
+            except ImportError:
+                return unsupported_read_result(
+                    file_info=file_info,
+                    handler_id=self.name,
+                    code="task_workspace.file.pdf_dependency_missing",
+                    message="PDF text extraction requires optional dependency 'pypdf'.",
+                    dependency="pypdf",
+                )
+            try:
+                document = await self.extraction_cache.get_or_extract(
+                    sha256=sha256,
+                    method=_PDF_EXTRACTION_METHOD,
+                    separator="\n\n",
+                    extract=lambda: self._extract_pages(pypdf, path),
+                )
+            except _EncryptedDocumentError:
                 return unsupported_read_result(
                     file_info=file_info,
                     handler_id=self.name,
                     code="task_workspace.file.pdf_encrypted",
                     message="Encrypted PDF files are not readable by the default PDF handler.",
                 )
-            page_texts = [page.extract_text() or "" for page in reader.pages]
-            text = "\n\n".join(item for item in page_texts if item.strip())
-        except Exception as exc:
-            return unsupported_read_result(
-                file_info=file_info,
-                handler_id=self.name,
-                code="task_workspace.file.pdf_extract_failed",
-                message=f"PDF text extraction failed: {exc}",
-            )
-        if not text.strip():
+            except Exception as exc:
+                return unsupported_read_result(
+                    file_info=file_info,
+                    handler_id=self.name,
+                    code="task_workspace.file.pdf_extract_failed",
+                    message=f"PDF text extraction failed: {exc}",
+                )
+        if not document.has_text:
             return unsupported_read_result(
                 file_info=file_info,
                 handler_id=self.name,
                 code="task_workspace.file.pdf_no_text",
                 message="PDF contains no extractable text. Use an image/VLM preparation handler if appropriate.",
             )
-        content, read_bytes, truncated = _slice_text_bytes(text, max_bytes=max_bytes, offset=offset)
-        path_text = str(file_info.get("path", ""))
-        return {
-            "ok": True,
-            "readable": True,
-            "path": path_text,
-            "content": content,
-            "truncated": truncated,
-            "bytes": int(file_info.get("bytes", 0)),
-            "offset": max(0, int(offset)),
-            "read_bytes": read_bytes,
-            "sha256": str(file_info.get("sha256", "")),
-            "media_type": file_info.get("media_type") or "application/pdf",
-            "content_kind": "pdf",
-            "encoding": "utf-8",
-            "handler_id": self.name,
-            "extraction_method": "pypdf.extract_text",
-            "diagnostics": [],
-            "file_refs": [_file_ref(path_text, file_info, role="source")] if path_text else [],
-        }
+        return _extracted_read_result(
+            document,
+            file_info=file_info,
+            handler_id=self.name,
+            content_kind="pdf",
+            media_type=file_info.get("media_type") or "application/pdf",
+            max_bytes=max_bytes,
+            offset=offset,
+        )
+
+    @staticmethod
+    def _extract_pages(pypdf: Any, path: Path) -> list[tuple[str, str]]:
+        reader = pypdf.PdfReader(str(path))
+        if getattr(reader, "is_encrypted", False):
+            raise _EncryptedDocumentError()
+        pages: list[tuple[str, str]] = []
+        for index, page in enumerate(reader.pages, start=1):
+            text = page.extract_text() or ""
+            if text.strip():
+                pages.append((f"page {index}", text))
+        return pages
 
     async def write(
         self,
@@ -593,6 +775,9 @@ class OfficeTaskWorkspaceFileIOHandler:
     priority = 210
     DEFAULT_SETTINGS: dict[str, Any] = {}
 
+    def __init__(self, extraction_cache: _TaskWorkspaceExtractionCache | None = None):
+        self.extraction_cache = extraction_cache or _TaskWorkspaceExtractionCache()
+
     @staticmethod
     def _on_register():
         return None
@@ -617,14 +802,11 @@ class OfficeTaskWorkspaceFileIOHandler:
         _ = options
         extension = str(file_info.get("extension", "")).lower()
         if extension == ".docx":
-            text_or_result = self._read_docx(path, file_info)
-            method = "python-docx"
+            method, package, install_name, extract = "python-docx", "docx", "python-docx", self._docx_units
         elif extension == ".xlsx":
-            text_or_result = self._read_xlsx(path, file_info)
-            method = "openpyxl"
+            method, package, install_name, extract = "openpyxl", "openpyxl", "openpyxl", self._xlsx_units
         elif extension == ".pptx":
-            text_or_result = self._read_pptx(path, file_info)
-            method = "python-pptx"
+            method, package, install_name, extract = "python-pptx", "pptx", "python-pptx", self._pptx_units
         else:
             return unsupported_read_result(
                 file_info=file_info,
@@ -632,96 +814,84 @@ class OfficeTaskWorkspaceFileIOHandler:
                 code="task_workspace.file.office_extension_unsupported",
                 message=f"Unsupported Office extension: {extension}",
             )
-        if isinstance(text_or_result, dict):
-            return text_or_result
-        text = text_or_result
-        if not text.strip():
+        sha256 = str(file_info.get("sha256", ""))
+        document = self.extraction_cache.get(sha256=sha256, method=method)
+        if document is None:
+            try:
+                module = LazyImport.import_package(package, auto_install=False, install_name=install_name)
+            except ImportError:
+                return unsupported_read_result(
+                    file_info=file_info,
+                    handler_id=self.name,
+                    code=f"task_workspace.file.{extension[1:]}_dependency_missing",
+                    message=(
+                        f"{extension[1:].upper()} text extraction requires optional dependency '{install_name}'."
+                    ),
+                    dependency=install_name,
+                )
+            document = await self.extraction_cache.get_or_extract(
+                sha256=sha256,
+                method=method,
+                separator="\n",
+                extract=lambda: extract(module, path),
+            )
+        if not document.has_text:
             return unsupported_read_result(
                 file_info=file_info,
                 handler_id=self.name,
                 code="task_workspace.file.office_no_text",
                 message="Office file contains no extractable text.",
             )
-        content, read_bytes, truncated = _slice_text_bytes(text, max_bytes=max_bytes, offset=offset)
-        path_text = str(file_info.get("path", ""))
-        return {
-            "ok": True,
-            "readable": True,
-            "path": path_text,
-            "content": content,
-            "truncated": truncated,
-            "bytes": int(file_info.get("bytes", 0)),
-            "offset": max(0, int(offset)),
-            "read_bytes": read_bytes,
-            "sha256": str(file_info.get("sha256", "")),
-            "media_type": file_info.get("media_type"),
-            "content_kind": "office",
-            "encoding": "utf-8",
-            "handler_id": self.name,
-            "extraction_method": method,
-            "diagnostics": [],
-            "file_refs": [_file_ref(path_text, file_info, role="source")] if path_text else [],
-        }
+        return _extracted_read_result(
+            document,
+            file_info=file_info,
+            handler_id=self.name,
+            content_kind="office",
+            media_type=file_info.get("media_type"),
+            max_bytes=max_bytes,
+            offset=offset,
+        )
 
-    def _read_docx(self, path: Path, file_info: TaskWorkspaceFileInfo) -> str | TaskWorkspaceReadResult:
-        try:
-            docx = LazyImport.import_package("docx", auto_install=False, install_name="python-docx")
-        except ImportError:
-            return unsupported_read_result(
-                file_info=file_info,
-                handler_id=self.name,
-                code="task_workspace.file.docx_dependency_missing",
-                message="DOCX text extraction requires optional dependency 'python-docx'.",
-                dependency="python-docx",
-            )
+    @staticmethod
+    def _docx_units(docx: Any, path: Path) -> list[tuple[str, str]]:
         document = docx.Document(str(path))
         paragraphs = [paragraph.text for paragraph in document.paragraphs if paragraph.text]
-        return "\n".join(paragraphs)
-
-    def _read_xlsx(self, path: Path, file_info: TaskWorkspaceFileInfo) -> str | TaskWorkspaceReadResult:
-        try:
-            openpyxl = LazyImport.import_package("openpyxl", auto_install=False)
-        except ImportError:
-            return unsupported_read_result(
-                file_info=file_info,
-                handler_id=self.name,
-                code="task_workspace.file.xlsx_dependency_missing",
-                message="XLSX text extraction requires optional dependency 'openpyxl'.",
-                dependency="openpyxl",
+        return [
+            (
+                f"paragraphs {start + 1}-{min(start + _DOCX_PARAGRAPHS_PER_UNIT, len(paragraphs))}",
+                "\n".join(paragraphs[start : start + _DOCX_PARAGRAPHS_PER_UNIT]),
             )
+            for start in range(0, len(paragraphs), _DOCX_PARAGRAPHS_PER_UNIT)
+        ]
+
+    @staticmethod
+    def _xlsx_units(openpyxl: Any, path: Path) -> list[tuple[str, str]]:
         workbook = openpyxl.load_workbook(str(path), read_only=True, data_only=True)
         try:
-            chunks: list[str] = []
+            units: list[tuple[str, str]] = []
             for sheet in workbook.worksheets:
-                chunks.append(f"# Sheet: {sheet.title}")
+                chunks = [f"# Sheet: {sheet.title}"]
                 for row in sheet.iter_rows(values_only=True):
                     values = ["" if value is None else str(value) for value in row]
                     if any(values):
                         chunks.append("\t".join(values))
-            return "\n".join(chunks)
+                units.append((f"sheet {sheet.title}", "\n".join(chunks)))
+            return units
         finally:
             workbook.close()
 
-    def _read_pptx(self, path: Path, file_info: TaskWorkspaceFileInfo) -> str | TaskWorkspaceReadResult:
-        try:
-            pptx = LazyImport.import_package("pptx", auto_install=False, install_name="python-pptx")
-        except ImportError:
-            return unsupported_read_result(
-                file_info=file_info,
-                handler_id=self.name,
-                code="task_workspace.file.pptx_dependency_missing",
-                message="PPTX text extraction requires optional dependency 'python-pptx'.",
-                dependency="python-pptx",
-            )
+    @staticmethod
+    def _pptx_units(pptx: Any, path: Path) -> list[tuple[str, str]]:
         presentation = pptx.Presentation(str(path))
-        chunks: list[str] = []
+        units: list[tuple[str, str]] = []
         for index, slide in enumerate(presentation.slides, start=1):
-            chunks.append(f"# Slide {index}")
+            chunks = [f"# Slide {index}"]
             for shape in slide.shapes:
                 text = getattr(shape, "text", "")
                 if text:
                     chunks.append(str(text))
-        return "\n".join(chunks)
+            units.append((f"slide {index}", "\n".join(chunks)))
+        return units
 
     async def write(
         self,
@@ -14,6 +14,7 @@ from agently.types.data import (
 )
 from agently.types.plugins import TaskWorkspaceFileIOHandler
 
+from .ExtractionCache import _TaskWorkspaceExtractionCache
 from .FileIO import (
     DefaultTextTaskWorkspaceFileIOHandler,
     HtmlExportTaskWorkspaceFileIOHandler,
@@ -30,12 +31,18 @@ from .FileIO import (
 class _TaskWorkspaceFileIORegistry:
     """TaskWorkspace-internal dispatch for pluggable file representations."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        extraction_cache_root: Path | None = None,
+        persist_extractions: bool = True,
+    ) -> None:
         self._handlers: dict[str, TaskWorkspaceFileIOHandler] = {}
+        extraction_cache = _TaskWorkspaceExtractionCache(extraction_cache_root, persist=persist_extractions)
         for handler in (
             DefaultTextTaskWorkspaceFileIOHandler(),
-            PdfTaskWorkspaceFileIOHandler(),
-            OfficeTaskWorkspaceFileIOHandler(),
+            PdfTaskWorkspaceFileIOHandler(extraction_cache),
+            OfficeTaskWorkspaceFileIOHandler(extraction_cache),
             ImageVLMTaskWorkspaceFileIOHandler(),
             HtmlExportTaskWorkspaceFileIOHandler(),
         ):
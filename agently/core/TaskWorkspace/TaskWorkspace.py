@@ -66,7 +66,11 @@ class TaskWorkspace:
             raise FileNotFoundError(str(self.root))
         self.mode = mode
         self.execution_id = str(execution_id or f"task_{uuid.uuid4().hex}")
-        self._file_io_registry = _TaskWorkspaceFileIORegistry()
+        self._file_io_registry = _TaskWorkspaceFileIORegistry(
+            extraction_cache_root=self.root / ".agently" / "extractions",
+            # A read-only workspace reuses stored extractions but never writes them.
+            persist_extractions=mode == "read_write",
+        )
         self._identity_catalog = TaskWorkspaceIdentityCatalog(
             self.root / ".agently",
             task_workspace_id=self.task_workspace_id,
@@ -333,6 +337,7 @@ class TaskWorkspace:
             extraction_method=str(result.get("extraction_method") or "none"),
             diagnostics=tuple(result.get("diagnostics") or ()),
             attachments=tuple(result.get("attachments") or ()),
+            source_units=tuple(result.get("source_units") or ()),
         )
 
     async def edit_file(
@@ -45,15 +45,9 @@ class SkillLibrary:
         self.plugin_manager = plugin_manager
         self._source_providers: dict[str, SkillSourceProvider] = {}
         self._library_owned_source_provider_ids: set[int] = set()
-        from agently.builtins.plugins.SkillSourceProvider import (
-            LocalPathSkillSourceProvider,
-        )
-
-        local_provider = LocalPathSkillSourceProvider(
-            cache_root=self.root / "source-cache"
-        )
-        self.register_source_provider(local_provider)
-        self._library_owned_source_provider_ids.add(id(local_provider))
+        # The library's own local source provider is created on first use, so
+        # constructing a library does not import the SkillSourceProvider plugins.
+        self._local_source_provider_pending = True
         self.install_source = default_stage_call_bridge.as_sync(self.async_install_source)
         self.install_pack_source = default_stage_call_bridge.as_sync(
             self.async_install_pack_source
@@ -64,6 +58,8 @@ class SkillLibrary:
 
         self.root = Path(root).expanduser().resolve()
         self.store = SkillPackageStore(self.root)
+        if self._local_source_provider_pending:
+            return self
         from agently.builtins.plugins.SkillSourceProvider import (
             LocalPathSkillSourceProvider,
         )
@@ -92,6 +88,7 @@ class SkillLibrary:
         *,
         replace: bool = True,
     ) -> "SkillLibrary":
+        self._ensure_local_source_provider()
         provider_id = str(getattr(provider, "provider_id", "")).strip()
         source_types = tuple(
             str(item).strip().lower()
@@ -110,6 +107,20 @@ class SkillLibrary:
             self._source_providers[source_type] = provider
         return self
 
+    def _ensure_local_source_provider(self) -> None:
+        if not self._local_source_provider_pending:
+            return
+        self._local_source_provider_pending = False
+        from agently.builtins.plugins.SkillSourceProvider import (
+            LocalPathSkillSourceProvider,
+        )
+
+        local_provider = LocalPathSkillSourceProvider(
+            cache_root=self.root / "source-cache"
+        )
+        self.register_source_provider(local_provider)
+        self._library_owned_source_provider_ids.add(id(local_provider))
+
     def _load_source_provider_plugins(self) -> None:
         if self.plugin_manager is None:
             return
@@ -134,6 +145,7 @@ class SkillLibrary:
         return "git"
 
     def _get_source_provider(self, request: SkillSourceRequest) -> SkillSourceProvider:
+        self._ensure_local_source_provider()
         source_type = self._infer_source_type(request)
         provider = self._source_providers.get(source_type)
         if provider is None:
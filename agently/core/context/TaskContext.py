@@ -28,9 +28,14 @@ from agently.types.data import (
     TaskContextEntrySnapshot,
     TaskContextSnapshot,
 )
-from agently.types.plugins import ContextSource, EmbeddingProvider
+from agently.types.plugins import ContextSource, EmbeddingCache, EmbeddingProvider
 
-from ._Index import _ContextIndex, _ContextIndexProfile, _ContextIndexQueryResult
+from ._Index import (
+    _PARTITION_CACHE,
+    _ContextIndex,
+    _ContextIndexProfile,
+    _ContextIndexQueryResult,
+)
 
 if TYPE_CHECKING:
     from .ContextReader import ContextReader
@@ -245,14 +250,21 @@ class TaskContext:
         *,
         embedding_provider: EmbeddingProvider | None = None,
         strategy: str = "structural",
+        embedding_cache: EmbeddingCache | None = None,
+        embedding_batch_size: int | None = None,
     ) -> None:
         """Configure the TaskContext-owned derived candidate index.
 
         The index only narrows and orders source-owned descriptors.  A
         consumer-bound ContextReader remains responsible for semantic
         selection, exact readback, and ContextPackage construction.
+        ``embedding_cache`` (for example ``SQLiteEmbeddingCache``) lets
+        partition rebuilds embed only descriptor texts it has not seen, in
+        calls of at most ``embedding_batch_size`` texts.
         """
 
+        if embedding_batch_size is not None and embedding_batch_size < 1:
+            raise ValueError("Context index embedding_batch_size must be positive.")
         normalized_strategy = str(strategy or "structural").strip().lower()
         if normalized_strategy not in {"structural", "lexical", "hybrid"}:
             raise ValueError(
@@ -266,8 +278,30 @@ class TaskContext:
                 ),
             ),
             embedding_provider=embedding_provider,
+            embedding_cache=embedding_cache,
+            embedding_batch_size=embedding_batch_size,
         )
 
+    @staticmethod
+    def configure_index_cache(
+        *,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        """Bound the process-wide cache of revisioned index partitions.
+
+        Partitions are shared by every TaskContext in the process and evicted
+        least-recently-used once either bound is exceeded.
+        """
+
+        _PARTITION_CACHE.configure(max_entries=max_entries, max_bytes=max_bytes)
+
+    @staticmethod
+    def index_cache_stats() -> dict[str, int]:
+        """Return entry, byte, hit, build, and eviction counters for monitoring."""
+
+        return _PARTITION_CACHE.stats()
+
     def _index_candidate_limit(self, max_blocks: int) -> int:
         """Return the reader-facing candidate window for this index profile."""
 
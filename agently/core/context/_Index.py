@@ -15,8 +15,11 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import importlib
 import math
 import re
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable, Mapping, Sequence
 from dataclasses import dataclass, replace
 from fnmatch import fnmatchcase
@@ -29,6 +32,12 @@ from agently.types.data import (
     ContextSourceDescriptor,
     ContextSourceDescriptorPage,
 )
+from agently.core.storage.Stores import (
+    embed_texts_cached,
+    embedding_identity,
+    embedding_text_digest,
+    observed_input_tokens,
+)
 from agently.types.plugins import ContextSource, ContextSourceChangeFeed
 
 
@@ -76,8 +85,159 @@ class _Partition:
     embedding_input_tokens: int | None = None
     embedding_input_chars: int = 0
     embedding_build_texts: int = 0
+    embedding_cache_hits: int = 0
+    embedding_cache_misses: int = 0
     sync_mode: str = "full"
     sync_fallback: str | None = None
+    search: "_PartitionSearchIndex | None" = None
+
+
+_TERM_PATTERN = re.compile(r"[\w.-]+")
+_NUMPY_UNRESOLVED = object()
+_numpy: Any = _NUMPY_UNRESOLVED
+
+
+def _load_numpy() -> Any:
+    """Return NumPy when installed; ranking falls back to pure Python otherwise."""
+    global _numpy
+    if _numpy is _NUMPY_UNRESOLVED:
+        try:
+            _numpy = importlib.import_module("numpy")
+        except ImportError:
+            _numpy = None
+    return _numpy
+
+
+def _descriptor_search_text(descriptor: ContextSourceDescriptor) -> str:
+    return descriptor.index_text or f"{descriptor.title}\n{descriptor.summary}"
+
+
+def _unit_vector(vector: Sequence[float]) -> tuple[float, ...]:
+    norm = math.sqrt(sum(value * value for value in vector))
+    if norm == 0:
+        return tuple(0.0 for _ in vector)
+    return tuple(value / norm for value in vector)
+
+
+class _PartitionSearchIndex:
+    """
+    Ranking structures derived once per immutable partition.
+
+    Vectors are normalized up front (a float32 matrix when NumPy is available)
+    so a query costs one matrix-vector product. Casefolded texts and the
+    token postings behind lexical scoring are built on first lexical use.
+    """
+
+    _TERM_CACHE_SIZE = 1024
+
+    def __init__(
+        self,
+        descriptors: tuple[ContextSourceDescriptor, ...],
+        vectors: tuple[tuple[float, ...], ...] | None,
+    ) -> None:
+        self.row_by_key = {
+            descriptor.descriptor_key: row for row, descriptor in enumerate(descriptors)
+        }
+        self._descriptors = descriptors
+        self._texts: tuple[str, ...] | None = None
+        self._postings: dict[str, list[int]] | None = None
+        self._term_rows: dict[str, frozenset[int]] = {}
+        self.matrix: Any = None
+        self.unit_vectors: tuple[tuple[float, ...], ...] | None = None
+        if vectors is None:
+            return
+        np = _load_numpy()
+        if np is not None and vectors and len({len(vector) for vector in vectors}) == 1:
+            matrix = np.asarray(vectors, dtype=np.float64)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            np.divide(matrix, norms, out=matrix, where=norms > 0)
+            self.matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+        else:
+            self.unit_vectors = tuple(_unit_vector(vector) for vector in vectors)
+
+    @property
+    def texts(self) -> tuple[str, ...]:
+        if self._texts is None:
+            self._texts = tuple(
+                _descriptor_search_text(descriptor).casefold()
+                for descriptor in self._descriptors
+            )
+        return self._texts
+
+    def _rows_containing(self, term: str) -> frozenset[int]:
+        # Query terms never span a `[\w.-]` boundary, so every occurrence of
+        # a term sits inside one indexed token of the descriptor text.
+        rows = self._term_rows.get(term)
+        if rows is not None:
+            return rows
+        if self._postings is None:
+            postings: dict[str, list[int]] = {}
+            for row, text in enumerate(self.texts):
+                for token in set(_TERM_PATTERN.findall(text)):
+                    postings.setdefault(token, []).append(row)
+            self._postings = postings
+        matched: set[int] = set()
+        for token, token_rows in self._postings.items():
+            if term in token:
+                matched.update(token_rows)
+        rows = frozenset(matched)
+        if len(self._term_rows) >= self._TERM_CACHE_SIZE:
+            self._term_rows.clear()
+        self._term_rows[term] = rows
+        return rows
+
+    def lexical_scores(self, query: str) -> dict[int, float]:
+        """Return term occurrence counts for rows with at least one hit."""
+        terms = frozenset(_TERM_PATTERN.findall(query.casefold()))
+        if not terms:
+            return {}
+        texts = self.texts
+        scores: dict[int, float] = {}
+        for term in terms:
+            for row in self._rows_containing(term):
+                scores[row] = scores.get(row, 0.0) + texts[row].count(term)
+        return scores
+
+    def literal_rows(self, query: str) -> frozenset[int]:
+        literal = str(query or "").strip().casefold()
+        if not literal:
+            return frozenset()
+        texts = self.texts
+        terms = _TERM_PATTERN.findall(literal)
+        if terms:
+            candidates = frozenset.intersection(
+                *(self._rows_containing(term) for term in terms)
+            )
+        else:
+            candidates = frozenset(range(len(texts)))
+        return frozenset(row for row in candidates if literal in texts[row])
+
+    def cosine_scores(self, query_vector: Sequence[float], rows: Sequence[int]) -> Any:
+        """Cosine similarity per row; a NumPy array when the matrix exists."""
+        if self.matrix is not None:
+            np = _load_numpy()
+            if len(query_vector) != self.matrix.shape[1]:
+                return np.zeros(len(rows), dtype=np.float64)
+            query = np.asarray(query_vector, dtype=np.float64)
+            norm = np.linalg.norm(query)
+            if norm == 0:
+                return np.zeros(len(rows), dtype=np.float64)
+            query = (query / norm).astype(np.float32)
+            if len(rows) * 2 < self.matrix.shape[0]:
+                scores = self.matrix[np.asarray(rows, dtype=np.intp)] @ query
+            else:
+                scores = (self.matrix @ query)[np.asarray(rows, dtype=np.intp)]
+            return scores.astype(np.float64)
+        assert self.unit_vectors is not None
+        query = _unit_vector(query_vector)
+        return [
+            (
+                sum(a * b for a, b in zip(self.unit_vectors[row], query))
+                if len(self.unit_vectors[row]) == len(query)
+                else 0.0
+            )
+            for row in rows
+        ]
 
 
 @dataclass(frozen=True)
@@ -95,13 +255,123 @@ class _ContextIndexQueryResult:
     diagnostics: Mapping[str, Any]
 
 
+_DESCRIPTOR_OVERHEAD_BYTES = 512
+_VECTOR_VALUE_BYTES = 32
+
+
+def _estimate_partition_bytes(partition: _Partition) -> int:
+    """Rough resident size of one partition, used only for cache accounting."""
+    size = 0
+    for descriptor in partition.descriptors:
+        # The search index keeps a casefolded copy of each index text.
+        size += _DESCRIPTOR_OVERHEAD_BYTES + 2 * len(_descriptor_search_text(descriptor))
+        size += len(descriptor.descriptor_key) + len(descriptor.source_ref)
+    if partition.vectors is not None:
+        size += _VECTOR_VALUE_BYTES * sum(len(vector) for vector in partition.vectors)
+    search = partition.search
+    if search is not None:
+        if search.matrix is not None:
+            size += int(search.matrix.nbytes)
+        elif search.unit_vectors is not None:
+            size += _VECTOR_VALUE_BYTES * sum(len(vector) for vector in search.unit_vectors)
+    return size
+
+
+def _compatibility_key(key: _PartitionKey) -> tuple[str, str, str, str]:
+    return (
+        key.source_id,
+        key.schema_version,
+        key.projection_profile,
+        key.embedding_identity,
+    )
+
+
 class _ContextIndexPartitionCache:
-    """Process-local immutable partition cache with one-flight construction."""
+    """
+    Process-local immutable partition cache with one-flight construction.
+
+    Entries are evicted least-recently-used once either `max_entries` or the
+    estimated `max_bytes` is exceeded; the newest entry is always kept. Only
+    the latest revision of each source/profile/embedding combination is
+    retained, since it is the base for the next delta sync.
+    """
 
-    def __init__(self) -> None:
-        self._partitions: dict[_PartitionKey, _Partition] = {}
+    def __init__(
+        self,
+        *,
+        max_entries: int = 256,
+        max_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        self._partitions: OrderedDict[_PartitionKey, tuple[_Partition, int]] = OrderedDict()
+        self._latest: dict[tuple[str, str, str, str], _PartitionKey] = {}
         self._inflight: dict[_PartitionKey, asyncio.Future[_Partition]] = {}
         self._lock = asyncio.Lock()
+        self._bytes = 0
+        self._hits = 0
+        self._builds = 0
+        self._evictions = 0
+        self._superseded = 0
+        self.configure(max_entries=max_entries, max_bytes=max_bytes)
+
+    def configure(
+        self,
+        *,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        if max_entries is not None:
+            if max_entries < 1:
+                raise ValueError("Context partition cache max_entries must be positive.")
+            self.max_entries = max_entries
+        if max_bytes is not None:
+            if max_bytes < 1:
+                raise ValueError("Context partition cache max_bytes must be positive.")
+            self.max_bytes = max_bytes
+        self._evict()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._partitions),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self._hits,
+            "builds": self._builds,
+            "evictions": self._evictions,
+            "superseded": self._superseded,
+        }
+
+    def _discard(self, key: _PartitionKey) -> None:
+        _partition, size = self._partitions.pop(key)
+        self._bytes -= size
+        compatibility_key = _compatibility_key(key)
+        if self._latest.get(compatibility_key) == key:
+            del self._latest[compatibility_key]
+
+    def _evict(self) -> None:
+        while len(self._partitions) > 1 and (
+            len(self._partitions) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            self._discard(next(iter(self._partitions)))
+            self._evictions += 1
+
+    def _store(self, key: _PartitionKey, partition: _Partition) -> _Partition:
+        cached = self._partitions.get(key)
+        if cached is not None:
+            self._partitions.move_to_end(key)
+            return cached[0]
+        compatibility_key = _compatibility_key(key)
+        superseded = self._latest.get(compatibility_key)
+        if superseded is not None and superseded in self._partitions:
+            self._discard(superseded)
+            self._superseded += 1
+        size = _estimate_partition_bytes(partition)
+        self._partitions[key] = (partition, size)
+        self._latest[compatibility_key] = key
+        self._bytes += size
+        self._builds += 1
+        self._evict()
+        return partition
 
     async def get_or_build(
         self,
@@ -111,7 +381,9 @@ class _ContextIndexPartitionCache:
         async with self._lock:
             cached = self._partitions.get(key)
             if cached is not None:
-                return cached, True
+                self._partitions.move_to_end(key)
+                self._hits += 1
+                return cached[0], True
             task = self._inflight.get(key)
             if task is None:
                 task = asyncio.ensure_future(build())
@@ -123,23 +395,14 @@ class _ContextIndexPartitionCache:
                 if self._inflight.get(key) is task:
                     self._inflight.pop(key, None)
         async with self._lock:
-            cached = self._partitions.setdefault(key, partition)
-        return cached, False
+            return self._store(key, partition), False
 
     async def find_compatible(self, key: _PartitionKey) -> _Partition | None:
         async with self._lock:
-            partitions = tuple(self._partitions.values())
-        for partition in reversed(partitions):
-            candidate = partition.key
-            if (
-                candidate.source_id == key.source_id
-                and candidate.source_revision != key.source_revision
-                and candidate.schema_version == key.schema_version
-                and candidate.projection_profile == key.projection_profile
-                and candidate.embedding_identity == key.embedding_identity
-            ):
-                return partition
-        return None
+            latest = self._latest.get(_compatibility_key(key))
+            if latest is None or latest.source_revision == key.source_revision:
+                return None
+            return self._partitions[latest][0]
 
 
 _PARTITION_CACHE = _ContextIndexPartitionCache()
@@ -293,32 +556,59 @@ class _ContextIndex:
         *,
         profile: _ContextIndexProfile | None = None,
         embedding_provider: Any = None,
+        embedding_cache: Any = None,
+        embedding_batch_size: int | None = None,
     ) -> None:
         self.profile = profile or _ContextIndexProfile()
         self.embedding_provider = embedding_provider
+        self.embedding_cache = embedding_cache
+        self.embedding_batch_size = embedding_batch_size
 
     @staticmethod
     def embedding_identity(embedding_provider: Any) -> str:
-        if embedding_provider is None:
-            return "none"
-        provider_id = str(
-            getattr(embedding_provider, "provider_id", None)
-            or getattr(embedding_provider, "name", None)
-            or f"{embedding_provider.__class__.__module__}."
-            f"{embedding_provider.__class__.__qualname__}"
+        return embedding_identity(embedding_provider)
+
+    async def _embed_descriptors(
+        self,
+        descriptors: Sequence[ContextSourceDescriptor],
+        *,
+        reusable: Mapping[str, tuple[float, ...]] | None = None,
+    ) -> tuple[tuple[tuple[float, ...], ...], dict[str, Any]]:
+        """
+        Embed descriptor texts, skipping any whose text digest already has a
+        vector in `reusable` (the previous partition) or the embedding cache.
+        """
+        reusable = reusable or {}
+        texts = [_descriptor_search_text(descriptor) for descriptor in descriptors]
+        digests = [embedding_text_digest(text) for text in texts]
+        missing = [text for text, digest in zip(texts, digests) if digest not in reusable]
+        fresh, stats = await embed_texts_cached(
+            self.embedding_provider,
+            missing,
+            cache=self.embedding_cache,
+            identity=self.embedding_identity(self.embedding_provider),
+            batch_size=self.embedding_batch_size,
+        )
+        fresh_vectors = iter(fresh)
+        vectors = tuple(
+            reusable[digest]
+            if digest in reusable
+            else tuple(float(value) for value in next(fresh_vectors))
+            for digest in digests
         )
-        model = str(getattr(embedding_provider, "model", None) or "default")
-        return f"{provider_id}:{model}"
+        if any(not vector for vector in vectors):
+            raise ValueError("embedding provider returned an empty vector")
+        stats["hits"] += len(texts) - len(missing)
+        return vectors, stats
 
     @staticmethod
-    def _observed_input_tokens(embedding_provider: Any) -> int | None:
-        usage = getattr(embedding_provider, "last_usage", None)
-        if not isinstance(usage, Mapping):
-            return None
-        value = usage.get("input_tokens")
-        if not isinstance(value, int) or isinstance(value, bool) or value < 0:
-            return None
-        return value
+    def _reusable_vectors(previous: _Partition | None) -> dict[str, tuple[float, ...]]:
+        if previous is None or previous.vectors is None:
+            return {}
+        return {
+            embedding_text_digest(_descriptor_search_text(descriptor)): vector
+            for descriptor, vector in zip(previous.descriptors, previous.vectors)
+        }
 
     def _partition_key(self, binding: ContextSourceBindingSnapshot) -> _PartitionKey:
         return _PartitionKey(
@@ -333,6 +623,8 @@ class _ContextIndex:
         self,
         source: ContextSource,
         binding: ContextSourceBindingSnapshot,
+        *,
+        previous: _Partition | None = None,
     ) -> _Partition:
         descriptors: list[ContextSourceDescriptor] = []
         descriptor_keys: set[str] = set()
@@ -369,49 +661,32 @@ class _ContextIndex:
             cursor = page.next_cursor
         vectors: tuple[tuple[float, ...], ...] | None = None
         vector_error: str | None = None
-        embedding_input_tokens: int | None = None
-        embedding_input_chars = 0
+        embedding_stats: dict[str, Any] = {}
         if self.profile.candidate_strategy == "hybrid":
             if self.embedding_provider is None:
                 vector_error = "embedding provider unavailable"
             elif descriptors:
-                texts = [
-                    descriptor.index_text
-                    or f"{descriptor.title}\n{descriptor.summary}"
-                    for descriptor in descriptors
-                ]
-                embedding_input_chars = sum(len(text) for text in texts)
                 try:
-                    raw_vectors = await self.embedding_provider.embed_texts(texts)
-                    if len(raw_vectors) != len(descriptors):
-                        raise ValueError(
-                            "embedding provider returned a different vector count"
-                        )
-                    vectors = tuple(
-                        tuple(float(value) for value in vector)
-                        for vector in raw_vectors
-                    )
-                    if any(not vector for vector in vectors):
-                        raise ValueError("embedding provider returned an empty vector")
-                    embedding_input_tokens = self._observed_input_tokens(
-                        self.embedding_provider
+                    vectors, embedding_stats = await self._embed_descriptors(
+                        descriptors,
+                        reusable=self._reusable_vectors(previous),
                     )
                 except Exception as error:
                     vectors = None
                     vector_error = f"{error.__class__.__name__}: {error}"
+        resolved_descriptors = tuple(descriptors)
         return _Partition(
             key=self._partition_key(binding),
-            descriptors=tuple(descriptors),
+            descriptors=resolved_descriptors,
             vectors=vectors,
             vector_error=vector_error,
-            embedding_input_tokens=embedding_input_tokens,
-            embedding_input_chars=embedding_input_chars,
-            embedding_build_texts=(
-                len(descriptors)
-                if self.profile.candidate_strategy == "hybrid" and descriptors
-                else 0
-            ),
+            embedding_input_tokens=embedding_stats.get("input_tokens"),
+            embedding_input_chars=embedding_stats.get("input_chars", 0),
+            embedding_build_texts=embedding_stats.get("embedded_texts", 0),
+            embedding_cache_hits=embedding_stats.get("hits", 0),
+            embedding_cache_misses=embedding_stats.get("misses", 0),
             sync_mode="full",
+            search=_PartitionSearchIndex(resolved_descriptors, vectors),
         )
 
     async def _build_or_sync_partition(
@@ -422,7 +697,7 @@ class _ContextIndex:
         key = self._partition_key(binding)
         previous = await _PARTITION_CACHE.find_compatible(key)
         if previous is None or not isinstance(source, ContextSourceChangeFeed):
-            return await self._build_partition(source, binding)
+            return await self._build_partition(source, binding, previous=previous)
         try:
             change_set = await source.async_changes(
                 from_revision=previous.key.source_revision,
@@ -441,7 +716,7 @@ class _ContextIndex:
             ):
                 raise ValueError("Context source change-set identity changed.")
         except Exception as error:
-            rebuilt = await self._build_partition(source, binding)
+            rebuilt = await self._build_partition(source, binding, previous=previous)
             return replace(
                 rebuilt,
                 sync_mode="full_after_delta_failure",
@@ -477,9 +752,7 @@ class _ContextIndex:
 
         vectors: tuple[tuple[float, ...], ...] | None = None
         vector_error: str | None = None
-        embedding_input_tokens: int | None = None
-        embedding_input_chars = 0
-        embedding_build_texts = 0
+        embedding_stats: dict[str, Any] = {}
         if self.profile.candidate_strategy == "hybrid":
             previous_vectors = (
                 {
@@ -513,30 +786,12 @@ class _ContextIndex:
             if self.embedding_provider is None:
                 vector_error = "embedding provider unavailable"
             elif changed:
-                texts = [
-                    descriptor.index_text
-                    or f"{descriptor.title}\n{descriptor.summary}"
-                    for descriptor in changed
-                ]
-                embedding_input_chars = sum(len(text) for text in texts)
-                embedding_build_texts = len(texts)
                 try:
-                    raw_vectors = await self.embedding_provider.embed_texts(texts)
-                    if len(raw_vectors) != len(changed):
-                        raise ValueError(
-                            "embedding provider returned a different vector count"
-                        )
+                    embedded, embedding_stats = await self._embed_descriptors(changed)
                     changed_vectors = {
-                        descriptor.descriptor_key: tuple(
-                            float(value) for value in vector
-                        )
-                        for descriptor, vector in zip(changed, raw_vectors)
+                        descriptor.descriptor_key: vector
+                        for descriptor, vector in zip(changed, embedded)
                     }
-                    if any(not vector for vector in changed_vectors.values()):
-                        raise ValueError("embedding provider returned an empty vector")
-                    embedding_input_tokens = self._observed_input_tokens(
-                        self.embedding_provider
-                    )
                 except Exception as error:
                     vector_error = f"{error.__class__.__name__}: {error}"
             if vector_error is None:
@@ -553,47 +808,62 @@ class _ContextIndex:
             descriptors=resolved_descriptors,
             vectors=vectors,
             vector_error=vector_error,
-            embedding_input_tokens=embedding_input_tokens,
-            embedding_input_chars=embedding_input_chars,
-            embedding_build_texts=embedding_build_texts,
+            embedding_input_tokens=embedding_stats.get("input_tokens"),
+            embedding_input_chars=embedding_stats.get("input_chars", 0),
+            embedding_build_texts=embedding_stats.get("embedded_texts", 0),
+            embedding_cache_hits=embedding_stats.get("hits", 0),
+            embedding_cache_misses=embedding_stats.get("misses", 0),
             sync_mode="delta",
+            search=_PartitionSearchIndex(resolved_descriptors, vectors),
         )
 
     @staticmethod
-    def _lexical_score(query: str, descriptor: ContextSourceDescriptor) -> float:
-        terms = frozenset(re.findall(r"[\w.-]+", query.casefold()))
-        if not terms:
-            return 0.0
-        text = (
-            descriptor.index_text
-            or f"{descriptor.title}\n{descriptor.summary}"
-        ).casefold()
-        return float(sum(text.count(term) for term in terms))
-
-    @staticmethod
-    def _literal_query_match(
-        query: str,
-        descriptor: ContextSourceDescriptor,
-    ) -> bool:
-        literal = str(query or "").strip().casefold()
-        if not literal:
-            return False
-        text = (
-            descriptor.index_text
-            or f"{descriptor.title}\n{descriptor.summary}"
-        ).casefold()
-        return literal in text
+    def _order_descriptors(
+        descriptors: tuple[ContextSourceDescriptor, ...],
+        sort_key: Callable[[int], tuple[Any, ...]],
+        *,
+        window: int | None,
+        anchor_refs: frozenset[str],
+        primary: Any = None,
+    ) -> tuple[ContextSourceDescriptor, ...]:
+        """
+        Order descriptors by `sort_key(position)`.
 
-    @staticmethod
-    def _cosine(left: Sequence[float], right: Sequence[float]) -> float:
-        if len(left) != len(right) or not left:
-            return 0.0
-        numerator = sum(a * b for a, b in zip(left, right))
-        left_norm = math.sqrt(sum(value * value for value in left))
-        right_norm = math.sqrt(sum(value * value for value in right))
-        if left_norm == 0 or right_norm == 0:
-            return 0.0
-        return numerator / (left_norm * right_norm)
+        With a `window`, only anchors and the best `window` optional
+        descriptors are sorted; the remaining optional descriptors follow in
+        partition order, which keeps paging and exhaustiveness unchanged.
+        `primary` is a NumPy array that orders positions like `sort_key`
+        (higher first, ties allowed) so `argpartition` can preselect them.
+        """
+        positions = range(len(descriptors))
+        if window is None or window >= len(descriptors):
+            return tuple(descriptors[position] for position in sorted(positions, key=sort_key))
+        anchors: list[int] = []
+        optional: list[int] = []
+        for position, descriptor in enumerate(descriptors):
+            if descriptor.required or descriptor.source_ref in anchor_refs:
+                anchors.append(position)
+            else:
+                optional.append(position)
+        if window >= len(optional):
+            return tuple(descriptors[position] for position in sorted(positions, key=sort_key))
+        if window == 0:
+            head: list[int] = []
+        elif primary is not None:
+            np = _load_numpy()
+            candidates = np.asarray(optional, dtype=np.intp)
+            values = primary[candidates]
+            kth = len(values) - window
+            threshold = values[np.argpartition(values, kth)[kth:]].min()
+            # Keep every tie at the threshold; the exact key decides among them.
+            tied = candidates[values >= threshold].tolist()
+            head = sorted(tied, key=sort_key)[:window]
+        else:
+            head = heapq.nsmallest(window, optional, key=sort_key)
+        selected = set(head)
+        ordered = sorted([*anchors, *head], key=sort_key)
+        ordered.extend(position for position in optional if position not in selected)
+        return tuple(descriptors[position] for position in ordered)
 
     async def _rank_descriptors(
         self,
@@ -601,6 +871,7 @@ class _ContextIndex:
         *,
         partition: _Partition,
         intent: ContextReadIntent,
+        window: int | None = None,
     ) -> tuple[
         tuple[ContextSourceDescriptor, ...],
         str,
@@ -614,28 +885,30 @@ class _ContextIndex:
             return (), requested, 0, None, 0, None
         if requested == "structural":
             return descriptors, "structural", 0, 0, 0, None
-        lexical_scores = {
-            descriptor.descriptor_key: self._lexical_score(intent.query, descriptor)
-            for descriptor in descriptors
-        }
-        literal_matches = {
-            descriptor.descriptor_key: self._literal_query_match(
-                intent.query,
-                descriptor,
+        search = partition.search or _PartitionSearchIndex(
+            partition.descriptors,
+            partition.vectors,
+        )
+        rows = [search.row_by_key[descriptor.descriptor_key] for descriptor in descriptors]
+        row_lexical = search.lexical_scores(intent.query)
+        row_literal = search.literal_rows(intent.query)
+        lexical_scores = [row_lexical.get(row, 0.0) for row in rows]
+        literal_matches = [int(row in row_literal) for row in rows]
+        anchor_refs = frozenset(intent.explicit_refs)
+
+        def lexical_key(position: int) -> tuple[Any, ...]:
+            return (
+                -lexical_scores[position],
+                -descriptors[position].priority,
+                descriptors[position].descriptor_key,
             )
-            for descriptor in descriptors
-        }
+
         if requested == "lexical":
-            ranked = tuple(
-                sorted(
-                    descriptors,
-                    key=lambda item: (
-                        -int(literal_matches[item.descriptor_key]),
-                        -lexical_scores[item.descriptor_key],
-                        -item.priority,
-                        item.descriptor_key,
-                    ),
-                )
+            ranked = self._order_descriptors(
+                descriptors,
+                lambda position: (-literal_matches[position], *lexical_key(position)),
+                window=window,
+                anchor_refs=anchor_refs,
             )
             return ranked, "lexical", 0, 0, 0, None
         vector_policy = str(intent.metadata.get("vector_policy") or "optional").strip()
@@ -645,15 +918,11 @@ class _ContextIndex:
                     "required vector Context recall is unavailable: "
                     + str(partition.vector_error or "unknown error")
                 )
-            ranked = tuple(
-                sorted(
-                    descriptors,
-                    key=lambda item: (
-                        -lexical_scores[item.descriptor_key],
-                        -item.priority,
-                        item.descriptor_key,
-                    ),
-                )
+            ranked = self._order_descriptors(
+                descriptors,
+                lexical_key,
+                window=window,
+                anchor_refs=anchor_refs,
             )
             return ranked, "lexical", 0, 0, 0, partition.vector_error
         if len(descriptors) == 1:
@@ -668,43 +937,57 @@ class _ContextIndex:
             if len(raw_query_vectors) != 1 or not raw_query_vectors[0]:
                 raise ValueError("embedding provider returned no query vector")
             query_vector = tuple(float(value) for value in raw_query_vectors[0])
-            query_tokens = self._observed_input_tokens(self.embedding_provider)
+            query_tokens = observed_input_tokens(self.embedding_provider)
         except Exception as error:
             if vector_policy == "required":
                 raise _RequiredVectorUnavailableError(
                     f"required vector Context recall is unavailable: {error}"
                 ) from error
-            ranked = tuple(
-                sorted(
-                    descriptors,
-                    key=lambda item: (
-                        -lexical_scores[item.descriptor_key],
-                        -item.priority,
-                        item.descriptor_key,
-                    ),
-                )
+            ranked = self._order_descriptors(
+                descriptors,
+                lexical_key,
+                window=window,
+                anchor_refs=anchor_refs,
             )
             return ranked, "lexical", 1, None, query_chars, str(error)
-        vector_by_key = {
-            descriptor.descriptor_key: vector
-            for descriptor, vector in zip(partition.descriptors, partition.vectors)
-        }
-        ranked = tuple(
-            sorted(
-                descriptors,
-                key=lambda item: (
-                    -int(literal_matches[item.descriptor_key]),
-                    -(
-                        self._cosine(query_vector, vector_by_key[item.descriptor_key])
-                        + min(1.0, lexical_scores[item.descriptor_key])
-                    ),
-                    -item.priority,
-                    item.descriptor_key,
-                ),
+        cosine_scores = search.cosine_scores(query_vector, rows)
+        primary: Any = None
+        if search.matrix is not None:
+            np = _load_numpy()
+            hybrid_array = cosine_scores + np.minimum(
+                np.asarray(lexical_scores, dtype=np.float64),
+                1.0,
             )
+            # Literal matches always outrank non-literal ones; the hybrid score
+            # stays below 10 so this folds both sort levels into one array.
+            primary = hybrid_array + 10.0 * np.asarray(literal_matches, dtype=np.float64)
+            hybrid_scores = hybrid_array.tolist()
+        else:
+            hybrid_scores = [
+                cosine + min(1.0, lexical)
+                for cosine, lexical in zip(cosine_scores, lexical_scores)
+            ]
+        ranked = self._order_descriptors(
+            descriptors,
+            lambda position: (
+                -literal_matches[position],
+                -hybrid_scores[position],
+                -descriptors[position].priority,
+                descriptors[position].descriptor_key,
+            ),
+            window=window,
+            anchor_refs=anchor_refs,
+            primary=primary,
         )
         return ranked, "hybrid", 1, query_tokens, query_chars, None
 
+    @staticmethod
+    def _ranking_window(offset: Any, limit: int) -> int | None:
+        # Pages never reach past `offset + limit` optional descriptors.
+        if not isinstance(offset, int) or isinstance(offset, bool) or offset < 0:
+            return None
+        return offset + limit
+
     async def async_query(
         self,
         *,
@@ -745,6 +1028,8 @@ class _ContextIndex:
         vector_errors: list[str] = []
         embedding_build_texts = 0
         embedding_build_chars = 0
+        embedding_cache_hits = 0
+        embedding_cache_misses = 0
         embedding_query_texts = 0
         embedding_query_chars = 0
         observed_token_parts: list[int] = []
@@ -775,6 +1060,8 @@ class _ContextIndex:
             if not cache_hit and self.profile.candidate_strategy == "hybrid":
                 embedding_build_texts += partition.embedding_build_texts
                 embedding_build_chars += partition.embedding_input_chars
+                embedding_cache_hits += partition.embedding_cache_hits
+                embedding_cache_misses += partition.embedding_cache_misses
                 if partition.embedding_input_tokens is None:
                     token_coverage_complete = False
                 else:
@@ -795,6 +1082,7 @@ class _ContextIndex:
                 authorized,
                 partition=partition,
                 intent=intent,
+                window=self._ranking_window(offsets.get(binding.binding_id, 0), limit),
             )
             effective_strategies.append(effective_strategy)
             embedding_query_texts += query_texts
@@ -870,6 +1158,8 @@ class _ContextIndex:
                 "source_failure_count": len(source_failures),
                 "embedding_build_texts": embedding_build_texts,
                 "embedding_build_chars": embedding_build_chars,
+                "embedding_cache_hits": embedding_cache_hits,
+                "embedding_cache_misses": embedding_cache_misses,
                 "embedding_query_texts": embedding_query_texts,
                 "embedding_query_chars": embedding_query_chars,
                 "embedding_input_tokens": (
@@ -19,7 +19,7 @@ from agently.utils import (
     Settings,
 )
 from agently.types.config import options_schema_registry, settings_schema_registry
-from agently.types.plugins import AgentlyPlugin, AgentlyPluginType
+from agently.types.plugins import AgentlyPlugin, AgentlyPluginType, LazyPlugin
 
 
 class PluginManager:
@@ -42,10 +42,14 @@ class PluginManager:
     def register(
         self,
         plugin_type: AgentlyPluginType,
-        plugin_class: Type[AgentlyPlugin],
+        plugin_class: Type[AgentlyPlugin] | LazyPlugin,
         *,
         activate: bool = True,
     ) -> "PluginManager":
+        """
+        Register a plugin class, or a `LazyPlugin` reference whose module is
+        imported on the first `get_plugin()` call.
+        """
         if plugin_type == "ToolManager":
             DeprecationWarnings.warn_deprecated_once(
                 "PluginManager.register.ToolManager",
@@ -53,7 +57,7 @@ class PluginManager:
                 "Use Action, ActionRuntime, ActionFlow, and ActionExecutor plugins instead.",
                 stacklevel=2,
             )
-        if hasattr(plugin_class, "_on_register"):
+        if not isinstance(plugin_class, LazyPlugin) and hasattr(plugin_class, "_on_register"):
             plugin_class._on_register()
         self.plugins.update(
             {
@@ -88,7 +92,7 @@ class PluginManager:
     def unregister(
         self,
         plugin_type: AgentlyPluginType,
-        plugin_class: type[AgentlyPlugin] | str,
+        plugin_class: type[AgentlyPlugin] | LazyPlugin | str,
     ):
         if plugin_type not in self.plugins:
             raise ValueError(f"Plugin type '{ plugin_type }' is not in plugin information.")
@@ -96,15 +100,17 @@ class PluginManager:
             if plugin_class not in self.plugins[plugin_type]:
                 raise ValueError(f"Plugin class '{ plugin_class }' is not in plugin information.")
             plugin_class_name = plugin_class
-            plugin_class = cast(type[AgentlyPlugin], self.plugins[plugin_type][plugin_class_name])
+            plugin_class = cast(type[AgentlyPlugin] | LazyPlugin, self.plugins[plugin_type][plugin_class_name])
         else:
             if plugin_class.name not in self.plugins[plugin_type]:
                 raise ValueError(f"Plugin class '{ plugin_class.name }' is not in plugin information.")
             plugin_class_name = plugin_class.name
-            plugin_class = cast(type[AgentlyPlugin], plugin_class)
+            plugin_class = cast(type[AgentlyPlugin] | LazyPlugin, self.plugins[plugin_type][plugin_class_name])
 
-        if hasattr(plugin_class, "_on_unregister"):
-            plugin_class._on_unregister()
+        # A lazy plugin that was never imported never ran `_on_register`.
+        loaded_class = plugin_class.load() if isinstance(plugin_class, LazyPlugin) and plugin_class.loaded else plugin_class
+        if not isinstance(loaded_class, LazyPlugin) and hasattr(loaded_class, "_on_unregister"):
+            loaded_class._on_unregister()
         schema_owner = f"{ plugin_type }:{ plugin_class.name }"
         for namespace in getattr(plugin_class, "SETTINGS_SCHEMAS", {}):
             if settings_schema_registry.owner(namespace) == schema_owner:
@@ -115,7 +121,10 @@ class PluginManager:
         del self.plugins[plugin_type][plugin_class_name]
 
     def get_plugin(self, plugin_type: AgentlyPluginType, plugin_name: str) -> AgentlyPlugin:
-        return self.plugins[plugin_type][plugin_name]
+        plugin = self.plugins[plugin_type][plugin_name]
+        if isinstance(plugin, LazyPlugin):
+            return plugin.load()
+        return plugin
 
     @overload
     def get_plugin_list(self, plugin_type: AgentlyPluginType) -> list[str]: ...
@@ -86,7 +86,8 @@ def image_file_to_data_url(file: str | os.PathLike[str]) -> str:
 
 def detect_image_mime_type(path: Path) -> str | None:
     try:
-        header = path.read_bytes()[:16]
+        with path.open("rb") as file:
+            header = file.read(16)
     except OSError:
         header = b""
 
@@ -112,6 +112,8 @@ class ModelRequestResult:
         self._validate_lock = asyncio.Lock()
         self._validate_handler_signature: tuple[int, ...] | None = None
         self._accepted_retry_result: ModelRequestResult | None = None
+        # (policy, key) of the response cache entry this result was served from or recorded to.
+        self._response_cache_entry: tuple[Any, str] | None = None
         self._data_flow = ModelRequestResultDataFlow(self)
         self.full_result_data = self._response_parser.full_result_data
         self._get_meta_sync = cast(Callable[[], dict[str, Any]], default_stage_call_bridge.as_sync(self.async_get_meta))
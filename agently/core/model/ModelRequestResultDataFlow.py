@@ -690,6 +690,11 @@ class ModelRequestResultDataFlow:
         from agently.core.model.Prompt import Prompt
 
         result = self._result
+        if result._response_cache_entry is not None:
+            from agently.base import response_cache
+
+            # The rejected response must not be replayed to the next identical request.
+            await response_cache.async_discard(*result._response_cache_entry)
         await self._apply_retry_backoff(retry_count)
         retry_prompt = result.prompt
         if output_correction:
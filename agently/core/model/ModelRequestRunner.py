@@ -13,16 +13,19 @@
 # limitations under the License.
 
 import asyncio
+import copy
 import inspect
 import json
 import time
 import uuid
 
+from dataclasses import dataclass
 from typing import Any, AsyncGenerator, Generator, Literal, Mapping, TYPE_CHECKING, cast, overload
 
 from agently.core.extension import ExtensionHandlers
 from agently.core.runtime import bind_runtime_context, get_current_agent_execution_context
-from agently.utils import Settings, DataFormatter
+from agently.utils import Settings, SettingsNamespace, DataFormatter
+from agently.utils.ModelPool import release_selected_api_key, reserve_selected_api_key, select_hedge_api_key
 
 from .Prompt import Prompt
 from .ModelRequestResult import DEFAULT_SPECIFIC_EVENTS, ModelRequestResult
@@ -37,6 +40,7 @@ if TYPE_CHECKING:
     from agently.types.data import (
         AgentlyModelResultMessage,
         AgentlyOriginalResultPayload,
+        AgentlyResultGenerator,
         AgentlySpecificResultMessage,
         InstantStreamingContentType,
         OutputValidateHandler,
@@ -46,6 +50,88 @@ if TYPE_CHECKING:
         StreamingData,
     )
     from agently.types.plugins import ModelRequester
+    from agently.utils.RequestHedger import RequestHedgePolicy
+    from agently.utils.ResponseCache import ResponseCacheEvents, ResponseCachePolicy
+
+
+@dataclass
+class _HedgeRequest:
+    """A duplicate provider request sent by hedging, with the slot and key it holds."""
+
+    stream: "AgentlyResultGenerator"
+    plugin_settings: SettingsNamespace
+    slot: Any
+    key_id: str | None
+    slot_entered: bool = True
+
+    async def release_slot(self) -> None:
+        if self.slot_entered:
+            self.slot_entered = False
+            await self.slot.__aexit__(None, None, None)
+
+    async def discard(self) -> None:
+        """Give back the slot and key of a hedge that was never raced."""
+        await self.stream.aclose()
+        await self.release_slot()
+        release_selected_api_key(self.plugin_settings)
+
+
+class _StreamPump:
+    """Run one broadcast stream in a task of its own, handing its items over one at a time.
+
+    A hedged request races two streams, and the loser must be cancellable
+    while it is still waiting for the provider. ``first_item`` resolves on the
+    first content event, or when the stream ends without one; status and
+    error events before it (such as a failed attempt) are kept for ``items()``
+    but do not count as an answer.
+    """
+
+    def __init__(self, stream: "AgentlyResultGenerator"):
+        self.queue: asyncio.Queue[tuple[bool, Any]] = asyncio.Queue(maxsize=1)
+        self.stopped = False
+        self.answered = False
+        self.leading: list[Any] = []
+        self.first_item: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self.task = asyncio.ensure_future(self._run(stream))
+
+    async def _run(self, stream: "AgentlyResultGenerator") -> None:
+        end: tuple[bool, Any] = (False, None)
+        try:
+            async for item in stream:
+                # A stream may answer its cancellation with one more event; nobody reads it.
+                if self.stopped:
+                    return
+                if self.first_item.done():
+                    await self.queue.put((True, item))
+                    continue
+                self.leading.append(item)
+                if item[0] not in ("status", "error"):
+                    self.answered = True
+                    self.first_item.set_result(None)
+        except Exception as error:
+            end = (False, error)
+        finally:
+            await stream.aclose()
+        if not self.stopped:
+            if not self.first_item.done():
+                self.first_item.set_result(None)
+            await self.queue.put(end)
+
+    async def items(self) -> "AgentlyResultGenerator":
+        for item in self.leading:
+            yield item
+        has_item, item = await self.queue.get()
+        while has_item:
+            yield item
+            has_item, item = await self.queue.get()
+        if isinstance(item, BaseException):
+            raise item
+
+    async def stop(self) -> None:
+        self.stopped = True
+        self.first_item.cancel()
+        self.task.cancel()
+        await asyncio.wait([self.task])
 
 
 class ModelRequestRunner:
@@ -168,7 +254,7 @@ class ModelRequestRunner:
     ) -> dict[str, Any]:
         """Add ModelRequest lineage to a reserved stream status and observe it."""
 
-        from agently.base import async_emit_runtime
+        from agently.base import async_emit_runtime, event_center
         from agently.core.runtime.RuntimeEvents import attach_model_request_telemetry
 
         payload = {
@@ -195,16 +281,17 @@ class ModelRequestRunner:
             run=self.model_run_context,
             source="ModelRequest",
         )
-        await async_emit_runtime(
-            {
-                "event_type": "model.status",
-                "source": "ModelRequest",
-                "level": level,
-                "message": f"Model request attempt #{ attempt_index } { status }.{ suffix }",
-                "payload": dict(payload),
-                "run": self.model_run_context,
-            }
-        )
+        if event_center.is_observed("model.status", level):
+            await async_emit_runtime(
+                {
+                    "event_type": "model.status",
+                    "source": "ModelRequest",
+                    "level": level,
+                    "message": f"Model request attempt #{ attempt_index } { status }.{ suffix }",
+                    "payload": dict(payload),
+                    "run": self.model_run_context,
+                }
+            )
         return payload
 
     @staticmethod
@@ -597,17 +684,214 @@ class ModelRequestRunner:
             .replace("\\\"", "\""),
         }
 
-    def _scheduler_slot(self, provider: str):
+    def _scheduler_slot(self, provider: str, **slot_options: Any):
         """Return the model request scheduling slot for this provider.
 
         Reads ``model_request.scheduler`` config into the process scheduler and
         returns its ``slot(provider)`` context manager. When no concurrency or
         rate limit is configured the slot is a no-op and behavior is unchanged.
+        Requests of one execution share a fair-queuing tenant unless
+        ``model_request.scheduler.tenant`` names another. ``slot_options``
+        override the options read from settings.
         """
         from agently.base import request_scheduler
 
         request_scheduler.configure_from_settings(provider, self.settings)
-        return request_scheduler.slot(provider)
+        default_tenant = self.request_run_context.execution_id or self.request_run_context.root_run_id
+        return request_scheduler.slot(
+            provider,
+            **{
+                **request_scheduler.slot_options_from_settings(self.settings, default_tenant=default_tenant),
+                **slot_options,
+            },
+        )
+
+    def _hedge_scope(self, provider: str) -> str:
+        return f"{ provider }:{ self.settings.get(f'plugins.ModelRequester.{ provider }.model', '') }"
+
+    async def _start_hedge_request(
+        self,
+        provider_name: str,
+        model_requester_class: type["ModelRequester"],
+    ) -> _HedgeRequest | None:
+        """Send the duplicate request of a hedge, or return None when no scheduler slot is free.
+
+        The hedge takes a scheduler slot of its own but never queues for one
+        (``max_wait=0`` sheds it instead), and uses another key of the
+        request's API key pool when there is one.
+        """
+        from agently.utils.RequestScheduler import RequestShedError
+
+        slot = self._scheduler_slot(provider_name, max_wait=0.0)
+        try:
+            await slot.__aenter__()
+        except RequestShedError:
+            return None
+        hedge_settings = Settings(name="ModelRequestHedgeSettings", parent=self.settings)
+        plugin_settings = SettingsNamespace(hedge_settings, f"plugins.ModelRequester.{ provider_name }")
+        try:
+            key_id = select_hedge_api_key(plugin_settings)
+            model_requester = model_requester_class(self.prompt, hedge_settings)
+            request_data = model_requester.generate_request_data()
+            stream = model_requester.broadcast_response(model_requester.request_model(request_data))
+        except BaseException:
+            release_selected_api_key(plugin_settings)
+            await slot.__aexit__(None, None, None)
+            raise
+        return _HedgeRequest(stream=stream, plugin_settings=plugin_settings, slot=slot, key_id=key_id)
+
+    async def _hedge_response(
+        self,
+        primary: "AgentlyResultGenerator",
+        policy: "RequestHedgePolicy",
+        *,
+        provider_name: str,
+        provider_settings: SettingsNamespace,
+        model_requester_class: type["ModelRequester"],
+    ) -> "AgentlyResultGenerator":
+        """Race ``primary`` against a hedged duplicate once its first event is late.
+
+        Whichever stream yields content first is broadcast; the other is
+        cancelled before any of its events are seen, so tool calls are never
+        duplicated. A stream that fails before any content leaves the race to
+        the other one, and a hedge still waiting for its slot when the primary
+        answers is dropped.
+        """
+        from agently.base import async_emit_runtime, event_center, request_hedger
+
+        scope = self._hedge_scope(provider_name)
+        delay = request_hedger.hedge_delay(policy, scope)
+        started_at = time.perf_counter()
+        pumps = {"primary": _StreamPump(primary)}
+        hedge: _HedgeRequest | None = None
+        skipped = False
+        try:
+            if delay is not None:
+                await asyncio.wait([pumps["primary"].first_item], timeout=delay)
+                if not pumps["primary"].first_item.done():
+                    # The primary is not paused while the hedge gets its slot.
+                    starting = asyncio.ensure_future(self._start_hedge_request(provider_name, model_requester_class))
+                    await asyncio.wait([starting, pumps["primary"].first_item], return_when=asyncio.FIRST_COMPLETED)
+                    if starting.done():
+                        hedge = starting.result()
+                        if hedge is not None:
+                            pumps["hedge"] = _StreamPump(hedge.stream)
+                    else:
+                        starting.cancel()
+                        await asyncio.wait([starting])
+                        if not starting.cancelled() and starting.exception() is None:
+                            late_hedge = starting.result()
+                            if late_hedge is not None:
+                                await late_hedge.discard()
+                    skipped = hedge is None
+            racing = dict(pumps)
+            # The primary keeps the request on a tie, and when no stream answers at all.
+            winner = "primary"
+            while racing:
+                await asyncio.wait([pump.first_item for pump in racing.values()], return_when=asyncio.FIRST_COMPLETED)
+                answered = [name for name, pump in racing.items() if pump.answered]
+                if answered:
+                    winner = answered[0]
+                    break
+                racing = {name: pump for name, pump in racing.items() if not pump.first_item.done()}
+            first_event_seconds = time.perf_counter() - started_at
+            if hedge is not None:
+                # One request goes on from here, so the pair gives one scheduler slot back at once.
+                await hedge.release_slot()
+                loser = "hedge" if winner == "primary" else "primary"
+                await pumps.pop(loser).stop()
+                release_selected_api_key(hedge.plugin_settings if loser == "hedge" else provider_settings)
+            # When the hedge wins this is a lower bound of the primary's own wait, which is what a p95 needs.
+            request_hedger.observe_first_event(policy, scope, first_event_seconds)
+            request_hedger.record_request(scope, hedged=hedge is not None, hedge_won=winner == "hedge", skipped=skipped)
+            if hedge is not None and event_center.is_observed("model.request_hedged"):
+                await async_emit_runtime(
+                    {
+                        "event_type": "model.request_hedged",
+                        "source": "ModelRequest",
+                        "message": (
+                            f"Hedged model request attempt #{ self.attempt_index }; the { winner } answered first."
+                        ),
+                        "payload": {
+                            "agent_name": self.agent_name,
+                            "response_id": self.id,
+                            "attempt_index": self.attempt_index,
+                            "model_run_id": self.model_run_context.run_id,
+                            "provider_family": provider_name,
+                            "hedge_delay": delay,
+                            "hedge_key_id": hedge.key_id,
+                            "winner": winner,
+                            "first_event_seconds": first_event_seconds,
+                        },
+                        "run": self.model_run_context,
+                    }
+                )
+            async for item in pumps[winner].items():
+                yield item
+        finally:
+            for pump in pumps.values():
+                await pump.stop()
+            if hedge is not None:
+                await hedge.release_slot()
+                release_selected_api_key(hedge.plugin_settings)
+
+    async def _lookup_response_cache(
+        self,
+        provider: str,
+        request_payload: Mapping[str, Any],
+    ) -> tuple["ResponseCachePolicy | None", str | None, "ResponseCacheEvents | None"]:
+        """Resolve the response cache policy, key and recorded events for this request.
+
+        Returns ``(None, None, None)`` when ``model_request.cache`` is off for
+        this request or its sampling is not deterministic. Output-validation
+        retries (``attempt_index`` > 1) follow a rejected response, so they drop
+        the cached entry and reach the provider again; the rejected entry itself
+        is dropped by the data flow before it retries.
+        """
+        from agently.base import response_cache
+
+        policy = response_cache.policy_from_settings(self.settings)
+        request_detail = request_payload.get("request")
+        if policy is None or not isinstance(request_detail, Mapping):
+            return None, None, None
+        request_options = request_detail.get("request_options")
+        if not response_cache.is_cacheable(policy, request_options if isinstance(request_options, Mapping) else {}):
+            return None, None, None
+        key = response_cache.key_for(provider, request_detail)
+        self.result._response_cache_entry = (policy, key)
+        if self.attempt_index > 1:
+            await response_cache.async_discard(policy, key)
+            return policy, key, None
+        return policy, key, await response_cache.async_get(policy, key)
+
+    @staticmethod
+    async def _replay_response(events: "ResponseCacheEvents") -> "AgentlyResultGenerator":
+        for event, data in events:
+            yield event, data
+            await asyncio.sleep(0)
+
+    @staticmethod
+    async def _record_response(
+        broadcast_generator: "AgentlyResultGenerator",
+        policy: "ResponseCachePolicy",
+        key: str,
+    ) -> "AgentlyResultGenerator":
+        """Pass the broadcast through and store it once it completes cleanly."""
+        from agently.base import response_cache
+
+        events: "ResponseCacheEvents" = []
+        cacheable = True
+        async for event, data in broadcast_generator:
+            if event == "error" or (
+                event == "status" and isinstance(data, Mapping) and data.get("status") != "completed"
+            ):
+                cacheable = False
+                events.clear()
+            if cacheable:
+                events.append((event, copy.deepcopy(data)))
+            yield event, data
+        if cacheable and events:
+            await response_cache.async_set(policy, key, events)
 
     def _build_full_provider_request_data(self, request_data: Any) -> dict[str, Any]:
         data = DataFormatter.to_str_key_dict(
@@ -624,7 +908,7 @@ class ModelRequestRunner:
         return data
 
     async def _get_response_generator(self) -> AsyncGenerator["AgentlyModelResultMessage", None]:
-        from agently.base import async_emit_runtime
+        from agently.base import async_emit_runtime, event_center, request_hedger
         from agently.core.runtime.RuntimeEvents import attach_model_request_telemetry
 
         with bind_runtime_context(
@@ -634,26 +918,27 @@ class ModelRequestRunner:
             agent_execution_run_context=self.agent_execution_run_context,
             settings=self.settings,
         ):
-            await async_emit_runtime(
-                {
-                    "event_type": "request.started",
-                    "source": "ModelRequest",
-                    "message": f"Starting request for agent '{ self.agent_name }'.",
-                    "payload": {
-                        "agent_name": self.agent_name,
-                        "response_id": self.id,
-                        "attempt_index": self.attempt_index,
-                    },
-                    "run": self.request_run_context,
-                }
-            )
+            if event_center.is_observed("request.started"):
+                await async_emit_runtime(
+                    {
+                        "event_type": "request.started",
+                        "source": "ModelRequest",
+                        "message": f"Starting request for agent '{ self.agent_name }'.",
+                        "payload": {
+                            "agent_name": self.agent_name,
+                            "response_id": self.id,
+                            "attempt_index": self.attempt_index,
+                        },
+                        "run": self.request_run_context,
+                    }
+                )
             provider_name = str(self.settings.get("plugins.ModelRequester.activate", ""))
+            provider_settings = SettingsNamespace(self.settings, f"plugins.ModelRequester.{ provider_name }")
             scheduler_slot = self._scheduler_slot(provider_name)
             scheduler_slot_entered = False
+            api_key_reserved = False
             terminal_status: str | None = None
             try:
-                await scheduler_slot.__aenter__()
-                scheduler_slot_entered = True
                 ModelRequester = cast(
                     type["ModelRequester"],
                     self.plugin_manager.get_plugin(
@@ -668,44 +953,46 @@ class ModelRequestRunner:
                     elif inspect.isfunction(prefix):
                         prefix(self.prompt, self.settings)
                 self.model_run_context.meta["_model_request_started_at"] = time.perf_counter()
-                request_started_payload = {
-                    "agent_name": self.agent_name,
-                    "response_id": self.id,
-                    "request_run_id": self.request_run_context.run_id,
-                    "model_run_id": self.model_run_context.run_id,
-                    "attempt_index": self.attempt_index,
-                    "provider_family": provider_name,
-                }
-                attach_model_request_telemetry(
-                    request_started_payload,
-                    event_kind="model.request_started",
-                    run=self.model_run_context,
-                    source="ModelRequest",
-                )
-                await async_emit_runtime(
-                    {
-                        "event_type": "model.request_started",
-                        "source": "ModelRequest",
-                        "message": f"Starting model request attempt #{ self.attempt_index } for agent '{ self.agent_name }'.",
-                        "payload": request_started_payload,
-                        "run": self.model_run_context,
-                    }
-                )
-                prompt_payload = self._build_prompt_payload()
-                await async_emit_runtime(
-                    {
-                        "event_type": "prompt.built",
-                        "source": "ModelRequest",
-                        "message": f"Prompt built for model request attempt #{ self.attempt_index }.",
-                        "payload": {
-                            "agent_name": self.agent_name,
-                            "response_id": self.id,
-                            "attempt_index": self.attempt_index,
-                            **prompt_payload,
-                        },
-                        "run": self.model_run_context,
+                if event_center.is_observed("model.request_started"):
+                    request_started_payload = {
+                        "agent_name": self.agent_name,
+                        "response_id": self.id,
+                        "request_run_id": self.request_run_context.run_id,
+                        "model_run_id": self.model_run_context.run_id,
+                        "attempt_index": self.attempt_index,
+                        "provider_family": provider_name,
                     }
-                )
+                    attach_model_request_telemetry(
+                        request_started_payload,
+                        event_kind="model.request_started",
+                        run=self.model_run_context,
+                        source="ModelRequest",
+                    )
+                    await async_emit_runtime(
+                        {
+                            "event_type": "model.request_started",
+                            "source": "ModelRequest",
+                            "message": f"Starting model request attempt #{ self.attempt_index } for agent '{ self.agent_name }'.",
+                            "payload": request_started_payload,
+                            "run": self.model_run_context,
+                        }
+                    )
+                if event_center.is_observed("prompt.built"):
+                    prompt_payload = self._build_prompt_payload()
+                    await async_emit_runtime(
+                        {
+                            "event_type": "prompt.built",
+                            "source": "ModelRequest",
+                            "message": f"Prompt built for model request attempt #{ self.attempt_index }.",
+                            "payload": {
+                                "agent_name": self.agent_name,
+                                "response_id": self.id,
+                                "attempt_index": self.attempt_index,
+                                **prompt_payload,
+                            },
+                            "run": self.model_run_context,
+                        }
+                    )
                 model_requester = ModelRequester(self.prompt, self.settings)
                 request_data = model_requester.generate_request_data()
                 request_payload = self._build_request_payload(request_data)
@@ -713,31 +1000,32 @@ class ModelRequestRunner:
                 if isinstance(request_text, str):
                     self.model_run_context.meta[_MODEL_REQUEST_ESTIMATED_INPUT_CHARS_META] = len(request_text)
                     self.model_run_context.meta[_MODEL_REQUEST_ESTIMATED_INPUT_SOURCE_META] = "request_text"
-                model_requesting_payload = {
-                    "agent_name": self.agent_name,
-                    "response_id": self.id,
-                    "attempt_index": self.attempt_index,
-                    "request_run_id": self.request_run_context.run_id,
-                    "model_run_id": self.model_run_context.run_id,
-                    "provider_family": provider_name,
-                    "liveness": self._provider_liveness_snapshot(provider_name),
-                    **request_payload,
-                }
-                attach_model_request_telemetry(
-                    model_requesting_payload,
-                    event_kind="model.requesting",
-                    run=self.model_run_context,
-                    source="ModelRequest",
-                )
-                await async_emit_runtime(
-                    {
-                        "event_type": "model.requesting",
-                        "source": "ModelRequest",
-                        "message": f"Sending model request for agent '{ self.agent_name }'.",
-                        "payload": model_requesting_payload,
-                        "run": self.model_run_context,
+                if event_center.is_observed("model.requesting"):
+                    model_requesting_payload = {
+                        "agent_name": self.agent_name,
+                        "response_id": self.id,
+                        "attempt_index": self.attempt_index,
+                        "request_run_id": self.request_run_context.run_id,
+                        "model_run_id": self.model_run_context.run_id,
+                        "provider_family": provider_name,
+                        "liveness": self._provider_liveness_snapshot(provider_name),
+                        **request_payload,
                     }
-                )
+                    attach_model_request_telemetry(
+                        model_requesting_payload,
+                        event_kind="model.requesting",
+                        run=self.model_run_context,
+                        source="ModelRequest",
+                    )
+                    await async_emit_runtime(
+                        {
+                            "event_type": "model.requesting",
+                            "source": "ModelRequest",
+                            "message": f"Sending model request for agent '{ self.agent_name }'.",
+                            "payload": model_requesting_payload,
+                            "run": self.model_run_context,
+                        }
+                    )
                 consume_model_request = getattr(
                     get_current_agent_execution_context(),
                     "consume_model_request",
@@ -748,52 +1036,77 @@ class ModelRequestRunner:
                         response_id=self.id,
                         run_id=self.model_run_context.run_id,
                     )
-                build_request_handlers = getattr(model_requester, "build_request_handlers", None)
-                if callable(build_request_handlers):
-                    from agently.core.model.AttemptRunner import AttemptRunner, is_core_attempt_runner_entrypoint
-                    from agently.types.data import AttemptHandlers, AttemptObservation, AttemptState
-
-                    if is_core_attempt_runner_entrypoint(getattr(model_requester, "request_model", None)):
-                        handlers = cast(AttemptHandlers, build_request_handlers(request_data))
-                        full_request_data = self._build_full_provider_request_data(request_data)
-
-                        async def observe_attempt(observation: AttemptObservation, state: AttemptState) -> None:
-                            if handlers.on_observation is not None:
-                                result = handlers.on_observation(observation, state)
-                                if inspect.isawaitable(result):
-                                    await result
-                            if observation.kind == "error_yielded":
-                                from agently.core.runtime.RuntimeEvents import async_emit_model_requester_error
-
-                                await async_emit_model_requester_error(
-                                    observation.data.get("error"),
-                                    source=str(getattr(model_requester, "name", ModelRequester.name)),
-                                    request_data=full_request_data,
-                                    payload={
-                                        "agent_name": self.agent_name,
-                                        "response_id": self.id,
-                                        "attempt_index": self.attempt_index,
-                                        "request_run_id": self.request_run_context.run_id,
-                                        "model_run_id": self.model_run_context.run_id,
-                                        "provider_family": provider_name,
-                                        "request_url": getattr(request_data, "request_url", None),
-                                    },
-                                    run=self.model_run_context,
+                cache_policy, cache_key, cached_events = await self._lookup_response_cache(
+                    provider_name, request_payload
+                )
+                if cached_events is not None:
+                    # A replayed response never reaches the provider, so it takes no slot and no API key.
+                    broadcast_generator = self._replay_response(cached_events)
+                else:
+                    # The API key chosen from a pool counts as in flight until this request ends.
+                    reserve_selected_api_key(provider_settings)
+                    api_key_reserved = True
+                    await scheduler_slot.__aenter__()
+                    scheduler_slot_entered = True
+                    # Time spent queued for the slot is not part of the model's latency.
+                    self.model_run_context.meta["_model_request_started_at"] = time.perf_counter()
+                    build_request_handlers = getattr(model_requester, "build_request_handlers", None)
+                    if callable(build_request_handlers):
+                        from agently.core.model.AttemptRunner import AttemptRunner, is_core_attempt_runner_entrypoint
+                        from agently.types.data import AttemptHandlers, AttemptObservation, AttemptState
+
+                        if is_core_attempt_runner_entrypoint(getattr(model_requester, "request_model", None)):
+                            handlers = cast(AttemptHandlers, build_request_handlers(request_data))
+                            full_request_data = self._build_full_provider_request_data(request_data)
+
+                            async def observe_attempt(observation: AttemptObservation, state: AttemptState) -> None:
+                                if handlers.on_observation is not None:
+                                    result = handlers.on_observation(observation, state)
+                                    if inspect.isawaitable(result):
+                                        await result
+                                if observation.kind == "error_yielded":
+                                    from agently.core.runtime.RuntimeEvents import async_emit_model_requester_error
+
+                                    await async_emit_model_requester_error(
+                                        observation.data.get("error"),
+                                        source=str(getattr(model_requester, "name", ModelRequester.name)),
+                                        request_data=full_request_data,
+                                        payload={
+                                            "agent_name": self.agent_name,
+                                            "response_id": self.id,
+                                            "attempt_index": self.attempt_index,
+                                            "request_run_id": self.request_run_context.run_id,
+                                            "model_run_id": self.model_run_context.run_id,
+                                            "provider_family": provider_name,
+                                            "request_url": getattr(request_data, "request_url", None),
+                                        },
+                                        run=self.model_run_context,
+                                    )
+
+                            response_generator = AttemptRunner(
+                                AttemptHandlers(
+                                    execute=handlers.execute,
+                                    handle_error=handlers.handle_error,
+                                    on_observation=observe_attempt,
+                                    is_output_started=handlers.is_output_started,
                                 )
-
-                        response_generator = AttemptRunner(
-                            AttemptHandlers(
-                                execute=handlers.execute,
-                                handle_error=handlers.handle_error,
-                                on_observation=observe_attempt,
-                                is_output_started=handlers.is_output_started,
-                            )
-                        ).run_stream()
+                            ).run_stream()
+                        else:
+                            response_generator = model_requester.request_model(request_data)
                     else:
                         response_generator = model_requester.request_model(request_data)
-                else:
-                    response_generator = model_requester.request_model(request_data)
-                broadcast_generator = model_requester.broadcast_response(response_generator)
+                    broadcast_generator = model_requester.broadcast_response(response_generator)
+                    hedge_policy = request_hedger.policy_from_settings(self.settings)
+                    if hedge_policy is not None:
+                        broadcast_generator = self._hedge_response(
+                            broadcast_generator,
+                            hedge_policy,
+                            provider_name=provider_name,
+                            provider_settings=provider_settings,
+                            model_requester_class=ModelRequester,
+                        )
+                    if cache_policy is not None and cache_key is not None:
+                        broadcast_generator = self._record_response(broadcast_generator, cache_policy, cache_key)
                 broadcast_prefixes = self.extension_handlers.get("broadcast_prefixes", [])
                 broadcast_suffixes = self.extension_handlers.get("broadcast_suffixes", {})
                 for prefix in broadcast_prefixes:
@@ -870,19 +1183,20 @@ class ModelRequestRunner:
                             )
                             if result is not None:
                                 yield result
-                await async_emit_runtime(
-                    {
-                        "event_type": "request.completed",
-                        "source": "ModelRequest",
-                        "message": f"Request completed for agent '{ self.agent_name }'.",
-                        "payload": {
-                            "agent_name": self.agent_name,
-                            "response_id": self.id,
-                            "attempt_index": self.attempt_index,
-                        },
-                        "run": self.request_run_context,
-                    }
-                )
+                if event_center.is_observed("request.completed"):
+                    await async_emit_runtime(
+                        {
+                            "event_type": "request.completed",
+                            "source": "ModelRequest",
+                            "message": f"Request completed for agent '{ self.agent_name }'.",
+                            "payload": {
+                                "agent_name": self.agent_name,
+                                "response_id": self.id,
+                                "attempt_index": self.attempt_index,
+                            },
+                            "run": self.request_run_context,
+                        }
+                    )
             except BaseException as error:
                 if isinstance(error, (GeneratorExit, SystemExit)):
                     raise
@@ -962,3 +1276,5 @@ class ModelRequestRunner:
             finally:
                 if scheduler_slot_entered:
                     await scheduler_slot.__aexit__(None, None, None)
+                if api_key_reserved:
+                    release_selected_api_key(provider_settings)
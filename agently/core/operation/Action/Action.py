@@ -114,6 +114,28 @@ class _DeprecatedActionManagerProxy:
         return getattr(self._action, item)
 
 
+class _DeferredActionExecutor:
+    """Creates an ActionExecutor plugin on the first call instead of at registration.
+
+    Used for actions every Action instance registers, so importing Agently does
+    not load the ActionExecutor plugins.
+    """
+
+    sandboxed = False
+
+    def __init__(self, action: "Action", plugin_name: str, *, kind: str, **kwargs: Any):
+        self._action = action
+        self._plugin_name = plugin_name
+        self._kwargs = kwargs
+        self._executor: Any = None
+        self.kind = kind
+
+    async def execute(self, **kwargs: Any) -> Any:
+        if self._executor is None:
+            self._executor = self._action._create_executor(self._plugin_name, **self._kwargs)
+        return await self._executor.execute(**kwargs)
+
+
 class Action:
     ACTION_RESULT_QUOTE_NOTICE = (
         "NOTICE: MUST QUOTE KEY INFO OR MARK SOURCE (PREFER URL INCLUDED) FROM {action_results} "
@@ -190,6 +212,12 @@ class Action:
                 },
             ),
             func=self.async_read_action_artifact,
+            executor=_DeferredActionExecutor(
+                self,
+                "LocalFunctionActionExecutor",
+                kind="function",
+                func=self.async_read_action_artifact,
+            ),
             side_effect_level="read",
             expose_to_model=False,
             meta={
@@ -16,7 +16,6 @@
 import uuid
 import copy
 import json
-import asyncio
 import hashlib
 import yaml
 from pathlib import Path
@@ -25,6 +24,7 @@ from asyncio import Event, Semaphore
 from collections.abc import Mapping
 from typing import Any, Literal, TYPE_CHECKING, Sequence, cast
 from ._async_utils import gather_cancel_on_error
+from ._for_each_runtime import create_for_each_collector, create_for_each_sender
 
 if TYPE_CHECKING:
     from agently.types.trigger_flow import (
@@ -40,7 +40,6 @@ if TYPE_CHECKING:
 
 from agently.types.data import EMPTY
 from agently.types.trigger_flow.runtime_keys import AGGREGATION_SCOPE_META_KEY
-from agently.utils import StateDataNamespace
 from .Chunk import TriggerFlowChunk
 from .Execution import TriggerFlowExecution
 from .Definition import (
@@ -801,60 +800,13 @@ class TriggerFlowBlueprint:
         if end_signal is None:
             group_id = operator.get("group_id") or str(operator["id"]).removeprefix("for_each-split-")
             end_signal = self.make_signal("event", f"ForEach-{ group_id }-End", role="continuation")
-        concurrency = operator["options"].get("concurrency")
-
-        async def send_items(data):
-            data.layer_in()
-            for_each_instance_id = data.layer_mark
-            assert for_each_instance_id is not None
-            send_tasks = []
-
-            def prepare_item(item):
-                data.layer_in()
-                item_id = data.layer_mark
-                assert item_id is not None
-                layer_marks = data._layer_marks.copy()
-                data._system_runtime_data.set(f"for_each_results.{ for_each_instance_id }.{ item_id }", EMPTY)
-                data.layer_out()
-                return layer_marks, item
-
-            async def emit_item(item, layer_marks):
-                if concurrency is None or concurrency <= 0:
-                    await data.async_emit(
-                        emit_signal["trigger_event"],
-                        item,
-                        layer_marks,
-                    )
-                else:
-                    semaphore_key = f"for_each_semaphores.{ operator['id'] }"
-                    semaphore = data._system_runtime_data.get(semaphore_key, inherit=False)
-                    if not isinstance(semaphore, asyncio.Semaphore):
-                        semaphore = asyncio.Semaphore(concurrency)
-                        data._system_runtime_data.set(semaphore_key, semaphore)
-                    async with semaphore:
-                        await data.async_emit(
-                            emit_signal["trigger_event"],
-                            item,
-                            layer_marks,
-                        )
-
-            if not isinstance(data.value, str) and isinstance(data.value, Sequence):
-                items = list(data.value)
-                if not items:
-                    data.layer_out()
-                    await data.async_emit(
-                        end_signal["trigger_event"],
-                        [],
-                        data._layer_marks.copy(),
-                    )
-                    return
-                for item in items:
-                    layer_marks, item_value = prepare_item(item)
-                    send_tasks.append(emit_item(item_value, layer_marks))
-                await gather_cancel_on_error(*send_tasks)
-            else:
-                layer_marks, item_value = prepare_item(data.value)
-                await emit_item(item_value, layer_marks)
+        send_items = create_for_each_sender(
+            item_trigger=emit_signal["trigger_event"],
+            end_trigger=end_signal["trigger_event"],
+            concurrency=operator["options"].get("concurrency"),
+            semaphore_key=f"for_each_semaphores.{ operator['id'] }",
+            collect_mode=lambda: operator["options"].get("collect_mode", "list"),
+        )
 
         for signal in operator["listen_signals"]:
             self.add_handler(signal["trigger_type"], signal["trigger_event"], send_items, id=operator["id"])
@@ -862,24 +814,10 @@ class TriggerFlowBlueprint:
     def _compile_for_each_collect_operator(self, operator: dict[str, Any]):
         emit_signal = operator["emit_signals"][0]
 
-        async def collect_results(data):
-            for_each_instance_id = data.upper_layer_mark
-            item_id = data.layer_mark
-            assert for_each_instance_id is not None and item_id is not None
-            for_each_results = StateDataNamespace(data._system_runtime_data, "for_each_results")
-            if for_each_instance_id in for_each_results and item_id in for_each_results[for_each_instance_id]:
-                for_each_results.set(f"{ for_each_instance_id }.{ item_id }", data.value)
-                for value in for_each_results.get(for_each_instance_id, {}).values():
-                    if value is EMPTY:
-                        return
-                data.layer_out()
-                data.layer_out()
-                await data.async_emit(
-                    emit_signal["trigger_event"],
-                    list(for_each_results[for_each_instance_id].values()),
-                    data._layer_marks.copy(),
-                )
-                for_each_results.delete(for_each_instance_id)
+        collect_results = create_for_each_collector(
+            end_trigger=emit_signal["trigger_event"],
+            mode=operator.get("options", {}).get("mode", "list"),
+        )
 
         for signal in operator["listen_signals"]:
             self.add_handler(signal["trigger_type"], signal["trigger_event"], collect_results, id=operator["id"])
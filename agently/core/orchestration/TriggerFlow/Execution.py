@@ -76,7 +76,7 @@ from .Control import (
     TRIGGER_FLOW_LIFECYCLE_SEALED,
 )
 from .Signal import TriggerFlowSignal, TriggerFlowSignalType
-from .SignalNet import TriggerFlowSignalNet
+from .SignalNet import DEFAULT_SIGNAL_ATTEMPT_KEEP_TERMINAL, TriggerFlowSignalNet
 from .ExecutionState import INTERVENTIONS_STATE_KEY, TriggerFlowInterventionMode
 from .ExecutionResult import TriggerFlowExecutionResult
 from .ExecutionInterrupts import TriggerFlowExecutionInterrupts
@@ -177,6 +177,7 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
         )
         self._close_lock = asyncio.Lock()
         self._sub_flow_control_lock = asyncio.Lock()
+        self._incremental_snapshot_lock = asyncio.Lock()
         self._live_sub_flow_executions: dict[str, "TriggerFlowExecution[Any, Any, Any]"] = {}
         self._live_sub_flow_tasks: dict[str, asyncio.Task[Any]] = {}
         self._live_sub_flow_signal_tasks: dict[str, set[asyncio.Task[Any]]] = {}
@@ -223,6 +224,7 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
             "project_terminal_signal_attempts": True,
         }
         self._snapshot_retention_policy: SnapshotRetentionPolicy | None = None
+        self._incremental_snapshot_policy: dict[str, Any] = {"enabled": False, "full_snapshot_interval": 32}
         self._load_policy: dict[str, Any] = {}
         self._heartbeat_at: float | None = None
         self._lease_until: float | None = self._created_at + lease_ttl if lease_ttl is not None else None
@@ -293,6 +295,8 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
         self.set_compaction_policy = self._set_compaction_policy
         self.set_snapshot_projection_policy = self._set_snapshot_projection_policy
         self.set_snapshot_retention_policy = self._set_snapshot_retention_policy
+        self.set_incremental_snapshot_policy = self._set_incremental_snapshot_policy
+        self.set_signal_attempt_retention_policy = self._set_signal_attempt_retention_policy
 
         # Runtime Stream
         self.put_into_stream = default_stage_call_bridge.as_sync(self.async_put_into_stream)
@@ -1349,6 +1353,8 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
     ):
         from agently.base import async_emit_runtime
 
+        if not self._is_runtime_event_observed(event_type, level, persist=persist):
+            return
         event_data: dict[str, Any] = {
             "event_type": event_type,
             "source": "TriggerFlowExecution",
@@ -1384,6 +1390,18 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
         if persistence_error is not None:
             raise persistence_error
 
+    def _is_runtime_event_observed(self, event_type: str, level: str = "INFO", *, persist: bool = True) -> bool:
+        """Whether a runtime event would be persisted or reach any EventCenter hook.
+
+        Hot paths check this before building payloads so that unobserved
+        events cost nothing beyond the check.
+        """
+        if persist and self._runtime_event_store is not None:
+            return True
+        from agently.base import event_center
+
+        return event_center.is_observed(event_type, level)
+
     async def _emit_runtime_definition_event(self):
         if self._runtime_definition_emitted:
             return
@@ -1490,6 +1508,8 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
     ):
         from agently.base import async_emit_runtime
 
+        if not self._is_runtime_event_observed(event_type, level):
+            return
         operator_kind = str(operator.get("kind", "chunk"))
         operator_name = str(operator.get("name") or operator_kind)
         base_payload = {
@@ -2310,6 +2330,39 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
         self._bump_state_version()
         return self
 
+    def _set_signal_attempt_retention_policy(
+        self,
+        *,
+        keep_terminal: int | None = DEFAULT_SIGNAL_ATTEMPT_KEEP_TERMINAL,
+    ) -> "TriggerFlowExecution[InputT, StreamT, ResultT]":
+        if keep_terminal is not None and (
+            isinstance(keep_terminal, bool) or not isinstance(keep_terminal, int) or keep_terminal < 0
+        ):
+            raise ValueError("signal attempt retention keep_terminal must be a non-negative integer or None.")
+        self._signal_net.set_attempt_retention(keep_terminal)
+        self._bump_state_version()
+        return self
+
+    def _set_incremental_snapshot_policy(
+        self,
+        *,
+        enabled: bool = True,
+        full_snapshot_interval: int = 32,
+    ) -> "TriggerFlowExecution[InputT, StreamT, ResultT]":
+        if (
+            isinstance(full_snapshot_interval, bool)
+            or not isinstance(full_snapshot_interval, int)
+            or full_snapshot_interval < 1
+        ):
+            raise ValueError("incremental snapshot full_snapshot_interval must be a positive integer.")
+        self._incremental_snapshot_policy = {
+            "enabled": bool(enabled),
+            "full_snapshot_interval": full_snapshot_interval,
+        }
+        if not enabled:
+            self._persistence.commit_incremental_save(None)
+        return self
+
     def _normalize_snapshot_retention_policy(
         self,
         policy: Any,
@@ -2893,7 +2946,10 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
             snapshot_store=resolved_snapshot_store,
             run_id=resolved_run_id,
         )
-        state = self.save(require_idle=require_idle)
+        incremental = bool(self._incremental_snapshot_policy["enabled"]) and self._provider_features(
+            resolved_snapshot_store
+        ).get("supports_snapshot_deltas", False)
+        state = None if incremental else self.save(require_idle=require_idle)
         resolved_step_id = step_id or f"state:{ self._state_version }"
         put_snapshot = resolved_snapshot_store.put_snapshot
         put_kwargs = self._filter_callable_kwargs(
@@ -2913,11 +2969,32 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
                 "TriggerFlow snapshot_store must accept retention=... when an "
                 "execution snapshot retention override is configured."
             )
-        return await put_snapshot(
-            resolved_run_id,
-            state,
-            **put_kwargs,
-        )
+        if state is not None:
+            return await put_snapshot(
+                resolved_run_id,
+                state,
+                **put_kwargs,
+            )
+        # Each delta names the record before it, so incremental saves are stored one at a time.
+        async with self._incremental_snapshot_lock:
+            state, incremental_base = self._persistence.prepare_incremental_save(
+                resolved_snapshot_store,
+                resolved_run_id,
+                full_snapshot_interval=self._incremental_snapshot_policy["full_snapshot_interval"],
+                require_idle=require_idle,
+            )
+            try:
+                result = await put_snapshot(
+                    resolved_run_id,
+                    state,
+                    **put_kwargs,
+                )
+            except BaseException:
+                # The store may not hold the record, so the next save starts a new chain.
+                self._persistence.commit_incremental_save(None)
+                raise
+            self._persistence.commit_incremental_save(incremental_base)
+            return result
 
     async def async_prune_recovery_snapshots(
         self,
@@ -3169,12 +3246,13 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
         self._mark_activity()
         await self._resume_interrupts_for_signal(signal)
         self._remember_signal(signal)
-        await self._emit_runtime_event(
-            "triggerflow.signal",
-            level="DEBUG",
-            message=f"Dispatch signal '{ signal.trigger_event }'.",
-            payload=signal.to_debug_dict(),
-        )
+        if self._is_runtime_event_observed("triggerflow.signal", "DEBUG"):
+            await self._emit_runtime_event(
+                "triggerflow.signal",
+                level="DEBUG",
+                message=f"Dispatch signal '{ signal.trigger_event }'.",
+                payload=signal.to_debug_dict(),
+            )
         tasks = []
         signal_handlers = list(self._signal_net.iter_handlers(signal, self._handlers))
 
@@ -3182,18 +3260,19 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
             for handler_id, handler in signal_handlers:
                 operator = self._get_handler_operator(handler_id)
                 chunk_run_context = self._create_chunk_run_context(operator, signal) if operator is not None else None
-                await self._emit_runtime_event(
-                    "triggerflow.handler_dispatch",
-                    level="DEBUG",
-                    message=f"Dispatch handler '{ handler_id }' for signal '{ signal.trigger_event }'.",
-                    payload={
-                        "event": signal.trigger_event,
-                        "type": signal.trigger_type,
-                        "handler": handler_id,
-                        "signal_id": signal.id,
-                        "node_id": operator.get("id") if operator is not None else None,
-                    },
-                )
+                if self._is_runtime_event_observed("triggerflow.handler_dispatch", "DEBUG"):
+                    await self._emit_runtime_event(
+                        "triggerflow.handler_dispatch",
+                        level="DEBUG",
+                        message=f"Dispatch handler '{ handler_id }' for signal '{ signal.trigger_event }'.",
+                        payload={
+                            "event": signal.trigger_event,
+                            "type": signal.trigger_type,
+                            "handler": handler_id,
+                            "signal_id": signal.id,
+                            "node_id": operator.get("id") if operator is not None else None,
+                        },
+                    )
                 await self._async_apply_auto_interventions(operator, signal)
 
                 async def run_handler(
@@ -3207,7 +3286,11 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
                     self._active_handler_count += 1
 
                     async def execute_handler():
-                        if bound_operator is not None and bound_chunk_run_context is not None:
+                        if (
+                            bound_operator is not None
+                            and bound_chunk_run_context is not None
+                            and self._is_runtime_event_observed("chunk.started")
+                        ):
                             await self._emit_chunk_runtime_event(
                                 "chunk.started",
                                 bound_chunk_run_context,
@@ -3238,7 +3321,11 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
                                 raise
                             if isinstance(error, asyncio.CancelledError):
                                 raise
-                            if bound_operator is not None and bound_chunk_run_context is not None:
+                            if (
+                                bound_operator is not None
+                                and bound_chunk_run_context is not None
+                                and self._is_runtime_event_observed("chunk.failed", "ERROR")
+                            ):
                                 await self._emit_chunk_runtime_event(
                                     "chunk.failed",
                                     bound_chunk_run_context,
@@ -3270,7 +3357,11 @@ class TriggerFlowExecution(Generic[InputT, StreamT, ResultT]):
                                 self._concurrency_permit_held.reset(token)
                                 self._concurrency_semaphore.release()
 
-                        if bound_operator is not None and bound_chunk_run_context is not None:
+                        if (
+                            bound_operator is not None
+                            and bound_chunk_run_context is not None
+                            and self._is_runtime_event_observed("chunk.completed")
+                        ):
                             await self._emit_chunk_runtime_event(
                                 "chunk.completed",
                                 bound_chunk_run_context,
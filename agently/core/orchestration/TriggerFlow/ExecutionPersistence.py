@@ -20,6 +20,7 @@ import inspect
 import json
 import time
 import uuid
+from dataclasses import dataclass
 from json import JSONDecodeError
 from pathlib import Path
 from typing import Any, TYPE_CHECKING, cast
@@ -29,6 +30,8 @@ import yaml
 from agently.types.data import ExecutionResourceRequirement
 from agently.types.data import EMPTY, RunContext
 from agently.types.trigger_flow.contract import TriggerFlowExecutionLoadReport
+from agently.utils import StateData
+from agently.utils.SnapshotDelta import build_snapshot_delta, is_snapshot_delta
 from agently.types.trigger_flow.runtime_keys import (
     DURABLE_SYSTEM_STATE_KEYS,
     TRIGGER_FLOW_EXECUTION_SNAPSHOT_KIND,
@@ -56,9 +59,24 @@ if TYPE_CHECKING:
     from .Execution import TriggerFlowExecution
 
 
+@dataclass
+class _IncrementalSnapshotBase:
+    """Last committed incremental save: the state deltas are built against."""
+
+    snapshot_store: Any
+    run_id: str
+    base_snapshot_id: str
+    sequence: int
+    state: dict[str, Any]
+    runtime_version: int
+    flow_version: int
+    signal_net_revision: int
+
+
 class TriggerFlowExecutionPersistence:
     def __init__(self, execution: "TriggerFlowExecution[Any, Any, Any]"):
         self._execution = execution
+        self._incremental_base: _IncrementalSnapshotBase | None = None
 
     def save(
         self,
@@ -66,6 +84,176 @@ class TriggerFlowExecutionPersistence:
         *,
         encoding: str | None = "utf-8",
         require_idle: bool = False,
+    ):
+        state = self._build_state(require_idle=require_idle)
+        if path is None:
+            return state
+
+        target = Path(path)
+        suffix = target.suffix.lower()
+        if suffix in {".yaml", ".yml"}:
+            content = yaml.safe_dump(
+                state,
+                indent=2,
+                allow_unicode=True,
+                sort_keys=False,
+            )
+        else:
+            content = json.dumps(
+                state,
+                indent=2,
+                ensure_ascii=False,
+            )
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content, encoding=encoding)
+        return state
+
+    def prepare_incremental_save(
+        self,
+        snapshot_store: Any,
+        run_id: str,
+        *,
+        full_snapshot_interval: int,
+        require_idle: bool = False,
+    ) -> tuple[dict[str, Any], "_IncrementalSnapshotBase | None"]:
+        """Build the record for the next incremental save and the base it leaves.
+
+        Returns a full snapshot when there is no base for this store and run, the
+        chain reached ``full_snapshot_interval`` deltas, a data layer was reset
+        or replaced, or the snapshot projection applies. Otherwise returns a
+        delta against the last committed state. Call ``commit_incremental_save``
+        with the returned base once the store accepted the record.
+        """
+        execution = self._execution
+        runtime_version = execution._runtime_data.version
+        flow_version = execution._trigger_flow._flow_data.version
+        signal_net_revision = execution._signal_net._revision
+        base = self._incremental_base
+        runtime_changes = flow_changes = None
+        if base is not None and base.snapshot_store is snapshot_store and base.run_id == run_id:
+            runtime_changes = execution._runtime_data.changed_keys(base.runtime_version)
+            flow_changes = execution._trigger_flow._flow_data.changed_keys(base.flow_version)
+        projection_applies = bool(execution._snapshot_projection_policy.get("enabled")) and execution.is_idle()
+        if (
+            base is None
+            or runtime_changes is None
+            or flow_changes is None
+            or base.sequence >= full_snapshot_interval
+            or projection_applies
+        ):
+            state = self._build_state(require_idle=require_idle)
+            if projection_applies:
+                # Projected sections differ from live state, so the next save starts a new chain.
+                return state, None
+            return state, _IncrementalSnapshotBase(
+                snapshot_store=snapshot_store,
+                run_id=run_id,
+                base_snapshot_id=state["snapshot_id"],
+                sequence=0,
+                state=state,
+                runtime_version=runtime_version,
+                flow_version=flow_version,
+                signal_net_revision=signal_net_revision,
+            )
+
+        previous = base.state
+        set_paths: list[tuple[list[str], Any]] = []
+        delete_paths: list[list[str]] = []
+        runtime_data = self._apply_changed_keys(
+            "runtime_data",
+            execution._runtime_data,
+            previous["runtime_data"],
+            runtime_changes,
+            set_paths,
+            delete_paths,
+        )
+        flow_data = self._apply_changed_keys(
+            "flow_data",
+            execution._trigger_flow._flow_data,
+            previous["flow_data"],
+            flow_changes,
+            set_paths,
+            delete_paths,
+        )
+        signal_net_changed = signal_net_revision != base.signal_net_revision
+        if signal_net_changed:
+            signal_net = execution._signal_net.to_snapshot()
+        else:
+            signal_net = {
+                **previous["signal_net"],
+                "accepted_signal_ids": sorted(execution._accepted_signal_ids),
+            }
+        state = self._build_state(
+            require_idle=require_idle,
+            runtime_data=runtime_data,
+            flow_data=flow_data,
+            signal_net=signal_net,
+        )
+        for section, value in state.items():
+            if section in {"snapshot_id", "runtime_data", "flow_data"}:
+                continue
+            if section == "signal_net" and not signal_net_changed:
+                if value["accepted_signal_ids"] != previous["signal_net"].get("accepted_signal_ids"):
+                    set_paths.append((["signal_net", "accepted_signal_ids"], value["accepted_signal_ids"]))
+                continue
+            if section not in previous or previous[section] != value:
+                set_paths.append(([section], value))
+        delete_paths.extend([section] for section in previous if section not in state)
+        delta = build_snapshot_delta(
+            snapshot_id=state["snapshot_id"],
+            previous_snapshot_id=previous["snapshot_id"],
+            base_snapshot_id=base.base_snapshot_id,
+            sequence=base.sequence + 1,
+            set_paths=set_paths,
+            delete_paths=delete_paths,
+            state_version=execution._state_version,
+        )
+        return delta, _IncrementalSnapshotBase(
+            snapshot_store=snapshot_store,
+            run_id=run_id,
+            base_snapshot_id=base.base_snapshot_id,
+            sequence=base.sequence + 1,
+            state=state,
+            runtime_version=runtime_version,
+            flow_version=flow_version,
+            signal_net_revision=signal_net_revision,
+        )
+
+    def commit_incremental_save(self, base: "_IncrementalSnapshotBase | None"):
+        self._incremental_base = base
+
+    def _apply_changed_keys(
+        self,
+        section: str,
+        state_data: StateData,
+        previous: dict[str, Any],
+        changed_keys: set[Any],
+        set_paths: list[tuple[list[str], Any]],
+        delete_paths: list[list[str]],
+    ):
+        if not changed_keys:
+            return previous
+        current = dict(previous)
+        for key in changed_keys:
+            name = str(key)
+            value = state_data.get(key, EMPTY, inherit=False)
+            if value is EMPTY:
+                if name in current:
+                    del current[name]
+                    delete_paths.append([section, name])
+                continue
+            # Round-trip each value the same way dump("json") does for the whole layer.
+            current[name] = json.loads(json.dumps(state_data._get_serializable_data(value)))
+            set_paths.append(([section, name], current[name]))
+        return current
+
+    def _build_state(
+        self,
+        *,
+        require_idle: bool,
+        runtime_data: dict[str, Any] | None = None,
+        flow_data: dict[str, Any] | None = None,
+        signal_net: dict[str, Any] | None = None,
     ):
         execution = self._execution
         if require_idle and not execution.is_idle():
@@ -79,8 +267,12 @@ class TriggerFlowExecutionPersistence:
         durable_system_state = self._collect_durable_system_state()
         interrupts = execution._to_serializable_value(execution._get_interrupts())
         run_context = execution.run_context.model_dump(mode="json")
-        runtime_data = json.loads(execution._runtime_data.dump("json"))
-        flow_data = json.loads(execution._trigger_flow._flow_data.dump("json"))
+        snapshot_runtime_data: dict[str, Any] = (
+            runtime_data if runtime_data is not None else json.loads(execution._runtime_data.dump("json"))
+        )
+        snapshot_flow_data: dict[str, Any] = (
+            flow_data if flow_data is not None else json.loads(execution._trigger_flow._flow_data.dump("json"))
+        )
         intervention = {
             "mode": execution._intervention_mode,
             "policy": execution._intervention_policy_name,
@@ -93,7 +285,8 @@ class TriggerFlowExecutionPersistence:
             "ready": result_ready,
             "value": execution._to_serializable_value(result) if result_ready else None,
         }
-        signal_net = execution._signal_net.to_snapshot()
+        if signal_net is None:
+            signal_net = execution._signal_net.to_snapshot()
         interrupts, signal_net, snapshot_projection = TriggerFlowSnapshotProjector(
             execution._serializable_snapshot_projection_policy()
         ).project(
@@ -121,8 +314,8 @@ class TriggerFlowExecutionPersistence:
             saved_at=saved_at,
             durable_system_state=durable_system_state,
             run_context=run_context,
-            runtime_data=runtime_data,
-            flow_data=flow_data,
+            runtime_data=snapshot_runtime_data,
+            flow_data=snapshot_flow_data,
             interrupts=interrupts,
             intervention=intervention,
             sub_flow_frames=sub_flow_frames,
@@ -163,26 +356,6 @@ class TriggerFlowExecutionPersistence:
             "result": result_state,
             }
         )
-        if path is None:
-            return state
-
-        target = Path(path)
-        suffix = target.suffix.lower()
-        if suffix in {".yaml", ".yml"}:
-            content = yaml.safe_dump(
-                state,
-                indent=2,
-                allow_unicode=True,
-                sort_keys=False,
-            )
-        else:
-            content = json.dumps(
-                state,
-                indent=2,
-                ensure_ascii=False,
-            )
-        target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_text(content, encoding=encoding)
         return state
 
     def _collect_durable_system_state(self):
@@ -396,6 +569,7 @@ class TriggerFlowExecutionPersistence:
         execution = self._execution
         state = self._load_state_content(state, encoding=encoding)
         self._validate_state_sections(state)
+        self._incremental_base = None
         snapshot_state = state
         self._raise_for_snapshot_contract(snapshot_state)
         active_sub_flow_frame_ids = sorted(
@@ -1934,6 +2108,11 @@ class TriggerFlowExecutionPersistence:
         return state
 
     def _validate_state_sections(self, state: dict[str, Any]):
+        if is_snapshot_delta(state):
+            raise ValueError(
+                "Can not load a TriggerFlow snapshot delta record directly; load the materialized "
+                "state returned by snapshot_store.get_snapshot(run_id) instead."
+            )
         snapshot_state = state
         runtime_data = snapshot_state.get("runtime_data", {})
         if not isinstance(runtime_data, dict):
@@ -155,15 +155,16 @@ class TriggerFlowExecutionRuntimeIO:
             stream_item = execution._trigger_flow._contract.validate_stream_item(stream_item)
         await execution._runtime_stream_transport.publish(stream_item)
         execution._mark_activity()
-        await execution._emit_runtime_event(
-            "triggerflow.stream_item_emitted",
-            message=f"TriggerFlow execution '{ execution.id }' emitted a stream item.",
-            payload={
-                "item": execution._to_serializable_value(stream_item),
-                "item_type": type(stream_item).__name__,
-                "origin_chunk": _origin_chunk or execution._get_origin_chunk_payload(),
-            },
-        )
+        if execution._is_runtime_event_observed("triggerflow.stream_item_emitted"):
+            await execution._emit_runtime_event(
+                "triggerflow.stream_item_emitted",
+                message=f"TriggerFlow execution '{ execution.id }' emitted a stream item.",
+                payload={
+                    "item": execution._to_serializable_value(stream_item),
+                    "item_type": type(stream_item).__name__,
+                    "origin_chunk": _origin_chunk or execution._get_origin_chunk_payload(),
+                },
+            )
 
     async def async_stop_stream(self):
         execution = self._execution
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import copy
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any, Literal, TYPE_CHECKING
 
@@ -29,6 +30,9 @@ if TYPE_CHECKING:
 
 SignalAttemptStatus = Literal["accepted", "running", "completed", "failed", "interrupted"]
 
+TERMINAL_SIGNAL_ATTEMPT_STATUSES = frozenset({"completed", "failed", "interrupted"})
+DEFAULT_SIGNAL_ATTEMPT_KEEP_TERMINAL = 1024
+
 
 @dataclass
 class TriggerFlowDynamicSignalBinding:
@@ -57,6 +61,10 @@ class TriggerFlowSignalNet:
     The blueprint keeps static flow definition. SignalNet records execution-time
     dynamic event bindings and signal attempts so save/load can reconstruct the
     runtime overlay without mutating the definition fingerprint.
+
+    Accepted and running attempts are always kept. Only the latest
+    ``keep_terminal`` terminal attempts stay in the ledger; older ones are
+    rolled into per-status counters.
     """
 
     def __init__(self, execution: "TriggerFlowExecution[Any, Any, Any]"):
@@ -68,6 +76,11 @@ class TriggerFlowSignalNet:
         }
         self._handler_registry: dict[str, tuple["TriggerFlowHandler", dict[str, Any], dict[str, Any]]] = {}
         self._signal_attempts: dict[str, dict[str, Any]] = {}
+        self._terminal_attempt_ids: OrderedDict[str, None] = OrderedDict()
+        self._evicted_attempt_counts: dict[str, int] = {}
+        self._keep_terminal: int | None = DEFAULT_SIGNAL_ATTEMPT_KEEP_TERMINAL
+        # Bumped on every binding or attempt change so incremental saves can skip an unchanged net.
+        self._revision = 0
 
     def register_dynamic_handler(
         self,
@@ -119,6 +132,7 @@ class TriggerFlowSignalNet:
                 if current_event in events and not events[current_event]:
                     del events[current_event]
         self._handler_registry.pop(binding_id, None)
+        self._revision += 1
         return removed
 
     def iter_handlers(
@@ -144,17 +158,35 @@ class TriggerFlowSignalNet:
         self._record_attempt(signal, "running")
 
     def mark_completed(self, signal: TriggerFlowSignal):
+        self._execution._accepted_signal_ids.discard(signal.id)
         self._record_attempt(signal, "completed")
 
     def mark_failed(self, signal: TriggerFlowSignal, error: BaseException):
+        self._execution._accepted_signal_ids.discard(signal.id)
         self._record_attempt(signal, "failed", error=error)
 
     def mark_interrupted(self, signal: TriggerFlowSignal, reason: str = "interrupted"):
+        self._execution._accepted_signal_ids.discard(signal.id)
         self._record_attempt(signal, "interrupted", reason=reason)
 
+    def set_attempt_retention(self, keep_terminal: int | None):
+        self._keep_terminal = keep_terminal
+        self._evict_terminal_attempts()
+        self._revision += 1
+
+    def attempt_counts(self):
+        """Per-status attempt counts, including attempts rolled out of the ledger."""
+        counts = dict(self._evicted_attempt_counts)
+        for attempt in self._signal_attempts.values():
+            status = str(attempt.get("status"))
+            counts[status] = counts.get(status, 0) + 1
+        return counts
+
     def to_snapshot(self):
         return {
             "version": 1,
+            "attempt_retention": {"keep_terminal": self._keep_terminal},
+            "evicted_attempt_counts": dict(self._evicted_attempt_counts),
             "bindings": [
                 binding.to_snapshot()
                 for events in self._dynamic_bindings.values()
@@ -178,15 +210,34 @@ class TriggerFlowSignalNet:
             "flow_data": {},
         }
         self._signal_attempts = {}
+        self._terminal_attempt_ids = OrderedDict()
+        self._evicted_attempt_counts = {}
+        self._revision += 1
         if not isinstance(snapshot, dict):
             return
+        retention = snapshot.get("attempt_retention")
+        if isinstance(retention, dict) and "keep_terminal" in retention:
+            keep_terminal = retention["keep_terminal"]
+            self._keep_terminal = (
+                keep_terminal
+                if keep_terminal is None or (isinstance(keep_terminal, int) and keep_terminal >= 0)
+                else DEFAULT_SIGNAL_ATTEMPT_KEEP_TERMINAL
+            )
+        evicted_counts = snapshot.get("evicted_attempt_counts")
+        if isinstance(evicted_counts, dict):
+            self._evicted_attempt_counts = {
+                str(status): int(count) for status, count in evicted_counts.items() if isinstance(count, int)
+            }
         for attempt in snapshot.get("signal_attempts") or []:
             if isinstance(attempt, dict) and attempt.get("signal_id"):
                 restored = copy.deepcopy(attempt)
                 if restored.get("status") in {"accepted", "running"}:
                     restored["status"] = "interrupted"
                     restored["reason"] = "interrupted during TriggerFlow load"
-                self._signal_attempts[str(restored["signal_id"])] = restored
+                signal_id = str(restored["signal_id"])
+                self._signal_attempts[signal_id] = restored
+                self._terminal_attempt_ids[signal_id] = None
+        self._evict_terminal_attempts()
         self._execution._accepted_signal_ids = set()
         for binding_state in snapshot.get("bindings") or []:
             if not isinstance(binding_state, dict):
@@ -247,6 +298,7 @@ class TriggerFlowSignalNet:
         if binding.trigger_event not in events:
             events[binding.trigger_event] = {}
         events[binding.trigger_event][binding.binding_id] = binding
+        self._revision += 1
 
     def _record_attempt(
         self,
@@ -275,3 +327,21 @@ class TriggerFlowSignalNet:
         if reason is not None:
             attempt["reason"] = reason
         self._signal_attempts[signal.id] = attempt
+        if status in TERMINAL_SIGNAL_ATTEMPT_STATUSES:
+            self._terminal_attempt_ids[signal.id] = None
+            self._terminal_attempt_ids.move_to_end(signal.id)
+            self._evict_terminal_attempts()
+        else:
+            self._terminal_attempt_ids.pop(signal.id, None)
+        self._revision += 1
+
+    def _evict_terminal_attempts(self):
+        if self._keep_terminal is None:
+            return
+        while len(self._terminal_attempt_ids) > self._keep_terminal:
+            signal_id, _ = self._terminal_attempt_ids.popitem(last=False)
+            attempt = self._signal_attempts.pop(signal_id, None)
+            if attempt is None:
+                continue
+            status = str(attempt.get("status"))
+            self._evicted_attempt_counts[status] = self._evicted_attempt_counts.get(status, 0) + 1
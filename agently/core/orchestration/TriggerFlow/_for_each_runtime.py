@@ -0,0 +1,223 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Runtime handlers shared by ``for_each`` definitions and compiled blueprints.
+
+Each for_each instance keeps one result slot per item in
+``for_each_results.<instance>`` and a ``{"pending", "exhausted"}`` counter in
+``for_each_states.<instance>``. Slots are opened as items are pulled from the
+input, so with a ``concurrency`` limit at most that many items are open at a
+time, whatever the input size. The instance finishes when the input is
+exhausted and no item is pending.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterable, Iterator, Sequence
+from typing import Any, Awaitable, Callable, Literal, TYPE_CHECKING
+
+from agently.types.data import EMPTY
+from ._async_utils import gather_cancel_on_error
+
+if TYPE_CHECKING:
+    from agently.types.trigger_flow import TriggerFlowRuntimeData
+
+ForEachCollectMode = Literal["list", "stream"]
+FOR_EACH_COLLECT_MODES = ("list", "stream")
+
+
+def is_streaming_for_each_input(value: Any) -> bool:
+    return isinstance(value, AsyncIterable) or (
+        isinstance(value, Iterator) and not isinstance(value, (str, bytes))
+    )
+
+
+def _results_key(instance_id: str):
+    return f"for_each_results.{ instance_id }"
+
+
+def _state_key(instance_id: str):
+    return f"for_each_states.{ instance_id }"
+
+
+def _open_item(data: "TriggerFlowRuntimeData", instance_id: str):
+    data.layer_in()
+    item_id = data.layer_mark
+    assert item_id is not None
+    layer_marks = data._layer_marks.copy()
+    data._system_runtime_data.set(f"{ _results_key(instance_id) }.{ item_id }", EMPTY)
+    data.layer_out()
+    state = data._system_runtime_data.get(_state_key(instance_id), None, inherit=False)
+    if isinstance(state, dict):
+        data._system_runtime_data.set(_state_key(instance_id), {**state, "pending": state["pending"] + 1})
+    return layer_marks
+
+
+def _close_input(data: "TriggerFlowRuntimeData", instance_id: str):
+    """Mark the input exhausted; return True when the caller must finish the instance."""
+    state = data._system_runtime_data.get(_state_key(instance_id), None, inherit=False)
+    if not isinstance(state, dict):
+        return False
+    data._system_runtime_data.set(_state_key(instance_id), {**state, "exhausted": True})
+    return state["pending"] <= 0
+
+
+def _take_results(data: "TriggerFlowRuntimeData", instance_id: str):
+    results = data._system_runtime_data.get(_results_key(instance_id), {}, inherit=False)
+    values = list(results.values()) if isinstance(results, dict) else []
+    del data._system_runtime_data[_results_key(instance_id)]
+    del data._system_runtime_data[_state_key(instance_id)]
+    return values
+
+
+def create_for_each_sender(
+    *,
+    item_trigger: str,
+    end_trigger: str,
+    concurrency: int | None,
+    semaphore_key: str,
+    collect_mode: Callable[[], ForEachCollectMode],
+):
+    bounded = concurrency is not None and concurrency > 0
+
+    async def emit_item(data: "TriggerFlowRuntimeData", item: Any, layer_marks: list[str]):
+        if not bounded:
+            await data.async_emit(item_trigger, item, layer_marks)
+            return
+        semaphore = data._system_runtime_data.get(semaphore_key, inherit=False)
+        if not isinstance(semaphore, asyncio.Semaphore):
+            semaphore = asyncio.Semaphore(concurrency)  # type: ignore[arg-type]
+            data._system_runtime_data.set(semaphore_key, semaphore)
+        async with semaphore:
+            await data.async_emit(item_trigger, item, layer_marks)
+
+    async def finish(data: "TriggerFlowRuntimeData", instance_id: str):
+        values = _take_results(data, instance_id)
+        if collect_mode() == "stream":
+            return
+        data.layer_out()
+        await data.async_emit(end_trigger, values, data._layer_marks.copy())
+
+    async def send_items(data: "TriggerFlowRuntimeData"):
+        data.layer_in()
+        instance_id = data.layer_mark
+        assert instance_id is not None
+        items = data.value
+        data._system_runtime_data.set(_state_key(instance_id), {"pending": 0, "exhausted": False})
+
+        if isinstance(items, str) or not (isinstance(items, Sequence) or is_streaming_for_each_input(items)):
+            layer_marks = _open_item(data, instance_id)
+            _close_input(data, instance_id)
+            await emit_item(data, items, layer_marks)
+            return
+
+        if not bounded and isinstance(items, Sequence):
+            sends = [emit_item(data, item, _open_item(data, instance_id)) for item in items]
+            if _close_input(data, instance_id):
+                await finish(data, instance_id)
+                return
+            await gather_cancel_on_error(*sends)
+            return
+
+        next_item: Callable[[], Awaitable[Any]]
+        if isinstance(items, AsyncIterable):
+            iterator: Any = aiter(items)
+
+            async def next_async_item():
+                return await anext(iterator)
+
+            next_item = next_async_item
+        else:
+            sync_iterator = iter(items)
+
+            async def next_sync_item():
+                try:
+                    return next(sync_iterator)
+                except StopIteration:
+                    raise StopAsyncIteration from None
+
+            next_item = next_sync_item
+
+        # Items are pulled one at a time, so at most `concurrency` are open per instance.
+        pull_lock = asyncio.Lock()
+        finished_by_sender = False
+
+        async def pull():
+            nonlocal finished_by_sender
+            async with pull_lock:
+                if finished_by_sender or data._system_runtime_data.get(
+                    _state_key(instance_id), {}, inherit=False
+                ).get("exhausted", True):
+                    return None
+                try:
+                    item = await next_item()
+                except StopAsyncIteration:
+                    finished_by_sender = _close_input(data, instance_id)
+                    return None
+                return item, _open_item(data, instance_id)
+
+        async def worker():
+            while (pulled := await pull()) is not None:
+                await emit_item(data, *pulled)
+
+        if bounded:
+            await gather_cancel_on_error(*(worker() for _ in range(concurrency)))  # type: ignore[arg-type]
+        else:
+            sends = []
+            while (pulled := await pull()) is not None:
+                sends.append(emit_item(data, *pulled))
+            await gather_cancel_on_error(*sends)
+        if finished_by_sender:
+            await finish(data, instance_id)
+
+    return send_items
+
+
+def create_for_each_collector(*, end_trigger: str, mode: ForEachCollectMode = "list"):
+    if mode not in FOR_EACH_COLLECT_MODES:
+        raise ValueError(f"for_each collect mode must be one of: { ', '.join(FOR_EACH_COLLECT_MODES) }.")
+
+    async def collect_results(data: "TriggerFlowRuntimeData"):
+        instance_id = data.upper_layer_mark
+        item_id = data.layer_mark
+        assert instance_id is not None and item_id is not None
+        system_data = data._system_runtime_data
+        results = system_data.get(_results_key(instance_id), None, inherit=False)
+        if not isinstance(results, dict) or item_id not in results:
+            return
+
+        item_key = f"{ _results_key(instance_id) }.{ item_id }"
+        if mode == "stream":
+            del system_data[item_key]
+        else:
+            system_data.set(item_key, data.value)
+        state = system_data.get(_state_key(instance_id), None, inherit=False)
+        if isinstance(state, dict):
+            state = {**state, "pending": state["pending"] - 1}
+            system_data.set(_state_key(instance_id), state)
+            done = state["exhausted"] and state["pending"] <= 0
+        else:
+            # Instances restored from snapshots without a counter finish when every slot is filled.
+            done = all(value is not EMPTY for value in results.values())
+        values = _take_results(data, instance_id) if done else None
+
+        data.layer_out()
+        data.layer_out()
+        if mode == "stream":
+            await data.async_emit(end_trigger, data.value, data._layer_marks.copy())
+        elif values is not None:
+            await data.async_emit(end_trigger, values, data._layer_marks.copy())
+
+    return collect_results
@@ -8,17 +8,9 @@
 # distributed under the License is distributed on an "AS IS" BASIS,
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 
-import asyncio
-from typing import Sequence, TYPE_CHECKING
-
-if TYPE_CHECKING:
-    from agently.types.trigger_flow import TriggerFlowRuntimeData
-
 from .BaseProcess import TriggerFlowBaseProcess
-from agently.types.data import EMPTY
 from agently.types.trigger_flow import TriggerFlowBlockData
-from agently.utils import StateDataNamespace
-from .._async_utils import gather_cancel_on_error
+from .._for_each_runtime import ForEachCollectMode, create_for_each_collector, create_for_each_sender
 
 
 class TriggerFlowForEachProcess(TriggerFlowBaseProcess):
@@ -44,59 +36,17 @@ class TriggerFlowForEachProcess(TriggerFlowBaseProcess):
         end_for_each_trigger = f"ForEach-{ for_each_id }-End"
         split_operator_id = f"for_each-split-{ for_each_id }"
 
-        async def send_items(data: "TriggerFlowRuntimeData"):
-            data.layer_in()
-            for_each_instance_id = data.layer_mark
-            assert for_each_instance_id is not None
-
-            send_tasks = []
-
-            def prepare_item(item):
-                data.layer_in()
-                item_id = data.layer_mark
-                assert item_id is not None
-                layer_marks = data._layer_marks.copy()
-                data._system_runtime_data.set(f"for_each_results.{ for_each_instance_id }.{ item_id }", EMPTY)
-                data.layer_out()
-                return item_id, layer_marks, item
+        def collect_mode():
+            options = self._blue_print.definition.get_operator(split_operator_id).get("options", {})
+            return options.get("collect_mode", "list")
 
-            async def emit_item(item, layer_marks):
-                if concurrency is None or concurrency <= 0:
-                    await data.async_emit(
-                        send_item_trigger,
-                        item,
-                        layer_marks,
-                    )
-                else:
-                    semaphore_key = f"for_each_semaphores.{ for_each_id }"
-                    semaphore = data._system_runtime_data.get(semaphore_key, inherit=False)
-                    if not isinstance(semaphore, asyncio.Semaphore):
-                        semaphore = asyncio.Semaphore(concurrency)
-                        data._system_runtime_data.set(semaphore_key, semaphore)
-                    async with semaphore:
-                        await data.async_emit(
-                            send_item_trigger,
-                            item,
-                            layer_marks,
-                        )
-
-            if not isinstance(data.value, str) and isinstance(data.value, Sequence):
-                items = list(data.value)
-                if not items:
-                    data.layer_out()
-                    await data.async_emit(
-                        end_for_each_trigger,
-                        [],
-                        data._layer_marks.copy(),
-                    )
-                    return
-                for item in items:
-                    _, layer_marks, item_value = prepare_item(item)
-                    send_tasks.append(emit_item(item_value, layer_marks))
-                await gather_cancel_on_error(*send_tasks)
-            else:
-                _, layer_marks, item_value = prepare_item(data.value)
-                await emit_item(item_value, layer_marks)
+        send_items = create_for_each_sender(
+            item_trigger=send_item_trigger,
+            end_trigger=end_for_each_trigger,
+            concurrency=concurrency,
+            semaphore_key=f"for_each_semaphores.{ for_each_id }",
+            collect_mode=collect_mode,
+        )
 
         self._blue_print.add_handler(
             self.trigger_type,
@@ -130,7 +80,13 @@ class TriggerFlowForEachProcess(TriggerFlowBaseProcess):
             definition_group_kind="for_each",
         )
 
-    def end_for_each(self):
+    def end_for_each(self, *, mode: ForEachCollectMode = "list"):
+        """Close the for_each block.
+
+        ``mode="list"`` emits all item results in input order once every item
+        finished. ``mode="stream"`` emits each item result as soon as it
+        finishes, in completion order, and keeps no results.
+        """
         if "for_each_id" not in self._block_data.data:
             raise NotImplementedError("Cannot use .end_for_each() without .for_each().")
 
@@ -138,29 +94,13 @@ class TriggerFlowForEachProcess(TriggerFlowBaseProcess):
         end_for_each_trigger = f"ForEach-{ for_each_id }-End"
         collect_operator_id = f"for_each-collect-{ for_each_id }"
 
-        async def collect_results(data: "TriggerFlowRuntimeData"):
-            for_each_instance_id = data.upper_layer_mark
-            item_id = data.layer_mark
-            assert for_each_instance_id is not None and item_id is not None
-
-            for_each_results = StateDataNamespace(data._system_runtime_data, "for_each_results")
-
-            if for_each_instance_id in for_each_results and item_id in for_each_results[for_each_instance_id]:
-                for_each_results.set(f"{ for_each_instance_id }.{ item_id }", data.value)
-
-                for value in for_each_results.get(for_each_instance_id, {}).values():
-                    if value is EMPTY:
-                        return
-
-                data.layer_out()
-                data.layer_out()
-
-                await data.async_emit(
-                    end_for_each_trigger,
-                    list(for_each_results[for_each_instance_id].values()),
-                    data._layer_marks.copy(),
-                )
-                for_each_results.delete(for_each_instance_id)
+        collect_results = create_for_each_collector(end_trigger=end_for_each_trigger, mode=mode)
+        split_operator_id = f"for_each-split-{ for_each_id }"
+        split_options = self._blue_print.definition.get_operator(split_operator_id).get("options", {})
+        self._blue_print.definition.update_operator(
+            split_operator_id,
+            options={**split_options, "collect_mode": mode},
+        )
 
         self._blue_print.add_handler(
             self.trigger_type,
@@ -174,6 +114,7 @@ class TriggerFlowForEachProcess(TriggerFlowBaseProcess):
             name=f"for_each_collect:{ for_each_id }",
             listen_signals=self._definition_signals,
             emit_signals=[self._event_signal(end_for_each_trigger, role="continuation")],
+            options={"mode": mode},
             group_id=for_each_id,
             group_kind="for_each",
             parent_group_id=self._block_data.data.get("definition_outer_group_id"),
@@ -16,11 +16,13 @@ from agently_stage import default_stage_call_bridge
 
 import asyncio
 import inspect
+import sys
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import FrameType
 
-from typing import TYPE_CHECKING, Any, Mapping, cast
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Coroutine, Mapping, cast
 
 from agently.types.data import ErrorInfo, EventDeliveryPolicy, ObservationEvent, RuntimeEvent
 from agently.types.data.event import matches_runtime_event_type
@@ -37,33 +39,39 @@ _INTERNAL_SOURCE_MODULES = {
 
 
 def _infer_runtime_source() -> str:
-    frame = inspect.currentframe()
+    frame = sys._getframe(1)
     try:
-        current = frame.f_back if frame is not None else None
+        current: FrameType | None = frame
         while current is not None:
             module_name = str(current.f_globals.get("__name__", ""))
             if module_name in _INTERNAL_SOURCE_MODULES:
                 current = current.f_back
                 continue
 
-            source_instance = current.f_locals.get("self")
-            if source_instance is not None:
-                source_name = getattr(source_instance, "name", None)
-                if isinstance(source_name, str) and source_name:
-                    return source_name
-                class_name = getattr(source_instance.__class__, "__name__", None)
+            # Reading f_locals materializes every local of the frame, so only
+            # touch it when the code object actually has a self/cls variable.
+            code = current.f_code
+            local_names = code.co_varnames + code.co_cellvars + code.co_freevars
+            if "self" in local_names:
+                source_instance = current.f_locals.get("self")
+                if source_instance is not None:
+                    source_name = getattr(source_instance, "name", None)
+                    if isinstance(source_name, str) and source_name:
+                        return source_name
+                    class_name = getattr(source_instance.__class__, "__name__", None)
+                    if isinstance(class_name, str) and class_name:
+                        return class_name
+
+            if "cls" in local_names:
+                source_class = current.f_locals.get("cls")
+                class_name = getattr(source_class, "__name__", None)
                 if isinstance(class_name, str) and class_name:
                     return class_name
 
-            source_class = current.f_locals.get("cls")
-            class_name = getattr(source_class, "__name__", None)
-            if isinstance(class_name, str) and class_name:
-                return class_name
-
             if module_name and module_name != "__main__":
                 return module_name.rsplit(".", 1)[-1]
 
-            file_name = current.f_code.co_filename
+            file_name = code.co_filename
             if file_name:
                 return Path(file_name).stem
 
@@ -73,13 +81,21 @@ def _infer_runtime_source() -> str:
     return "Agently"
 
 
+def _string_list(value: Any, *, default: list[str] | None) -> list[str] | None:
+    if value is None:
+        return default
+    if isinstance(value, str):
+        return [value]
+    return [str(item) for item in value]
+
+
 def _normalize_delivery_policy(policy: EventDeliveryPolicy | Mapping[str, Any] | None) -> EventDeliveryPolicy:
     source = dict(policy or {})
     mode = source.get("mode", "raw")
     if mode not in ("raw", "summary"):
         mode = "raw"
     dispatch = source.get("dispatch", "await")
-    if dispatch not in ("await", "background"):
+    if dispatch not in ("await", "background", "inline"):
         dispatch = "await"
 
     def _optional_float(value: Any) -> float | None:
@@ -109,6 +125,10 @@ def _normalize_delivery_policy(policy: EventDeliveryPolicy | Mapping[str, Any] |
         "max_summary_items": _optional_int(source.get("max_summary_items")) or 20,
         "idle_flush_seconds": _optional_float(source.get("idle_flush_seconds")),
         "background_timeout": _optional_float(source.get("background_timeout")),
+        "sample_every": _optional_int(source.get("sample_every")),
+        "max_per_second": _optional_float(source.get("max_per_second")),
+        "sample_levels": _string_list(source.get("sample_levels"), default=["DEBUG"]),
+        "sample_event_types": _string_list(source.get("sample_event_types"), default=None),
     }
 
 
@@ -146,13 +166,19 @@ def _compact_event_payload(event: RuntimeEvent) -> dict[str, Any]:
     }
 
 
-def _consume_task_exception(task: asyncio.Task[Any]):
+def _consume_task_exception(task: asyncio.Future[Any]):
     try:
         task.exception()
     except (asyncio.CancelledError, Exception):
         return
 
 
+def _log_hook_failure(hook_name: str, error: BaseException):
+    from agently.base import logger
+
+    logger.warning(f"[EventCenter] Hook '{ hook_name }' failed: { repr(error) }")
+
+
 @dataclass
 class _BufferedEventOutlet:
     events: list[RuntimeEvent]
@@ -160,12 +186,81 @@ class _BufferedEventOutlet:
     last_seen_at: float
 
 
+# Per-event-type routing tables are cached until the hook set changes; the cap
+# only guards against producers that mint unbounded event type names.
+_MAX_CACHED_ROUTES = 1024
+
+
+class _EventSampler:
+    """Per-event-type sampling for one hook.
+
+    Admits one of every ``sample_every`` matching events and at most
+    ``max_per_second`` of them per one-second window. Events whose level is not
+    in ``sample_levels`` (or whose type is not in ``sample_event_types``) are
+    always admitted.
+    """
+
+    __slots__ = ("every", "max_per_second", "levels", "event_types", "_seen", "_windows")
+
+    def __init__(self, policy: EventDeliveryPolicy):
+        self.every = policy.get("sample_every")
+        self.max_per_second = policy.get("max_per_second")
+        levels = policy.get("sample_levels")
+        event_types = policy.get("sample_event_types")
+        self.levels = frozenset(level.upper() for level in levels) if levels is not None else None
+        self.event_types = set(event_types) if event_types is not None else None
+        self._seen: dict[str, int] = {}
+        self._windows: dict[str, tuple[float, int]] = {}
+
+    @classmethod
+    def from_policy(cls, policy: EventDeliveryPolicy) -> "_EventSampler | None":
+        every = policy.get("sample_every")
+        if (every is None or every <= 1) and policy.get("max_per_second") is None:
+            return None
+        return cls(policy)
+
+    def admit(self, event: RuntimeEvent) -> bool:
+        if self.levels is not None and event.level not in self.levels:
+            return True
+        event_type = event.event_type
+        if self.event_types is not None and not matches_runtime_event_type(event_type, self.event_types):
+            return True
+        if self.every is not None and self.every > 1:
+            if event_type not in self._seen and len(self._seen) >= _MAX_CACHED_ROUTES:
+                self._seen.clear()
+            seen = self._seen.get(event_type, 0)
+            self._seen[event_type] = seen + 1
+            if seen % self.every:
+                return False
+        if self.max_per_second is not None:
+            now = time.monotonic()
+            window_started_at, count = self._windows.get(event_type, (now, 0))
+            if now - window_started_at >= 1.0:
+                window_started_at, count = now, 0
+            if count >= self.max_per_second:
+                return False
+            if event_type not in self._windows and len(self._windows) >= _MAX_CACHED_ROUTES:
+                self._windows.clear()
+            self._windows[event_type] = (window_started_at, count + 1)
+        return True
+
+
 @dataclass
 class _HookRegistration:
     event_types: set[str] | None
     callback: "EventHook"
     delivery_policy: EventDeliveryPolicy
+    observes: Callable[[str, str], bool] | None = None
+    hook_name: str = ""
     buffer: _BufferedEventOutlet | None = None
+    invoke: Callable[[RuntimeEvent], Coroutine[Any, Any, Any]] = field(init=False, repr=False)
+    inline: bool = field(init=False, repr=False)
+    sampler: _EventSampler | None = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.invoke = default_stage_call_bridge.as_async(self.callback, managed=True)
+        self.inline = self.delivery_policy.get("dispatch") == "inline"
+        self.sampler = _EventSampler.from_policy(self.delivery_policy)
 
 
 class EventCenter:
@@ -176,9 +271,11 @@ class EventCenter:
         background_timeout: float | None = 5.0,
     ):
         self._hooks: dict[str, _HookRegistration] = {}
+        self._routes: dict[str | None, tuple[tuple[str, _HookRegistration], ...]] = {}
+        self._interest: dict[str, tuple[bool, tuple[Callable[[str, str], bool], ...]]] = {}
         self._hookers: dict[str, type["EventHooker"]] = {}
-        self._background_tasks: set[asyncio.Task[Any]] = set()
-        self._background_task_hooks: dict[asyncio.Task[Any], str] = {}
+        self._background_tasks: set[asyncio.Future[Any]] = set()
+        self._background_task_hooks: dict[asyncio.Future[Any], str] = {}
         self._idle_flush_seconds = idle_flush_seconds
         self._next_idle_flush_seconds = idle_flush_seconds
         self._background_timeout = background_timeout
@@ -202,7 +299,14 @@ class EventCenter:
         event_types: str | list[str] | None = None,
         hook_name: str | None = None,
         delivery_policy: EventDeliveryPolicy | Mapping[str, Any] | None = None,
+        observes: Callable[[str, str], bool] | None = None,
     ):
+        """Register ``callback`` for ``event_types`` (all events when omitted).
+
+        ``observes(event_type, level)`` optionally tells ``is_observed`` whether
+        the hook would do anything with such an event under the current
+        settings; it must err on the side of returning ``True``.
+        """
         if hook_name is None:
             hook_name = callback.__name__
         normalized_event_types: set[str] | None = None
@@ -212,11 +316,46 @@ class EventCenter:
             event_types=normalized_event_types,
             callback=callback,
             delivery_policy=_normalize_delivery_policy(delivery_policy),
+            observes=observes,
+            hook_name=hook_name,
         )
+        self._routes.clear()
+        self._interest.clear()
 
     def unregister_hook(self, hook_name: str):
         if hook_name in self._hooks:
             del self._hooks[hook_name]
+            self._routes.clear()
+            self._interest.clear()
+
+    def is_observed(self, event_type: str, level: "ObservationEventLevel | str" = "INFO") -> bool:
+        """Whether emitting ``event_type`` at ``level`` could reach any hook.
+
+        Producers use this to skip building payloads nobody will read. The
+        routing part is cached until the hook set changes; ``observes``
+        predicates of the routed hooks are evaluated on every call because they
+        usually depend on settings.
+        """
+        interest = self._interest.get(event_type)
+        if interest is None:
+            routes = self._routes_for(event_type)
+            interest = (
+                any(registration.observes is None for _, registration in routes),
+                tuple(registration.observes for _, registration in routes if registration.observes is not None),
+            )
+            if len(self._interest) >= _MAX_CACHED_ROUTES:
+                self._interest.clear()
+            self._interest[event_type] = interest
+        always, predicates = interest
+        if always:
+            return True
+        for predicate in predicates:
+            try:
+                if predicate(event_type, level):
+                    return True
+            except Exception:
+                return True
+        return False
 
     def register_hooker_plugin(self, hooker: type["EventHooker"]):
         if hasattr(hooker, "_on_register"):
@@ -226,6 +365,7 @@ class EventCenter:
             event_types=hooker.event_types,
             hook_name=hooker.name,
             delivery_policy=getattr(hooker, "delivery_policy", None),
+            observes=getattr(hooker, "observes", None),
         )
         self._hookers[hooker.name] = hooker
 
@@ -240,27 +380,66 @@ class EventCenter:
         del self._hookers[hooker.name]
 
     async def async_emit(self, event: "Mapping[str, Any] | ObservationEvent | RuntimeEvent"):
-        event_object = self._normalize_event(event)
-        await_tasks: list[asyncio.Task[Any]] = []
-        for hook_name, registration in list(self._hooks.items()):
-            if not matches_runtime_event_type(event_object.event_type, registration.event_types):
+        event_object: RuntimeEvent | None = None
+        event_type = event.event_type if isinstance(event, ObservationEvent) else event.get("event_type")
+        if not isinstance(event_type, str):
+            event_object = self._normalize_event(event)
+            event_type = event_object.event_type
+        routes = self._routes_for(event_type)
+        if not routes:
+            # Nothing routes this event type: skip validation and source inference.
+            if self._background_tasks:
+                await asyncio.sleep(0)
+            return
+        if event_object is None:
+            event_object = self._normalize_event(event)
+        pending: list[Awaitable[Any]] = []
+        pending_hooks: list[str] = []
+        for hook_name, registration in routes:
+            if registration.sampler is not None and not registration.sampler.admit(event_object):
                 continue
-            task = await self._prepare_hook_delivery(registration, event_object)
-            if task is not None:
-                if registration.delivery_policy.get("dispatch") == "background":
-                    self._track_background_task(task, hook_name=hook_name)
-                else:
-                    await_tasks.append(task)
-        if await_tasks:
-            await asyncio.gather(*await_tasks, return_exceptions=True)
+            delivery = await self._prepare_hook_delivery(registration, event_object)
+            if delivery is None:
+                continue
+            if registration.delivery_policy.get("dispatch") == "background":
+                self._track_background_task(
+                    asyncio.ensure_future(self._logged_delivery(hook_name, delivery)),
+                    hook_name=hook_name,
+                )
+            else:
+                pending.append(delivery)
+                pending_hooks.append(hook_name)
+        if len(pending) == 1:
+            try:
+                await pending[0]
+            except Exception as error:
+                _log_hook_failure(pending_hooks[0], error)
+        elif pending:
+            results = await asyncio.gather(*pending, return_exceptions=True)
+            for hook_name, result in zip(pending_hooks, results):
+                if isinstance(result, Exception):
+                    _log_hook_failure(hook_name, result)
         if self._background_tasks:
             await asyncio.sleep(0)
 
+    def _routes_for(self, event_type: str | None) -> tuple[tuple[str, _HookRegistration], ...]:
+        routes = self._routes.get(event_type)
+        if routes is None:
+            routes = tuple(
+                (hook_name, registration)
+                for hook_name, registration in self._hooks.items()
+                if matches_runtime_event_type(event_type, registration.event_types)
+            )
+            if len(self._routes) >= _MAX_CACHED_ROUTES:
+                self._routes.clear()
+            self._routes[event_type] = routes
+        return routes
+
     def _normalize_event(self, event: "Mapping[str, Any] | ObservationEvent | RuntimeEvent") -> RuntimeEvent:
         if isinstance(event, RuntimeEvent):
             return event
         elif isinstance(event, ObservationEvent):
-            return RuntimeEvent.model_validate(event.model_dump())
+            return RuntimeEvent.model_validate(event, from_attributes=True)
         else:
             event_data: dict[str, Any] = dict(event)
             if not event_data.get("source"):
@@ -271,16 +450,15 @@ class EventCenter:
         self,
         registration: _HookRegistration,
         event: RuntimeEvent,
-    ) -> asyncio.Task[Any] | None:
+    ) -> Awaitable[Any] | None:
         policy = registration.delivery_policy
         if not _is_summary_policy(policy):
-            return self._create_hook_task(registration, event)
+            return self._deliver(registration, event)
         if policy.get("high_frequency_only", True) and not _is_high_frequency_event(event):
             flush_task = await self._flush_registration(registration)
-            current_task = self._create_hook_task(registration, event)
             if flush_task is not None:
                 await asyncio.gather(flush_task, return_exceptions=True)
-            return current_task
+            return self._deliver(registration, event)
 
         now = time.monotonic()
         if registration.buffer is None:
@@ -300,18 +478,43 @@ class EventCenter:
             return await self._flush_registration(registration)
         return None
 
-    def _create_hook_task(self, registration: _HookRegistration, event: RuntimeEvent) -> asyncio.Task[Any]:
-        coro = default_stage_call_bridge.as_async(registration.callback, managed=True)
-        return asyncio.create_task(coro(event))
+    def _deliver(self, registration: _HookRegistration, event: RuntimeEvent) -> Awaitable[Any] | None:
+        """Start one hook call and return what is left to await, if anything.
+
+        ``inline`` hooks are called directly on the emitting loop: a sync hook
+        finishes here without a task or executor hop. Other sync hooks still run
+        on the stage executor.
+        """
+        if not registration.inline:
+            return registration.invoke(event)
+        try:
+            result = registration.callback(event)
+        except Exception as error:
+            _log_hook_failure(registration.hook_name, error)
+            return None
+        return result if inspect.isawaitable(result) else None
+
+    def _create_hook_task(self, registration: _HookRegistration, event: RuntimeEvent) -> asyncio.Future[Any] | None:
+        delivery = self._deliver(registration, event)
+        if delivery is None:
+            return None
+        return asyncio.ensure_future(self._logged_delivery(registration.hook_name, delivery))
+
+    @staticmethod
+    async def _logged_delivery(hook_name: str, delivery: Awaitable[Any]):
+        try:
+            return await delivery
+        except Exception as error:
+            _log_hook_failure(hook_name, error)
 
-    def _track_background_task(self, task: asyncio.Task[Any], *, hook_name: str):
+    def _track_background_task(self, task: asyncio.Future[Any], *, hook_name: str):
         self._background_tasks.add(task)
         self._background_task_hooks[task] = hook_name
         self._schedule_idle_flush()
         task.add_done_callback(self._forget_background_task)
         return task
 
-    def _forget_background_task(self, done_task: asyncio.Task[Any]):
+    def _forget_background_task(self, done_task: asyncio.Future[Any]):
         self._background_tasks.discard(done_task)
         self._background_task_hooks.pop(done_task, None)
         _consume_task_exception(done_task)
@@ -347,7 +550,7 @@ class EventCenter:
             if generation == self._idle_flush_generation:
                 break
 
-    async def _flush_registration(self, registration: _HookRegistration) -> asyncio.Task[Any] | None:
+    async def _flush_registration(self, registration: _HookRegistration) -> asyncio.Future[Any] | None:
         if registration.buffer is None or not registration.buffer.events:
             registration.buffer = None
             return None
@@ -392,7 +595,7 @@ class EventCenter:
         )
 
     async def async_flush(self, hook_name: str | None = None, *, timeout: float | None = None):
-        tasks: list[asyncio.Task[Any]] = []
+        tasks: list[asyncio.Future[Any]] = []
         registrations = (
             [self._hooks[hook_name]]
             if hook_name is not None and hook_name in self._hooks
@@ -338,8 +338,10 @@ async def async_emit_model_requester_error(
     responsible for propagating the original provider error.
     """
 
-    from agently.base import async_emit_runtime
+    from agently.base import async_emit_runtime, event_center
 
+    if not event_center.is_observed("model.requester.error", "ERROR"):
+        return
     event_payload: dict[str, Any] = {}
     if payload:
         event_payload.update(payload)
@@ -375,7 +377,7 @@ async def async_emit_response_parser_observation(
 ) -> None:
     """Map response parser observations to official RuntimeEvent records."""
 
-    from agently.base import async_emit_runtime
+    from agently.base import async_emit_runtime, event_center
 
     kind = str(observation.get("kind", ""))
     event_types = {
@@ -391,6 +393,9 @@ async def async_emit_response_parser_observation(
     event_type = event_types.get(kind)
     if event_type is None:
         return
+    level = observation.get("level", "INFO")
+    if not event_center.is_observed(event_type, level):
+        return
     payload = observation.get("payload")
     resolved_payload = dict(payload) if isinstance(payload, dict) else {}
     resolved_payload.setdefault("agent_name", agent_name)
@@ -407,7 +412,7 @@ async def async_emit_response_parser_observation(
         {
             "event_type": event_type,
             "source": str(observation.get("source") or "AgentlyResponseParser"),
-            "level": observation.get("level", "INFO"),
+            "level": level,
             "message": observation.get("message"),
             "payload": resolved_payload,
             "error": observation.get("error"),
@@ -19,6 +19,7 @@ import hashlib
 import json
 import os
 import threading
+import weakref
 from collections.abc import Iterable, Iterator, Mapping, Sequence
 from contextlib import contextmanager
 from pathlib import Path
@@ -70,6 +71,44 @@ def _write_json_atomic(path: Path, value: Mapping[str, Any]) -> None:
         temporary.unlink(missing_ok=True)
 
 
+def _write_manifest_batch(
+    pending: list[tuple[Path, dict[str, Any]]],
+    lock: threading.Lock,
+    *,
+    root: Path | None = None,
+) -> None:
+    """Durably write buffered identity manifests with one fsync per directory.
+
+    With ``root``, nothing is written once that identity root has been removed.
+    """
+    with lock:
+        batch = list(pending)
+        pending.clear()
+    if root is not None and not root.exists():
+        return
+    directories: set[Path] = set()
+    try:
+        for index, (path, value) in enumerate(batch):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                with temporary.open("xb") as file:
+                    file.write(_json_bytes(value))
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(temporary, path)
+            except BaseException:
+                with lock:
+                    pending[:0] = batch[index:]
+                raise
+            finally:
+                temporary.unlink(missing_ok=True)
+            directories.add(path.parent)
+    finally:
+        for directory in directories:
+            _fsync_directory(directory)
+
+
 @contextmanager
 def _exclusive_file_lock(path: Path) -> Iterator[None]:
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -98,7 +137,14 @@ def _exclusive_file_lock(path: Path) -> Iterator[None]:
 
 
 class RecordIdentityCatalog:
-    """Private filesystem owner for one RecordStore identity high-water mark."""
+    """Private filesystem owner for one RecordStore identity high-water mark.
+
+    ``allocate`` hands out sequences from a block of ``id_block_size`` leased
+    under the file lock; the durable high-water mark already covers the whole
+    block, so sequences are never reused after a crash (unused ones become
+    gaps). Their manifests are buffered and written ``manifest_batch_size``
+    at a time, and always before any operation that reads manifests.
+    """
 
     def __init__(
         self,
@@ -107,6 +153,8 @@ class RecordIdentityCatalog:
         record_store_id: str,
         create: bool = True,
         private_write: bool = True,
+        id_block_size: int = 1024,
+        manifest_batch_size: int = 64,
     ) -> None:
         if not str(record_store_id or "").strip():
             raise ValueError("RecordStore identity catalog requires a record_store_id.")
@@ -118,9 +166,30 @@ class RecordIdentityCatalog:
         self.state_path = self.root / "state.json"
         self.lock_path = self.root / "state.lock"
         self.pins_path = self.root / "pins.json"
+        self.id_block_size = max(1, int(id_block_size))
+        self.manifest_batch_size = max(1, int(manifest_batch_size))
+        self._lease_lock = threading.Lock()
+        self._block_lock = threading.Lock()
+        self._block_next = 1
+        self._block_end = 0
+        self._pending_lock = threading.Lock()
+        self._pending_manifests: list[tuple[Path, dict[str, Any]]] = []
+        # Buffered manifests still reach disk when the catalog is dropped or the interpreter exits.
+        weakref.finalize(self, _write_manifest_batch, self._pending_manifests, self._pending_lock, root=self.root)
 
     async def allocate(self, kind: IdentityKind) -> ScopedIdentity:
-        return await asyncio.to_thread(self._allocate_sync, kind)
+        identity = self._allocate_from_block(kind)
+        while identity is None:
+            await asyncio.to_thread(self._lease_block_sync)
+            identity = self._allocate_from_block(kind)
+        if len(self._pending_manifests) >= self.manifest_batch_size:
+            await asyncio.to_thread(self.flush)
+        return identity
+
+    def flush(self) -> None:
+        """Write buffered identity manifests."""
+        if self._pending_manifests:
+            _write_manifest_batch(self._pending_manifests, self._pending_lock)
 
     async def lease_task_range(self, task_id: str, *, size: int = 1024) -> tuple[int, int]:
         return await asyncio.to_thread(self._lease_task_range_sync, task_id, size)
@@ -221,11 +290,63 @@ class RecordIdentityCatalog:
     async def discard(self, entity_ids: Sequence[str]) -> tuple[str, ...]:
         return await asyncio.to_thread(self._discard_sync, tuple(entity_ids))
 
-    def _allocate_sync(self, kind: IdentityKind) -> ScopedIdentity:
-        self._require_persistence()
-        self.root.mkdir(parents=True, exist_ok=True)
-        with _exclusive_file_lock(self.lock_path):
-            return self._allocate_locked(kind)
+    def _allocate_from_block(self, kind: IdentityKind) -> ScopedIdentity | None:
+        try:
+            prefix = IDENTITY_PREFIXES[kind]
+        except KeyError as error:
+            raise ValueError(f"Unknown RecordStore identity kind: {kind!r}.") from error
+        with self._block_lock:
+            if self._block_next > self._block_end:
+                return None
+            sequence = self._block_next
+            self._block_next += 1
+        identity = ScopedIdentity(
+            scope_kind="record_store",
+            scope_id=self.record_store_id,
+            entity_id=f"{prefix}_{encode_base62(sequence)}",
+            sequence=sequence,
+        )
+        manifest_path = self._manifest_path(kind, sequence)
+        if manifest_path.exists():
+            raise RecordStoreError("RecordStore identity state regressed to an already allocated sequence.")
+        with self._pending_lock:
+            self._pending_manifests.append(
+                (
+                    manifest_path,
+                    {
+                        "schema_version": RECORD_IDENTITY_OBJECT_SCHEMA_VERSION,
+                        "scope_kind": identity.scope_kind,
+                        "scope_id": identity.scope_id,
+                        "entity_id": identity.entity_id,
+                        "sequence": str(identity.sequence),
+                        "kind": kind,
+                    },
+                )
+            )
+        return identity
+
+    def _lease_block_sync(self) -> None:
+        with self._lease_lock:
+            with self._block_lock:
+                if self._block_next <= self._block_end:
+                    return
+            self._require_persistence()
+            self.root.mkdir(parents=True, exist_ok=True)
+            with _exclusive_file_lock(self.lock_path):
+                state = self._read_state()
+                start = int(state["high_water"]) + 1
+                end = start + self.id_block_size - 1
+                _write_json_atomic(
+                    self.state_path,
+                    {
+                        "schema_version": RECORD_IDENTITY_STATE_SCHEMA_VERSION,
+                        "record_store_id": self.record_store_id,
+                        "high_water": str(end),
+                        "revision": int(state["revision"]) + 1,
+                    },
+                )
+            with self._block_lock:
+                self._block_next, self._block_end = start, end
 
     def _allocate_locked(
         self,
@@ -376,6 +497,7 @@ class RecordIdentityCatalog:
             )
 
     def _resolve_sync(self, entity_id: str) -> dict[str, Any]:
+        self.flush()
         kind, sequence = self._parse_entity_id(entity_id)
         path = self._manifest_path(kind, sequence)
         if not path.exists():
@@ -532,6 +654,7 @@ class RecordIdentityCatalog:
         strong_roots: Sequence[str],
         audit_retained_ids: Sequence[str],
     ) -> IdentityRetentionReport:
+        self.flush()
         if not self.state_path.exists():
             return IdentityRetentionReport((), (), (), (), "0")
         self._require_persistence()
@@ -635,6 +758,7 @@ class RecordIdentityCatalog:
 
     def _discard_sync(self, entity_ids: Sequence[str]) -> tuple[str, ...]:
         normalized = tuple(dict.fromkeys(str(entity_id).strip() for entity_id in entity_ids))
+        self.flush()
         if not normalized or not self.state_path.exists():
             return ()
         self._require_persistence()
@@ -14,19 +14,20 @@
 
 from __future__ import annotations
 
-import asyncio
 import base64
 import hashlib
 import json
 import sqlite3
 import time
 import uuid
-from collections.abc import AsyncIterator, Callable, Sequence
+import weakref
+from collections.abc import AsyncIterator, Callable, Mapping, Sequence
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, TypeVar, cast
 
 from agently.types.data.event import RuntimeEvent, RuntimeEventDict
+from agently.utils.SnapshotDelta import is_snapshot_delta, read_snapshot_chain
 from agently.types.data.record_store import (
     RecordStoreCapabilities,
     RecordContentSegment,
@@ -34,6 +35,7 @@ from agently.types.data.record_store import (
     RecordLink,
     RecordRef,
     RecordReference,
+    RecordSearchPage,
     SnapshotPruneResult,
     SnapshotRetentionPolicy,
     StoredRuntimeEvent,
@@ -42,7 +44,16 @@ from agently.types.data.record_store import (
 from .Errors import RecordStorePolicyError
 from .Identity import RecordIdentityCatalog
 from .SnapshotRetention import normalize_snapshot_retention
-from .Stores import VectorIndexPipeline
+from .Stores import SQLiteEmbeddingCache, VectorIndexPipeline, embed_texts_cached
+from ._sqlite import GroupCommitPolicy, SQLiteEngine
+
+T = TypeVar("T")
+
+# Scope keys with an expression index on ``records``. Filters on these keys are
+# compiled to exactly the indexed expression so SQLite can use the index.
+_INDEXED_SCOPE_KEYS = ("execution_id", "session_id")
+_TEXT_COLUMNS = frozenset({"id", "collection", "kind", "path", "sha256", "summary", "created_at"})
+_JSON_COLUMNS = frozenset({"scope", "source", "meta"})
 
 
 def _now() -> str:
@@ -62,6 +73,10 @@ def _json_loads(value: str | None, default: Any) -> Any:
         return default
 
 
+def _casefold(value: Any) -> str | None:
+    return value.casefold() if isinstance(value, str) else None
+
+
 def _sanitize(value: Any) -> Any:
     return _json_loads(_json(value), None)
 
@@ -73,6 +88,11 @@ class LocalRecordStore:
     path arithmetic only: neither the directory nor SQLite is created until a
     persistence operation explicitly needs it. Each feature creates only its
     own tables.
+
+    SQLite work runs on a per-store ``SQLiteEngine``: one long-lived WAL writer
+    connection on a dedicated thread plus ``read_connections`` pooled readers.
+    ``group_commit=True`` (or ``{"window": seconds, "max_batch": n}``) lets
+    concurrent ``put`` and ``append_runtime_event`` calls share one commit.
     """
 
     name = "local"
@@ -85,6 +105,8 @@ class LocalRecordStore:
         mode: str = "read_write",
         initialize_default_vector_store_provider: bool = False,
         snapshot_retention: SnapshotRetentionPolicy | None = None,
+        group_commit: bool | Mapping[str, Any] | None = None,
+        read_connections: int = 2,
         **_: Any,
     ) -> None:
         if mode not in {"read", "read_only", "readonly", "read_write", "write"}:
@@ -93,7 +115,12 @@ class LocalRecordStore:
         self.db_path = self.root / "records.db"
         self.create = bool(create)
         self.read_only = mode in {"read", "read_only", "readonly"}
-        self._lock = asyncio.Lock()
+        self._engine = SQLiteEngine(
+            self.db_path,
+            read_connections=read_connections,
+            group_commit=GroupCommitPolicy.from_value(group_commit),
+        )
+        weakref.finalize(self, self._engine.close)
         self._identity_catalog = RecordIdentityCatalog(
             self.root,
             record_store_id=self.record_store_id,
@@ -107,6 +134,13 @@ class LocalRecordStore:
         self.vector_store_provider: Any | None = None
         self.vector_store_provider_name: str | None = None
         self.vector_store_fallback_reason: str | None = None
+        # Side file keyed by (embedding identity, sha256(text)); created on the
+        # first vector write so unchanged content is never embedded twice.
+        self.embedding_cache = SQLiteEmbeddingCache(
+            self.root / "embeddings.db",
+            read_only=self.read_only,
+            create=self.create,
+        )
         self.vector_index = VectorIndexPipeline(
             embedding_provider=None,
             vector_store_provider=None,
@@ -176,23 +210,49 @@ class LocalRecordStore:
         self.vector_index = VectorIndexPipeline(
             embedding_provider=self.embedding_provider,
             vector_store_provider=self.vector_store_provider,
+            embedding_cache=self.embedding_cache,
         )
         return self.embedding_provider, self.vector_store_provider
 
-    def _connect(self, *, write: bool = False) -> sqlite3.Connection:
-        if write:
-            if self.read_only:
-                raise RecordStorePolicyError("RecordStore persistence backend is read-only.")
-            if not self.db_path.exists():
-                if not self.create:
-                    raise RecordStorePolicyError("RecordStore persistence is not initialized and create=False.")
-                self.root.mkdir(parents=True, exist_ok=True)
-        if not self.db_path.exists() and not write:
+    async def _write(
+        self,
+        operation: Callable[[sqlite3.Connection], T],
+        *,
+        grouped: bool = False,
+        discard_if: Callable[[T], bool] | None = None,
+    ) -> T:
+        if self.read_only:
+            raise RecordStorePolicyError("RecordStore persistence backend is read-only.")
+        if not self.db_path.exists():
+            if not self.create:
+                raise RecordStorePolicyError("RecordStore persistence is not initialized and create=False.")
+            self.root.mkdir(parents=True, exist_ok=True)
+        return await self._engine.write(operation, grouped=grouped, discard_if=discard_if)
+
+    async def _read(self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        if not self.db_path.exists():
             raise FileNotFoundError(f"RecordStore database does not exist: {self.db_path}")
-        connection = sqlite3.connect(self.db_path, timeout=30)
-        connection.row_factory = sqlite3.Row
-        connection.execute("PRAGMA foreign_keys = ON")
-        return connection
+        return await self._engine.read(operation)
+
+    def _ensure_table(
+        self,
+        connection: sqlite3.Connection,
+        name: str,
+        create: Callable[[sqlite3.Connection], None],
+    ) -> None:
+        # DDL runs once per writer connection instead of on every write.
+        if name not in self._engine.ensured_schema:
+            create(connection)
+            self._engine.ensured_schema.add(name)
+
+    def engine_stats(self) -> dict[str, int]:
+        """Return writer transaction/batch counters of the SQLite engine."""
+        return self._engine.stats()
+
+    def close(self) -> None:
+        """Close pooled SQLite connections; later operations reopen them."""
+        self._identity_catalog.flush()
+        self._engine.close()
 
     @staticmethod
     def _create_records_table(connection: sqlite3.Connection) -> None:
@@ -215,6 +275,12 @@ class LocalRecordStore:
             )
             """
         )
+        connection.execute("CREATE INDEX IF NOT EXISTS records_recent ON records (created_at DESC, id DESC)")
+        connection.execute("CREATE INDEX IF NOT EXISTS records_collection ON records (collection, kind)")
+        for key in _INDEXED_SCOPE_KEYS:
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS records_scope_{ key } ON records (json_extract(scope, '$.{ key }'))"
+            )
 
     @staticmethod
     def _serialize_content(content: Any) -> tuple[str, str, bytes]:
@@ -291,39 +357,40 @@ class LocalRecordStore:
             "created_at": created_at,
             "meta": dict(meta or {}),
         }
-        async with self._lock:
-            with self._connect(write=True) as connection:
-                self._create_records_table(connection)
+
+        def insert(connection: sqlite3.Connection) -> None:
+            self._ensure_table(connection, "records", self._create_records_table)
+            connection.execute(
+                """
+                INSERT INTO records (
+                    id, collection, kind, content, content_format, path, sha256,
+                    size, summary, scope, source, created_at, meta
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    record_id,
+                    ref["collection"],
+                    kind,
+                    stored,
+                    content_format,
+                    None,
+                    ref["sha256"],
+                    ref["size"],
+                    ref["summary"],
+                    _json(ref["scope"]),
+                    _json(ref["source"]),
+                    created_at,
+                    _json(ref["meta"]),
+                ),
+            )
+            if indexed:
+                self._ensure_table(connection, "records_fts", self._create_fts_table)
                 connection.execute(
-                    """
-                    INSERT INTO records (
-                        id, collection, kind, content, content_format, path, sha256,
-                        size, summary, scope, source, created_at, meta
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        record_id,
-                        ref["collection"],
-                        kind,
-                        stored,
-                        content_format,
-                        None,
-                        ref["sha256"],
-                        ref["size"],
-                        ref["summary"],
-                        _json(ref["scope"]),
-                        _json(ref["source"]),
-                        created_at,
-                        _json(ref["meta"]),
-                    ),
+                    "INSERT INTO records_fts (id, content, summary) VALUES (?, ?, ?)",
+                    (record_id, self._content_text(content), ref["summary"]),
                 )
-                if indexed:
-                    self._create_fts_table(connection)
-                    connection.execute(
-                        "INSERT INTO records_fts (id, content, summary) VALUES (?, ?, ?)",
-                        (record_id, self._content_text(content), ref["summary"]),
-                    )
-                connection.commit()
+
+        await self._write(insert, grouped=True)
         self._materialized_components.add("records")
 
         provider = self._ensure_db_store_provider()
@@ -333,40 +400,44 @@ class LocalRecordStore:
                 await provider.index_record(ref, self._content_text(content))
         if vector:
             embedding_provider, vector_provider = self.ensure_vector_index()
-            embeddings = await embedding_provider.embed_texts([self._content_text(content)])
-            if not embeddings:
+            embeddings, _stats = await embed_texts_cached(
+                embedding_provider,
+                [self._content_text(content)],
+                cache=self.embedding_cache,
+            )
+            if not embeddings or not embeddings[0]:
                 raise RuntimeError("RecordStore embedding provider returned no embedding.")
             await vector_provider.index_record(ref, embeddings[0])
         return ref
 
     async def put_record(self, ref: RecordRef) -> RecordRef:
-        async with self._lock:
-            with self._connect(write=True) as connection:
-                self._create_records_table(connection)
-                existing = connection.execute("SELECT id FROM records WHERE id = ?", (ref["id"],)).fetchone()
-                if existing is None:
-                    raise KeyError("RecordStore.put_record(...) can update metadata only for a locally stored record.")
-                connection.execute(
-                    """
-                    UPDATE records SET collection = ?, kind = ?, path = ?, sha256 = ?,
-                        size = ?, summary = ?, scope = ?, source = ?, created_at = ?, meta = ?
-                    WHERE id = ?
-                    """,
-                    (
-                        ref["collection"],
-                        ref.get("kind"),
-                        ref.get("path"),
-                        ref.get("sha256"),
-                        int(ref.get("size", 0)),
-                        str(ref.get("summary", "")),
-                        _json(ref.get("scope", {})),
-                        _json(ref.get("source", {})),
-                        str(ref.get("created_at") or _now()),
-                        _json(ref.get("meta", {})),
-                        ref["id"],
-                    ),
-                )
-                connection.commit()
+        def update(connection: sqlite3.Connection) -> None:
+            self._ensure_table(connection, "records", self._create_records_table)
+            existing = connection.execute("SELECT id FROM records WHERE id = ?", (ref["id"],)).fetchone()
+            if existing is None:
+                raise KeyError("RecordStore.put_record(...) can update metadata only for a locally stored record.")
+            connection.execute(
+                """
+                UPDATE records SET collection = ?, kind = ?, path = ?, sha256 = ?,
+                    size = ?, summary = ?, scope = ?, source = ?, created_at = ?, meta = ?
+                WHERE id = ?
+                """,
+                (
+                    ref["collection"],
+                    ref.get("kind"),
+                    ref.get("path"),
+                    ref.get("sha256"),
+                    int(ref.get("size", 0)),
+                    str(ref.get("summary", "")),
+                    _json(ref.get("scope", {})),
+                    _json(ref.get("source", {})),
+                    str(ref.get("created_at") or _now()),
+                    _json(ref.get("meta", {})),
+                    ref["id"],
+                ),
+            )
+
+        await self._write(update)
         provider = self._ensure_db_store_provider()
         if provider is not self:
             await provider.put_record(ref)
@@ -375,22 +446,25 @@ class LocalRecordStore:
     async def get_record(self, record_id: str) -> RecordRef | None:
         if not self.db_path.exists():
             return None
-        with self._connect() as connection:
+
+        def select(connection: sqlite3.Connection) -> sqlite3.Row | None:
             if not self._table_exists(connection, "records"):
                 return None
-            row = connection.execute("SELECT * FROM records WHERE id = ?", (record_id,)).fetchone()
+            return connection.execute("SELECT * FROM records WHERE id = ?", (record_id,)).fetchone()
+
+        row = await self._read(select)
         return self._row_to_ref(row) if row is not None else None
 
     async def index_record(self, ref: RecordRef, content: str) -> None:
-        async with self._lock:
-            with self._connect(write=True) as connection:
-                self._create_fts_table(connection)
-                connection.execute("DELETE FROM records_fts WHERE id = ?", (ref["id"],))
-                connection.execute(
-                    "INSERT INTO records_fts (id, content, summary) VALUES (?, ?, ?)",
-                    (ref["id"], content, str(ref.get("summary", ""))),
-                )
-                connection.commit()
+        def replace(connection: sqlite3.Connection) -> None:
+            self._ensure_table(connection, "records_fts", self._create_fts_table)
+            connection.execute("DELETE FROM records_fts WHERE id = ?", (ref["id"],))
+            connection.execute(
+                "INSERT INTO records_fts (id, content, summary) VALUES (?, ?, ?)",
+                (ref["id"], content, str(ref.get("summary", ""))),
+            )
+
+        await self._write(replace)
         self._materialized_components.add("text_index")
 
     @staticmethod
@@ -413,12 +487,15 @@ class LocalRecordStore:
         record_id = self._record_id(ref_or_path)
         if not self.db_path.exists():
             raise KeyError(f"RecordStore record not found: {record_id}")
-        with self._connect() as connection:
+
+        def select(connection: sqlite3.Connection) -> sqlite3.Row | None:
             if not self._table_exists(connection, "records"):
                 raise KeyError(f"RecordStore record not found: {record_id}")
-            row = connection.execute(
+            return connection.execute(
                 "SELECT content, content_format FROM records WHERE id = ?", (record_id,)
             ).fetchone()
+
+        row = await self._read(select)
         if row is None:
             raise KeyError(f"RecordStore record not found: {record_id}")
         return self._decode_content(str(row["content"]), str(row["content_format"]))
@@ -492,24 +569,194 @@ class LocalRecordStore:
         self,
         query: str | None = None,
         filters: dict[str, Any] | None = None,
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+        match: str = "auto",
     ) -> list[RecordRef]:
+        page = await self.search_page(query, filters, limit=limit, cursor=cursor, match=match)
+        return page["records"]
+
+    async def search_page(
+        self,
+        query: str | None = None,
+        filters: dict[str, Any] | None = None,
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+        match: str = "auto",
+    ) -> RecordSearchPage:
+        """Search records with filters, ranking and pagination done in SQLite.
+
+        Without a query, records are returned newest first. With a query,
+        ``match="auto"`` (and its alias ``"substring"``) keeps the casefolded
+        substring match over content and summary, newest first.
+        ``match="fulltext"`` puts records whose full-text index matches the
+        query as one phrase first, ranked by bm25, followed by the remaining
+        substring matches, so it never finds fewer records than ``"auto"``.
+        ``cursor`` is the ``next_cursor`` of the previous page.
+        """
+        if match not in {"auto", "substring", "fulltext"}:
+            raise ValueError("RecordStore search match must be 'auto', 'substring' or 'fulltext'.")
+        if limit is not None and int(limit) <= 0:
+            raise ValueError("RecordStore search limit must be a positive integer.")
         if not self.db_path.exists():
-            return []
-        with self._connect() as connection:
-            if not self._table_exists(connection, "records"):
-                return []
-            rows = connection.execute("SELECT * FROM records ORDER BY created_at DESC, id DESC").fetchall()
+            return {"records": [], "next_cursor": None}
         needle = str(query or "").casefold()
-        resolved_filters = dict(filters or {})
-        results: list[RecordRef] = []
-        for row in rows:
-            ref = self._row_to_ref(row)
-            if needle and needle not in f"{row['content']}\n{row['summary']}".casefold():
-                continue
-            if not self._matches_filters(ref, resolved_filters):
-                continue
-            results.append(ref)
-        return results
+        clauses: list[str] = []
+        params: list[Any] = []
+        residual: dict[str, Any] = {}
+        for key, expected in dict(filters or {}).items():
+            compiled = self._compile_filter(key, expected)
+            if compiled is None:
+                residual[key] = expected
+            else:
+                clauses.append(compiled[0])
+                params.extend(compiled[1])
+        offset, after = self._decode_search_cursor(cursor, ranked=bool(needle))
+
+        def select(connection: sqlite3.Connection) -> tuple[list[sqlite3.Row], int, bool]:
+            if not self._table_exists(connection, "records"):
+                return [], offset, False
+            recent = " ORDER BY records.created_at DESC, records.id DESC"
+            statements: list[tuple[str, list[Any]]] = []
+            if needle:
+                connection.create_function("agently_casefold", 1, _casefold, deterministic=True)
+                substring = "instr(agently_casefold(records.content || char(10) || records.summary), ?) > 0"
+                substring_params: list[Any] = [needle]
+                if match == "fulltext" and self._table_exists(connection, "records_fts"):
+                    phrase = self._fts_phrase(str(query))
+                    statements.append(
+                        (
+                            "SELECT records.* FROM records_fts JOIN records ON records.id = records_fts.id"
+                            + " WHERE "
+                            + " AND ".join(["records_fts MATCH ?", *clauses])
+                            + " ORDER BY bm25(records_fts), records.created_at DESC, records.id DESC",
+                            [phrase, *params],
+                        )
+                    )
+                    # Token phrases miss substrings inside words and unsegmented
+                    # CJK text, so every record FTS did not return keeps the
+                    # substring match.
+                    substring = (
+                        "records.id NOT IN (SELECT id FROM records_fts WHERE records_fts MATCH ?)"
+                        f" AND { substring }"
+                    )
+                    substring_params = [phrase, needle]
+                statements.append(
+                    (
+                        "SELECT records.* FROM records WHERE " + " AND ".join([*clauses, substring]) + recent,
+                        [*params, *substring_params],
+                    )
+                )
+            else:
+                where = list(clauses)
+                bound = list(params)
+                if after is not None:
+                    where.append("(records.created_at, records.id) < (?, ?)")
+                    bound.extend(after)
+                sql = "SELECT records.* FROM records"
+                if where:
+                    sql += " WHERE " + " AND ".join(where)
+                statements.append((sql + recent, bound))
+            matched: list[sqlite3.Row] = []
+            consumed = 0
+            # Full-text hits (match="fulltext") come first, ranked by bm25. Rows
+            # are stepped lazily, so a page stops reading SQLite once it is full.
+            for sql, bound in statements:
+                for row in connection.execute(sql, bound):
+                    if consumed < offset:
+                        consumed += 1
+                        continue
+                    if limit is not None and len(matched) >= int(limit):
+                        return matched, consumed, True
+                    consumed += 1
+                    if residual and not self._matches_filters(self._row_to_ref(row), residual):
+                        continue
+                    matched.append(row)
+            return matched, consumed, False
+
+        rows, consumed, has_more = await self._read(select)
+        next_cursor: str | None = None
+        if has_more and needle:
+            next_cursor = f"o:{ consumed }"
+        elif has_more:
+            next_cursor = "k:" + _json([str(rows[-1]["created_at"]), str(rows[-1]["id"])])
+        return {"records": [self._row_to_ref(row) for row in rows], "next_cursor": next_cursor}
+
+    @staticmethod
+    def _decode_search_cursor(cursor: str | None, *, ranked: bool) -> tuple[int, tuple[str, str] | None]:
+        if not cursor:
+            return 0, None
+        kind, _, value = str(cursor).partition(":")
+        try:
+            if ranked and kind == "o":
+                offset = int(value)
+                if offset >= 0:
+                    return offset, None
+            elif not ranked and kind == "k":
+                created_at, record_id = json.loads(value)
+                return 0, (str(created_at), str(record_id))
+        except (TypeError, ValueError):
+            pass
+        raise ValueError("RecordStore search cursor is invalid for this query.")
+
+    @staticmethod
+    def _fts_phrase(text: str) -> str:
+        # One quoted FTS5 phrase: query syntax in user text is matched literally.
+        return '"' + text.replace('"', '""') + '"'
+
+    @staticmethod
+    def _compile_filter(key: str, expected: Any) -> tuple[str, list[Any]] | None:
+        """Compile one search filter to SQL, or ``None`` to filter in Python.
+
+        Only filters whose SQL comparison is equivalent to ``_matches_filters``
+        are compiled: scalar values on record columns and on top-level keys of
+        ``scope``/``source``/``meta``.
+        """
+        if "." in key:
+            prefix, child = key.split(".", 1)
+            if prefix not in _JSON_COLUMNS or '"' in child:
+                return None
+            if prefix == "scope" and child in _INDEXED_SCOPE_KEYS:
+                target = f"json_extract(records.scope, '$.{ child }')"
+                target_params: list[Any] = []
+            else:
+                target = f"json_extract(records.{ prefix }, ?)"
+                target_params = [f'$."{ child }"']
+            type_check = target.replace("json_extract", "json_type", 1)
+        elif key in _TEXT_COLUMNS or key == "size":
+            target, target_params, type_check = f"records.{ key }", [], None
+        else:
+            return None
+
+        def compare(value: Any) -> tuple[str, list[Any]] | None:
+            if value is None:
+                return f"{ target } IS NULL", list(target_params)
+            if isinstance(value, str):
+                if type_check is None:
+                    return (f"{ target } = ?", [*target_params, value]) if key != "size" else None
+                # Objects and arrays extract as JSON text; only JSON strings equal a str.
+                return f"({ target } = ? AND { type_check } = 'text')", [*target_params, value, *target_params]
+            if isinstance(value, int) and not -(2**63) <= value < 2**63:
+                return None
+            if isinstance(value, (bool, int, float)) and type_check is not None:
+                return f"{ target } = ?", [*target_params, value]
+            if isinstance(value, int) and not isinstance(value, bool) and key == "size":
+                return f"{ target } = ?", [value]
+            return None
+
+        if isinstance(expected, (list, tuple, set)):
+            parts = [compare(value) for value in expected]
+            if any(part is None for part in parts):
+                return None
+            if not parts:
+                return "0", []
+            return (
+                "(" + " OR ".join(part[0] for part in parts if part is not None) + ")",
+                [param for part in parts if part is not None for param in part[1]],
+            )
+        return compare(expected)
 
     @staticmethod
     def _matches_filters(ref: RecordRef, filters: dict[str, Any]) -> bool:
@@ -553,21 +800,22 @@ class LocalRecordStore:
             "created_at": _now(),
             "meta": dict(meta or {}),
         }
-        async with self._lock:
-            with self._connect(write=True) as connection:
-                self._create_links_table(connection)
-                connection.execute(
-                    "INSERT INTO links VALUES (?, ?, ?, ?, ?, ?)",
-                    (
-                        record["id"],
-                        record["source_id"],
-                        record["target_id"],
-                        record["relation"],
-                        record["created_at"],
-                        _json(record["meta"]),
-                    ),
-                )
-                connection.commit()
+
+        def insert(connection: sqlite3.Connection) -> None:
+            self._ensure_table(connection, "links", self._create_links_table)
+            connection.execute(
+                "INSERT INTO links VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    record["id"],
+                    record["source_id"],
+                    record["target_id"],
+                    record["relation"],
+                    record["created_at"],
+                    _json(record["meta"]),
+                ),
+            )
+
+        await self._write(insert)
         self._materialized_components.add("links")
         return record
 
@@ -581,10 +829,13 @@ class LocalRecordStore:
     ) -> list[RecordLink]:
         if not self.db_path.exists():
             return []
-        with self._connect() as connection:
+
+        def select(connection: sqlite3.Connection) -> list[sqlite3.Row]:
             if not self._table_exists(connection, "links"):
                 return []
-            rows = connection.execute("SELECT * FROM links ORDER BY created_at, id").fetchall()
+            return connection.execute("SELECT * FROM links ORDER BY created_at, id").fetchall()
+
+        rows = await self._read(select)
         any_id = self._record_id(ref_or_id) if ref_or_id is not None else None
         source_id = self._record_id(source) if source is not None else None
         target_id = self._record_id(target) if target is not None else None
@@ -692,79 +943,83 @@ class LocalRecordStore:
     ) -> RecordRef:
         state_version_value = state.get("state_version")
         state_version = int(state_version_value) if state_version_value is not None else None
-        deleted_record_ids: set[str] = set()
-        deleted_link_ids: set[str] = set()
-        async with self._lock:
-            record_id = (await self._identity_catalog.allocate("record")).entity_id
-            with self._connect(write=True) as connection:
-                self._create_recovery_tables(connection)
-                latest = connection.execute(
-                    "SELECT state_version FROM manifests WHERE run_id = ?", (run_id,)
-                ).fetchone()
-                current_version = int(latest["state_version"] or 0) if latest else 0
-                if expected_state_version is not None and current_version != expected_state_version:
-                    raise RuntimeError(
-                        f"RecordStore state version conflict for run '{run_id}': "
-                        f"expected {expected_state_version}, current is {current_version}."
-                    )
-                stored, content_format, raw = self._serialize_content(state)
-                created_at = _now()
-                scope = {"run_id": run_id}
-                if step_id is not None:
-                    scope["step_id"] = step_id
-                ref: RecordRef = {
-                    "id": record_id,
-                    "collection": "checkpoints",
-                    "kind": "snapshot",
-                    "path": None,
-                    "sha256": hashlib.sha256(raw).hexdigest(),
-                    "size": len(raw),
-                    "summary": f"Checkpoint for {run_id}",
-                    "scope": scope,
-                    "source": {"type": "record_store_recovery"},
-                    "created_at": created_at,
-                    "meta": {"state_version": state_version},
-                }
-                connection.execute(
-                    """
-                    INSERT INTO records VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        record_id,
-                        "checkpoints",
-                        "snapshot",
-                        stored,
-                        content_format,
-                        None,
-                        ref["sha256"],
-                        ref["size"],
-                        ref["summary"],
-                        _json(scope),
-                        _json(ref["source"]),
-                        created_at,
-                        _json(ref["meta"]),
-                    ),
-                )
-                connection.execute(
-                    "INSERT INTO checkpoints (run_id, step_id, record_id, state_version, created_at) VALUES (?, ?, ?, ?, ?)",
-                    (run_id, step_id, record_id, state_version, created_at),
+        record_id = (await self._identity_catalog.allocate("record")).entity_id
+
+        def insert(connection: sqlite3.Connection) -> tuple[RecordRef, set[str], set[str]]:
+            deleted_record_ids: set[str] = set()
+            deleted_link_ids: set[str] = set()
+            self._ensure_table(connection, "recovery", self._create_recovery_tables)
+            latest = connection.execute(
+                "SELECT state_version FROM manifests WHERE run_id = ?", (run_id,)
+            ).fetchone()
+            current_version = int(latest["state_version"] or 0) if latest else 0
+            if expected_state_version is not None and current_version != expected_state_version:
+                raise RuntimeError(
+                    f"RecordStore state version conflict for run '{run_id}': "
+                    f"expected {expected_state_version}, current is {current_version}."
                 )
-                connection.execute(
-                    """
-                    INSERT INTO manifests (run_id, latest_record_id, state_version, updated_at)
-                    VALUES (?, ?, ?, ?)
-                    ON CONFLICT(run_id) DO UPDATE SET latest_record_id = excluded.latest_record_id,
-                        state_version = excluded.state_version, updated_at = excluded.updated_at
-                    """,
-                    (run_id, record_id, state_version, created_at),
+            stored, content_format, raw = self._serialize_content(state)
+            created_at = _now()
+            scope = {"run_id": run_id}
+            if step_id is not None:
+                scope["step_id"] = step_id
+            # Delta records only make sense together with their base; pruning keeps the chain.
+            kind = "snapshot_delta" if is_snapshot_delta(state) else "snapshot"
+            ref: RecordRef = {
+                "id": record_id,
+                "collection": "checkpoints",
+                "kind": kind,
+                "path": None,
+                "sha256": hashlib.sha256(raw).hexdigest(),
+                "size": len(raw),
+                "summary": f"Checkpoint for {run_id}",
+                "scope": scope,
+                "source": {"type": "record_store_recovery"},
+                "created_at": created_at,
+                "meta": {"state_version": state_version},
+            }
+            connection.execute(
+                """
+                INSERT INTO records VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    record_id,
+                    "checkpoints",
+                    kind,
+                    stored,
+                    content_format,
+                    None,
+                    ref["sha256"],
+                    ref["size"],
+                    ref["summary"],
+                    _json(scope),
+                    _json(ref["source"]),
+                    created_at,
+                    _json(ref["meta"]),
+                ),
+            )
+            connection.execute(
+                "INSERT INTO checkpoints (run_id, step_id, record_id, state_version, created_at) VALUES (?, ?, ?, ?, ?)",
+                (run_id, step_id, record_id, state_version, created_at),
+            )
+            connection.execute(
+                """
+                INSERT INTO manifests (run_id, latest_record_id, state_version, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(run_id) DO UPDATE SET latest_record_id = excluded.latest_record_id,
+                    state_version = excluded.state_version, updated_at = excluded.updated_at
+                """,
+                (run_id, record_id, state_version, created_at),
+            )
+            if snapshot_keep_last is not None:
+                deleted_record_ids, deleted_link_ids, _ = self._prune_snapshot_records(
+                    connection,
+                    run_id=run_id,
+                    keep_last=snapshot_keep_last,
                 )
-                if snapshot_keep_last is not None:
-                    deleted_record_ids, deleted_link_ids, _ = self._prune_snapshot_records(
-                        connection,
-                        run_id=run_id,
-                        keep_last=snapshot_keep_last,
-                    )
-                connection.commit()
+            return ref, deleted_record_ids, deleted_link_ids
+
+        ref, deleted_record_ids, deleted_link_ids = await self._write(insert)
         if deleted_record_ids or deleted_link_ids:
             await self._identity_catalog.discard([*sorted(deleted_record_ids), *sorted(deleted_link_ids)])
         self._materialized_components.update({"records", "recovery"})
@@ -800,14 +1055,18 @@ class LocalRecordStore:
     ) -> tuple[set[str], set[str], int]:
         rows = connection.execute(
             """
-            SELECT record_id FROM checkpoints
-            WHERE run_id = ?
-            ORDER BY id DESC
-            LIMIT -1 OFFSET ?
+            SELECT checkpoints.record_id, records.kind FROM checkpoints
+            LEFT JOIN records ON records.id = checkpoints.record_id
+            WHERE checkpoints.run_id = ?
+            ORDER BY checkpoints.id DESC
             """,
-            (run_id, keep_last),
+            (run_id,),
         ).fetchall()
-        record_ids = {str(row["record_id"]) for row in rows}
+        retained = keep_last
+        # A retained delta needs every older record back to its base snapshot.
+        while retained < len(rows) and rows[retained - 1]["kind"] == "snapshot_delta":
+            retained += 1
+        record_ids = {str(row["record_id"]) for row in rows[retained:]}
         if not record_ids:
             return set(), set(), 0
 
@@ -871,24 +1130,22 @@ class LocalRecordStore:
                 "deleted_bytes": 0,
             }
 
-        deleted_record_ids: set[str] = set()
-        deleted_link_ids: set[str] = set()
-        deleted_bytes = 0
-        retained_records = 0
-        async with self._lock:
-            with self._connect(write=True) as connection:
-                if self._table_exists(connection, "checkpoints"):
-                    deleted_record_ids, deleted_link_ids, deleted_bytes = self._prune_snapshot_records(
-                        connection,
-                        run_id=run_id,
-                        keep_last=resolved_keep_last,
-                    )
-                    retained_row = connection.execute(
-                        "SELECT COUNT(*) AS value FROM checkpoints WHERE run_id = ?",
-                        (run_id,),
-                    ).fetchone()
-                    retained_records = int(retained_row["value"] or 0) if retained_row is not None else 0
-                connection.commit()
+        def prune(connection: sqlite3.Connection) -> tuple[set[str], set[str], int, int]:
+            if not self._table_exists(connection, "checkpoints"):
+                return set(), set(), 0, 0
+            deleted_record_ids, deleted_link_ids, deleted_bytes = self._prune_snapshot_records(
+                connection,
+                run_id=run_id,
+                keep_last=resolved_keep_last,
+            )
+            retained_row = connection.execute(
+                "SELECT COUNT(*) AS value FROM checkpoints WHERE run_id = ?",
+                (run_id,),
+            ).fetchone()
+            retained_records = int(retained_row["value"] or 0) if retained_row is not None else 0
+            return deleted_record_ids, deleted_link_ids, deleted_bytes, retained_records
+
+        deleted_record_ids, deleted_link_ids, deleted_bytes, retained_records = await self._write(prune)
 
         if deleted_record_ids or deleted_link_ids:
             await self._identity_catalog.discard([*sorted(deleted_record_ids), *sorted(deleted_link_ids)])
@@ -903,10 +1160,11 @@ class LocalRecordStore:
     async def latest_checkpoint(self, run_id: str) -> RecordRef | None:
         if not self.db_path.exists():
             return None
-        with self._connect() as connection:
+
+        def select(connection: sqlite3.Connection) -> sqlite3.Row | None:
             if not self._table_exists(connection, "manifests"):
                 return None
-            row = connection.execute(
+            return connection.execute(
                 """
                 SELECT records.* FROM manifests
                 JOIN records ON records.id = manifests.latest_record_id
@@ -914,6 +1172,8 @@ class LocalRecordStore:
                 """,
                 (run_id,),
             ).fetchone()
+
+        row = await self._read(select)
         return self._row_to_ref(row) if row is not None else None
 
     async def get_checkpoint(self, run_id: str) -> RecordRef | None:
@@ -939,106 +1199,104 @@ class LocalRecordStore:
                 "database_removed": False,
             }
 
-        deleted_record_ids: set[str] = set()
-        deleted_link_ids: set[str] = set()
-        deleted_bytes = 0
-        remove_database = False
-        async with self._lock:
-            with self._connect(write=True) as connection:
-                if self._table_exists(connection, "checkpoints"):
-                    rows = connection.execute(
-                        "SELECT record_id FROM checkpoints WHERE run_id = ?",
-                        (run_id,),
-                    ).fetchall()
-                    deleted_record_ids.update(str(row["record_id"]) for row in rows)
-
-                if self._table_exists(connection, "records"):
-                    rows = connection.execute("SELECT id, size, scope, source, meta FROM records").fetchall()
-                    for row in rows:
-                        scope = _json_loads(row["scope"], {})
-                        source = _json_loads(row["source"], {})
-                        meta = _json_loads(row["meta"], {})
-                        if not isinstance(scope, dict) or str(scope.get("run_id") or "") != run_id:
-                            continue
-                        source_type = str(source.get("type") or "") if isinstance(source, dict) else ""
-                        generated_by = str(meta.get("generated_by") or "") if isinstance(meta, dict) else ""
-                        if source_type == "record_store_recovery" or generated_by == "triggerflow.compaction_policy":
-                            deleted_record_ids.add(str(row["id"]))
-
-                    if deleted_record_ids:
-                        placeholders = ",".join("?" for _ in deleted_record_ids)
-                        parameters = tuple(sorted(deleted_record_ids))
-                        size_row = connection.execute(
-                            f"SELECT COALESCE(SUM(size), 0) AS value FROM records WHERE id IN ({placeholders})",
+        def delete(connection: sqlite3.Connection) -> tuple[set[str], set[str], int, bool, bool]:
+            deleted_record_ids: set[str] = set()
+            deleted_link_ids: set[str] = set()
+            deleted_bytes = 0
+            if self._table_exists(connection, "checkpoints"):
+                rows = connection.execute(
+                    "SELECT record_id FROM checkpoints WHERE run_id = ?",
+                    (run_id,),
+                ).fetchall()
+                deleted_record_ids.update(str(row["record_id"]) for row in rows)
+
+            if self._table_exists(connection, "records"):
+                rows = connection.execute("SELECT id, size, scope, source, meta FROM records").fetchall()
+                for row in rows:
+                    scope = _json_loads(row["scope"], {})
+                    source = _json_loads(row["source"], {})
+                    meta = _json_loads(row["meta"], {})
+                    if not isinstance(scope, dict) or str(scope.get("run_id") or "") != run_id:
+                        continue
+                    source_type = str(source.get("type") or "") if isinstance(source, dict) else ""
+                    generated_by = str(meta.get("generated_by") or "") if isinstance(meta, dict) else ""
+                    if source_type == "record_store_recovery" or generated_by == "triggerflow.compaction_policy":
+                        deleted_record_ids.add(str(row["id"]))
+
+                if deleted_record_ids:
+                    placeholders = ",".join("?" for _ in deleted_record_ids)
+                    parameters = tuple(sorted(deleted_record_ids))
+                    size_row = connection.execute(
+                        f"SELECT COALESCE(SUM(size), 0) AS value FROM records WHERE id IN ({placeholders})",
+                        parameters,
+                    ).fetchone()
+                    deleted_bytes = int(size_row["value"] or 0) if size_row is not None else 0
+                    if self._table_exists(connection, "records_fts"):
+                        connection.execute(
+                            f"DELETE FROM records_fts WHERE id IN ({placeholders})",
                             parameters,
-                        ).fetchone()
-                        deleted_bytes = int(size_row["value"] or 0) if size_row is not None else 0
-                        if self._table_exists(connection, "records_fts"):
-                            connection.execute(
-                                f"DELETE FROM records_fts WHERE id IN ({placeholders})",
-                                parameters,
-                            )
-                        if self._table_exists(connection, "record_store_vectors"):
-                            connection.execute(
-                                f"DELETE FROM record_store_vectors WHERE record_id IN ({placeholders})",
-                                parameters,
-                            )
-                        if self._table_exists(connection, "links"):
-                            link_rows = connection.execute(
-                                f"SELECT id FROM links WHERE source_id IN ({placeholders}) OR target_id IN ({placeholders})",
-                                (*parameters, *parameters),
-                            ).fetchall()
-                            deleted_link_ids.update(str(row["id"]) for row in link_rows)
-                            connection.execute(
-                                f"DELETE FROM links WHERE source_id IN ({placeholders}) OR target_id IN ({placeholders})",
-                                (*parameters, *parameters),
-                            )
+                        )
+                    if self._table_exists(connection, "record_store_vectors"):
                         connection.execute(
-                            f"DELETE FROM records WHERE id IN ({placeholders})",
+                            f"DELETE FROM record_store_vectors WHERE record_id IN ({placeholders})",
                             parameters,
                         )
+                    if self._table_exists(connection, "links"):
+                        link_rows = connection.execute(
+                            f"SELECT id FROM links WHERE source_id IN ({placeholders}) OR target_id IN ({placeholders})",
+                            (*parameters, *parameters),
+                        ).fetchall()
+                        deleted_link_ids.update(str(row["id"]) for row in link_rows)
+                        connection.execute(
+                            f"DELETE FROM links WHERE source_id IN ({placeholders}) OR target_id IN ({placeholders})",
+                            (*parameters, *parameters),
+                        )
+                    connection.execute(
+                        f"DELETE FROM records WHERE id IN ({placeholders})",
+                        parameters,
+                    )
 
-                for table in ("checkpoints", "manifests", "leases"):
-                    if self._table_exists(connection, table):
-                        connection.execute(f"DELETE FROM {table} WHERE run_id = ?", (run_id,))
-
-                connection.commit()
-                semantic_tables = (
-                    "records",
-                    "records_fts",
-                    "record_store_vectors",
-                    "links",
-                    "checkpoints",
-                    "manifests",
-                    "leases",
-                    "runtime_events",
-                )
-                remove_database = not any(
-                    self._table_exists(connection, table)
-                    and connection.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone() is not None
-                    for table in semantic_tables
-                )
+            for table in ("checkpoints", "manifests", "leases"):
+                if self._table_exists(connection, table):
+                    connection.execute(f"DELETE FROM {table} WHERE run_id = ?", (run_id,))
+
+            semantic_tables = (
+                "records",
+                "records_fts",
+                "record_store_vectors",
+                "links",
+                "checkpoints",
+                "manifests",
+                "leases",
+                "runtime_events",
+            )
+            remove_database = not any(
+                self._table_exists(connection, table)
+                and connection.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone() is not None
+                for table in semantic_tables
+            )
+            records_remain = (
+                self._table_exists(connection, "records")
+                and connection.execute("SELECT 1 FROM records LIMIT 1").fetchone() is not None
+            )
+            return deleted_record_ids, deleted_link_ids, deleted_bytes, remove_database, records_remain
 
-            if remove_database:
-                for candidate in (
-                    self.db_path,
-                    Path(f"{self.db_path}-wal"),
-                    Path(f"{self.db_path}-shm"),
-                    Path(f"{self.db_path}-journal"),
-                ):
-                    try:
-                        candidate.unlink()
-                    except FileNotFoundError:
-                        pass
-                try:
-                    self.root.rmdir()
-                except OSError:
-                    pass
-                self._materialized_components.clear()
-            else:
-                if self._table_has_rows_from_disk("records") is False:
-                    self._materialized_components.discard("records")
-                self._materialized_components.discard("recovery")
+        # The writer thread closes its connections and deletes the database
+        # files right after this transaction commits, before any later write.
+        deleted_record_ids, deleted_link_ids, deleted_bytes, remove_database, records_remain = await self._write(
+            delete,
+            discard_if=lambda result: result[3],
+        )
+        if remove_database:
+            try:
+                self.root.rmdir()
+            except OSError:
+                pass
+            self._materialized_components.clear()
+        else:
+            if not records_remain:
+                self._materialized_components.discard("records")
+            self._materialized_components.discard("recovery")
 
         await self._identity_catalog.discard([*sorted(deleted_record_ids), *sorted(deleted_link_ids)])
 
@@ -1049,20 +1307,13 @@ class LocalRecordStore:
             "database_removed": remove_database,
         }
 
-    def _table_has_rows_from_disk(self, name: str) -> bool:
-        if not self.db_path.exists():
-            return False
-        with self._connect() as connection:
-            return (
-                self._table_exists(connection, name)
-                and connection.execute(f"SELECT 1 FROM {name} LIMIT 1").fetchone() is not None
-            )
-
     async def get_snapshot(self, run_id: str) -> dict[str, Any] | None:
         ref = await self.latest_checkpoint(run_id)
         if ref is None:
             return None
         data = await self.get_data(ref)
+        if is_snapshot_delta(data):
+            return await read_snapshot_chain(await self.checkpoint_history(run_id), self.get_data)
         return data if isinstance(data, dict) else None
 
     async def checkpoint_history(
@@ -1076,22 +1327,25 @@ class LocalRecordStore:
             raise ValueError("limit must be non-negative.")
         if not self.db_path.exists():
             return []
-        with self._connect() as connection:
+        query = (
+            "SELECT records.* FROM checkpoints JOIN records ON records.id = checkpoints.record_id "
+            "WHERE checkpoints.run_id = ?"
+        )
+        params: list[Any] = [run_id]
+        if step_id is not None:
+            query += " AND checkpoints.step_id = ?"
+            params.append(step_id)
+        query += " ORDER BY checkpoints.id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        def select(connection: sqlite3.Connection) -> list[sqlite3.Row]:
             if not self._table_exists(connection, "checkpoints"):
                 return []
-            query = (
-                "SELECT records.* FROM checkpoints JOIN records ON records.id = checkpoints.record_id "
-                "WHERE checkpoints.run_id = ?"
-            )
-            params: list[Any] = [run_id]
-            if step_id is not None:
-                query += " AND checkpoints.step_id = ?"
-                params.append(step_id)
-            query += " ORDER BY checkpoints.id DESC"
-            if limit is not None:
-                query += " LIMIT ?"
-                params.append(limit)
-            rows = connection.execute(query, params).fetchall()
+            return connection.execute(query, params).fetchall()
+
+        rows = await self._read(select)
         return [self._row_to_ref(row) for row in rows]
 
     @staticmethod
@@ -1132,78 +1386,80 @@ class LocalRecordStore:
             raise ValueError("RecordStore lease ttl must be positive.")
         now_epoch = time.time()
         now_text = _now()
-        async with self._lock:
-            with self._connect(write=True) as connection:
-                self._create_leases_table(connection)
-                existing = connection.execute("SELECT * FROM leases WHERE run_id = ?", (run_id,)).fetchone()
-                if (
-                    existing is not None
-                    and existing["released_at"] is None
-                    and float(existing["lease_until"]) > now_epoch
-                    and str(existing["owner_id"]) != owner_id
-                ):
-                    raise RuntimeError(f"RecordStore lease conflict for run '{run_id}'.")
-                token = uuid.uuid4().hex
-                connection.execute(
-                    """
-                    INSERT INTO leases VALUES (?, ?, ?, ?, ?, ?, ?, NULL, ?)
-                    ON CONFLICT(run_id) DO UPDATE SET owner_id = excluded.owner_id,
-                        lease_token = excluded.lease_token, lease_ttl = excluded.lease_ttl,
-                        lease_until = excluded.lease_until, claimed_at = excluded.claimed_at,
-                        heartbeat_at = excluded.heartbeat_at, released_at = NULL,
-                        state_version = excluded.state_version
-                    """,
-                    (
-                        run_id,
-                        owner_id,
-                        token,
-                        float(ttl),
-                        now_epoch + float(ttl),
-                        now_text,
-                        now_text,
-                        expected_state_version,
-                    ),
-                )
-                connection.commit()
-                row = connection.execute("SELECT * FROM leases WHERE run_id = ?", (run_id,)).fetchone()
+
+        def claim(connection: sqlite3.Connection) -> sqlite3.Row:
+            self._ensure_table(connection, "leases", self._create_leases_table)
+            existing = connection.execute("SELECT * FROM leases WHERE run_id = ?", (run_id,)).fetchone()
+            if (
+                existing is not None
+                and existing["released_at"] is None
+                and float(existing["lease_until"]) > now_epoch
+                and str(existing["owner_id"]) != owner_id
+            ):
+                raise RuntimeError(f"RecordStore lease conflict for run '{run_id}'.")
+            token = uuid.uuid4().hex
+            connection.execute(
+                """
+                INSERT INTO leases VALUES (?, ?, ?, ?, ?, ?, ?, NULL, ?)
+                ON CONFLICT(run_id) DO UPDATE SET owner_id = excluded.owner_id,
+                    lease_token = excluded.lease_token, lease_ttl = excluded.lease_ttl,
+                    lease_until = excluded.lease_until, claimed_at = excluded.claimed_at,
+                    heartbeat_at = excluded.heartbeat_at, released_at = NULL,
+                    state_version = excluded.state_version
+                """,
+                (
+                    run_id,
+                    owner_id,
+                    token,
+                    float(ttl),
+                    now_epoch + float(ttl),
+                    now_text,
+                    now_text,
+                    expected_state_version,
+                ),
+            )
+            return connection.execute("SELECT * FROM leases WHERE run_id = ?", (run_id,)).fetchone()
+
+        row = await self._write(claim)
         self._materialized_components.add("recovery")
         return self._row_to_lease(cast(sqlite3.Row, row))
 
     async def heartbeat_lease(self, run_id: str, owner_id: str, lease_token: str) -> ExecutionLease:
         now_epoch = time.time()
         now_text = _now()
-        async with self._lock:
-            with self._connect(write=True) as connection:
-                if not self._table_exists(connection, "leases"):
-                    raise RuntimeError(f"RecordStore lease is unavailable for run '{run_id}'.")
-                row = connection.execute("SELECT * FROM leases WHERE run_id = ?", (run_id,)).fetchone()
-                if (
-                    row is None
-                    or row["released_at"] is not None
-                    or str(row["owner_id"]) != owner_id
-                    or str(row["lease_token"]) != lease_token
-                    or float(row["lease_until"]) <= now_epoch
-                ):
-                    raise RuntimeError(f"RecordStore lease conflict or expired lease for run '{run_id}'.")
-                connection.execute(
-                    "UPDATE leases SET lease_until = ?, heartbeat_at = ? WHERE run_id = ?",
-                    (now_epoch + float(row["lease_ttl"]), now_text, run_id),
-                )
-                connection.commit()
-                row = connection.execute("SELECT * FROM leases WHERE run_id = ?", (run_id,)).fetchone()
+
+        def heartbeat(connection: sqlite3.Connection) -> sqlite3.Row:
+            if not self._table_exists(connection, "leases"):
+                raise RuntimeError(f"RecordStore lease is unavailable for run '{run_id}'.")
+            row = connection.execute("SELECT * FROM leases WHERE run_id = ?", (run_id,)).fetchone()
+            if (
+                row is None
+                or row["released_at"] is not None
+                or str(row["owner_id"]) != owner_id
+                or str(row["lease_token"]) != lease_token
+                or float(row["lease_until"]) <= now_epoch
+            ):
+                raise RuntimeError(f"RecordStore lease conflict or expired lease for run '{run_id}'.")
+            connection.execute(
+                "UPDATE leases SET lease_until = ?, heartbeat_at = ? WHERE run_id = ?",
+                (now_epoch + float(row["lease_ttl"]), now_text, run_id),
+            )
+            return connection.execute("SELECT * FROM leases WHERE run_id = ?", (run_id,)).fetchone()
+
+        row = await self._write(heartbeat)
         return self._row_to_lease(cast(sqlite3.Row, row))
 
     async def release_lease(self, run_id: str, owner_id: str, lease_token: str) -> ExecutionLease:
-        async with self._lock:
-            with self._connect(write=True) as connection:
-                if not self._table_exists(connection, "leases"):
-                    raise RuntimeError(f"RecordStore lease is unavailable for run '{run_id}'.")
-                row = connection.execute("SELECT * FROM leases WHERE run_id = ?", (run_id,)).fetchone()
-                if row is None or str(row["owner_id"]) != owner_id or str(row["lease_token"]) != lease_token:
-                    raise RuntimeError(f"RecordStore lease conflict for run '{run_id}'.")
-                connection.execute("UPDATE leases SET released_at = ? WHERE run_id = ?", (_now(), run_id))
-                connection.commit()
-                row = connection.execute("SELECT * FROM leases WHERE run_id = ?", (run_id,)).fetchone()
+        def release(connection: sqlite3.Connection) -> sqlite3.Row:
+            if not self._table_exists(connection, "leases"):
+                raise RuntimeError(f"RecordStore lease is unavailable for run '{run_id}'.")
+            row = connection.execute("SELECT * FROM leases WHERE run_id = ?", (run_id,)).fetchone()
+            if row is None or str(row["owner_id"]) != owner_id or str(row["lease_token"]) != lease_token:
+                raise RuntimeError(f"RecordStore lease conflict for run '{run_id}'.")
+            connection.execute("UPDATE leases SET released_at = ? WHERE run_id = ?", (_now(), run_id))
+            return connection.execute("SELECT * FROM leases WHERE run_id = ?", (run_id,)).fetchone()
+
+        row = await self._write(release)
         return self._row_to_lease(cast(sqlite3.Row, row))
 
     async def put_artifact_ref(
@@ -1314,67 +1570,70 @@ class LocalRecordStore:
         resolved_artifacts = [
             envelope for item in artifact_refs or [] if (envelope := await self._optional_envelope(item)) is not None
         ]
-        async with self._lock:
-            with self._connect(write=True) as connection:
-                self._create_runtime_events_table(connection)
-                if idempotency_key is not None:
-                    duplicate = connection.execute(
-                        "SELECT * FROM runtime_events WHERE execution_id = ? AND idempotency_key = ?",
-                        (execution_id, idempotency_key),
-                    ).fetchone()
-                    if duplicate is not None:
-                        return self._row_to_runtime_event(duplicate)
-                current = connection.execute(
-                    "SELECT COALESCE(MAX(sequence), 0) AS value FROM runtime_events WHERE execution_id = ?",
-                    (execution_id,),
+
+        def append(connection: sqlite3.Connection) -> tuple[sqlite3.Row, bool]:
+            self._ensure_table(connection, "runtime_events", self._create_runtime_events_table)
+            if idempotency_key is not None:
+                duplicate = connection.execute(
+                    "SELECT * FROM runtime_events WHERE execution_id = ? AND idempotency_key = ?",
+                    (execution_id, idempotency_key),
                 ).fetchone()
-                next_sequence = int(current["value"]) + 1
-                if expected_sequence is not None and int(expected_sequence) != next_sequence:
-                    raise RuntimeError(
-                        f"RecordStore runtime event sequence conflict for execution '{execution_id}': "
-                        f"expected {expected_sequence}, next sequence is {next_sequence}."
-                    )
-                resolved_sequence = int(sequence) if sequence is not None else next_sequence
-                if resolved_sequence != next_sequence:
-                    raise RuntimeError(
-                        f"RecordStore runtime event sequence conflict for execution '{execution_id}': "
-                        f"received {resolved_sequence}, next sequence is {next_sequence}."
-                    )
-                created_at = _now()
-                persisted_at = _now()
-                event_id = str(event_data.get("event_id") or uuid.uuid4().hex)
-                record_id = f"evt_{uuid.uuid4().hex}"
-                values = (
-                    record_id,
-                    execution_id,
-                    resolved_sequence,
-                    event_id,
-                    str(event_data.get("event_type") or "runtime.event"),
-                    state_version,
-                    idempotency_key,
-                    parent_id or meta.get("parent_event_id") or meta.get("parent_id"),
-                    causation_id or meta.get("causation_id"),
-                    parent_signal_id or meta.get("parent_signal_id"),
-                    node_id or meta.get("node_id"),
-                    operator_id or meta.get("operator_id"),
-                    interrupt_id or meta.get("interrupt_id"),
-                    resume_request_id or meta.get("resume_request_id"),
-                    actor_id or meta.get("actor_id"),
-                    lease_owner_id or meta.get("lease_owner_id"),
-                    aggregation_scope or meta.get("aggregation_scope"),
-                    _json(resolved_snapshot) if resolved_snapshot is not None else None,
-                    exchange_id,
-                    _json(resolved_artifacts),
-                    _json(event_data),
-                    created_at,
-                    persisted_at,
+                if duplicate is not None:
+                    return duplicate, True
+            current = connection.execute(
+                "SELECT COALESCE(MAX(sequence), 0) AS value FROM runtime_events WHERE execution_id = ?",
+                (execution_id,),
+            ).fetchone()
+            next_sequence = int(current["value"]) + 1
+            if expected_sequence is not None and int(expected_sequence) != next_sequence:
+                raise RuntimeError(
+                    f"RecordStore runtime event sequence conflict for execution '{execution_id}': "
+                    f"expected {expected_sequence}, next sequence is {next_sequence}."
                 )
-                connection.execute(
-                    "INSERT INTO runtime_events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                    values,
+            resolved_sequence = int(sequence) if sequence is not None else next_sequence
+            if resolved_sequence != next_sequence:
+                raise RuntimeError(
+                    f"RecordStore runtime event sequence conflict for execution '{execution_id}': "
+                    f"received {resolved_sequence}, next sequence is {next_sequence}."
                 )
-                connection.commit()
-                row = connection.execute("SELECT * FROM runtime_events WHERE id = ?", (record_id,)).fetchone()
+            created_at = _now()
+            persisted_at = _now()
+            event_id = str(event_data.get("event_id") or uuid.uuid4().hex)
+            record_id = f"evt_{uuid.uuid4().hex}"
+            values = (
+                record_id,
+                execution_id,
+                resolved_sequence,
+                event_id,
+                str(event_data.get("event_type") or "runtime.event"),
+                state_version,
+                idempotency_key,
+                parent_id or meta.get("parent_event_id") or meta.get("parent_id"),
+                causation_id or meta.get("causation_id"),
+                parent_signal_id or meta.get("parent_signal_id"),
+                node_id or meta.get("node_id"),
+                operator_id or meta.get("operator_id"),
+                interrupt_id or meta.get("interrupt_id"),
+                resume_request_id or meta.get("resume_request_id"),
+                actor_id or meta.get("actor_id"),
+                lease_owner_id or meta.get("lease_owner_id"),
+                aggregation_scope or meta.get("aggregation_scope"),
+                _json(resolved_snapshot) if resolved_snapshot is not None else None,
+                exchange_id,
+                _json(resolved_artifacts),
+                _json(event_data),
+                created_at,
+                persisted_at,
+            )
+            connection.execute(
+                "INSERT INTO runtime_events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                values,
+            )
+            return connection.execute("SELECT * FROM runtime_events WHERE id = ?", (record_id,)).fetchone(), False
+
+        row, duplicate = await self._write(append, grouped=True)
+        if duplicate:
+            return self._row_to_runtime_event(row)
         self._materialized_components.add("runtime_events")
         return self._row_to_runtime_event(cast(sqlite3.Row, row))
 
@@ -1391,25 +1650,28 @@ class LocalRecordStore:
             raise ValueError("limit must be non-negative.")
         if not self.db_path.exists():
             return []
-        with self._connect() as connection:
+        query = "SELECT * FROM runtime_events WHERE execution_id = ?"
+        params: list[Any] = [execution_id]
+        if sequence_from is not None:
+            query += " AND sequence >= ?"
+            params.append(sequence_from)
+        if sequence_to is not None:
+            query += " AND sequence <= ?"
+            params.append(sequence_to)
+        if event_id is not None:
+            query += " AND event_id = ?"
+            params.append(event_id)
+        query += " ORDER BY sequence"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        def select(connection: sqlite3.Connection) -> list[sqlite3.Row]:
             if not self._table_exists(connection, "runtime_events"):
                 return []
-            query = "SELECT * FROM runtime_events WHERE execution_id = ?"
-            params: list[Any] = [execution_id]
-            if sequence_from is not None:
-                query += " AND sequence >= ?"
-                params.append(sequence_from)
-            if sequence_to is not None:
-                query += " AND sequence <= ?"
-                params.append(sequence_to)
-            if event_id is not None:
-                query += " AND event_id = ?"
-                params.append(event_id)
-            query += " ORDER BY sequence"
-            if limit is not None:
-                query += " LIMIT ?"
-                params.append(limit)
-            rows = connection.execute(query, params).fetchall()
+            return connection.execute(query, params).fetchall()
+
+        rows = await self._read(select)
         return [self._row_to_runtime_event(row) for row in rows]
 
     def capabilities(self) -> RecordStoreCapabilities:
@@ -1420,6 +1682,7 @@ class LocalRecordStore:
             "external_write": False,
             "private_write": not self.read_only,
             "materialized_components": sorted(self._materialized_components),
+            "features": {"supports_snapshot_deltas": True},
         }
 
 
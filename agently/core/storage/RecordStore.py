@@ -33,6 +33,7 @@ from agently.types.data.record_store import (
     RecordLink,
     RecordRef,
     RecordReference,
+    RecordSearchPage,
     RecordRetrievalMethod,
     RecordRetrievalPackage,
     RecordRetrievalSelection,
@@ -41,6 +42,7 @@ from agently.types.data.record_store import (
     StoredRuntimeEvent,
 )
 from agently.types.plugins import RecordStoreBackend
+from agently.utils.SnapshotDelta import is_snapshot_delta, read_snapshot_chain
 from .Retrieval import RerankHandler, retrieve_records
 from .SnapshotRetention import normalize_snapshot_retention
 from ._defaults import default_record_store_root, merge_scope
@@ -330,11 +332,65 @@ class RecordStore:
             chunk_size=chunk_size,
         )
 
-    async def grep(self, query: str | None = None, filters: dict[str, Any] | None = None):
-        return await self.backend.search(query, self._scoped_filters(filters))
+    async def grep(
+        self,
+        query: str | None = None,
+        filters: dict[str, Any] | None = None,
+        *,
+        limit: int | None = None,
+    ):
+        page = await self._search_page(query, filters, limit=limit, cursor=None, match="substring")
+        return page["records"]
 
-    async def search(self, query: str | None = None, filters: dict[str, Any] | None = None):
-        return await self.backend.search(query, self._scoped_filters(filters))
+    async def search(
+        self,
+        query: str | None = None,
+        filters: dict[str, Any] | None = None,
+        *,
+        limit: int | None = None,
+        match: str = "auto",
+    ):
+        page = await self._search_page(query, filters, limit=limit, cursor=None, match=match)
+        return page["records"]
+
+    async def search_page(
+        self,
+        query: str | None = None,
+        filters: dict[str, Any] | None = None,
+        *,
+        limit: int = 50,
+        cursor: str | None = None,
+        match: str = "auto",
+    ) -> RecordSearchPage:
+        return await self._search_page(query, filters, limit=limit, cursor=cursor, match=match)
+
+    async def _search_page(
+        self,
+        query: str | None,
+        filters: dict[str, Any] | None,
+        *,
+        limit: int | None,
+        cursor: str | None,
+        match: str,
+    ) -> RecordSearchPage:
+        scoped = self._scoped_filters(filters)
+        search_page = getattr(self.backend, "search_page", None)
+        if callable(search_page):
+            search_page = cast(Callable[..., Awaitable[RecordSearchPage]], search_page)
+            return await search_page(query, scoped, limit=limit, cursor=cursor, match=match)
+        # Backends with only the minimum search contract are paged in memory.
+        if limit is not None and int(limit) <= 0:
+            raise ValueError("RecordStore search limit must be a positive integer.")
+        try:
+            offset = int(cursor or 0)
+        except (TypeError, ValueError) as error:
+            raise ValueError("RecordStore search cursor is invalid for this query.") from error
+        records = list(await self.backend.search(query, scoped))
+        end = len(records) if limit is None else offset + int(limit)
+        return {
+            "records": records[offset:end],
+            "next_cursor": str(end) if end < len(records) else None,
+        }
 
     async def retrieve(
         self,
@@ -488,6 +544,8 @@ class RecordStore:
         if ref is None:
             return None
         state = await self.get_data(ref)
+        if is_snapshot_delta(state):
+            return await read_snapshot_chain(await self.checkpoint_history(run_id), self.get_data)
         return state if isinstance(state, dict) else None
 
     async def latest_snapshot(self, run_id: str) -> RecordRef | None:
@@ -659,12 +717,19 @@ class RecordStore:
     def capabilities(self) -> RecordStoreCapabilities:
         materialized_components: list[str] = []
         private_write = True
+        features: dict[str, bool] = {}
         if self._backend is not None:
             backend_capabilities = dict(self._backend.capabilities())
             private_write = bool(backend_capabilities.get("private_write", False))
             components = backend_capabilities.get("materialized_components", [])
             if isinstance(components, list):
                 materialized_components = sorted(str(name) for name in components)
+            backend_features = backend_capabilities.get("features", {})
+            if isinstance(backend_features, dict):
+                features = {str(key): bool(value) for key, value in backend_features.items()}
+        elif self._provider is None:
+            # Not materialized yet; the default backend is the local store.
+            features = {"supports_snapshot_deltas": True}
         return cast(
             RecordStoreCapabilities,
             {
@@ -674,6 +739,7 @@ class RecordStore:
                 "external_write": self.mode == "read_write",
                 "private_write": private_write,
                 "materialized_components": materialized_components,
+                "features": features,
             },
         )
 
@@ -207,11 +207,16 @@ class RecordStoreRegistry:
             if path_or_backend is None:
                 path_or_backend = Path.cwd() / ".agently"
             backend_root = cast(str | Path, path_or_backend)
+            # The built-in sqlite DB store is the local backend itself, so its
+            # options tune the local SQLite engine.
+            sqlite_options = dict(db_store_options or {}) if db_store_provider in (None, "sqlite") else {}
             backend = LocalRecordStore(
                 backend_root,
                 create=create,
                 mode=mode,
                 initialize_default_vector_store_provider=False,
+                group_commit=sqlite_options.get("group_commit"),
+                read_connections=int(sqlite_options.get("read_connections", 2)),
             )
             self._configure_local_backend_components(
                 backend,
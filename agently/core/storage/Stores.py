@@ -14,10 +14,12 @@
 
 from __future__ import annotations
 
+import hashlib
 import importlib
 import inspect
 import math
 import sqlite3
+from array import array
 from collections.abc import Awaitable, Callable, Mapping, Sequence
 from pathlib import Path
 from typing import Any, Literal, cast
@@ -25,7 +27,7 @@ from typing import Any, Literal, cast
 from agently.types.data.record_store import RecordRef
 
 from .Errors import RecordStoreConfigurationError, RecordStorePolicyError
-from ._utils import json_dumps, json_loads
+from ._utils import json_dumps, json_loads, utc_now
 
 
 VectorSimilarity = Literal["cosine", "dot", "l2"]
@@ -105,6 +107,22 @@ class AgentEmbeddingProvider:
     def __init__(self, agent: Any):
         self.agent = agent
 
+    @property
+    def model(self) -> str | None:
+        """`requester/model@endpoint` the agent embeds with; None unless a model is set explicitly."""
+        get = getattr(getattr(self.agent, "settings", None), "get", None)
+        if not callable(get):
+            return None
+        requester = get("plugins.ModelRequester.activate", None)
+        if not requester:
+            return None
+        namespace = f"plugins.ModelRequester.{requester}"
+        model = get(f"{namespace}.model", None)
+        if not model:
+            return None
+        endpoint = get(f"{namespace}.full_url", None) or get(f"{namespace}.base_url", None)
+        return f"{requester}/{model}@{endpoint}" if endpoint else f"{requester}/{model}"
+
     async def embed_texts(self, texts: list[str]) -> list[list[float]]:
         execution = self.agent.input(texts)
         async_start = getattr(execution, "async_start", None)
@@ -118,6 +136,201 @@ class AgentEmbeddingProvider:
         return _coerce_embedding_vectors(embedding_result, len(texts))
 
 
+def embedding_identity(embedding_provider: Any) -> str:
+    """Return the `provider:model` identity that scopes cached embeddings."""
+    if embedding_provider is None:
+        return "none"
+    provider_id = str(
+        getattr(embedding_provider, "provider_id", None)
+        or getattr(embedding_provider, "name", None)
+        or f"{embedding_provider.__class__.__module__}."
+        f"{embedding_provider.__class__.__qualname__}"
+    )
+    model = str(getattr(embedding_provider, "model", None) or "default")
+    return f"{provider_id}:{model}"
+
+
+def embedding_text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def observed_input_tokens(embedding_provider: Any) -> int | None:
+    """Input tokens the provider reported for its last call, when it reports usage."""
+    usage = getattr(embedding_provider, "last_usage", None)
+    if not isinstance(usage, Mapping):
+        return None
+    value = usage.get("input_tokens")
+    if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+        return None
+    return value
+
+
+async def embed_texts_cached(
+    embedding_provider: Any,
+    texts: Sequence[str],
+    *,
+    cache: Any | None = None,
+    identity: str | None = None,
+    batch_size: int | None = None,
+) -> tuple[list[list[float]], dict[str, Any]]:
+    """
+    Embed `texts`, reusing vectors cached by `(identity, sha256(text))`.
+
+    Only texts missing from `cache` are sent to the provider, deduplicated
+    and split into calls of at most `batch_size` texts. The returned stats
+    carry `hits`, `misses`, the `embedded_texts` and `input_chars` actually
+    sent, `batches`, and the provider-reported `input_tokens` (None when any
+    batch did not report usage).
+
+    Vectors are only read from or written to `cache` when the provider
+    exposes a `model`: under a generic identity such as `agent:default`, a
+    model change would keep serving the previous model's vectors.
+    """
+    if batch_size is not None and batch_size < 1:
+        raise ValueError("Embedding batch_size must be positive.")
+    if not getattr(embedding_provider, "model", None):
+        cache = None
+    resolved_identity = identity or embedding_identity(embedding_provider)
+    digests = [embedding_text_digest(text) for text in texts]
+    cached: dict[str, list[float]] = {}
+    if cache is not None and digests:
+        cached = dict(await cache.get_embeddings(resolved_identity, sorted(set(digests))))
+    pending: dict[str, str] = {}
+    for digest, text in zip(digests, texts):
+        if digest not in cached:
+            pending.setdefault(digest, text)
+    pending_items = list(pending.items())
+    step = batch_size or max(1, len(pending_items))
+    input_tokens: int | None = 0
+    batches = 0
+    fresh: dict[str, list[float]] = {}
+    for start in range(0, len(pending_items), step):
+        batch = pending_items[start : start + step]
+        vectors = await embedding_provider.embed_texts([text for _digest, text in batch])
+        if not vectors:
+            vectors = [[] for _ in batch]
+        elif len(vectors) != len(batch):
+            raise ValueError("embedding provider returned a different vector count")
+        batches += 1
+        observed = observed_input_tokens(embedding_provider)
+        input_tokens = None if input_tokens is None or observed is None else input_tokens + observed
+        for (digest, _text), vector in zip(batch, vectors):
+            fresh[digest] = [float(value) for value in vector]
+    cacheable = {digest: vector for digest, vector in fresh.items() if vector}
+    if cache is not None and cacheable:
+        await cache.put_embeddings(resolved_identity, cacheable)
+    resolved = {**cached, **fresh}
+    stats = {
+        "hits": sum(1 for digest in digests if digest in cached),
+        "misses": sum(1 for digest in digests if digest not in cached),
+        "embedded_texts": len(pending_items),
+        "input_chars": sum(len(text) for _digest, text in pending_items),
+        "batches": batches,
+        "input_tokens": input_tokens,
+    }
+    return [resolved[digest] for digest in digests], stats
+
+
+class SQLiteEmbeddingCache:
+    """Content-addressed embedding vectors persisted in one SQLite file."""
+
+    name = "sqlite"
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        *,
+        read_only: bool = False,
+        create: bool = True,
+    ):
+        self.db_path = Path(db_path).expanduser().resolve()
+        self.read_only = read_only
+        self.create = create
+        self._initialized = False
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        conn.execute("PRAGMA busy_timeout=30000")
+        return conn
+
+    def _ensure_table(self) -> bool:
+        if self._initialized:
+            return True
+        if not self.db_path.exists():
+            if self.read_only or not self.create:
+                return False
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embedding_cache (
+                    embedding_identity TEXT NOT NULL,
+                    text_sha256 TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY (embedding_identity, text_sha256)
+                )
+                """
+            )
+            conn.commit()
+        self._initialized = True
+        return True
+
+    async def get_embeddings(
+        self,
+        embedding_identity: str,
+        digests: Sequence[str],
+    ) -> dict[str, list[float]]:
+        found: dict[str, list[float]] = {}
+        if digests and self._ensure_table():
+            with self._connect() as conn:
+                # Stay well below SQLite's bound-parameter limit.
+                for start in range(0, len(digests), 500):
+                    chunk = list(digests[start : start + 500])
+                    placeholders = ",".join("?" for _ in chunk)
+                    rows = conn.execute(
+                        f"""
+                        SELECT text_sha256, vector FROM embedding_cache
+                        WHERE embedding_identity = ? AND text_sha256 IN ({ placeholders })
+                        """,
+                        [embedding_identity, *chunk],
+                    ).fetchall()
+                    for digest, blob in rows:
+                        found[str(digest)] = array("d", bytes(blob)).tolist()
+        self._hits += len(found)
+        self._misses += len(digests) - len(found)
+        return found
+
+    async def put_embeddings(
+        self,
+        embedding_identity: str,
+        embeddings: Mapping[str, Sequence[float]],
+    ) -> None:
+        if self.read_only or not embeddings or not self._ensure_table():
+            return
+        created_at = utc_now()
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO embedding_cache (
+                    embedding_identity, text_sha256, vector, created_at
+                ) VALUES (?, ?, ?, ?)
+                """,
+                [
+                    (embedding_identity, digest, array("d", vector).tobytes(), created_at)
+                    for digest, vector in embeddings.items()
+                ],
+            )
+            conn.commit()
+        self._writes += len(embeddings)
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self._hits, "misses": self._misses, "writes": self._writes}
+
+
 class NoopVectorIndex:
     name = "noop"
 
@@ -143,9 +356,11 @@ class VectorIndexPipeline:
         *,
         embedding_provider: Any | None,
         vector_store_provider: Any | None,
+        embedding_cache: Any | None = None,
     ):
         self.embedding_provider = embedding_provider
         self.vector_store_provider = vector_store_provider
+        self.embedding_cache = embedding_cache
         self.similarity = getattr(vector_store_provider, "similarity", None)
 
     async def index_record(self, ref: RecordRef, content: str) -> None:
@@ -153,7 +368,11 @@ class VectorIndexPipeline:
             raise VectorStoreProviderUnavailableError("RecordStore vector store is unavailable.")
         if self.embedding_provider is None:
             return
-        embeddings = await self.embedding_provider.embed_texts([content])
+        embeddings, _stats = await embed_texts_cached(
+            self.embedding_provider,
+            [content],
+            cache=self.embedding_cache,
+        )
         embedding = embeddings[0] if embeddings else []
         if embedding:
             await self.vector_store_provider.index_record(ref, embedding)
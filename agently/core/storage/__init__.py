@@ -24,6 +24,7 @@ from .Stores import (
     ChromaVectorStoreProvider,
     LocalVectorIndex,
     NoopVectorIndex,
+    SQLiteEmbeddingCache,
     SQLiteVectorStoreProvider,
     VectorIndexPipeline,
 )
@@ -37,6 +38,7 @@ __all__ = [
     "LocalVectorIndex",
     "LocalRecordStore",
     "NoopVectorIndex",
+    "SQLiteEmbeddingCache",
     "SQLiteVectorStoreProvider",
     "VectorIndexPipeline",
     "RecordStore",
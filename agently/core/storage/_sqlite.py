@@ -0,0 +1,382 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Long-lived SQLite connections for one ``LocalRecordStore`` database file.
+
+All writes run on one dedicated writer thread that owns a persistent WAL
+connection (``synchronous=NORMAL``), so the event loop never blocks on SQLite
+and each write no longer pays for a fresh connection and an fsync. Reads use a
+small pool of reader connections on worker threads; WAL lets them run while
+the writer commits.
+
+Writes submitted with ``grouped=True`` may be coalesced with other grouped
+writes that arrive within ``GroupCommitPolicy.window`` seconds into a single
+transaction. Each write runs inside its own savepoint, so one failing write
+rolls back alone and the rest of the batch still commits. A write's future
+resolves only after its transaction has committed.
+
+Connections are bound to the file they opened: when the database file is
+removed or replaced (for example by another store instance reclaiming an empty
+database), the next operation reopens it instead of writing to an unlinked
+inode.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Generic, Mapping, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class GroupCommitPolicy:
+    """How long and how many grouped writes may wait for one shared commit."""
+
+    window: float = 0.002
+    max_batch: int = 64
+
+    @classmethod
+    def from_value(cls, value: Any) -> "GroupCommitPolicy | None":
+        """Build a policy from a ``group_commit`` option.
+
+        ``None``/``False`` disables group commit, ``True`` uses the defaults and
+        a mapping may set ``window`` (seconds) and ``max_batch``.
+        """
+        if value is None or value is False:
+            return None
+        if value is True:
+            return cls()
+        if not isinstance(value, Mapping):
+            raise TypeError("RecordStore group_commit must be a bool or a mapping with window/max_batch.")
+        defaults = cls()
+        window = float(value.get("window", defaults.window))
+        max_batch = int(value.get("max_batch", defaults.max_batch))
+        if window < 0 or max_batch < 1:
+            raise ValueError("RecordStore group_commit window must be >= 0 and max_batch >= 1.")
+        return cls(window=window, max_batch=max_batch)
+
+
+class _WriteJob(Generic[T]):
+    __slots__ = ("operation", "grouped", "discard_if", "future")
+
+    def __init__(
+        self,
+        operation: Callable[[sqlite3.Connection], T] | None,
+        *,
+        grouped: bool,
+        discard_if: Callable[[T], bool] | None,
+    ):
+        self.operation = operation
+        self.grouped = grouped
+        self.discard_if = discard_if
+        self.future: Future[T] = Future()
+
+
+class SQLiteEngine:
+    def __init__(
+        self,
+        db_path: str | Path,
+        *,
+        read_connections: int = 2,
+        group_commit: GroupCommitPolicy | None = None,
+        cache_size_kib: int = 8192,
+        idle_timeout: float = 5.0,
+    ):
+        if read_connections < 1:
+            raise ValueError("RecordStore read_connections must be at least 1.")
+        self.db_path = Path(db_path)
+        self.group_commit = group_commit
+        self.cache_size_kib = int(cache_size_kib)
+        self.idle_timeout = float(idle_timeout)
+        # Tables created through this engine's current connections; cleared on
+        # rollback and reconnect so DDL is re-run only when it may be missing.
+        self.ensured_schema: set[str] = set()
+        self._state_lock = threading.Lock()
+        self._jobs: "queue.SimpleQueue[_WriteJob[Any]]" = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._writer: sqlite3.Connection | None = None
+        self._writer_inode: int | None = None
+        self._readers: list[tuple[sqlite3.Connection, int | None]] = []
+        self._reader_slots = threading.BoundedSemaphore(read_connections)
+        self._generation = 0
+        self._transactions = 0
+        self._writes = 0
+        self._largest_batch = 0
+
+    async def write(
+        self,
+        operation: Callable[[sqlite3.Connection], T],
+        *,
+        grouped: bool = False,
+        discard_if: Callable[[T], bool] | None = None,
+    ) -> T:
+        """Run ``operation`` in a write transaction on the writer thread.
+
+        ``operation`` must not commit; the engine commits once the transaction
+        (or the group-commit batch) is complete. When ``discard_if(result)`` is
+        true the engine closes every connection and deletes the database files
+        before it runs the next write.
+        """
+        job = _WriteJob(operation, grouped=grouped and self.group_commit is not None, discard_if=discard_if)
+        self._submit(job)
+        return await asyncio.wrap_future(job.future)
+
+    async def read(self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        """Run ``operation`` on a pooled reader connection off the event loop."""
+        return await asyncio.to_thread(self._read_sync, operation)
+
+    def stats(self) -> dict[str, int]:
+        with self._state_lock:
+            return {
+                "transactions": self._transactions,
+                "writes": self._writes,
+                "largest_batch": self._largest_batch,
+                "idle_readers": len(self._readers),
+            }
+
+    def close(self) -> None:
+        """Close pooled connections; later operations reopen them lazily.
+
+        The writer connection is closed on the writer thread after writes that
+        were already submitted, so pending writes are never dropped.
+        """
+        with self._state_lock:
+            self._generation += 1
+            readers = self._readers
+            self._readers = []
+            writer_idle = self._thread is None
+            if writer_idle:
+                writer, self._writer, self._writer_inode = self._writer, None, None
+                self.ensured_schema.clear()
+            else:
+                self._jobs.put(_WriteJob(None, grouped=False, discard_if=None))
+        for connection, _ in readers:
+            connection.close()
+        if writer_idle and writer is not None:
+            writer.close()
+
+    def _submit(self, job: _WriteJob[Any]) -> None:
+        with self._state_lock:
+            self._jobs.put(job)
+            if self._thread is None:
+                self._start_writer_locked()
+
+    def _start_writer_locked(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run_writer,
+            name=f"agently-record-store-writer:{ self.db_path.parent.name }",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _close_writer(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._writer_inode = None
+        self.ensured_schema.clear()
+
+    def _inode(self) -> int | None:
+        try:
+            return os.stat(self.db_path).st_ino
+        except FileNotFoundError:
+            return None
+
+    def _open(self, *, writer: bool) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.db_path,
+            timeout=30,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.execute(f"PRAGMA cache_size = -{ self.cache_size_kib }")
+        connection.execute("PRAGMA temp_store = MEMORY")
+        if writer:
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+        return connection
+
+    def _writer_connection(self) -> sqlite3.Connection:
+        inode = self._inode()
+        if self._writer is not None and (inode is None or inode != self._writer_inode):
+            self._writer.close()
+            self._writer = None
+            self.ensured_schema.clear()
+        if self._writer is None:
+            self._writer = self._open(writer=True)
+            self._writer_inode = self._inode()
+        return self._writer
+
+    def _read_sync(self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        with self._reader_slots:
+            inode = self._inode()
+            connection: sqlite3.Connection | None = None
+            stale: list[sqlite3.Connection] = []
+            with self._state_lock:
+                generation = self._generation
+                while self._readers:
+                    candidate, candidate_inode = self._readers.pop()
+                    if candidate_inode == inode:
+                        connection = candidate
+                        break
+                    stale.append(candidate)
+            for candidate in stale:
+                candidate.close()
+            if connection is None:
+                connection = self._open(writer=False)
+            try:
+                return operation(connection)
+            finally:
+                with self._state_lock:
+                    keep = generation == self._generation
+                    if keep:
+                        self._readers.append((connection, inode))
+                if not keep:
+                    connection.close()
+
+    def _run_writer(self) -> None:
+        try:
+            self._write_loop()
+        finally:
+            # A writer that stopped for any reason must not keep later writes
+            # waiting for a thread that no longer runs.
+            with self._state_lock:
+                if self._thread is threading.current_thread():
+                    self._thread = None
+                    if not self._jobs.empty():
+                        self._start_writer_locked()
+
+    def _write_loop(self) -> None:
+        while True:
+            try:
+                job = self._jobs.get(timeout=self.idle_timeout)
+            except queue.Empty:
+                with self._state_lock:
+                    if self._jobs.empty():
+                        self._thread = None
+                        return
+                continue
+            # Writes cancelled while queued are dropped; claimed ones can no longer be cancelled.
+            if not job.future.set_running_or_notify_cancel():
+                continue
+            if job.operation is None:
+                self._close_writer()
+                job.future.set_result(None)
+                continue
+            batch = [job]
+            deferred: _WriteJob[Any] | None = None
+            policy = self.group_commit
+            if job.grouped and policy is not None:
+                deadline = time.monotonic() + policy.window
+                while len(batch) < policy.max_batch:
+                    remaining = deadline - time.monotonic()
+                    try:
+                        candidate = self._jobs.get(timeout=remaining) if remaining > 0 else self._jobs.get_nowait()
+                    except queue.Empty:
+                        break
+                    if not candidate.future.set_running_or_notify_cancel():
+                        continue
+                    if not candidate.grouped or candidate.operation is None:
+                        deferred = candidate
+                        break
+                    batch.append(candidate)
+            self._execute(batch)
+            if deferred is not None and deferred.operation is None:
+                self._close_writer()
+                deferred.future.set_result(None)
+            elif deferred is not None:
+                self._execute([deferred])
+
+    def _execute(self, batch: list[_WriteJob[Any]]) -> None:
+        outcomes: list[tuple[Any, BaseException | None]] = []
+        try:
+            connection = self._writer_connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                if len(batch) == 1:
+                    outcomes.append((batch[0].operation(connection), None))  # type: ignore[misc]
+                else:
+                    for job in batch:
+                        connection.execute("SAVEPOINT agently_grouped_write")
+                        try:
+                            result = job.operation(connection)  # type: ignore[misc]
+                        except Exception as error:
+                            connection.execute("ROLLBACK TO agently_grouped_write")
+                            connection.execute("RELEASE agently_grouped_write")
+                            self.ensured_schema.clear()
+                            outcomes.append((None, error))
+                        else:
+                            connection.execute("RELEASE agently_grouped_write")
+                            outcomes.append((result, None))
+                connection.execute("COMMIT")
+            except BaseException:
+                if connection.in_transaction:
+                    connection.execute("ROLLBACK")
+                self.ensured_schema.clear()
+                raise
+        except BaseException as error:
+            for job in batch:
+                if not job.future.done():
+                    job.future.set_exception(error)
+            return
+        with self._state_lock:
+            self._transactions += 1
+            self._writes += len(batch)
+            self._largest_batch = max(self._largest_batch, len(batch))
+        for job, (result, error) in zip(batch, outcomes):
+            if error is None and job.discard_if is not None:
+                try:
+                    if job.discard_if(result):
+                        self._discard_database()
+                except Exception as discard_error:
+                    error = discard_error
+            if job.future.done():
+                continue
+            if error is not None:
+                job.future.set_exception(error)
+            else:
+                job.future.set_result(result)
+
+    def _discard_database(self) -> None:
+        with self._state_lock:
+            self._generation += 1
+            readers = self._readers
+            self._readers = []
+        for connection, _ in readers:
+            connection.close()
+        self._close_writer()
+        for candidate in (
+            self.db_path,
+            Path(f"{ self.db_path }-wal"),
+            Path(f"{ self.db_path }-shm"),
+            Path(f"{ self.db_path }-journal"),
+        ):
+            try:
+                candidate.unlink()
+            except FileNotFoundError:
+                pass
+
+
+__all__ = ["GroupCommitPolicy", "SQLiteEngine"]
@@ -309,6 +309,7 @@ from .record_store import (
     RecordRef,
     RecordReference,
     StoredRuntimeEvent,
+    RecordSearchPage,
     RecordSearchResult,
 )
 
@@ -23,7 +23,7 @@ from typing_extensions import TypedDict
 ObservationEventLevel: TypeAlias = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 RuntimeEventLevel: TypeAlias = ObservationEventLevel
 EventDeliveryMode: TypeAlias = Literal["raw", "summary"]
-EventDispatchMode: TypeAlias = Literal["await", "background"]
+EventDispatchMode: TypeAlias = Literal["await", "background", "inline"]
 
 _TRIGGERFLOW_WORKFLOW_SUFFIXES = frozenset(
     {
@@ -152,6 +152,10 @@ class EventDeliveryPolicy(TypedDict, total=False):
     max_summary_items: int | None
     idle_flush_seconds: float | None
     background_timeout: float | None
+    sample_every: int | None
+    max_per_second: float | None
+    sample_levels: list[str] | None
+    sample_event_types: list[str] | None
 
 
 RuntimeEventDict: TypeAlias = ObservationEventDict
@@ -15,7 +15,7 @@
 from __future__ import annotations
 
 from typing import Any, Literal
-from typing_extensions import TypedDict
+from typing_extensions import NotRequired, TypedDict
 
 
 class RecordRef(TypedDict):
@@ -63,6 +63,7 @@ class RecordStoreCapabilities(TypedDict):
     external_write: bool
     private_write: bool
     materialized_components: list[str]
+    features: NotRequired[dict[str, bool]]
 
 
 class RecordReference(TypedDict):
@@ -128,6 +129,11 @@ class ExecutionLease(TypedDict):
     state_version: int | None
 
 
+class RecordSearchPage(TypedDict):
+    records: list[RecordRef]
+    next_cursor: str | None
+
+
 class RecordSearchResult(TypedDict, total=False):
     ref: RecordRef
     score: float | None
@@ -38,7 +38,8 @@ class AgentlyRequestData(BaseModel):
     @field_validator("headers")
     @classmethod
     def fix_headers(cls, value: dict[str, str]):
-        value.update({"Connection": "close"})
+        # Requesters that lease pooled clients opt into keep-alive explicitly.
+        value.setdefault("Connection", "close")
         return value
 
     @model_validator(mode="after")
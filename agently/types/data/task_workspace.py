@@ -185,6 +185,7 @@ class TaskWorkspaceReadResult(TypedDict):
     diagnostics: list[TaskWorkspaceDiagnostic]
     file_refs: list[TaskWorkspaceFileRef]
     attachments: NotRequired[list[dict[str, Any]]]
+    source_units: NotRequired[list[str]]
 
 
 class TaskWorkspaceWriteResult(TypedDict):
@@ -274,6 +275,7 @@ class TaskWorkspaceFileRead(_ResultMapping):
     extraction_method: str = "plain_text"
     diagnostics: tuple[TaskWorkspaceDiagnostic, ...] = ()
     attachments: tuple[dict[str, Any], ...] = ()
+    source_units: tuple[str, ...] = ()
 
     @property
     def exists(self) -> bool:
@@ -308,6 +310,7 @@ class TaskWorkspaceFileRead(_ResultMapping):
             "extraction_method": self.extraction_method,
             "diagnostics": [dict(item) for item in self.diagnostics],
             "attachments": [dict(item) for item in self.attachments],
+            "source_units": list(self.source_units),
             "file_refs": [
                 {
                     "type": "file",
@@ -23,6 +23,10 @@ class EventHooker(AgentlyPlugin, Protocol):
     name: str
     event_types: list[str] | None
     delivery_policy: "EventDeliveryPolicy | None"
+    # Hookers may also define a static ``observes(event_type, level) -> bool``
+    # so producers can skip events the hooker would ignore. It is optional and
+    # deliberately not part of this protocol: hookers without it observe all
+    # routed events.
 
     @staticmethod
     def _on_register(): ...
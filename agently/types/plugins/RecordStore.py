@@ -14,7 +14,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Any, AsyncIterator, Protocol, runtime_checkable
 
 from agently.types.data.event import RuntimeEvent, RuntimeEventDict
@@ -364,6 +364,23 @@ class EmbeddingProvider(Protocol):
     async def embed_texts(self, texts: list[str]) -> list[list[float]]: ...
 
 
+@runtime_checkable
+class EmbeddingCache(Protocol):
+    name: str
+
+    async def get_embeddings(
+        self,
+        embedding_identity: str,
+        digests: Sequence[str],
+    ) -> dict[str, list[float]]: ...
+
+    async def put_embeddings(
+        self,
+        embedding_identity: str,
+        embeddings: Mapping[str, Sequence[float]],
+    ) -> None: ...
+
+
 @runtime_checkable
 class VectorStoreProvider(Protocol):
     name: str
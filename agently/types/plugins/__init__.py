@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .base import AgentlyPlugin, AgentlyPluginType
+from .base import AgentlyPlugin, AgentlyPluginType, LazyPlugin
 from .ContextSource import (
     ContextSource,
     ContextSourceChangeFeed,
@@ -46,6 +46,7 @@ from .RecordStore import (
     CheckpointStore,
     DBStoreProvider,
     DurableCheckpointStore,
+    EmbeddingCache,
     EmbeddingProvider,
     ExecutionSnapshotStore,
     ExecutionSnapshotRetentionStore,
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Literal, Protocol, runtime_checkable
+import importlib
+import threading
+from typing import Any, Literal, Mapping, Protocol, runtime_checkable
 
 AgentlyPluginType = Literal[
     "PromptGenerator",
@@ -68,3 +70,70 @@ class AgentlyPlugin(Protocol):
         Tasks to be done after unregister plugin
         """
         ...
+
+
+class LazyPlugin:
+    """
+    Import reference that can be registered in place of a plugin class.
+
+    `ref` uses the `package.module:ClassName` form. The declared `name`,
+    `DEFAULT_SETTINGS` and schemas are applied at registration time, so the
+    plugin module is only imported when the plugin is first requested. They
+    must match the loaded class; `load()` raises `ValueError` otherwise.
+    """
+
+    def __init__(
+        self,
+        ref: str,
+        *,
+        name: str | None = None,
+        default_settings: Mapping[str, Any] | None = None,
+        settings_schemas: Mapping[str, Any] | None = None,
+        options_schemas: Mapping[str, Any] | None = None,
+    ):
+        module_name, _, attribute_path = str(ref).partition(":")
+        if not module_name or not attribute_path:
+            raise ValueError(f"Lazy plugin reference must use 'module:attribute': { ref }")
+        self.ref = str(ref)
+        self.module_name = module_name
+        self.attribute_path = attribute_path
+        self.name = name if name is not None else attribute_path.rsplit(".", 1)[-1]
+        self.DEFAULT_SETTINGS: dict[str, Any] = dict(default_settings or {})
+        self.SETTINGS_SCHEMAS: dict[str, Any] = dict(settings_schemas or {})
+        self.OPTIONS_SCHEMAS: dict[str, Any] = dict(options_schemas or {})
+        self._plugin_class: Any = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._plugin_class is not None
+
+    def load(self) -> Any:
+        if self._plugin_class is not None:
+            return self._plugin_class
+        with self._lock:
+            if self._plugin_class is None:
+                value: Any = importlib.import_module(self.module_name)
+                for attribute in self.attribute_path.split("."):
+                    value = getattr(value, attribute)
+                if getattr(value, "name", None) != self.name:
+                    raise ValueError(
+                        f"Lazy plugin '{ self.ref }' declares name '{ self.name }' "
+                        f"but the loaded plugin is named '{ getattr(value, 'name', None) }'."
+                    )
+                for attribute in ("DEFAULT_SETTINGS", "SETTINGS_SCHEMAS", "OPTIONS_SCHEMAS"):
+                    declared = getattr(self, attribute)
+                    loaded = dict(getattr(value, attribute, None) or {})
+                    if loaded != declared:
+                        raise ValueError(
+                            f"Lazy plugin '{ self.ref }' declares { attribute } { declared !r} "
+                            f"but the loaded plugin has { loaded !r}."
+                        )
+                if hasattr(value, "_on_register"):
+                    value._on_register()
+                self._plugin_class = value
+        return self._plugin_class
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<LazyPlugin { self.name } ({ self.ref }, { state })>"
@@ -28,6 +28,14 @@ class _HTTPTimeoutSettings(AgentlyConfigModel):
     pool: float | None = None
 
 
+class _HTTPClientPoolSettings(AgentlyConfigModel):
+    enabled: bool | None = None
+    http2: bool | None = None
+    max_connections: int | None = None
+    max_keepalive_connections: int | None = None
+    keepalive_expiry: float | None = None
+
+
 class _RequestRetrySettings(AgentlyConfigModel):
     max_attempts: int | None = None
     after_output: bool | None = None
@@ -62,6 +70,7 @@ class OpenAICompatibleSettings(AgentlyConfigModel):
     stream_idle_timeout: float | None = None
     request_retry: _RequestRetrySettings | dict[str, int | bool | None] | bool | None = None
     client_options: dict[str, Any] | None = None
+    client_pool: _HTTPClientPoolSettings | dict[str, Any] | bool | None = None
     headers: dict[str, Any] | None = None
     proxy: str | None = None
     request_options: dict[str, Any] | None = None
@@ -90,6 +99,7 @@ class OpenAIResponsesCompatibleSettings(AgentlyConfigModel):
     stream_idle_timeout: float | None = None
     request_retry: _RequestRetrySettings | dict[str, int | bool | None] | bool | None = None
     client_options: dict[str, Any] | None = None
+    client_pool: _HTTPClientPoolSettings | dict[str, Any] | bool | None = None
     headers: dict[str, Any] | None = None
     proxy: str | None = None
     request_options: dict[str, Any] | None = None
@@ -113,6 +123,7 @@ class AnthropicCompatibleSettings(AgentlyConfigModel):
     stream_idle_timeout: float | None = None
     request_retry: _RequestRetrySettings | dict[str, int | bool | None] | bool | None = None
     client_options: dict[str, Any] | None = None
+    client_pool: _HTTPClientPoolSettings | dict[str, Any] | bool | None = None
     headers: dict[str, Any] | None = None
     proxy: str | None = None
     request_options: dict[str, Any] | None = None
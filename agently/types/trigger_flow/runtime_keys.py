@@ -27,6 +27,7 @@ DURABLE_SYSTEM_STATE_KEYS = (
     "batch_states",
     "collect_states",
     "for_each_results",
+    "for_each_states",
     "match_results",
 )
 
@@ -15,9 +15,158 @@
 import asyncio
 import contextlib
 import threading
-import queue as sync_queue
+from collections import deque
 from types import AsyncGeneratorType, GeneratorType
-from typing import AsyncGenerator, Awaitable, Callable, Generator, cast, Any
+from typing import AsyncGenerator, Awaitable, Callable, Generator, Literal, cast, Any
+
+OverflowPolicy = Literal["block", "drop_oldest", "coalesce"]
+HistoryPolicy = Literal["full", "none"] | int
+
+_Waiter = tuple[asyncio.AbstractEventLoop, asyncio.Future]
+
+
+def is_delta_message(message: Any) -> bool:
+    """Whether a message is an `("<name>delta", str)` stream event."""
+    return (
+        isinstance(message, tuple)
+        and len(message) == 2
+        and isinstance(message[0], str)
+        and message[0].endswith("delta")
+        and isinstance(message[1], str)
+    )
+
+
+def coalesce_delta_messages(previous: Any, current: Any) -> Any | None:
+    """Merge two adjacent delta events of the same kind, or return None."""
+    if is_delta_message(previous) and is_delta_message(current) and previous[0] == current[0]:
+        return (previous[0], previous[1] + current[1])
+    return None
+
+
+def _resolve_waiter(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
+def _wake(waiter: _Waiter | None):
+    if waiter is None:
+        return
+    loop, future = waiter
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is loop:
+        _resolve_waiter(future)
+        return
+    with contextlib.suppress(RuntimeError):
+        loop.call_soon_threadsafe(_resolve_waiter, future)
+
+
+class _Listener:
+    """
+    Per-listener buffer. The producer and the listener may run on different
+    event loops (sync consumers are served from the shared Stage loop), so
+    waiters are always woken through their own loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int | None,
+        overflow: OverflowPolicy,
+        coalesce: Callable[[Any, Any], Any | None],
+    ):
+        self.max_size = max_size
+        self.overflow = overflow
+        self.coalesce = coalesce
+        self.items: deque = deque()
+        self.dropped = 0
+        self.coalesced = 0
+        self.detached = False
+        self._lock = threading.Lock()
+        self._getter: _Waiter | None = None
+        self._putters: deque[_Waiter] = deque()
+
+    def _is_full(self) -> bool:
+        return self.max_size is not None and len(self.items) >= self.max_size
+
+    def _drop_oldest_delta(self) -> bool:
+        for index, item in enumerate(self.items):
+            if is_delta_message(item):
+                del self.items[index]
+                self.dropped += 1
+                return True
+        return False
+
+    def _offer(self, message: Any, *, terminal: bool, putter: _Waiter | None) -> bool:
+        with self._lock:
+            if self.detached:
+                return True
+            if terminal or not self._is_full():
+                self.items.append(message)
+            elif self.overflow == "coalesce" and self.items and (
+                merged := self.coalesce(self.items[-1], message)
+            ) is not None:
+                self.items[-1] = merged
+                self.coalesced += 1
+            elif self.overflow == "drop_oldest" and is_delta_message(message) and self._drop_oldest_delta():
+                self.items.append(message)
+            else:
+                # Nothing could be merged or dropped: fall back to blocking so
+                # structural events are never lost.
+                if putter is not None:
+                    self._putters.append(putter)
+                return False
+            getter, self._getter = self._getter, None
+        _wake(getter)
+        return True
+
+    def prefill(self, messages):
+        self.items.extend(messages)
+
+    async def put(self, message: Any, *, terminal: bool = False):
+        if self._offer(message, terminal=terminal, putter=None):
+            return
+        loop = asyncio.get_running_loop()
+        while True:
+            future = loop.create_future()
+            if self._offer(message, terminal=terminal, putter=(loop, future)):
+                return
+            try:
+                await future
+            except asyncio.CancelledError:
+                with self._lock:
+                    with contextlib.suppress(ValueError):
+                        self._putters.remove((loop, future))
+                raise
+
+    async def get(self) -> Any:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self.items:
+                    message = self.items.popleft()
+                    putter = self._putters.popleft() if self._putters else None
+                    break
+                future = loop.create_future()
+                self._getter = (loop, future)
+            try:
+                await future
+            finally:
+                with self._lock:
+                    if self._getter is not None and self._getter[1] is future:
+                        self._getter = None
+        _wake(putter)
+        return message
+
+    def detach(self):
+        with self._lock:
+            self.detached = True
+            self.items.clear()
+            putters, self._putters = list(self._putters), deque()
+        for putter in putters:
+            _wake(putter)
 
 
 class GeneratorConsumer:
@@ -25,17 +174,42 @@ class GeneratorConsumer:
     A utility to wrap a Generator or AsyncGenerator and allow multiple
     asynchronous or synchronous consumers to subscribe to its output,
     with history replay, error propagation, and graceful shutdown.
+
+    Each listener gets its own buffer. `max_queue_size` bounds it and
+    `overflow` decides what happens when a slow listener's buffer is full:
+    "block" pauses the producer, "drop_oldest" drops the oldest queued delta
+    event, and "coalesce" merges the message into the last queued one.
+    `history` controls replay for late subscribers: "full" keeps everything,
+    an int keeps the last N messages, and "none" keeps nothing once
+    `expected_listeners` listeners have attached.
     """
 
-    def __init__(self, original_generator: AsyncGenerator | Generator):
+    def __init__(
+        self,
+        original_generator: AsyncGenerator | Generator,
+        *,
+        max_queue_size: int | None = None,
+        overflow: OverflowPolicy = "block",
+        history: HistoryPolicy = "full",
+        expected_listeners: int | None = None,
+        coalesce: Callable[[Any, Any], Any | None] | None = None,
+    ):
         """
         Initialize the consumer with a generator or async generator.
 
         Args:
             original_generator: The original generator to consume.
+            max_queue_size: Per-listener buffer size. None means unbounded.
+            overflow: Policy applied when a listener buffer is full.
+            history: "full", "none" or the ring buffer size for replay.
+            expected_listeners: With `history="none"`, keep history until
+                this many listeners have attached.
+            coalesce: Merge function used by the "coalesce" overflow policy.
+                Defaults to concatenating adjacent delta events.
 
         Raises:
             TypeError: If input is neither Generator nor AsyncGenerator.
+            ValueError: If a policy value is not supported.
         """
         if isinstance(original_generator, GeneratorType):
             self._generator_type = "Generator"
@@ -43,16 +217,33 @@ class GeneratorConsumer:
             self._generator_type = "AsyncGenerator"
         else:
             raise TypeError(f"Expected Generator or AsyncGenerator, got: {original_generator}")
+        if max_queue_size is not None and max_queue_size <= 0:
+            raise ValueError(f"max_queue_size must be a positive integer or None, got: {max_queue_size}")
+        if overflow not in ("block", "drop_oldest", "coalesce"):
+            raise ValueError(f"Unsupported overflow policy: {overflow}")
+        if isinstance(history, bool) or not (
+            history in ("full", "none") or (isinstance(history, int) and history >= 0)
+        ):
+            raise ValueError(f"Unsupported history policy: {history}")
 
         self.original_generator = original_generator
-        self._history: list = []
-        self._listeners: list[asyncio.Queue] = []
+        self._max_queue_size = max_queue_size
+        self._overflow: OverflowPolicy = overflow
+        self._coalesce = coalesce or coalesce_delta_messages
+        self._history_policy = history
+        self._history: list | deque = deque(maxlen=history) if isinstance(history, int) else []
+        self._record_history = history != "none" or (expected_listeners or 0) > 0
+        self._expected_listeners = expected_listeners
+        self._attached_count = 0
+        self._listeners: list[_Listener] = []
+        self._state_lock = threading.Lock()
         self._consume_task: asyncio.Task | None = None
-        self._done = asyncio.Event()
+        self._done = threading.Event()
+        self._done_waiters: list[_Waiter] = []
         self._sentinel = object()
         self._exception: Exception | None = None
         self._closed = False
-        self._closing_lock = asyncio.Lock()
+        self._close_started = False
         self._generator_closed = False
         self._source_closed = False
 
@@ -85,10 +276,30 @@ class GeneratorConsumer:
             await self._broadcast(e)
         finally:
             await self._close_source_generator()
+            await self._finish()
+
+    async def _finish(self):
+        if not self._generator_closed:
+            await self._broadcast(self._sentinel)
+        self._set_done()
+
+    def _set_done(self):
+        with self._state_lock:
             self._done.set()
-            if not self._generator_closed:
-                await self._broadcast(self._sentinel)
-                self._generator_closed = True
+            waiters, self._done_waiters = self._done_waiters, []
+        for waiter in waiters:
+            _wake(waiter)
+
+    async def _wait_done(self):
+        if self._done.is_set():
+            return
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._state_lock:
+            if self._done.is_set():
+                return
+            self._done_waiters.append((loop, future))
+        await future
 
     async def _broadcast(self, msg: Any):
         """
@@ -97,23 +308,62 @@ class GeneratorConsumer:
         Args:
             msg: The message, exception, or sentinel object to broadcast.
         """
-        if msg is not self._sentinel and not isinstance(msg, Exception):
-            self._history.append(msg)
+        terminal = msg is self._sentinel or isinstance(msg, Exception)
+        with self._state_lock:
+            if msg is self._sentinel:
+                if self._generator_closed:
+                    return
+                self._generator_closed = True
+            elif not terminal and self._record_history:
+                self._history.append(msg)
+            listeners = list(self._listeners)
 
-        for queue in self._listeners:
-            await queue.put(msg)
+        for listener in listeners:
+            await listener.put(msg, terminal=terminal)
 
     async def _ensure_started(self):
         """
         Start the internal consumer task if it hasn't been started.
         """
         if self._consume_task is None:
-            self._consume_task = asyncio.create_task(self._consume())
+            with self._state_lock:
+                if self._consume_task is not None:
+                    return
+                self._consume_task = asyncio.get_running_loop().create_task(self._consume())
+
+    def _attach(self) -> _Listener:
+        listener = _Listener(
+            max_size=self._max_queue_size,
+            overflow=self._overflow,
+            coalesce=self._coalesce,
+        )
+        with self._state_lock:
+            listener.prefill(self._history)
+            if self._exception:
+                listener.prefill([self._exception])
+            elif self._generator_closed:
+                listener.prefill([self._sentinel])
+            self._listeners.append(listener)
+            self._attached_count += 1
+            if (
+                self._history_policy == "none"
+                and self._record_history
+                and self._attached_count >= (self._expected_listeners or 0)
+            ):
+                self._record_history = False
+                self._history.clear()
+        return listener
+
+    def _detach(self, listener: _Listener):
+        with self._state_lock:
+            with contextlib.suppress(ValueError):
+                self._listeners.remove(listener)
+        listener.detach()
 
     async def get_async_generator(self) -> AsyncGenerator:
         """
         Get an async generator that receives messages from the source,
-        including all past history.
+        including the replayable history.
 
         Raises:
             Exception: If the source generator raised an exception.
@@ -121,100 +371,65 @@ class GeneratorConsumer:
         if self._closed:
             raise RuntimeError("GeneratorConsumer has been closed.")
 
-        await self._ensure_started()
-        queue = asyncio.Queue()
-        self._listeners.append(queue)
-
+        listener = self._attach()
         try:
-            for msg in self._history:
-                await queue.put(msg)
-
-            if self._exception:
-                await queue.put(self._exception)
-            elif self._done.is_set():
-                await queue.put(self._sentinel)
-
+            await self._ensure_started()
             while True:
-                msg = await queue.get()
+                msg = await listener.get()
                 if msg is self._sentinel:
                     break
                 if isinstance(msg, Exception):
                     raise msg
                 yield msg
         finally:
-            self._listeners.remove(queue)
+            self._detach(listener)
 
     def get_generator(self) -> Generator:
         """
         Get a synchronous generator that receives messages from the source.
 
+        Sync consumers share the Stage bridge loop instead of starting a
+        thread and an event loop each.
+
         Raises:
             Exception: If the source generator raised an exception.
         """
         if self._closed:
             raise RuntimeError("GeneratorConsumer has been closed.")
 
-        sync_q: sync_queue.Queue = sync_queue.Queue()
-
-        def run_bridge():
-            async def bridge():
-                await self._ensure_started()
-                queue = asyncio.Queue()
-                self._listeners.append(queue)
+        from agently_stage import default_stage_call_bridge
 
-                try:
-                    for msg in self._history:
-                        await queue.put(msg)
-
-                    if self._exception:
-                        await queue.put(self._exception)
-                    elif self._done.is_set():
-                        await queue.put(self._sentinel)
-
-                    while True:
-                        msg = await queue.get()
-                        if msg is self._sentinel:
-                            break
-                        sync_q.put(msg)
-                except Exception as e:
-                    sync_q.put(e)
-                finally:
-                    self._listeners.remove(queue)
-                    sync_q.put(self._sentinel)
-
-            try:
-                asyncio.run(bridge())
-            except Exception as e:
-                sync_q.put(e)
-                sync_q.put(self._sentinel)
-
-        threading.Thread(target=run_bridge, daemon=True).start()
-
-        def generator():
-            while True:
-                msg = sync_q.get()
-                if msg is self._sentinel:
-                    break
-                if isinstance(msg, Exception):
-                    raise msg
-                yield msg
-
-        return generator()
+        return default_stage_call_bridge.iter_sync(self.get_async_generator())
 
     async def get_result(self) -> list:
         """
-        Wait for the generator to finish and return the full history.
+        Wait for the generator to finish and return the retained history.
 
         Returns:
-            A list of all messages produced by the generator.
+            A list of the messages kept by the history policy; with the
+            default "full" policy this is every message produced.
         """
         await self._ensure_started()
-        await self._done.wait()
+        await self._wait_done()
 
         if self._exception:
             raise self._exception
 
-        return self._history
+        return self._history if isinstance(self._history, list) else list(self._history)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Return buffer usage of the active listeners.
+        """
+        with self._state_lock:
+            listeners = list(self._listeners)
+        return {
+            "listeners": len(listeners),
+            "history_size": len(self._history),
+            "queued": [len(listener.items) for listener in listeners],
+            "dropped": sum(listener.dropped for listener in listeners),
+            "coalesced": sum(listener.coalesced for listener in listeners),
+        }
 
     async def close(self):
         """
@@ -222,17 +437,29 @@ class GeneratorConsumer:
         After calling this, no new listeners can be added.
         """
         self._closed = True
-        async with self._closing_lock:
-            if self._consume_task:
-                self._consume_task.cancel()
+        with self._state_lock:
+            already_closing = self._close_started
+            self._close_started = True
+        if already_closing:
+            await self._wait_done()
+            return
+        task = self._consume_task
+        if task is not None:
+            task_loop = task.get_loop()
+            if task_loop is asyncio.get_running_loop():
+                task.cancel()
                 try:
-                    await self._consume_task
+                    await task
                 except asyncio.CancelledError:
                     pass
                 except Exception as e:
                     self._exception = e
-            await self._close_source_generator()
-            self._done.set()
-            if not self._generator_closed:
-                await self._broadcast(self._sentinel)
-                self._generator_closed = True
+            elif not task.done():
+                # The producer runs on another loop (e.g. the Stage bridge loop);
+                # its own `finally` closes the source and broadcasts the sentinel.
+                with contextlib.suppress(RuntimeError):
+                    task_loop.call_soon_threadsafe(task.cancel)
+                await self._wait_done()
+                return
+        await self._close_source_generator()
+        await self._finish()
@@ -0,0 +1,364 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Process-wide pooled ``httpx.AsyncClient`` instances for model requesters.
+
+Creating one ``AsyncClient`` per model request throws away keep-alive, so every
+request pays a fresh TCP+TLS handshake. ``HTTPClientPool`` keeps long-lived
+clients keyed by ``(origin, proxy, timeout profile, http2, other client
+options)`` and hands them out through ``lease(...)``. Leased clients are never
+closed by the caller; the pool closes them on ``aclose()``/``close()``.
+
+Clients are owned by the event loop that created them: an ``AsyncClient``
+connection pool cannot be shared across loops, so clients are tracked per
+running loop (weakly, like ``RequestScheduler`` keys its primitives per loop)
+and clients of loops that have been closed are dropped on the next access.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Mapping
+
+import httpx
+
+
+@dataclass(frozen=True)
+class HTTPClientPoolConfig:
+    """Connection limits applied to every pooled client of one pool key."""
+
+    enabled: bool = True
+    http2: bool = False
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 30.0
+
+    @classmethod
+    def from_settings(cls, value: Any) -> "HTTPClientPoolConfig":
+        """Build a config from a ``client_pool`` plugin setting value.
+
+        Accepts ``None`` (defaults), a bool (toggle pooling) or a mapping with
+        ``enabled``/``http2``/``max_connections``/``max_keepalive_connections``/
+        ``keepalive_expiry`` keys.
+        """
+        if value is None:
+            return cls()
+        if isinstance(value, bool):
+            return cls(enabled=value)
+        if not isinstance(value, Mapping):
+            return cls()
+        defaults = cls()
+        return cls(
+            enabled=bool(value.get("enabled", defaults.enabled)),
+            http2=bool(value.get("http2", defaults.http2)),
+            max_connections=_positive_int_or_none(value.get("max_connections", defaults.max_connections)),
+            max_keepalive_connections=_positive_int_or_none(
+                value.get("max_keepalive_connections", defaults.max_keepalive_connections)
+            ),
+            keepalive_expiry=_non_negative_float_or_none(value.get("keepalive_expiry", defaults.keepalive_expiry)),
+        )
+
+
+class _CountingNetworkBackend:
+    """Wrap an httpcore network backend to count opened connections."""
+
+    def __init__(self, backend: Any, entry: "_PooledClient"):
+        self._backend = backend
+        self._entry = entry
+
+    async def connect_tcp(self, *args: Any, **kwargs: Any) -> Any:
+        stream = await self._backend.connect_tcp(*args, **kwargs)
+        self._entry.connections_opened += 1
+        return stream
+
+    async def connect_unix_socket(self, *args: Any, **kwargs: Any) -> Any:
+        stream = await self._backend.connect_unix_socket(*args, **kwargs)
+        self._entry.connections_opened += 1
+        return stream
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+@dataclass
+class _PooledClient:
+    key: tuple[Any, ...]
+    client: httpx.AsyncClient | None = None
+    hits: int = 0
+    in_flight: int = 0
+    connections_opened: int = 0
+
+    def stats(self) -> dict[str, Any]:
+        pool = _get_connection_pool(self.client)
+        connections = list(getattr(pool, "connections", []) or [])
+        requests = list(getattr(pool, "_requests", []) or [])
+        return {
+            "origin": self.key[0],
+            "http2": self.key[3],
+            "hits": self.hits,
+            "in_flight": self.in_flight,
+            "connections_opened": self.connections_opened,
+            "open_connections": len(connections),
+            "idle_connections": sum(1 for connection in connections if _safe_call(connection, "is_idle")),
+            "waiters": sum(1 for request in requests if _safe_call(request, "is_queued")),
+        }
+
+
+@dataclass
+class _LoopClients:
+    clients: dict[tuple[Any, ...], _PooledClient] = field(default_factory=dict)
+
+
+class HTTPClientPool:
+    def __init__(self) -> None:
+        self._loops: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClients]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._clients_opened = 0
+        self._clients_closed = 0
+
+    @staticmethod
+    def build_key(
+        url: str,
+        config: HTTPClientPoolConfig,
+        client_options: Mapping[str, Any],
+    ) -> tuple[Any, ...] | None:
+        """Return the pool key for one request, or None when it cannot be pooled.
+
+        Options that are not plain data (custom transports, auth flows, event
+        hooks...) cannot be compared safely, so such requests fall back to a
+        dedicated per-request client.
+        """
+        try:
+            origin = str(httpx.URL(url).copy_with(path="/", query=None, fragment=None))
+        except Exception:
+            return None
+        options = dict(client_options)
+        proxy = options.pop("proxy", None)
+        timeout = options.pop("timeout", None)
+        if proxy is not None and not isinstance(proxy, str):
+            return None
+        timeout_profile = _timeout_profile(timeout)
+        if timeout_profile is None:
+            return None
+        try:
+            options_fingerprint = json.dumps(options, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+        return (origin, proxy, timeout_profile, config.http2, options_fingerprint)
+
+    @asynccontextmanager
+    async def lease(
+        self,
+        url: str,
+        config: HTTPClientPoolConfig | None = None,
+        **client_options: Any,
+    ) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield a shared client for ``url``; the client stays open on exit."""
+        config = config or HTTPClientPoolConfig()
+        key = self.build_key(url, config, client_options) if config.enabled else None
+        if key is None:
+            async with httpx.AsyncClient(**client_options) as client:
+                yield client
+            return
+        entry = self._get_entry(key, config, client_options)
+        entry.in_flight += 1
+        try:
+            yield entry.client  # type: ignore[misc]
+        finally:
+            entry.in_flight -= 1
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool-wide counters and per-client connection stats."""
+        with self._lock:
+            entries = [
+                entry
+                for loop, loop_clients in list(self._loops.items())
+                if not loop.is_closed()
+                for entry in loop_clients.clients.values()
+            ]
+            clients = [entry.stats() for entry in entries]
+            return {
+                "hits": self._hits,
+                "clients_opened": self._clients_opened,
+                "clients_closed": self._clients_closed,
+                "active_clients": len(clients),
+                "connections_opened": sum(item["connections_opened"] for item in clients),
+                "open_connections": sum(item["open_connections"] for item in clients),
+                "waiters": sum(item["waiters"] for item in clients),
+                "clients": clients,
+            }
+
+    async def aclose(self) -> None:
+        """Close every pooled client owned by the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            loop_clients = self._loops.pop(loop, None)
+        if loop_clients is None:
+            return
+        for entry in loop_clients.clients.values():
+            if entry.client is not None:
+                await entry.client.aclose()
+                self._clients_closed += 1
+
+    def close(self) -> None:
+        """Release clients of every loop; safe to call at interpreter shutdown.
+
+        Clients of idle loops are closed on their own loop. Clients of running
+        loops get a scheduled close, and clients of closed loops are dropped
+        because their transports are already unusable.
+        """
+        with self._lock:
+            loops = list(self._loops.items())
+            self._loops.clear()
+        for loop, loop_clients in loops:
+            clients = [entry.client for entry in loop_clients.clients.values() if entry.client is not None]
+            if not clients or loop.is_closed():
+                continue
+            close_all = _close_clients(clients)
+            try:
+                if loop.is_running():
+                    asyncio.run_coroutine_threadsafe(close_all, loop)
+                else:
+                    loop.run_until_complete(close_all)
+            except Exception:
+                close_all.close()
+                continue
+            self._clients_closed += len(clients)
+
+    def _get_entry(
+        self,
+        key: tuple[Any, ...],
+        config: HTTPClientPoolConfig,
+        client_options: Mapping[str, Any],
+    ) -> _PooledClient:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._drop_closed_loops()
+            loop_clients = self._loops.get(loop)
+            if loop_clients is None:
+                loop_clients = _LoopClients()
+                self._loops[loop] = loop_clients
+            entry = loop_clients.clients.get(key)
+            if entry is not None and entry.client is not None and not entry.client.is_closed:
+                entry.hits += 1
+                self._hits += 1
+                return entry
+            entry = _PooledClient(key=key)
+            entry.client = self._create_client(entry, config, client_options)
+            loop_clients.clients[key] = entry
+            self._clients_opened += 1
+            return entry
+
+    def _drop_closed_loops(self) -> None:
+        for loop in [loop for loop in list(self._loops.keys()) if loop.is_closed()]:
+            self._loops.pop(loop, None)
+
+    @staticmethod
+    def _create_client(
+        entry: _PooledClient,
+        config: HTTPClientPoolConfig,
+        client_options: Mapping[str, Any],
+    ) -> httpx.AsyncClient:
+        if config.http2:
+            from agently.utils.LazyImport import LazyImport
+
+            LazyImport.import_package("h2", install_name="httpx[http2]")
+        options = dict(client_options)
+        options["http2"] = config.http2
+        if config.http2:
+            # HTTP/2 forbids connection-specific headers; HTTP/1.1 requests keep them.
+            options["event_hooks"] = {"request": [_strip_connection_header]}
+        options["limits"] = httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        )
+        client = httpx.AsyncClient(**options)
+        pool = _get_connection_pool(client)
+        backend = getattr(pool, "_network_backend", None)
+        if backend is not None:
+            pool._network_backend = _CountingNetworkBackend(backend, entry)
+        return client
+
+
+async def _strip_connection_header(request: httpx.Request) -> None:
+    request.headers.pop("Connection", None)
+
+
+async def _close_clients(clients: list[httpx.AsyncClient]) -> None:
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception:
+            pass
+
+
+def _get_connection_pool(client: httpx.AsyncClient | None) -> Any:
+    transport = getattr(client, "_transport", None)
+    return getattr(transport, "_pool", None)
+
+
+def _safe_call(target: Any, method_name: str) -> bool:
+    method = getattr(target, method_name, None)
+    if not callable(method):
+        return False
+    try:
+        return bool(method())
+    except Exception:
+        return False
+
+
+def _timeout_profile(timeout: Any) -> tuple[float | None, ...] | None:
+    if timeout is None:
+        return (None, None, None, None)
+    if isinstance(timeout, (int, float)):
+        value = float(timeout)
+        return (value, value, value, value)
+    if isinstance(timeout, httpx.Timeout):
+        return (timeout.connect, timeout.read, timeout.write, timeout.pool)
+    if isinstance(timeout, Mapping):
+        try:
+            resolved = httpx.Timeout(**dict(timeout))
+        except Exception:
+            return None
+        return (resolved.connect, resolved.read, resolved.write, resolved.pool)
+    return None
+
+
+def _positive_int_or_none(value: Any) -> int | None:
+    if value is None:
+        return None
+    try:
+        result = int(value)
+    except (TypeError, ValueError):
+        return None
+    return result if result > 0 else None
+
+
+def _non_negative_float_or_none(value: Any) -> float | None:
+    if value is None:
+        return None
+    try:
+        result = float(value)
+    except (TypeError, ValueError):
+        return None
+    return result if result >= 0 else None
@@ -0,0 +1,441 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Process-wide pooled MCP client sessions for ``MCPActionExecutor``.
+
+Opening ``async with Client(transport)`` per tool call spawns and initializes a
+new server process for stdio transports and repeats the session handshake for
+HTTP ones. ``MCPSessionPool`` keeps one initialized client per normalized
+transport and runs operations on it through ``call(...)``: concurrent calls
+share the session up to ``max_concurrency``, sessions that have been idle for
+``health_check_interval`` are pinged (and reconnected when the ping fails)
+before reuse, sessions idle for longer than ``idle_timeout`` are closed, and a
+session whose operation raised is replaced on the next call.
+
+Execution resources hold the session of their transport with ``hold(...)`` and
+drop it with ``release(...)``. Equal transports share one session, so it is
+closed only when its last holder releases it and no call is in flight; a call
+still running at that point closes it when it finishes.
+
+A FastMCP session is driven by a background task of the loop that opened it,
+while action executions run on short-lived loops (each sync bridge generation
+drains and closes its own loop). Pooled sessions therefore live on one
+pool-owned loop thread that is started on first use, and callers await their
+operation from whatever loop they run on.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Coroutine, Mapping, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class MCPSessionPoolConfig:
+    """Reuse limits applied to every pooled session."""
+
+    enabled: bool = True
+    max_concurrency: int = 8
+    idle_timeout: float | None = 300.0
+    health_check_interval: float | None = 30.0
+    health_check_timeout: float = 5.0
+
+    @classmethod
+    def from_settings(cls, value: Any) -> "MCPSessionPoolConfig":
+        """Build a config from a ``session_pool`` plugin setting value.
+
+        Accepts ``None`` (defaults), a bool (toggle pooling) or a mapping with
+        ``enabled``/``max_concurrency``/``idle_timeout``/
+        ``health_check_interval``/``health_check_timeout`` keys.
+        """
+        if value is None:
+            return cls()
+        if isinstance(value, bool):
+            return cls(enabled=value)
+        if not isinstance(value, Mapping):
+            return cls()
+        defaults = cls()
+        max_concurrency = value.get("max_concurrency", defaults.max_concurrency)
+        health_check_timeout = value.get("health_check_timeout", defaults.health_check_timeout)
+        return cls(
+            enabled=bool(value.get("enabled", defaults.enabled)),
+            max_concurrency=(
+                int(max_concurrency)
+                if _is_number(max_concurrency) and max_concurrency >= 1
+                else defaults.max_concurrency
+            ),
+            idle_timeout=_non_negative_float_or_none(value.get("idle_timeout", defaults.idle_timeout)),
+            health_check_interval=_non_negative_float_or_none(
+                value.get("health_check_interval", defaults.health_check_interval)
+            ),
+            health_check_timeout=(
+                float(health_check_timeout)
+                if _is_number(health_check_timeout) and health_check_timeout > 0
+                else defaults.health_check_timeout
+            ),
+        )
+
+
+@dataclass
+class _PooledSession:
+    key: str
+    # Keeps object transports (in-process servers, transport instances) alive
+    # while their identity is used as the key.
+    transport: Any
+    semaphore: asyncio.Semaphore
+    connect_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    client: Any = None
+    broken: bool = False
+    close_pending: bool = False
+    in_flight: int = 0
+    calls: int = 0
+    connects: int = 0
+    reconnects: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+    last_checked: float = field(default_factory=time.monotonic)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "key": self.key,
+            "connected": self.client is not None and _is_connected(self.client),
+            "in_flight": self.in_flight,
+            "calls": self.calls,
+            "connects": self.connects,
+            "reconnects": self.reconnects,
+            "idle_seconds": max(0.0, time.monotonic() - self.last_used),
+        }
+
+
+class MCPSessionPool:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._sessions: dict[str, _PooledSession] = {}
+        self._holders: dict[str, int] = {}
+        self._sweep_handle: asyncio.TimerHandle | None = None
+        self._hits = 0
+        self._sessions_opened = 0
+        self._sessions_closed = 0
+        self._health_check_failures = 0
+        self._evictions = 0
+
+    @staticmethod
+    def build_key(transport: Any) -> str:
+        """Return the pool key of a normalized MCP transport.
+
+        URL/path strings and MCP config mappings are keyed by value, so equal
+        transports declared by different actions share one session. Any other
+        transport object is keyed by identity.
+        """
+        if isinstance(transport, str):
+            return f"str:{ transport }"
+        if isinstance(transport, Mapping):
+            try:
+                return "config:" + json.dumps(transport, sort_keys=True, separators=(",", ":"))
+            except (TypeError, ValueError):
+                pass
+        return f"object:{ type(transport).__qualname__ }:{ id(transport) }"
+
+    async def call(
+        self,
+        transport: Any,
+        client_factory: Callable[[Any], Any],
+        operation: Callable[[Any], Awaitable[T]],
+        config: MCPSessionPoolConfig | None = None,
+    ) -> T:
+        """Run ``operation(client)`` on the pooled session of ``transport``.
+
+        ``client_factory`` builds an unconnected FastMCP ``Client`` for the
+        transport. The operation runs on the pool loop, so it should only talk
+        to the client and return plain results. With ``config.enabled=False``
+        the client is opened and closed around the single operation on the
+        caller's loop, as before pooling.
+        """
+        config = config or MCPSessionPoolConfig()
+        if not config.enabled:
+            async with client_factory(transport) as client:
+                return await operation(client)
+        return await self._submit(self._call(transport, client_factory, operation, config))
+
+    async def aclose(self, transport: Any = None) -> None:
+        """Close the pooled session of ``transport``, or every session without it."""
+        with self._lock:
+            if self._loop is None:
+                return
+        await self._submit(self._close_sessions(None if transport is None else self.build_key(transport)))
+
+    def hold(self, transport: Any) -> None:
+        """Register one more holder of the pooled session of ``transport``."""
+        key = self.build_key(transport)
+        with self._lock:
+            self._holders[key] = self._holders.get(key, 0) + 1
+
+    async def release(self, transport: Any) -> None:
+        """Drop one holder of ``transport``'s session and close it after the last one.
+
+        A session still running a call is closed when that call finishes, unless
+        it was held again in the meantime.
+        """
+        key = self.build_key(transport)
+        with self._lock:
+            holders = self._holders.get(key, 0) - 1
+            if holders > 0:
+                self._holders[key] = holders
+                return
+            self._holders.pop(key, None)
+            if self._loop is None:
+                return
+        await self._submit(self._release_session(key))
+
+    def close(self) -> None:
+        """Close every session and stop the pool loop; safe at interpreter shutdown."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or loop.is_closed():
+            return
+        if loop.is_running() and thread is not threading.current_thread():
+            future = asyncio.run_coroutine_threadsafe(self._close_sessions(None), loop)
+            try:
+                future.result(timeout=10)
+            except Exception:
+                future.cancel()
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not None:
+                thread.join(timeout=5)
+        if not loop.is_running():
+            loop.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool-wide counters and per-session usage."""
+        with self._lock:
+            sessions = [entry.stats() for entry in self._sessions.values()]
+            return {
+                "hits": self._hits,
+                "sessions_opened": self._sessions_opened,
+                "sessions_closed": self._sessions_closed,
+                "health_check_failures": self._health_check_failures,
+                "evictions": self._evictions,
+                "active_sessions": len(sessions),
+                "in_flight": sum(item["in_flight"] for item in sessions),
+                "sessions": sessions,
+            }
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed() or self._thread is None or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="AgentlyMCPSessionPool", daemon=True)
+                thread.start()
+                self._loop = loop
+                self._thread = thread
+                self._sessions = {}
+                self._sweep_handle = None
+            return self._loop
+
+    async def _submit(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        loop = self._get_loop()
+        if asyncio.get_running_loop() is loop:
+            return await coroutine
+        # Cancelling the caller (action timeouts) cancels the pool-side task too.
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coroutine, loop))
+
+    async def _call(
+        self,
+        transport: Any,
+        client_factory: Callable[[Any], Any],
+        operation: Callable[[Any], Awaitable[T]],
+        config: MCPSessionPoolConfig,
+    ) -> T:
+        await self._evict_idle(config)
+        entry = self._get_entry(transport, config)
+        async with entry.semaphore:
+            entry.in_flight += 1
+            try:
+                client = await self._ensure_connected(entry, client_factory, config)
+                entry.calls += 1
+                try:
+                    return await operation(client)
+                except Exception:
+                    # Tool errors come back as results; a raised exception means
+                    # the session itself is suspect, so the next call reconnects.
+                    entry.broken = True
+                    raise
+            finally:
+                entry.in_flight -= 1
+                entry.last_used = time.monotonic()
+                if entry.close_pending and entry.in_flight == 0:
+                    await self._release_session(entry.key)
+                else:
+                    self._schedule_sweep(config)
+
+    def _get_entry(self, transport: Any, config: MCPSessionPoolConfig) -> _PooledSession:
+        key = self.build_key(transport)
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is None:
+                entry = _PooledSession(
+                    key=key,
+                    transport=transport,
+                    semaphore=asyncio.Semaphore(config.max_concurrency),
+                )
+                self._sessions[key] = entry
+            return entry
+
+    async def _ensure_connected(
+        self,
+        entry: _PooledSession,
+        client_factory: Callable[[Any], Any],
+        config: MCPSessionPoolConfig,
+    ) -> Any:
+        async with entry.connect_lock:
+            client = entry.client
+            if client is not None and not entry.broken and _is_connected(client):
+                if await self._is_healthy(entry, client, config):
+                    self._hits += 1
+                    return client
+                self._health_check_failures += 1
+            if entry.client is not None:
+                stale_client = entry.client
+                entry.client = None
+                entry.reconnects += 1
+                await _close_clients([stale_client])
+                self._sessions_closed += 1
+            client = client_factory(entry.transport)
+            await client.__aenter__()
+            entry.client = client
+            entry.broken = False
+            entry.connects += 1
+            entry.last_checked = time.monotonic()
+            self._sessions_opened += 1
+            return client
+
+    @staticmethod
+    async def _is_healthy(entry: _PooledSession, client: Any, config: MCPSessionPoolConfig) -> bool:
+        interval = config.health_check_interval
+        # Sessions in use by another call, or used recently, are known to be alive.
+        if (
+            interval is None
+            or entry.in_flight > 1
+            or time.monotonic() - max(entry.last_used, entry.last_checked) < interval
+        ):
+            return True
+        try:
+            healthy = bool(await asyncio.wait_for(client.ping(), timeout=config.health_check_timeout))
+        except Exception:
+            healthy = False
+        entry.last_checked = time.monotonic()
+        return healthy
+
+    def _schedule_sweep(self, config: MCPSessionPoolConfig) -> None:
+        if config.idle_timeout is None or self._sweep_handle is not None:
+            return
+        loop = asyncio.get_running_loop()
+
+        def sweep() -> None:
+            self._sweep_handle = None
+            loop.create_task(self._evict_idle(config))
+
+        self._sweep_handle = loop.call_later(config.idle_timeout, sweep)
+
+    async def _evict_idle(self, config: MCPSessionPoolConfig) -> None:
+        if config.idle_timeout is None:
+            return
+        deadline = time.monotonic() - config.idle_timeout
+        with self._lock:
+            expired = [
+                key
+                for key, entry in self._sessions.items()
+                if entry.in_flight == 0 and entry.last_used <= deadline
+            ]
+            entries = [self._sessions.pop(key) for key in expired]
+            remaining = bool(self._sessions)
+        self._evictions += len(entries)
+        for entry in entries:
+            await self._close_entry(entry)
+        if remaining:
+            self._schedule_sweep(config)
+
+    async def _close_sessions(self, key: str | None) -> None:
+        with self._lock:
+            if key is None:
+                entries = list(self._sessions.values())
+                self._sessions.clear()
+            else:
+                entry = self._sessions.pop(key, None)
+                entries = [entry] if entry is not None else []
+        for entry in entries:
+            await self._close_entry(entry)
+
+    async def _release_session(self, key: str) -> None:
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is None:
+                return
+            if self._holders.get(key, 0) > 0:
+                entry.close_pending = False
+                return
+            if entry.in_flight > 0:
+                entry.close_pending = True
+                return
+            del self._sessions[key]
+        await self._close_entry(entry)
+
+    async def _close_entry(self, entry: _PooledSession) -> None:
+        client = entry.client
+        entry.client = None
+        if client is None:
+            return
+        await _close_clients([client])
+        self._sessions_closed += 1
+
+
+def _is_connected(client: Any) -> bool:
+    is_connected = getattr(client, "is_connected", None)
+    if not callable(is_connected):
+        return True
+    try:
+        return bool(is_connected())
+    except Exception:
+        return False
+
+
+async def _close_clients(clients: list[Any]) -> None:
+    for client in clients:
+        try:
+            close: Callable[[], Awaitable[Any]] | None = getattr(client, "close", None)
+            if callable(close):
+                await close()
+            else:
+                await client.__aexit__(None, None, None)
+        except Exception:
+            pass
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _non_negative_float_or_none(value: Any) -> float | None:
+    if not _is_number(value):
+        return None
+    return float(value) if value >= 0 else None
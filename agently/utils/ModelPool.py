@@ -21,6 +21,13 @@ current layered shape is::
 
 Legacy ``model_pool``/``key_pool_strategy``/``key_pool`` settings remain
 supported for compatibility.
+
+Keys of an API key pool may carry their own ``base_url``, so one pool can
+spread requests over several endpoints. The ``least_outstanding`` and
+``ewma_latency`` strategies route by how each key is behaving: in-flight
+requests, EWMA latency and error rate, reported by the builtin transports. A
+key that fails several times in a row (5xx, 429, timeouts) is ejected for a
+while and then admits one probe request before it serves traffic again.
 """
 
 from __future__ import annotations
@@ -30,6 +37,7 @@ import os
 import random
 import re
 import threading
+import time
 from dataclasses import dataclass
 from collections.abc import Callable, Mapping
 from typing import Any
@@ -45,12 +53,46 @@ _FAILOVER_ACTION_ALIASES = {
     "error": "raise",
 }
 
+_HEALTH_AWARE_STRATEGIES = {"least_outstanding", "ewma_latency"}
+_STATUS_CODE_IN_ERROR = re.compile(r"^\s*Status Code:\s*(\d{3})")
+KEY_HEALTH_EWMA_ALPHA = 0.3
+DEFAULT_EJECT_AFTER_FAILURES = 3
+DEFAULT_EJECT_SECONDS = 30.0
+MAX_EJECT_SECONDS = 300.0
+
 # Module-level state for key selection strategies (process-scoped).
 _round_robin_counters: dict[str, int] = {}
 _usage_counters: dict[str, int] = {}
+_key_health: dict[tuple[str, str], "_KeyHealth"] = {}
 _lock = threading.Lock()
 
 
+@dataclass
+class _KeyHealth:
+    in_flight: int = 0
+    selected: int = 0
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    ewma_latency: float | None = None
+    error_rate: float = 0.0
+    ejected_until: float = 0.0
+    eject_seconds: float = 0.0
+    ejections: int = 0
+    probing: bool = False
+
+    def state(self, now: float) -> str:
+        if not self.ejected_until:
+            return "healthy"
+        return "ejected" if self.ejected_until > now else "half_open"
+
+    def latency_cost(self) -> float:
+        # Untried keys cost nothing so each one gets measured; busy or failing keys cost more.
+        if self.ewma_latency is None:
+            return float("inf") if self.failures else 0.0
+        return self.ewma_latency * (self.in_flight + 1) / (1.0 - min(self.error_rate, 0.9))
+
+
 @dataclass(frozen=True)
 class APIKeyFailoverDecision:
     retry: bool
@@ -93,9 +135,238 @@ def _select_key(mode: str, pool: list[str], model_name: str, key_pool: dict[str,
             _usage_counters[selected] = _usage_counters.get(selected, 0) + 1
             return selected
 
+        if mode in _HEALTH_AWARE_STRATEGIES:
+            selected = _select_healthy_key_locked(mode, pool, model_name)
+            _key_health[(model_name, selected)].selected += 1
+            return selected
+
     raise ValueError(f"Unknown key_pool_strategy mode: {mode!r}")
 
 
+def _select_healthy_key_locked(mode: str, pool: list[str], scope: str) -> str:
+    now = time.monotonic()
+    healths = {kid: _key_health.setdefault((scope, kid), _KeyHealth()) for kid in pool}
+    # A key whose ejection ran out gets exactly one probe request at a time.
+    for kid in pool:
+        health = healths[kid]
+        if health.state(now) == "half_open" and not health.probing:
+            health.probing = True
+            return kid
+    available = [kid for kid in pool if healths[kid].state(now) == "healthy"]
+    if not available:
+        # Every key is ejected or probing: use the one that recovers first instead of failing the request.
+        return min(pool, key=lambda kid: healths[kid].ejected_until)
+    if mode == "least_outstanding":
+        return min(available, key=lambda kid: (healths[kid].in_flight, healths[kid].selected))
+    return min(available, key=lambda kid: (healths[kid].latency_cost(), healths[kid].selected))
+
+
+def _health_scope(pool_id: str) -> str:
+    return f"api_key_pool:{ pool_id }"
+
+
+def _is_unhealthy_outcome(status_code: int | None, error: BaseException | None) -> bool:
+    if error is not None:
+        response_status = getattr(getattr(error, "response", None), "status_code", None)
+        if not isinstance(response_status, int):
+            match = _STATUS_CODE_IN_ERROR.match(str(error))
+            response_status = int(match.group(1)) if match else None
+        if response_status is None:
+            # Timeouts, stalls and connection failures say nothing good about the endpoint.
+            return True
+        status_code = response_status
+    return isinstance(status_code, int) and (status_code == 429 or status_code >= 500)
+
+
+def _reserve_runtime_key(runtime: dict[str, Any]) -> bool:
+    """Count the selected key as in flight for this request; False when nothing changed."""
+    scope = runtime.get("health_scope")
+    key_id = runtime.get("selected_key_id")
+    if (
+        not scope
+        or key_id is None
+        or runtime.get("reserved_key_id") is not None
+        or runtime.get("strategy") not in _HEALTH_AWARE_STRATEGIES
+    ):
+        return False
+    with _lock:
+        _key_health.setdefault((str(scope), str(key_id)), _KeyHealth()).in_flight += 1
+    runtime["reserved_key_id"] = key_id
+    return True
+
+
+def _release_runtime_key(runtime: dict[str, Any]) -> bool:
+    scope = runtime.get("health_scope")
+    key_id = runtime.get("reserved_key_id")
+    if not scope or key_id is None:
+        return False
+    with _lock:
+        health = _key_health.setdefault((str(scope), str(key_id)), _KeyHealth())
+        health.in_flight = max(0, health.in_flight - 1)
+        # A probe that ended without any outcome (cancelled, answered from cache) lets the next request probe.
+        health.probing = False
+    runtime["reserved_key_id"] = None
+    return True
+
+
+def reserve_selected_api_key(plugin_settings: Any) -> None:
+    """Count the request's selected API key as in flight again (e.g. for a retried request)."""
+    runtime = _as_dict(plugin_settings.get("_api_key_pool_runtime", None))
+    if runtime and _reserve_runtime_key(runtime):
+        plugin_settings.set("_api_key_pool_runtime", runtime)
+
+
+def release_selected_api_key(plugin_settings: Any) -> None:
+    """Stop counting the request's selected API key as in flight once the request is over."""
+    runtime = _as_dict(plugin_settings.get("_api_key_pool_runtime", None))
+    if runtime and _release_runtime_key(runtime):
+        plugin_settings.set("_api_key_pool_runtime", runtime)
+
+
+def select_hedge_api_key(plugin_settings: Any) -> str | None:
+    """Point ``plugin_settings`` at another key of the request's pool for a hedged duplicate request.
+
+    ``plugin_settings`` must be a namespace over child settings of the request,
+    so the original selection is left as it is. Health-aware pools pick the
+    other key by their strategy; other pools take the next healthy key. The
+    hedge's key is counted as in flight on its own. Returns the new key id, or
+    None when there is no pool or no other usable key and the hedge reuses the
+    request's key.
+    """
+    runtime = _as_dict(plugin_settings.get("_api_key_pool_runtime", None))
+    if not runtime:
+        return None
+    key_entries = [entry for entry in runtime.get("keys", []) if isinstance(entry, dict)]
+    current_entry = _runtime_key_entry(runtime, runtime.get("selected_key_id"))
+    current_base_url = current_entry.get("base_url") if current_entry is not None else None
+    # A key without its own base_url can only be sent to the endpoint the request already uses.
+    candidates = [
+        str(entry["id"])
+        for entry in key_entries
+        if entry.get("id") != runtime.get("selected_key_id") and (entry.get("base_url") or not current_base_url)
+    ]
+    scope = str(runtime.get("health_scope") or "")
+    strategy = runtime.get("strategy")
+    key_id: str | None = None
+    if candidates:
+        with _lock:
+            if strategy in _HEALTH_AWARE_STRATEGIES:
+                key_id = _select_healthy_key_locked(str(strategy), candidates, scope)
+                _key_health[(scope, key_id)].selected += 1
+            else:
+                now = time.monotonic()
+                healthy = [
+                    kid
+                    for kid in candidates
+                    if (scope, kid) not in _key_health or _key_health[(scope, kid)].state(now) == "healthy"
+                ]
+                key_id = (healthy or candidates)[0]
+    entry = _runtime_key_entry(runtime, key_id) if key_id is not None else None
+    # The copied runtime still holds the request's own reservation, which stays with the request.
+    runtime.update(reserved_key_id=None, attempts=[])
+    if entry is not None:
+        runtime["selected_key_id"] = key_id
+    _reserve_runtime_key(runtime)
+    plugin_settings.set("_api_key_pool_runtime", runtime)
+    if entry is None:
+        return None
+    plugin_settings.set("api_key", str(entry["value"]))
+    if entry.get("base_url"):
+        plugin_settings.set("base_url", str(entry["base_url"]))
+    return key_id
+
+
+def record_api_key_outcome(
+    plugin_settings: Any,
+    *,
+    status_code: int | None = None,
+    error: BaseException | None = None,
+    latency: float | None = None,
+) -> None:
+    """Record one provider response or error against the request's selected API key.
+
+    429 and 5xx responses, timeouts and connection errors count as failures.
+    ``eject_after_failures`` consecutive failures (selection config, default
+    3) eject the key for ``eject_seconds`` (default 30), doubled each time its
+    probe fails again.
+    """
+    runtime = _as_dict(plugin_settings.get("_api_key_pool_runtime", None))
+    scope = runtime.get("health_scope")
+    key_id = runtime.get("selected_key_id")
+    if not scope or key_id is None:
+        return
+    selection_config = _as_dict(runtime.get("selection"))
+    eject_after = _positive_number(selection_config.get("eject_after_failures"), DEFAULT_EJECT_AFTER_FAILURES)
+    eject_seconds = _positive_number(selection_config.get("eject_seconds"), DEFAULT_EJECT_SECONDS)
+    failed = _is_unhealthy_outcome(status_code, error)
+    now = time.monotonic()
+    with _lock:
+        health = _key_health.setdefault((str(scope), str(key_id)), _KeyHealth())
+        health.error_rate += KEY_HEALTH_EWMA_ALPHA * ((1.0 if failed else 0.0) - health.error_rate)
+        if failed:
+            health.failures += 1
+            health.consecutive_failures += 1
+        else:
+            health.successes += 1
+            health.consecutive_failures = 0
+            if latency is not None:
+                health.ewma_latency = (
+                    latency
+                    if health.ewma_latency is None
+                    else health.ewma_latency + KEY_HEALTH_EWMA_ALPHA * (latency - health.ewma_latency)
+                )
+        state = health.state(now)
+        if state == "half_open" and health.probing:
+            health.probing = False
+            if failed:
+                health.eject_seconds = min(MAX_EJECT_SECONDS, health.eject_seconds * 2)
+                health.ejected_until = now + health.eject_seconds
+                health.ejections += 1
+            else:
+                health.ejected_until = 0.0
+                health.eject_seconds = 0.0
+        elif state == "healthy" and failed and health.consecutive_failures >= eject_after:
+            health.eject_seconds = min(MAX_EJECT_SECONDS, eject_seconds)
+            health.ejected_until = now + health.eject_seconds
+            health.ejections += 1
+
+
+def api_key_pool_stats(pool_id: str | None = None) -> dict[str, Any]:
+    """Routing health per key: ``{key_id: {...}}`` for ``pool_id``, or ``{scope: {key_id: {...}}}``.
+
+    Scopes are ``api_key_pool:<pool_id>`` for API key pools and the model name
+    for legacy ``key_pool_strategy`` entries.
+    """
+    now = time.monotonic()
+    stats: dict[str, dict[str, Any]] = {}
+    with _lock:
+        for (scope, key_id), health in _key_health.items():
+            stats.setdefault(scope, {})[key_id] = {
+                "state": health.state(now),
+                "in_flight": health.in_flight,
+                "selected": health.selected,
+                "successes": health.successes,
+                "failures": health.failures,
+                "consecutive_failures": health.consecutive_failures,
+                "ewma_latency": health.ewma_latency,
+                "error_rate": health.error_rate,
+                "ejections": health.ejections,
+                "ejected_for": max(0.0, health.ejected_until - now),
+            }
+    if pool_id is not None:
+        return stats.get(_health_scope(pool_id), {})
+    return stats
+
+
+def reset_api_key_pool_stats() -> None:
+    with _lock:
+        _key_health.clear()
+
+
+def _positive_number(value: Any, default: float) -> float:
+    return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0 else default
+
+
 def _as_dict(value: Any) -> dict[str, Any]:
     if hasattr(value, "to_dict"):
         value = value.to_dict()
@@ -175,6 +446,8 @@ def _build_key_entry(
     }
     if "weight" in entry:
         key_entry["weight"] = entry["weight"]
+    if entry.get("base_url"):
+        key_entry["base_url"] = _resolve_env(str(entry["base_url"]))
     if "tags" in entry:
         key_entry["tags"] = entry["tags"]
     return key_entry
@@ -237,7 +510,7 @@ def _select_key_entry(
         if selected is not None:
             return selected
     key_values = {str(entry["id"]): str(entry["value"]) for entry in key_entries}
-    selected_key_id = _select_key(strategy, [str(entry["id"]) for entry in key_entries], f"api_key_pool:{ pool_id }", key_values)
+    selected_key_id = _select_key(strategy, [str(entry["id"]) for entry in key_entries], _health_scope(pool_id), key_values)
     selected_entry = _coerce_key_entry(selected_key_id, key_entries, default_id=f"{ pool_id }.selected")
     if selected_entry is None:
         raise ValueError(f"API key pool selection returned unknown key id: { selected_key_id }")
@@ -283,11 +556,15 @@ def _resolve_api_key_pool(
     runtime = {
         "pool_id": pool_id,
         "selection": selection_config,
+        "strategy": str(selection_config.get("strategy") or selection_config.get("mode") or mode),
+        "health_scope": _health_scope(pool_id),
         "failover": failover_config,
         "keys": key_entries,
         "selected_key_id": selected["id"],
+        "reserved_key_id": None,
         "attempts": [{"key_id": selected["id"], "action": "initial"}],
     }
+    _reserve_runtime_key(runtime)
     return str(selected["value"]), runtime
 
 
@@ -343,13 +620,16 @@ def _next_key_entry(runtime: dict[str, Any]) -> dict[str, Any] | None:
         if isinstance(attempt, dict) and attempt.get("key_id") is not None
     }
     start_index = 0
+    current_base_url = None
     for index, entry in enumerate(key_entries):
         if entry.get("id") == current_key_id:
             start_index = index + 1
+            current_base_url = entry.get("base_url")
             break
     ordered = key_entries[start_index:] + key_entries[:start_index]
     for entry in ordered:
-        if entry.get("id") not in attempted_ids:
+        # The request url is already built, so only keys of the same endpoint can take over.
+        if entry.get("id") not in attempted_ids and entry.get("base_url") == current_base_url:
             return entry
     return None
 
@@ -460,7 +740,9 @@ def resolve_api_key_failover(
     if entry is None:
         return APIKeyFailoverDecision(False, "raise", reason="no_retry_key_available")
 
+    _release_runtime_key(runtime)
     runtime["selected_key_id"] = entry["id"]
+    _reserve_runtime_key(runtime)
     attempts.append({"key_id": entry["id"], "action": action})
     plugin_settings.set("_api_key_pool_runtime", runtime)
     plugin_settings.set("api_key", str(entry["value"]))
@@ -517,10 +799,14 @@ def resolve_model_pool_settings(model_key: str, settings: Any) -> None:
     if provider != active_plugin:
         settings.set("plugins.ModelRequester.activate", provider)
     ns = f"plugins.ModelRequester.{provider}"
+    previous_runtime = _as_dict(settings.get(f"{ns}._api_key_pool_runtime", None, inherit=False))
+    if previous_runtime:
+        _release_runtime_key(previous_runtime)
     settings.set(f"{ns}._api_key_pool_runtime", None)
 
     strategy = key_pool_strategy.get(model_name)
     api_key: str | None = None
+    key_base_url: str | None = None
     if profile.get("api_key_pool"):
         api_key, api_key_pool_runtime = _resolve_api_key_pool(
             pool_id=str(profile["api_key_pool"]),
@@ -529,6 +815,9 @@ def resolve_model_pool_settings(model_key: str, settings: Any) -> None:
         )
         if api_key_pool_runtime is not None:
             settings.set(f"{ns}._api_key_pool_runtime", api_key_pool_runtime)
+            selected_entry = _runtime_key_entry(api_key_pool_runtime, api_key_pool_runtime["selected_key_id"])
+            if selected_entry is not None and selected_entry.get("base_url"):
+                key_base_url = str(selected_entry["base_url"])
     if api_key is None:
         raw_profile_key = profile.get("api_key")
         if raw_profile_key is None:
@@ -550,3 +839,5 @@ def resolve_model_pool_settings(model_key: str, settings: Any) -> None:
             settings.set(f"{ ns }.{ key }", value)
     if api_key is not None:
         settings.set(f"{ns}.api_key", api_key)
+    if key_base_url is not None:
+        settings.set(f"{ns}.base_url", key_base_url)
@@ -0,0 +1,167 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Optional request hedging for slow model responses.
+
+When a model request has not produced its first content event within a hedge
+delay, ``ModelRequestRunner`` sends one duplicate request, preferably with
+another key or endpoint of the request's API key pool, and keeps whichever
+stream starts first. The other stream is cancelled before any of its events
+are broadcast, so tool calls and other response handling happen once.
+
+The delay is either fixed (``model_request.hedge.delay``) or learned per
+provider and model as a quantile (p95 by default) of recent times to first
+event. ``RequestHedger`` owns the policy, the learned delays and the hedge
+counters; the runner owns the streams.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+DEFAULT_HEDGE_QUANTILE = 0.95
+DEFAULT_HEDGE_MIN_SAMPLES = 20
+DEFAULT_HEDGE_WINDOW = 200
+
+
+@dataclass(frozen=True)
+class RequestHedgePolicy:
+    """Effective hedge policy of one request. ``delay`` None learns it from ``quantile``."""
+
+    delay: float | None = None
+    quantile: float = DEFAULT_HEDGE_QUANTILE
+    min_samples: int = DEFAULT_HEDGE_MIN_SAMPLES
+    window: int = DEFAULT_HEDGE_WINDOW
+
+
+@dataclass
+class _HedgeScope:
+    samples: deque[float] = field(default_factory=lambda: deque(maxlen=DEFAULT_HEDGE_WINDOW))
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    skipped: int = 0
+
+
+class RequestHedger:
+    def __init__(self) -> None:
+        self._scopes: dict[str, _HedgeScope] = {}
+        self._lock = threading.Lock()
+
+    def policy_from_settings(self, settings: Any) -> RequestHedgePolicy | None:
+        """Read ``model_request.hedge`` settings; None when hedging is off for this request.
+
+        Keys: ``enabled`` (default False), ``delay`` (seconds; unset learns it),
+        ``quantile`` (default 0.95), ``min_samples`` (first events seen before a
+        learned delay applies, default 20) and ``window`` (samples kept, default 200).
+        """
+        get = getattr(settings, "get", None)
+        if not callable(get) or not get("model_request.hedge.enabled", False):
+            return None
+        quantile = _positive_float_or_none(get("model_request.hedge.quantile", None))
+        return RequestHedgePolicy(
+            delay=_positive_float_or_none(get("model_request.hedge.delay", None)),
+            quantile=quantile if quantile is not None and quantile < 1 else DEFAULT_HEDGE_QUANTILE,
+            min_samples=_positive_int_or_default(
+                get("model_request.hedge.min_samples", None),
+                DEFAULT_HEDGE_MIN_SAMPLES,
+            ),
+            window=_positive_int_or_default(get("model_request.hedge.window", None), DEFAULT_HEDGE_WINDOW),
+        )
+
+    def hedge_delay(self, policy: RequestHedgePolicy, scope: str) -> float | None:
+        """Seconds to wait for the first event before hedging; None while too few samples are known."""
+        if policy.delay is not None:
+            return policy.delay
+        with self._lock:
+            samples = sorted(self._scope_locked(scope, policy).samples)
+        if len(samples) < policy.min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(policy.quantile * len(samples)))]
+
+    def observe_first_event(self, policy: RequestHedgePolicy, scope: str, seconds: float) -> None:
+        """Record how long a request waited for its first response event."""
+        with self._lock:
+            self._scope_locked(scope, policy).samples.append(max(0.0, float(seconds)))
+
+    def record_request(
+        self,
+        scope: str,
+        *,
+        hedged: bool = False,
+        hedge_won: bool = False,
+        skipped: bool = False,
+    ) -> None:
+        with self._lock:
+            stats = self._scopes.setdefault(scope, _HedgeScope())
+            stats.requests += 1
+            stats.hedged += int(hedged)
+            stats.hedge_wins += int(hedged and hedge_won)
+            stats.skipped += int(skipped)
+
+    def stats(self, scope: str | None = None) -> dict[str, Any]:
+        """Hedge counters per ``provider:model`` scope, or of one scope.
+
+        ``hedge_rate`` is the share of requests that sent a hedge and
+        ``win_rate`` the share of hedges that answered first. ``skipped`` counts
+        hedges not sent because the request scheduler had no free slot, or because
+        the primary answered while the hedge was getting one.
+        """
+        with self._lock:
+            stats = {
+                name: {
+                    "requests": item.requests,
+                    "hedged": item.hedged,
+                    "hedge_wins": item.hedge_wins,
+                    "skipped": item.skipped,
+                    "hedge_rate": item.hedged / item.requests if item.requests else 0.0,
+                    "win_rate": item.hedge_wins / item.hedged if item.hedged else 0.0,
+                    "samples": len(item.samples),
+                }
+                for name, item in self._scopes.items()
+            }
+        if scope is not None:
+            return stats.get(scope, {})
+        return stats
+
+    def reset(self) -> None:
+        with self._lock:
+            self._scopes.clear()
+
+    def _scope_locked(self, scope: str, policy: RequestHedgePolicy) -> _HedgeScope:
+        stats = self._scopes.setdefault(scope, _HedgeScope())
+        if stats.samples.maxlen != policy.window:
+            stats.samples = deque(stats.samples, maxlen=policy.window)
+        return stats
+
+
+def _positive_int_or_default(value: Any, default: int) -> int:
+    try:
+        result = int(value)
+    except (TypeError, ValueError):
+        return default
+    return result if result > 0 else default
+
+
+def _positive_float_or_none(value: Any) -> float | None:
+    if value is None:
+        return None
+    try:
+        result = float(value)
+    except (TypeError, ValueError):
+        return None
+    return result if result > 0 else None
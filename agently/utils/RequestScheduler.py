@@ -20,60 +20,444 @@ provider rate-limit storm. It also exposes a clamped exponential backoff helper
 for retry paths.
 
 Scheduling is opt-in: with no configured concurrency or rate limit, ``slot(...)``
-is a no-op and request behavior is unchanged. Concurrency/rate primitives are
-keyed by ``(provider, running event loop)`` so a process-wide scheduler stays
-correct when reused across different event loops (e.g. across tests).
+is a no-op and request behavior is unchanged. Each provider has one limiter
+that grants both concurrency slots and rate tokens; it hands them to waiters
+through their own event loops, so it is shared across loops (e.g. across
+tests).
+
+In adaptive mode the concurrency limit is not fixed: it grows additively while
+the provider answers and shrinks multiplicatively on 429/503 responses and
+timeouts, which the builtin transports report through ``observe_response`` and
+``observe_error``. ``Retry-After`` and exhausted ``x-ratelimit-*`` headers pause
+new starts for the whole provider.
+
+Waiting requests are served by priority class (``interactive`` before
+``default`` before ``batch``) and, within a class, by weighted fair queuing
+over tenants, so one large batch cannot starve other callers. With
+``max_queue`` or a per-request ``max_wait`` a request is shed with
+``RequestShedError`` instead of waiting forever. The same queue orders
+requests waiting for a rate token.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import random
+import re
+import threading
 import time
+from collections import deque
 from contextlib import asynccontextmanager
-from dataclasses import dataclass, field
-from typing import Any, AsyncIterator
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Literal, Mapping
+
+DEFAULT_ADAPTIVE_MAX_CONCURRENCY = 64
+DEFAULT_ADAPTIVE_INITIAL_CONCURRENCY = 4
+ADAPTIVE_DECREASE_FACTOR = 0.5
+# Fallback when an overload is reported outside a slot and its start time is unknown.
+ADAPTIVE_DECREASE_COOLDOWN = 0.25
+MAX_RATE_LIMIT_PAUSE = 120.0
+OVERLOAD_STATUS_CODES = frozenset({429, 503})
+REQUEST_PRIORITIES = ("interactive", "default", "batch")
+HOLD_TIME_EWMA_ALPHA = 0.2
+
+RequestPriority = Literal["interactive", "default", "batch"]
+RequestShedReason = Literal["queue_full", "deadline"]
+
+# Start time of the slot the current request runs in, so one congestion event shrinks the limit once.
+_slot_started_at: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "agently_request_slot_started_at",
+    default=None,
+)
+
+
+class RequestShedError(RuntimeError):
+    """A request left the scheduler queue without a slot.
+
+    ``reason`` is ``"queue_full"`` when the bounded queue had no room for its
+    priority, or ``"deadline"`` when it could not start within ``max_wait``.
+    """
+
+    def __init__(self, provider: str, *, reason: RequestShedReason, priority: str, waited: float = 0.0):
+        self.provider = provider
+        self.reason = reason
+        self.priority = priority
+        self.waited = waited
+        super().__init__(
+            f"Model request to '{ provider }' was shed ({ reason }) at priority '{ priority }' "
+            f"after waiting { round(waited, 3) }s."
+        )
 
 
 @dataclass
 class ProviderScheduleConfig:
-    """Per-provider scheduling limits. None disables that dimension."""
+    """Per-provider scheduling limits. None disables that dimension.
+
+    With ``adaptive`` the concurrency limit starts at ``initial_concurrency``
+    and moves between ``min_concurrency`` and ``max_concurrency``.
+    ``max_queue`` bounds how many requests may wait for a slot.
+    """
 
     max_concurrency: int | None = None
     rate_per_second: float | None = None
+    adaptive: bool = False
+    min_concurrency: int = 1
+    initial_concurrency: int | None = None
+    max_queue: int | None = None
 
 
-class _TokenBucket:
-    """Minimal token bucket: at most ``rate`` starts per second, burst 1."""
+@dataclass(eq=False)
+class _Waiter:
+    future: asyncio.Future[None]
+    priority: int
+    tenant: str
+    tag: float
+    enqueued_at: float
 
-    def __init__(self, rate_per_second: float):
-        self._min_interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
-        self._next_allowed_at = 0.0
-        self._lock = asyncio.Lock()
 
-    async def acquire(self) -> None:
-        if self._min_interval <= 0:
-            return
-        async with self._lock:
+class _ConcurrencyLimiter:
+    """Concurrency limit whose limit may change while requests run.
+
+    The limit is a float so additive increase can add ``1 / limit`` per
+    success, about one slot per window of completed requests; its integer part
+    is what admits requests. Waiters are futures of their own event loops, so
+    one limiter is safe to share across loops.
+
+    Waiters queue per priority class and tenant. A freed slot goes to the
+    highest non-empty class, and within it to the waiter with the smallest
+    start-time fair queuing tag: each tenant's tags advance by ``1 / weight``
+    per request, so backlogged tenants share slots in proportion to weight.
+
+    With ``rate_per_second`` a start also needs a rate token (burst 1). Tokens
+    go to waiters in the same order as slots; a limit of None only limits the
+    rate.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        limit: int | None,
+        *,
+        floor: int = 1,
+        ceiling: int | None = None,
+        adaptive: bool = False,
+        max_queue: int | None = None,
+        rate_per_second: float | None = None,
+    ):
+        self.provider = provider
+        self.bounded = limit is not None
+        limit = limit if limit is not None else 1
+        self.floor = max(1, floor)
+        self.ceiling = max(self.floor, ceiling if ceiling is not None else limit)
+        self.limit = float(min(self.ceiling, max(self.floor, limit)))
+        self.adaptive = adaptive
+        self.max_queue = max_queue
+        self.rate_per_second = rate_per_second
+        self._min_interval = 1.0 / rate_per_second if rate_per_second else 0.0
+        self._next_start_at = 0.0
+        self._wake_at: float | None = None
+        self.in_flight = 0
+        self._queues: list[dict[str, deque[_Waiter]]] = [{} for _ in REQUEST_PRIORITIES]
+        self._finish_tags: list[dict[str, float]] = [{} for _ in REQUEST_PRIORITIES]
+        self._virtual_time = [0.0 for _ in REQUEST_PRIORITIES]
+        self._waiting = 0
+        self._lock = threading.Lock()
+        self._last_decrease_at = 0.0
+        self._hold_seconds: float | None = None
+        self.acquired = 0
+        self.queued = 0
+        self.shed = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.successes = 0
+        self.overloads = 0
+
+    async def acquire(
+        self,
+        *,
+        priority: int = 1,
+        tenant: str = "",
+        weight: float = 1.0,
+        deadline: float | None = None,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        displaced: _Waiter | None = None
+        with self._lock:
+            self.acquired += 1
             now = time.monotonic()
-            wait = self._next_allowed_at - now
-            if wait > 0:
-                await asyncio.sleep(wait)
-                now = time.monotonic()
-            self._next_allowed_at = max(now, self._next_allowed_at) + self._min_interval
+            if not self._waiting and self._has_slot_locked() and now >= self._next_start_at:
+                self._start_locked(now)
+                return
+            if deadline is not None and now + self._expected_wait_locked(priority, now) > deadline:
+                self.shed += 1
+                raise RequestShedError(self.provider, reason="deadline", priority=REQUEST_PRIORITIES[priority])
+            if self.max_queue is not None and self._waiting >= self.max_queue:
+                displaced = self._pop_lowest_locked(below=priority)
+                if displaced is None:
+                    self.shed += 1
+                    raise RequestShedError(self.provider, reason="queue_full", priority=REQUEST_PRIORITIES[priority])
+            waiter = self._enqueue_locked(loop.create_future(), priority, tenant, weight, now)
+            self.queued += 1
+            # Only a missing rate token can hold up a waiter while a slot is free.
+            self._wake_locked()
+        if displaced is not None:
+            self._reject(displaced, "queue_full")
+        try:
+            if deadline is None:
+                await waiter.future
+            else:
+                await asyncio.wait_for(asyncio.shield(waiter.future), timeout=max(0.0, deadline - time.monotonic()))
+        except asyncio.TimeoutError:
+            with self._lock:
+                removed = self._remove_locked(waiter)
+                if removed:
+                    self.shed += 1
+                    self._rearm_wake_locked()
+            if removed:
+                raise RequestShedError(
+                    self.provider,
+                    reason="deadline",
+                    priority=REQUEST_PRIORITIES[priority],
+                    waited=time.monotonic() - waiter.enqueued_at,
+                ) from None
+            # Granted or displaced at the deadline; take whichever happened.
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                removed = self._remove_locked(waiter)
+                if removed:
+                    self._rearm_wake_locked()
+            if not removed:
+                future = waiter.future
+                # A slot handed over just before the cancellation goes back to the queue.
+                if not future.done():
+                    future.cancel()
+                elif not future.cancelled() and future.exception() is None:
+                    self.release()
+            raise
+        waited = time.monotonic() - waiter.enqueued_at
+        with self._lock:
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
 
+    def release(self, held_seconds: float | None = None) -> None:
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            if held_seconds is not None:
+                self._hold_seconds = (
+                    held_seconds
+                    if self._hold_seconds is None
+                    else self._hold_seconds + HOLD_TIME_EWMA_ALPHA * (held_seconds - self._hold_seconds)
+                )
+            self._wake_locked()
+
+    def increase(self) -> None:
+        with self._lock:
+            self.successes += 1
+            # Only a limit that is actually reached has proven it can grow.
+            if not self.adaptive or self.in_flight < int(self.limit) - 1:
+                return
+            self.limit = min(float(self.ceiling), self.limit + 1.0 / self.limit)
+            self._wake_locked()
+
+    def decrease(self, started_at: float | None = None) -> None:
+        """Shrink the limit once per congestion event.
+
+        Overloads of requests that started before the last decrease were sent
+        under the old limit and are ignored.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self.overloads += 1
+            if not self.adaptive:
+                return
+            if started_at is not None:
+                if started_at < self._last_decrease_at:
+                    return
+            elif now - self._last_decrease_at < ADAPTIVE_DECREASE_COOLDOWN:
+                return
+            self._last_decrease_at = now
+            self.limit = max(float(self.floor), self.limit * ADAPTIVE_DECREASE_FACTOR)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "adaptive": self.adaptive,
+                "limit": int(self.limit) if self.bounded else None,
+                "rate_per_second": self.rate_per_second,
+                "min_limit": self.floor,
+                "max_limit": self.ceiling,
+                "in_flight": self.in_flight,
+                "queue_depth": self._waiting,
+                "queue_depth_by_priority": {
+                    name: sum(len(waiters) for waiters in self._queues[index].values())
+                    for index, name in enumerate(REQUEST_PRIORITIES)
+                },
+                "max_queue": self.max_queue,
+                "acquired": self.acquired,
+                "queued": self.queued,
+                "shed": self.shed,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_max": self.wait_seconds_max,
+                "hold_seconds_avg": self._hold_seconds,
+                "successes": self.successes,
+                "overloads": self.overloads,
+            }
+
+    def _enqueue_locked(
+        self,
+        future: asyncio.Future[None],
+        priority: int,
+        tenant: str,
+        weight: float,
+        now: float,
+    ) -> _Waiter:
+        finish_tags = self._finish_tags[priority]
+        tag = max(self._virtual_time[priority], finish_tags.get(tenant, 0.0))
+        finish_tags[tenant] = tag + 1.0 / weight
+        waiter = _Waiter(future=future, priority=priority, tenant=tenant, tag=tag, enqueued_at=now)
+        self._queues[priority].setdefault(tenant, deque()).append(waiter)
+        self._waiting += 1
+        return waiter
+
+    def _remove_locked(self, waiter: _Waiter) -> bool:
+        waiters = self._queues[waiter.priority].get(waiter.tenant)
+        if waiters is None or waiter not in waiters:
+            return False
+        waiters.remove(waiter)
+        self._forget_tenant_if_idle_locked(waiter.priority, waiter.tenant)
+        self._waiting -= 1
+        return True
+
+    def _forget_tenant_if_idle_locked(self, priority: int, tenant: str) -> None:
+        # An idle tenant restarts at the class's virtual time, so tags stay bounded by active tenants.
+        if not self._queues[priority].get(tenant):
+            self._queues[priority].pop(tenant, None)
+            self._finish_tags[priority].pop(tenant, None)
+
+    def _pop_next_locked(self) -> _Waiter | None:
+        for priority, queues in enumerate(self._queues):
+            if not queues:
+                continue
+            tenant = min(queues, key=lambda name: queues[name][0].tag)
+            waiter = queues[tenant].popleft()
+            self._virtual_time[priority] = waiter.tag
+            self._forget_tenant_if_idle_locked(priority, tenant)
+            self._waiting -= 1
+            return waiter
+        return None
+
+    def _pop_lowest_locked(self, *, below: int) -> _Waiter | None:
+        """Take the newest waiter of the lowest class under ``below``, from its most-served tenant."""
+        for priority in range(len(REQUEST_PRIORITIES) - 1, below, -1):
+            queues = self._queues[priority]
+            if not queues:
+                continue
+            tenant = max(queues, key=lambda name: queues[name][-1].tag)
+            waiter = queues[tenant].pop()
+            self._forget_tenant_if_idle_locked(priority, tenant)
+            self._waiting -= 1
+            self.shed += 1
+            return waiter
+        return None
+
+    def _expected_wait_locked(self, priority: int, now: float) -> float:
+        """Estimated queueing delay for a new waiter of ``priority``.
+
+        The slot part is 0 until a hold time is known; the rate part counts one
+        token interval per waiter served first.
+        """
+        ahead = sum(
+            len(waiters) for queues in self._queues[: priority + 1] for waiters in queues.values()
+        )
+        wait = 0.0
+        if self.bounded and self._hold_seconds is not None:
+            wait = (ahead + 1) * self._hold_seconds / max(1, int(self.limit))
+        if self._min_interval:
+            wait = max(wait, self._next_start_at - now + ahead * self._min_interval)
+        return wait
+
+    def _has_slot_locked(self) -> bool:
+        return not self.bounded or self.in_flight < int(self.limit)
+
+    def _start_locked(self, now: float) -> None:
+        self.in_flight += 1
+        if self._min_interval:
+            self._next_start_at = max(now, self._next_start_at) + self._min_interval
+
+    def _wake_locked(self) -> None:
+        while self._waiting and self._has_slot_locked():
+            now = time.monotonic()
+            if now < self._next_start_at:
+                self._schedule_wake_locked(self._next_start_at)
+                return
+            waiter = self._pop_next_locked()
+            if waiter is None:
+                break
+            if waiter.future.done():
+                continue
+            self._start_locked(now)
+            waiter.future.get_loop().call_soon_threadsafe(self._grant, waiter.future)
+
+    def _schedule_wake_locked(self, at: float) -> None:
+        """Wake the queue when the next rate token is due, on the loop of a waiter."""
+        if self._wake_at is not None and self._wake_at <= at:
+            return
+        waiter = next(
+            (waiter for queues in self._queues for waiters in queues.values() for waiter in waiters),
+            None,
+        )
+        if waiter is None:
+            return
+        self._wake_at = at
+        try:
+            waiter.future.get_loop().call_soon_threadsafe(self._arm_wake, at)
+        except RuntimeError:
+            # The waiter's loop is closed; the next acquire or removal re-arms the wake.
+            self._wake_at = None
+
+    def _arm_wake(self, at: float) -> None:
+        asyncio.get_running_loop().call_later(max(0.0, at - time.monotonic()), self._rate_wake)
+
+    def _rate_wake(self) -> None:
+        with self._lock:
+            self._wake_at = None
+            self._wake_locked()
+
+    def _rearm_wake_locked(self) -> None:
+        # The pending wake may run on the loop of the waiter that just left.
+        if self._min_interval:
+            self._wake_at = None
+            self._wake_locked()
+
+    def _grant(self, future: asyncio.Future[None]) -> None:
+        if future.done():
+            self.release()
+        else:
+            future.set_result(None)
+
+    def _reject(self, waiter: _Waiter, reason: RequestShedReason) -> None:
+        error = RequestShedError(
+            self.provider,
+            reason=reason,
+            priority=REQUEST_PRIORITIES[waiter.priority],
+            waited=time.monotonic() - waiter.enqueued_at,
+        )
+        waiter.future.get_loop().call_soon_threadsafe(_fail_future, waiter.future, error)
 
-@dataclass
-class _LoopState:
-    semaphores: dict[str, asyncio.Semaphore] = field(default_factory=dict)
-    buckets: dict[str, _TokenBucket] = field(default_factory=dict)
+
+def _fail_future(future: asyncio.Future[None], error: BaseException) -> None:
+    if not future.done():
+        future.set_exception(error)
 
 
 class RequestScheduler:
     def __init__(self) -> None:
         self._configs: dict[str, ProviderScheduleConfig] = {}
-        # Keyed by id(running loop) so primitives never cross event loops.
-        self._loop_states: dict[int, _LoopState] = {}
+        self._limiters: dict[str, _ConcurrencyLimiter] = {}
+        self._paused_until: dict[str, float] = {}
 
     def configure(
         self,
@@ -81,14 +465,26 @@ class RequestScheduler:
         *,
         max_concurrency: int | None = None,
         rate_per_second: float | None = None,
+        adaptive: bool = False,
+        min_concurrency: int | None = None,
+        initial_concurrency: int | None = None,
+        max_queue: int | None = None,
     ) -> "RequestScheduler":
         provider = str(provider or "").strip()
         if not provider:
             raise ValueError("RequestScheduler.configure requires a non-empty provider name.")
-        self._configs[provider] = ProviderScheduleConfig(
+        config = ProviderScheduleConfig(
             max_concurrency=_positive_int_or_none(max_concurrency),
             rate_per_second=_positive_float_or_none(rate_per_second),
+            adaptive=bool(adaptive),
+            min_concurrency=_positive_int_or_none(min_concurrency) or 1,
+            initial_concurrency=_positive_int_or_none(initial_concurrency),
+            max_queue=_positive_int_or_none(max_queue),
         )
+        # Requests re-apply their settings on every call; keep limiter state unless they changed.
+        if self._configs.get(provider) == config:
+            return self
+        self._configs[provider] = config
         self._clear_cached_primitives(provider)
         return self
 
@@ -96,68 +492,216 @@ class RequestScheduler:
         """Read ``model_request.scheduler`` config for a provider from settings.
 
         Supports a global block and a per-provider override:
-        ``model_request.scheduler.max_concurrency`` / ``.rate_per_second`` and
-        ``model_request.scheduler.providers.<provider>.{max_concurrency,rate_per_second}``.
+        ``model_request.scheduler.max_concurrency`` / ``.rate_per_second`` /
+        ``.adaptive`` / ``.min_concurrency`` / ``.initial_concurrency`` /
+        ``.max_queue`` and ``model_request.scheduler.providers.<provider>.{...}``
+        with the same keys.
         """
         get = getattr(settings, "get", None)
         if not callable(get):
             return self
-        max_concurrency: Any = get("model_request.scheduler.max_concurrency", None)
-        rate_per_second: Any = get("model_request.scheduler.rate_per_second", None)
+        options: dict[str, Any] = {
+            key: get(f"model_request.scheduler.{ key }", None)
+            for key in (
+                "max_concurrency",
+                "rate_per_second",
+                "adaptive",
+                "min_concurrency",
+                "initial_concurrency",
+                "max_queue",
+            )
+        }
         providers = get("model_request.scheduler.providers", None)
         if isinstance(providers, dict) and provider in providers and isinstance(providers[provider], dict):
             override = providers[provider]
-            max_concurrency = override.get("max_concurrency", max_concurrency)
-            rate_per_second = override.get("rate_per_second", rate_per_second)
-        if max_concurrency is None and rate_per_second is None:
+            options = {key: override.get(key, value) for key, value in options.items()}
+        if options["max_concurrency"] is None and options["rate_per_second"] is None and not options["adaptive"]:
             return self
         return self.configure(
             provider,
-            max_concurrency=max_concurrency,
-            rate_per_second=rate_per_second,
+            max_concurrency=options["max_concurrency"],
+            rate_per_second=options["rate_per_second"],
+            adaptive=bool(options["adaptive"]),
+            min_concurrency=options["min_concurrency"],
+            initial_concurrency=options["initial_concurrency"],
+            max_queue=options["max_queue"],
         )
 
+    @staticmethod
+    def slot_options_from_settings(settings: Any, *, default_tenant: str | None = None) -> dict[str, Any]:
+        """Read the per-request ``slot(...)`` options from settings.
+
+        Keys: ``model_request.scheduler.priority`` (``"interactive"``,
+        ``"default"`` or ``"batch"``), ``.tenant`` (falls back to
+        ``default_tenant``), ``.weight`` and ``.max_wait`` (seconds).
+        """
+        get = getattr(settings, "get", None)
+        if not callable(get):
+            return {"tenant": default_tenant}
+        tenant = get("model_request.scheduler.tenant", None)
+        return {
+            "priority": str(get("model_request.scheduler.priority", "default") or "default"),
+            "tenant": str(tenant) if tenant not in (None, "") else default_tenant,
+            "weight": _positive_float_or_none(get("model_request.scheduler.weight", None)) or 1.0,
+            "max_wait": _positive_float_or_none(get("model_request.scheduler.max_wait", None)),
+        }
+
     def is_active(self, provider: str) -> bool:
         config = self._configs.get(str(provider))
-        return bool(config and (config.max_concurrency or config.rate_per_second))
+        return bool(config and (config.max_concurrency or config.rate_per_second or config.adaptive))
 
     @asynccontextmanager
-    async def slot(self, provider: str) -> AsyncIterator[None]:
+    async def slot(
+        self,
+        provider: str,
+        *,
+        priority: RequestPriority | str = "default",
+        tenant: str | None = None,
+        weight: float = 1.0,
+        max_wait: float | None = None,
+    ) -> AsyncIterator[None]:
+        """Hold one request slot of ``provider``.
+
+        ``priority`` picks the class a waiting request queues in; ``tenant``
+        and ``weight`` share each class fairly between callers. With
+        ``max_wait`` (seconds) the request raises ``RequestShedError`` instead
+        of waiting longer, or at once when the queue is not expected to reach
+        it in time. Requests waiting for a rate token queue the same way.
+        """
         provider = str(provider)
+        if priority not in REQUEST_PRIORITIES:
+            raise ValueError(f"Request priority must be one of: { ', '.join(REQUEST_PRIORITIES) }.")
         config = self._configs.get(provider)
-        if config is None or not (config.max_concurrency or config.rate_per_second):
+        if config is None or not (config.max_concurrency or config.rate_per_second or config.adaptive):
             yield
             return
-        state = self._loop_state()
-        if config.rate_per_second:
-            bucket = state.buckets.get(provider)
-            if bucket is None:
-                bucket = _TokenBucket(config.rate_per_second)
-                state.buckets[provider] = bucket
-            await bucket.acquire()
-        if config.max_concurrency:
-            semaphore = state.semaphores.get(provider)
-            if semaphore is None:
-                semaphore = asyncio.Semaphore(config.max_concurrency)
-                state.semaphores[provider] = semaphore
-            async with semaphore:
-                yield
-        else:
+        deadline = time.monotonic() + max_wait if max_wait is not None else None
+        await self._wait_for_pause(provider, deadline=deadline, priority=str(priority))
+        limiter = self._limiter(provider, config)
+        if limiter is None:
             yield
+            return
+        await limiter.acquire(
+            priority=REQUEST_PRIORITIES.index(priority),
+            tenant=str(tenant or ""),
+            weight=weight if weight > 0 else 1.0,
+            deadline=deadline,
+        )
+        started_at = time.monotonic()
+        # Restored by value: a hedge enters its slot in a task of its own and leaves it from the request.
+        outer_started_at = _slot_started_at.get()
+        _slot_started_at.set(started_at)
+        try:
+            yield
+        finally:
+            _slot_started_at.set(outer_started_at)
+            limiter.release(time.monotonic() - started_at)
 
-    def _loop_state(self) -> _LoopState:
-        loop = asyncio.get_running_loop()
-        key = id(loop)
-        state = self._loop_states.get(key)
-        if state is None:
-            state = _LoopState()
-            self._loop_states[key] = state
-        return state
+    def observe_response(
+        self,
+        provider: str,
+        *,
+        status_code: int | None,
+        headers: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Feed one provider HTTP response into the adaptive limit of ``provider``.
+
+        429/503 shrink the limit, other non-error responses grow it, and rate
+        limit headers pause new starts. Non-adaptive providers ignore it.
+        """
+        provider = str(provider)
+        config = self._configs.get(provider)
+        if config is None or not config.adaptive:
+            return
+        delay = rate_limit_delay(headers, status_code=status_code if isinstance(status_code, int) else None)
+        if delay is not None:
+            self.pause(provider, delay)
+        limiter = self._limiter(provider, config)
+        if limiter is None or not isinstance(status_code, int):
+            return
+        if status_code in OVERLOAD_STATUS_CODES:
+            limiter.decrease(_slot_started_at.get())
+        elif status_code < 400:
+            limiter.increase()
+
+    def observe_error(self, provider: str, error: BaseException) -> None:
+        """Feed a transport error: HTTP status errors and timeouts count as overload."""
+        from httpx import HTTPStatusError, TimeoutException
+
+        if isinstance(error, HTTPStatusError):
+            self.observe_response(provider, status_code=error.response.status_code, headers=error.response.headers)
+            return
+        if not isinstance(error, (TimeoutError, TimeoutException)) and getattr(error, "status", None) != "stalled":
+            return
+        config = self._configs.get(str(provider))
+        if config is None or not config.adaptive:
+            return
+        limiter = self._limiter(str(provider), config)
+        if limiter is not None:
+            limiter.decrease(_slot_started_at.get())
+
+    def pause(self, provider: str, seconds: float) -> None:
+        """Hold new starts for ``provider`` for ``seconds`` (capped); in-flight requests continue."""
+        seconds = min(MAX_RATE_LIMIT_PAUSE, max(0.0, float(seconds)))
+        provider = str(provider)
+        self._paused_until[provider] = max(self._paused_until.get(provider, 0.0), time.monotonic() + seconds)
+
+    def stats(self, provider: str) -> dict[str, Any]:
+        """Return the current limit, in-flight count, queue depth and wait times for ``provider``."""
+        provider = str(provider)
+        config = self._configs.get(provider)
+        limiter = self._limiter(provider, config) if config is not None else None
+        stats: dict[str, Any] = (
+            limiter.stats()
+            if limiter is not None
+            else {"adaptive": False, "limit": None, "in_flight": 0, "queue_depth": 0}
+        )
+        stats["paused_for"] = max(0.0, self._paused_until.get(provider, 0.0) - time.monotonic())
+        return stats
+
+    async def _wait_for_pause(self, provider: str, *, deadline: float | None = None, priority: str = "default") -> None:
+        while True:
+            paused_until = self._paused_until.get(provider, 0.0)
+            now = time.monotonic()
+            if paused_until <= now:
+                return
+            if deadline is not None and paused_until > deadline:
+                limiter = self._limiters.get(provider)
+                if limiter is not None:
+                    with limiter._lock:
+                        limiter.shed += 1
+                raise RequestShedError(provider, reason="deadline", priority=priority)
+            await asyncio.sleep(paused_until - now)
+
+    def _limiter(self, provider: str, config: ProviderScheduleConfig) -> _ConcurrencyLimiter | None:
+        limiter = self._limiters.get(provider)
+        if limiter is not None:
+            return limiter
+        if config.adaptive:
+            ceiling = config.max_concurrency or DEFAULT_ADAPTIVE_MAX_CONCURRENCY
+            initial = config.initial_concurrency or min(ceiling, DEFAULT_ADAPTIVE_INITIAL_CONCURRENCY)
+            limiter = _ConcurrencyLimiter(
+                provider,
+                initial,
+                floor=config.min_concurrency,
+                ceiling=ceiling,
+                adaptive=True,
+                max_queue=config.max_queue,
+                rate_per_second=config.rate_per_second,
+            )
+        elif config.max_concurrency or config.rate_per_second:
+            limiter = _ConcurrencyLimiter(
+                provider,
+                config.max_concurrency,
+                max_queue=config.max_queue,
+                rate_per_second=config.rate_per_second,
+            )
+        else:
+            return None
+        return self._limiters.setdefault(provider, limiter)
 
     def _clear_cached_primitives(self, provider: str) -> None:
-        for state in self._loop_states.values():
-            state.semaphores.pop(provider, None)
-            state.buckets.pop(provider, None)
+        self._limiters.pop(provider, None)
 
     @staticmethod
     def backoff_delay(
@@ -176,6 +720,57 @@ class RequestScheduler:
         return delay
 
 
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+def rate_limit_delay(headers: Mapping[str, Any] | None, *, status_code: int | None = None) -> float | None:
+    """Seconds a provider asked callers to wait, from rate limit response headers.
+
+    Reads ``retry-after-ms`` / ``retry-after`` (seconds or HTTP date) on any
+    response, then ``x-ratelimit-reset-{requests,tokens}`` when the matching
+    ``x-ratelimit-remaining-*`` is exhausted or the response is a 429.
+    """
+    if not headers or not callable(getattr(headers, "items", None)):
+        return None
+    values = {str(key).lower(): str(value).strip() for key, value in headers.items()}
+    if "retry-after-ms" in values:
+        seconds = _positive_float_or_none(values["retry-after-ms"])
+        if seconds is not None:
+            return seconds / 1000
+    if "retry-after" in values:
+        seconds = _positive_float_or_none(values["retry-after"])
+        if seconds is None:
+            try:
+                seconds = parsedate_to_datetime(values["retry-after"]).timestamp() - time.time()
+            except (TypeError, ValueError, IndexError, OverflowError):
+                seconds = None
+        if seconds is not None and seconds > 0:
+            return seconds
+    delays = []
+    for kind in ("requests", "tokens"):
+        if values.get(f"x-ratelimit-remaining-{ kind }") != "0" and status_code != 429:
+            continue
+        delay = _parse_duration(values.get(f"x-ratelimit-reset-{ kind }"))
+        if delay is not None:
+            delays.append(delay)
+    return max(delays) if delays else None
+
+
+def _parse_duration(value: str | None) -> float | None:
+    """Parse ``1.5``, ``20ms`` or ``6m0s`` style durations into seconds."""
+    if not value:
+        return None
+    seconds = _positive_float_or_none(value)
+    if seconds is not None:
+        return seconds
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(number + unit for number, unit in parts) != value:
+        return None
+    scale = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+    total = sum(float(number) * scale[unit] for number, unit in parts)
+    return total if total > 0 else None
+
+
 def _positive_int_or_none(value: Any) -> int | None:
     if value is None:
         return None
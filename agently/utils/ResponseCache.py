@@ -0,0 +1,345 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Optional exact-match model response cache.
+
+A ``ResponseCache`` records the standardized event stream a ModelRequester
+broadcast for one request (deltas, tool calls, done, meta, ...) and replays it
+when an identical request is sent again. The key is a sha256 of the canonical
+JSON of the provider name, request url, request body and request options, so
+the rendered messages, model and sampling settings all take part; headers and
+client options (credentials, timeouts) do not.
+
+Caching is opt-in through ``model_request.cache`` settings. By default only
+deterministic requests are cached: ``temperature`` 0, ``top_k`` 1 or a fixed
+``seed``, and never ``n`` > 1.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Mapping, Protocol, TypeAlias, cast
+
+if TYPE_CHECKING:
+    from agently.types.data import AgentlyModelResultEvent, AgentlyModelResultMessage
+
+ResponseCacheEvents: TypeAlias = list["AgentlyModelResultMessage"]
+
+
+@dataclass(frozen=True)
+class ResponseCachePolicy:
+    """Effective cache policy of one request. ``ttl`` None keeps entries until evicted."""
+
+    backend: str = "memory"
+    path: str | None = None
+    max_entries: int = 256
+    ttl: float | None = None
+    deterministic_only: bool = True
+
+
+class ResponseCacheBackend(Protocol):
+    def get(self, key: str, *, now: float) -> ResponseCacheEvents | None: ...
+
+    def set(self, key: str, events: ResponseCacheEvents, *, expires_at: float | None) -> bool: ...
+
+    def discard(self, key: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class MemoryResponseCacheBackend:
+    """Process-local LRU of recorded event streams."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[str, tuple[float | None, ResponseCacheEvents]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, *, now: float) -> ResponseCacheEvents | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, events = entry
+            if expires_at is not None and expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # Consumers own the replayed payloads, so they must not share the cached ones.
+        return copy.deepcopy(events)
+
+    def set(self, key: str, events: ResponseCacheEvents, *, expires_at: float | None) -> bool:
+        with self._lock:
+            self._entries[key] = (expires_at, events)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return True
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteResponseCacheBackend:
+    """Event streams stored as JSON rows in a sqlite file, shared across processes.
+
+    Streams whose payloads are not JSON serializable are not stored.
+    """
+
+    def __init__(self, path: str | Path, max_entries: int = 256):
+        self.path = Path(path)
+        self.max_entries = max(1, int(max_entries))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache ("
+                "key TEXT PRIMARY KEY, events TEXT NOT NULL, expires_at REAL, used_at REAL NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS response_cache_used_at ON response_cache(used_at)")
+
+    def get(self, key: str, *, now: float) -> ResponseCacheEvents | None:
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT events, expires_at FROM response_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] is not None and row[1] <= now:
+                self._connection.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+                return None
+            self._connection.execute("UPDATE response_cache SET used_at = ? WHERE key = ?", (time.time(), key))
+        try:
+            return [(cast("AgentlyModelResultEvent", str(event)), data) for event, data in json.loads(row[0])]
+        except (TypeError, ValueError):
+            self.discard(key)
+            return None
+
+    def set(self, key: str, events: ResponseCacheEvents, *, expires_at: float | None) -> bool:
+        try:
+            encoded = json.dumps([[event, data] for event, data in events], ensure_ascii=False)
+        except (TypeError, ValueError):
+            return False
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO response_cache (key, events, expires_at, used_at) VALUES (?, ?, ?, ?)",
+                (key, encoded, expires_at, time.time()),
+            )
+            self._connection.execute(
+                "DELETE FROM response_cache WHERE key NOT IN "
+                "(SELECT key FROM response_cache ORDER BY used_at DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+        return True
+
+    def discard(self, key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM response_cache")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class ResponseCache:
+    def __init__(self) -> None:
+        self._backends: dict[tuple[str, str | None], ResponseCacheBackend] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.skips = 0
+
+    def register_backend(self, name: str, backend: ResponseCacheBackend) -> "ResponseCache":
+        """Make ``backend`` selectable as ``model_request.cache.backend = name``."""
+        name = str(name or "").strip()
+        if not name or name in ("memory", "sqlite"):
+            raise ValueError("ResponseCache.register_backend requires a custom backend name.")
+        with self._lock:
+            self._backends[(name, None)] = backend
+        return self
+
+    def policy_from_settings(self, settings: Any) -> ResponseCachePolicy | None:
+        """Read ``model_request.cache`` settings; None when caching is off for this request.
+
+        Keys: ``enabled`` (default False), ``backend`` (``"memory"`` or
+        ``"sqlite"`` or a registered name), ``path`` (sqlite file), ``max_entries``, ``ttl`` (seconds)
+        and ``deterministic_only`` (default True). A request opts out by
+        setting ``model_request.cache.enabled`` to False on its own settings.
+        """
+        get = getattr(settings, "get", None)
+        if not callable(get) or not get("model_request.cache.enabled", False):
+            return None
+        backend = str(get("model_request.cache.backend", "memory") or "memory")
+        if backend not in ("memory", "sqlite") and (backend, None) not in self._backends:
+            raise ValueError(f"model_request.cache.backend '{ backend }' is not registered.")
+        path = get("model_request.cache.path", None)
+        if backend == "sqlite" and not path:
+            path = ".agently/cache/model_responses.sqlite3"
+        return ResponseCachePolicy(
+            backend=backend,
+            path=str(path) if backend == "sqlite" else None,
+            max_entries=_positive_int_or_default(get("model_request.cache.max_entries", None), 256),
+            ttl=_positive_float_or_none(get("model_request.cache.ttl", None)),
+            deterministic_only=bool(get("model_request.cache.deterministic_only", True)),
+        )
+
+    @staticmethod
+    def key_for(provider: str, request_data: Mapping[str, Any]) -> str:
+        canonical = json.dumps(
+            {
+                "provider": str(provider),
+                "request_url": request_data.get("request_url"),
+                "data": request_data.get("data"),
+                "request_options": request_data.get("request_options"),
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=repr,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def is_deterministic(request_options: Mapping[str, Any]) -> bool:
+        if request_options.get("n") not in (None, 1):
+            return False
+        if request_options.get("seed") is not None:
+            return True
+        try:
+            if request_options.get("temperature") is not None and float(request_options["temperature"]) == 0:
+                return True
+            if request_options.get("top_k") is not None and int(request_options["top_k"]) == 1:
+                return True
+        except (TypeError, ValueError):
+            return False
+        return False
+
+    def is_cacheable(self, policy: ResponseCachePolicy, request_options: Mapping[str, Any]) -> bool:
+        if policy.deterministic_only and not self.is_deterministic(request_options):
+            self.skips += 1
+            return False
+        return True
+
+    def get(self, policy: ResponseCachePolicy, key: str) -> ResponseCacheEvents | None:
+        events = self._backend(policy).get(key, now=time.time())
+        if events is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return events
+
+    def set(self, policy: ResponseCachePolicy, key: str, events: ResponseCacheEvents) -> bool:
+        expires_at = time.time() + policy.ttl if policy.ttl is not None else None
+        stored = self._backend(policy).set(key, events, expires_at=expires_at)
+        if stored:
+            self.stores += 1
+        else:
+            self.skips += 1
+        return stored
+
+    def discard(self, policy: ResponseCachePolicy, key: str) -> None:
+        self._backend(policy).discard(key)
+
+    async def async_get(self, policy: ResponseCachePolicy, key: str) -> ResponseCacheEvents | None:
+        """``get`` for code on an event loop; backends other than memory run in a worker thread."""
+        if policy.backend == "memory":
+            return self.get(policy, key)
+        return await asyncio.to_thread(self.get, policy, key)
+
+    async def async_set(self, policy: ResponseCachePolicy, key: str, events: ResponseCacheEvents) -> bool:
+        if policy.backend == "memory":
+            return self.set(policy, key, events)
+        return await asyncio.to_thread(self.set, policy, key, events)
+
+    async def async_discard(self, policy: ResponseCachePolicy, key: str) -> None:
+        if policy.backend == "memory":
+            return self.discard(policy, key)
+        await asyncio.to_thread(self.discard, policy, key)
+
+    def clear(self) -> None:
+        with self._lock:
+            backends = list(self._backends.values())
+        for backend in backends:
+            backend.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            backends = list(self._backends.values())
+            self._backends.clear()
+        for backend in backends:
+            close = getattr(backend, "close", None)
+            if callable(close):
+                close()
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "stores": self.stores, "skips": self.skips}
+
+    def reset_stats(self) -> None:
+        self.hits = self.misses = self.stores = self.skips = 0
+
+    def _backend(self, policy: ResponseCachePolicy) -> ResponseCacheBackend:
+        key = (policy.backend, policy.path)
+        with self._lock:
+            backend = self._backends.get(key)
+            if backend is None:
+                if policy.backend not in ("memory", "sqlite"):
+                    raise ValueError(f"model_request.cache.backend '{ policy.backend }' is not registered.")
+                if policy.backend == "sqlite":
+                    assert policy.path is not None
+                    backend = SQLiteResponseCacheBackend(policy.path, policy.max_entries)
+                else:
+                    backend = MemoryResponseCacheBackend(policy.max_entries)
+                self._backends[key] = backend
+            elif policy.backend in ("memory", "sqlite"):
+                setattr(backend, "max_entries", policy.max_entries)
+            return backend
+
+
+def _positive_int_or_default(value: Any, default: int) -> int:
+    try:
+        result = int(value)
+    except (TypeError, ValueError):
+        return default
+    return result if result > 0 else default
+
+
+def _positive_float_or_none(value: Any) -> float | None:
+    if value is None:
+        return None
+    try:
+        result = float(value)
+    except (TypeError, ValueError):
+        return None
+    return result if result > 0 else None
@@ -17,8 +17,10 @@ import os
 import re
 import yaml
 import toml
-from typing import TYPE_CHECKING, Any, Literal, cast
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Iterator, KeysView, Literal, Mapping, TypeVar, cast
 from .SerializableStateData import SerializableStateData, SerializableStateDataNamespace
+from .StateData import _MISSING
 from .LazyImport import LazyImport
 from .DataFormatter import DataFormatter
 
@@ -26,9 +28,34 @@ if TYPE_CHECKING:
     from agently.types.data import SerializableMapping, SerializableValue
 
 _UNSET = object()
+_SNAPSHOT = object()
+# Resolved lookups kept per layer; the cap only matters for callers that read
+# an unbounded number of distinct keys.
+_MAX_RESOLVED_KEYS = 4096
+
+T = TypeVar("T")
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
 
 
 class Settings(SerializableStateData):
+    """Layered settings: each layer stores only its own overrides.
+
+    Inherited reads are resolved along the parent chain for the requested key
+    only and memoized per layer. Entries are stamped with ``_chain_version()``
+    and recomputed once this layer or any ancestor has been written. Scalar
+    values come straight from the memo; dicts, lists and sets are copied on the
+    way out because callers may mutate them. ``snapshot()`` returns the whole
+    resolved view as a read-only mapping without copying.
+    """
 
     def __init__(
         self,
@@ -37,6 +64,7 @@ class Settings(SerializableStateData):
         name: str | None = None,
         parent: "Settings | None" = None,
     ) -> None:
+        self._resolved: dict[Any, tuple[int, Any]] = {}
         super().__init__(
             data,
             name=name,
@@ -45,6 +73,66 @@ class Settings(SerializableStateData):
         self._path_mappings = SerializableStateData(parent=parent._path_mappings if parent is not None else None)
         self._kv_mappings = SerializableStateData(parent=parent._kv_mappings if parent is not None else None)
 
+    def _resolve_cached(self, key: Any) -> Any:
+        version = self._chain_version()
+        cached = self._resolved.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        value = self._get_inherited(key)
+        if len(self._resolved) >= _MAX_RESOLVED_KEYS:
+            self._resolved.clear()
+        self._resolved[key] = (version, value)
+        return value
+
+    def get(
+        self,
+        key: Any | None = None,
+        default: T = None,
+        inherit: bool = True,
+    ) -> Any | T:
+        if not inherit:
+            return super().get(key, default, inherit=False)
+        try:
+            value = self._resolve_cached(key)
+        except TypeError:
+            return super().get(key, default, inherit=True)
+        if value is _MISSING:
+            return default
+        if isinstance(value, (dict, list, set, tuple)):
+            return self._copy(value)
+        return value
+
+    def snapshot(self) -> Mapping[str, Any]:
+        """Return the resolved settings as a read-only, cached mapping.
+
+        Nested dicts are mapping proxies and lists are tuples. The same object
+        is returned until this layer or an ancestor is written.
+        """
+        version = self._chain_version()
+        cached = self._resolved.get(_SNAPSHOT)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        snapshot = _freeze(self._resolve_cached(None))
+        self._resolved[_SNAPSHOT] = (version, snapshot)
+        return snapshot
+
+    def __contains__(self, key: Any) -> bool:
+        try:
+            if isinstance(key, str) and "." in key:
+                return key in self._resolve_cached(None)
+            return self._resolve_cached(key) is not _MISSING
+        except TypeError:
+            return super().__contains__(key)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._resolve_cached(None))
+
+    def __len__(self) -> int:
+        return len(self._resolve_cached(None))
+
+    def keys(self) -> KeysView[Any]:
+        return self._resolve_cached(None).keys()
+
     @staticmethod
     def _load_environ() -> dict[str, str]:
         LazyImport.import_package("dotenv")
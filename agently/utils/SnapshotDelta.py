@@ -0,0 +1,125 @@
+# Copyright 2023-2026 AgentEra(Agently.Tech)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Append-only deltas over JSON snapshot states.
+
+A delta records the path writes and deletes that turn the state saved as
+``previous_snapshot_id`` into the state saved with the delta. A chain starts
+with one full (base) state followed by the deltas saved after it, so a store
+can keep writing small records and still return the full latest state.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, TypeVar
+
+SNAPSHOT_DELTA_KIND = "agently.snapshot_delta"
+SNAPSHOT_DELTA_SCHEMA_VERSION = 1
+
+RefT = TypeVar("RefT")
+
+
+def is_snapshot_delta(state: Any) -> bool:
+    return isinstance(state, dict) and state.get("kind") == SNAPSHOT_DELTA_KIND
+
+
+def build_snapshot_delta(
+    *,
+    snapshot_id: str,
+    previous_snapshot_id: str,
+    base_snapshot_id: str,
+    sequence: int,
+    set_paths: Sequence[tuple[Sequence[str], Any]],
+    delete_paths: Sequence[Sequence[str]] = (),
+    state_version: int | None = None,
+) -> dict[str, Any]:
+    return {
+        "kind": SNAPSHOT_DELTA_KIND,
+        "schema_version": SNAPSHOT_DELTA_SCHEMA_VERSION,
+        "snapshot_id": snapshot_id,
+        "previous_snapshot_id": previous_snapshot_id,
+        "base_snapshot_id": base_snapshot_id,
+        "sequence": sequence,
+        "state_version": state_version,
+        "set": [[list(path), value] for path, value in set_paths],
+        "delete": [list(path) for path in delete_paths],
+    }
+
+
+def apply_snapshot_delta(state: dict[str, Any], delta: dict[str, Any]) -> dict[str, Any]:
+    """Apply ``delta`` to ``state`` in place and return it."""
+    if not is_snapshot_delta(delta) or delta.get("schema_version") != SNAPSHOT_DELTA_SCHEMA_VERSION:
+        raise ValueError("Snapshot delta kind or schema version is unsupported.")
+    if state.get("snapshot_id") != delta.get("previous_snapshot_id"):
+        raise ValueError(
+            f"Snapshot delta { delta.get('snapshot_id') } does not follow snapshot { state.get('snapshot_id') }."
+        )
+    for path in delta.get("delete") or []:
+        parent = _walk(state, path[:-1], create=False)
+        if isinstance(parent, dict):
+            parent.pop(path[-1], None)
+    for path, value in delta.get("set") or []:
+        parent = _walk(state, path[:-1], create=True)
+        parent[path[-1]] = value
+    state["snapshot_id"] = delta.get("snapshot_id")
+    return state
+
+
+def materialize_snapshot(chain: Sequence[dict[str, Any]]) -> dict[str, Any]:
+    """Replay ``chain`` (one base state, then its deltas in save order)."""
+    if not chain or is_snapshot_delta(chain[0]):
+        raise ValueError("Snapshot delta chain must start with a full base snapshot.")
+    state = chain[0]
+    for delta in chain[1:]:
+        state = apply_snapshot_delta(state, delta)
+    return state
+
+
+async def read_snapshot_chain(
+    refs: Sequence[RefT],
+    read: Callable[[RefT], Awaitable[Any]],
+) -> dict[str, Any] | None:
+    """Read snapshot records newest first back to their base and materialize them.
+
+    ``refs`` are one run's snapshot records, newest first. Only the records
+    needed to rebuild the newest state are read.
+    """
+    chain: list[dict[str, Any]] = []
+    for ref in refs:
+        state = await read(ref)
+        if not isinstance(state, dict):
+            return None
+        chain.append(state)
+        if not is_snapshot_delta(state):
+            chain.reverse()
+            return materialize_snapshot(chain)
+    if chain:
+        raise ValueError("Snapshot delta chain lost its base snapshot.")
+    return None
+
+
+def _walk(state: dict[str, Any], path: Sequence[str], *, create: bool) -> Any:
+    current: Any = state
+    for key in path:
+        if not isinstance(current, dict):
+            raise ValueError(f"Snapshot delta path { list(path) } crosses a non-object value.")
+        if key not in current:
+            if not create:
+                return None
+            current[key] = {}
+        current = current[key]
+    if create and not isinstance(current, dict):
+        raise ValueError(f"Snapshot delta path { list(path) } crosses a non-object value.")
+    return current
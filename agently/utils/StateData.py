@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import datetime
+import itertools
 from copy import deepcopy
 from pathlib import Path
 from typing import Any, ItemsView, Iterator, KeysView, Literal, Mapping, Sequence, TypeVar, ValuesView, cast
@@ -26,6 +27,12 @@ from .DataFormatter import DataFormatter
 
 T = TypeVar("T")
 
+_MISSING = object()
+# Every write stamps the written layer with a fresh, process-wide increasing
+# number, so the largest stamp along a parent chain changes whenever any layer
+# of that chain is written (or re-parented).
+_write_stamps = itertools.count(1)
+
 
 class DictRef:
     def __init__(self, container: dict[Any, Any], key: Any = None) -> None:
@@ -68,6 +75,11 @@ class StateData:
         parent: "StateData | None" = None,
     ) -> None:
         self._data = data if data is not None else {}
+        self._version = next(_write_stamps)
+        # Per top-level key write stamps; a write without a key (clear,
+        # re-parenting) may have changed every key and moves _reset_version.
+        self._key_versions: dict[Any, int] = {}
+        self._reset_version = self._version
         if name is None:
             # Keep the historical auto-generated prefix for compatibility.
             self.name = f"runtime_data_{ StateData.instance_counter }"
@@ -79,6 +91,52 @@ class StateData:
     def __repr__(self) -> str:
         return f"StateData(name={ self.name }, data={ str(self.data) })"
 
+    @property
+    def parent(self) -> "StateData | None":
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent: "StateData | None") -> None:
+        self._parent = parent
+        self._touch()
+
+    def _touch(self, *keys: Any) -> None:
+        self._version = next(_write_stamps)
+        if not keys:
+            self._reset_version = self._version
+            self._key_versions.clear()
+            return
+        for key in keys:
+            if isinstance(key, str) and "." in key:
+                key = key.split(".", 1)[0]
+            self._key_versions[key] = self._version
+
+    @property
+    def version(self) -> int:
+        """Write stamp of this layer; pass it to ``changed_keys`` later."""
+        return self._version
+
+    def changed_keys(self, since: int) -> set[Any] | None:
+        """Return top-level keys of this layer written after stamp ``since``.
+
+        Returns ``None`` when the whole layer may have changed. Keys in the
+        result that are no longer present were deleted. In-place mutation of
+        values read with ``inherit=False`` is not tracked.
+        """
+        if self._reset_version > since:
+            return None
+        return {key for key, version in self._key_versions.items() if version > since}
+
+    def _chain_version(self) -> int:
+        """Return a stamp that changes whenever this layer or an ancestor is written."""
+        version = self._version
+        layer = self._parent
+        while layer is not None:
+            if layer._version > version:
+                version = layer._version
+            layer = layer._parent
+        return version
+
     def __eq__(self, equal_target: Any) -> bool:
         return self.data == equal_target
 
@@ -111,31 +169,37 @@ class StateData:
         except Exception:
             return origin
 
+    def _merge_value(self, child_value: Any, parent_value: Any) -> Any:
+        """Merge a non-dict child value with its parent value.
+
+        ``child_value`` must already be a private copy: lists and sets are
+        extended in place with the parent's items, anything else wins as is.
+        """
+        if isinstance(child_value, list):
+            if isinstance(parent_value, (list, set, tuple)):
+                for item in parent_value:
+                    if item not in child_value:
+                        child_value.append(self._copy(item))
+            elif parent_value not in child_value:
+                child_value.append(self._copy(parent_value))
+        elif isinstance(child_value, set):
+            if isinstance(parent_value, (list, set, tuple)):
+                for item in parent_value:
+                    if item not in child_value:
+                        child_value.add(self._copy(item))
+            else:
+                child_value.add(self._copy(parent_value))
+        return child_value
+
     def _merge_view(self, child_data: dict[Any, Any], parent_data: dict[Any, Any]) -> dict[Any, Any]:
         result = self._copy(parent_data)
         for key, value in child_data.items():
             if key not in parent_data:
-                result.update({key: self._copy(value)})
+                result[key] = self._copy(value)
             elif isinstance(value, dict) and isinstance(parent_data[key], dict):
-                result.update({key: self._merge_view(value, parent_data[key])})
-            elif isinstance(value, list):
-                if isinstance(parent_data[key], (list, set, tuple)):
-                    for item in parent_data[key]:
-                        if item not in value:
-                            value.append(self._copy(item))
-                elif parent_data[key] not in value:
-                    value.append(self._copy(parent_data[key]))
-                result.update({key: self._copy(value)})
-            elif isinstance(value, set):
-                if isinstance(parent_data[key], (list, set, tuple)):
-                    for item in parent_data[key]:
-                        if item not in value:
-                            value.add(self._copy(item))
-                else:
-                    value.add(self._copy(parent_data[key]))
-                result.update({key: self._copy(value)})
+                result[key] = self._merge_view(value, parent_data[key])
             else:
-                result.update({key: self._copy(value)})
+                result[key] = self._merge_value(self._copy(value), parent_data[key])
         return result
 
     def _get_inherited_view(self, state_data: "StateData", result: dict[Any, Any] | None = None) -> dict[Any, Any]:
@@ -146,8 +210,66 @@ class StateData:
             return self._get_inherited_view(state_data.parent, result)
         return result
 
+    def _resolve_inherited(self, path: Sequence[Any]) -> Any:
+        """Resolve ``path`` against this layer and its ancestors.
+
+        Returns the value walking ``_get_inherited_view`` would reach (as a
+        private copy), or ``_MISSING``, but only merges values along ``path``
+        instead of building the whole inherited view: each layer is visited
+        once per path segment.
+        """
+        nodes: list[dict[Any, Any]] = []
+        layer: StateData | None = self
+        while layer is not None:
+            nodes.append(layer._data)
+            layer = layer._parent
+        last_index = len(path) - 1
+        for index, segment in enumerate(path):
+            dicts: list[dict[Any, Any]] = []
+            value: Any = _MISSING
+            for node in nodes:
+                item = node.get(segment, _MISSING)
+                if item is _MISSING:
+                    continue
+                if dicts:
+                    # A child dict wins over non-dict parent values.
+                    if isinstance(item, dict):
+                        dicts.append(item)
+                elif value is _MISSING:
+                    if isinstance(item, dict):
+                        dicts.append(item)
+                    else:
+                        value = self._copy(item)
+                else:
+                    value = self._merge_value(value, item)
+            if index < last_index:
+                if not dicts:
+                    return _MISSING
+                nodes = dicts
+                continue
+            if dicts:
+                merged = self._copy(dicts[0])
+                for parent_dict in dicts[1:]:
+                    merged = self._merge_view(merged, parent_dict)
+                return merged
+            return value
+        return _MISSING
+
+    def _get_inherited(self, key: Any) -> Any:
+        if key is None:
+            return self._get_inherited_view(self, {})
+        if isinstance(key, str) and "." in key:
+            try:
+                return self._resolve_inherited(key.split("."))
+            except Exception:
+                return _MISSING
+        return self._resolve_inherited((key,))
+
     def _get_item_by_dot_path(self, dot_path: str, inherit: bool = True):
-        current = self._get_inherited_view(self, {}) if inherit else self._copy(self._data)
+        if inherit:
+            result = self._get_inherited(dot_path)
+            return None if result is _MISSING else result
+        current = self._copy(self._data)
         path_list = dot_path.split(".")
         for path in path_list:
             if path in current:
@@ -169,12 +291,13 @@ class StateData:
         default: T = None,
         inherit: bool = True,
     ) -> Any | T:
+        if inherit:
+            result = self._get_inherited(key)
+            return default if result is _MISSING else result
         if key is None:
-            if inherit:
-                return self._get_inherited_view(self, {})
             return self._copy(self._data)
 
-        data = self.data if inherit else self._data
+        data = self._data
 
         if isinstance(key, str) and "." in key:
             current = data
@@ -214,11 +337,14 @@ class StateData:
             del self[key]
             return val
         if key in self._data:
-            return self._data.pop(key)
+            value = self._data.pop(key)
+            self._touch(key)
+            return value
         return default
 
     def clear(self) -> None:
-        return self._data.clear()
+        self._data.clear()
+        self._touch()
 
     def __contains__(self, key: Any) -> bool:
         return key in self.data
@@ -283,15 +409,19 @@ class StateData:
             if path not in current.get():
                 current.update({path: {}})
             current = current.move_in(path)
-        if cover:
-            current.set(self._copy(value))
-        else:
-            self._set_item(current, value)
+        try:
+            if cover:
+                current.set(self._copy(value))
+            else:
+                self._set_item(current, value)
+        finally:
+            self._touch(dot_path)
 
     def __setitem__(self, key: Any, value: Any) -> None:
         if isinstance(key, str) and "." in key:
             return self._set_item_by_dot_path(key, value, cover=True)
         self._data[key] = self._copy(value)
+        self._touch(key)
 
     def set(self, key: Any, value: Any) -> None:
         """Replace ``key`` with an isolated copy of ``value``."""
@@ -304,13 +434,19 @@ class StateData:
 
     def update(self, new: dict[Any, Any]) -> None:
         """Recursively merge a partial mapping into the current local data."""
-        for key, value in new.items():
-            if isinstance(key, str) and "." in key:
-                self._set_item_by_dot_path(key, value)
-            elif key in self._data:
-                self._set_item(DictRef(self._data, key), value)
+        try:
+            for key, value in new.items():
+                if isinstance(key, str) and "." in key:
+                    self._set_item_by_dot_path(key, value)
+                elif key in self._data:
+                    self._set_item(DictRef(self._data, key), value)
+                else:
+                    self._data[key] = self._copy(value)
+        finally:
+            if new:
+                self._touch(*new.keys())
             else:
-                self._data[key] = self._copy(value)
+                self._touch()
 
     def load(
         self,
@@ -389,9 +525,11 @@ class StateData:
             cur = current.get()
             if isinstance(cur, dict) and last_key in cur:
                 del cur[last_key]
+                self._touch(key)
         else:
             if key in self._data:
                 del self._data[key]
+                self._touch(key)
 
     def append(self, key: Any, value: Any) -> None:
         if isinstance(key, str) and "." in key:
@@ -416,6 +554,7 @@ class StateData:
             self._set_item_by_dot_path(key, new_value, cover=True)
         else:
             self._data[key] = new_value
+            self._touch(key)
 
     def extend(self, key: Any, values: Sequence[Any]) -> None:
         if isinstance(key, str) and "." in key:
@@ -436,6 +575,7 @@ class StateData:
             self._set_item_by_dot_path(key, new_value, cover=True)
         else:
             self._data[key] = new_value
+            self._touch(key)
 
     def delete(self, key: Any) -> None:
         self.__delitem__(key)
@@ -537,6 +677,7 @@ class StateDataNamespace:
             return self.root.set(f"{self.namespace}.{key}", value)
         if self.root.get(self.namespace, inherit=False) is None:
             self.root._data[self.namespace] = {}
+            self.root._touch(self.namespace)
         self.root.set(f"{self.namespace}.{key}", value)
 
     def __delitem__(self, key: Any) -> None:
@@ -547,6 +688,7 @@ class StateDataNamespace:
             if isinstance(ns, dict) and key in ns:
                 del ns[key]
                 self.root._data[self.namespace] = ns
+                self.root._touch(self.namespace)
 
     def pop(self, key: str, default: Any = None) -> Any:
         if isinstance(key, str) and "." in key:
@@ -555,11 +697,13 @@ class StateDataNamespace:
         if isinstance(ns, dict) and key in ns:
             val = ns.pop(key)
             self.root._data[self.namespace] = ns
+            self.root._touch(self.namespace)
             return val
         return default
 
     def clear(self) -> None:
         self.root._data[self.namespace] = {}
+        self.root._touch(self.namespace)
 
     def __contains__(self, key: Any) -> bool:
         return key in self.keys()
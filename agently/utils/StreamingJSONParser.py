@@ -13,8 +13,10 @@
 # limitations under the License.
 
 import json
+import json.decoder
 import json5
-from typing import Any, AsyncGenerator, List, Literal, TYPE_CHECKING
+import re
+from typing import Any, AsyncGenerator, Callable, List, Literal, TYPE_CHECKING, cast
 import copy
 
 from agently.utils import DataLocator, DataPathBuilder, StreamingJSONCompleter
@@ -24,6 +26,495 @@ if TYPE_CHECKING:
     from agently.types.data import PromptOutputStructure
 
 
+_STRING_BODY = re.compile(r'(?:[^"\\]|\\.)*', re.DOTALL)
+_INCOMPLETE_ESCAPE = re.compile(r'\\u[0-9a-fA-F]{0,4}$')
+_HIGH_SURROGATE_ESCAPE = re.compile(r'\\u[dD][89abAB][0-9a-fA-F]{2}$')
+_LITERAL_RUN = re.compile(r"[A-Za-z0-9_.+\-]*")
+_WHITESPACE_RUN = re.compile(r"\s+")
+_ROOT_START = re.compile(r"[{\[]")
+_LINE_END = re.compile(r"[\r\n]")
+_INDEXED_PATH = re.compile(r"^(.*)\[(\d+)\](?:\.|$)")
+_LITERAL_VALUES: dict[str, Any] = {"true": True, "false": False, "null": None}
+# The stdlib string scanner (C accelerated when available); typeshed does not declare it.
+_scan_string: Callable[[str, int, bool], tuple[str, int]] = getattr(json.decoder, "scanstring")
+
+# Reader states for the innermost open container.
+_OBJECT_KEY = 0
+_OBJECT_COLON = 1
+_OBJECT_VALUE = 2
+_OBJECT_NEXT = 3
+_ARRAY_VALUE = 4
+_ARRAY_NEXT = 5
+
+
+class _ReaderFrame:
+    __slots__ = ("container", "path", "state", "key", "slot")
+
+    def __init__(self, container: dict | list, path: str, state: int, slot: str | int | None):
+        self.container = container
+        self.path = path
+        self.state = state
+        self.key: str | None = None
+        # Where the container sits in its parent; None for the root.
+        self.slot = slot
+
+
+class _ReaderString:
+    __slots__ = ("frame", "slot", "path", "parts", "pending")
+
+    def __init__(self, frame: _ReaderFrame, slot: str | int | None, path: str | None):
+        # ``path`` is None for object keys, which never produce events.
+        self.frame = frame
+        self.slot = slot
+        self.path = path
+        self.parts: list[str] = []
+        self.pending = ""
+
+
+class _IncrementalJSONReader:
+    """Resumable strict-JSON reader that builds the parsed tree in place.
+
+    The reader keeps its lexer state (open containers, the open string and any
+    half-received escape or literal) between ``feed`` calls, so every chunk is
+    processed once. ``feed`` returns ``(event_type, path, value, delta)``
+    tuples in token order: string deltas as characters arrive, and ``done``
+    tuples only when the closing token of a value is present in the raw text.
+
+    Leading prose before the first ``{``/``[`` and anything after the root
+    closes are ignored. Comments and trailing commas are accepted; any other
+    JSON5 syntax (single quotes, unquoted keys, hex numbers...) sets
+    ``failed`` so the caller can fall back to full-buffer parsing.
+    """
+
+    def __init__(self) -> None:
+        self.root: dict | list | None = None
+        self.closed = False
+        self.failed = False
+        self._stack: list[_ReaderFrame] = []
+        self._string: _ReaderString | None = None
+        self._literal: list[str] | None = None
+        self._literal_target: tuple[_ReaderFrame, str | int | None, str] | None = None
+        self._comment: str | None = None
+        # Slots assigned since each container's last snapshot, in assignment order.
+        self._dirty: dict[int, dict[str | int, None]] = {}
+        self._snapshots: dict[int, dict | list] = {}
+
+    @staticmethod
+    def _child_path(parent_path: str, key: str | int) -> str:
+        if isinstance(key, int):
+            return f"{ parent_path }[{ key }]"
+        if key in ("*", "[]", "[*]"):
+            return f"{ parent_path }[*]"
+        return f"{ parent_path }.{ key }" if parent_path else key
+
+    def feed(self, text: str) -> list[tuple[str, str, Any, str | None]]:
+        events: list[tuple[str, str, Any, str | None]] = []
+        self._mark_open_path()
+        index = 0
+        length = len(text)
+        while index < length and not self.failed and not self.closed:
+            if self._string is not None:
+                index = self._read_string(text, index, events)
+                continue
+            if self._literal is not None:
+                literal_run = _LITERAL_RUN.match(text, index)
+                # The pattern also matches an empty run, so there is always a match.
+                assert literal_run is not None
+                self._literal.append(literal_run.group())
+                index = literal_run.end()
+                if index >= length:
+                    break
+                self._commit_literal(events)
+                continue
+            if self._comment is not None:
+                index = self._read_comment(text, index)
+                continue
+            char = text[index]
+            if char.isspace():
+                index = _WHITESPACE_RUN.match(text, index).end()  # type: ignore[union-attr]
+                continue
+            if not self._stack:
+                match = _ROOT_START.search(text, index)
+                if match is None:
+                    break
+                index = match.start()
+                char = text[index]
+                self._open_container(char, None, None, "", events)
+                index += 1
+                continue
+            if char == "/":
+                self._comment = "/"
+                index += 1
+                continue
+            index = self._read_structure(text, index, char, events)
+        return events
+
+    def finish(self) -> list[tuple[str, str, Any, str | None]]:
+        """Commit a literal still open at the end of the stream, if it parses."""
+        events: list[tuple[str, str, Any, str | None]] = []
+        if self._literal is not None and not self.failed:
+            self._mark_open_path()
+            self._commit_literal(events, emit_done=False)
+        return events
+
+    def snapshot(self, value: Any = None) -> Any:
+        """Return an immutable-by-convention copy of ``value`` (the root by default).
+
+        The reader builds its tree in place, so events must not hand the live
+        containers out. Containers untouched since their last snapshot reuse
+        it; a changed container starts from a shallow copy of its previous
+        snapshot and only its assigned slots (the tail being written) are
+        refreshed, so a chunk costs the same however long the output is.
+        """
+        return self._snapshot_value(self.root if value is None else value)
+
+    def _snapshot_value(self, value: Any) -> Any:
+        if not isinstance(value, (dict, list)):
+            return value
+        key = id(value)
+        cached = self._snapshots.get(key)
+        dirty = self._dirty.pop(key, None)
+        if cached is not None and dirty is None:
+            return cached
+        copied: dict | list
+        if isinstance(value, dict):
+            if isinstance(cached, dict) and dirty is not None:
+                copied = cached.copy()
+                for slot in dirty:
+                    copied[slot] = self._snapshot_value(value[slot])
+            else:
+                copied = {child_key: self._snapshot_value(child) for child_key, child in value.items()}
+        elif isinstance(cached, list) and dirty is not None:
+            copied = cached.copy()
+            # List slots are assigned in order, so new items extend the copy.
+            for slot in sorted(cast(dict[int, None], dirty)):
+                child = self._snapshot_value(value[slot])
+                if slot < len(copied):
+                    copied[slot] = child
+                else:
+                    copied.append(child)
+        else:
+            copied = [self._snapshot_value(child) for child in value]
+        self._snapshots[key] = copied
+        return copied
+
+    def _mark(self, container: dict | list, slot: str | int) -> None:
+        self._dirty.setdefault(id(container), {})[slot] = None
+
+    def _mark_open_path(self) -> None:
+        # Only containers open while text is read can change, each through the
+        # slot holding its innermost open child.
+        for parent, child in zip(self._stack, self._stack[1:]):
+            if child.slot is not None:
+                self._mark(parent.container, child.slot)
+
+    def _fail(self) -> int:
+        self.failed = True
+        return 0
+
+    def _read_structure(
+        self,
+        text: str,
+        index: int,
+        char: str,
+        events: list[tuple[str, str, Any, str | None]],
+    ) -> int:
+        frame = self._stack[-1]
+        state = frame.state
+        if state == _OBJECT_KEY:
+            if char == '"':
+                self._string = _ReaderString(frame, None, None)
+            elif char == "}":
+                self._close_container(events)
+            else:
+                return self._fail()
+        elif state == _OBJECT_COLON:
+            if char != ":":
+                return self._fail()
+            frame.state = _OBJECT_VALUE
+        elif state == _OBJECT_NEXT or state == _ARRAY_NEXT:
+            if char == ",":
+                frame.state = _OBJECT_KEY if state == _OBJECT_NEXT else _ARRAY_VALUE
+            elif char == ("}" if state == _OBJECT_NEXT else "]"):
+                self._close_container(events)
+            else:
+                return self._fail()
+        elif state == _ARRAY_VALUE and char == "]":
+            self._close_container(events)
+        else:
+            self._start_value(frame, char, events)
+        return index + 1
+
+    def _start_value(
+        self,
+        frame: _ReaderFrame,
+        char: str,
+        events: list[tuple[str, str, Any, str | None]],
+    ) -> None:
+        if isinstance(frame.container, dict):
+            slot: str | int = frame.key if frame.key is not None else ""
+            frame.state = _OBJECT_NEXT
+        else:
+            slot = len(frame.container)
+            frame.state = _ARRAY_NEXT
+        path = self._child_path(frame.path, slot)
+        if char in "{[":
+            self._open_container(char, frame, slot, path, events)
+        elif char == '"':
+            self._assign(frame, slot, "")
+            self._string = _ReaderString(frame, slot, path)
+        elif char == "-" or char.isalnum():
+            self._literal = [char]
+            self._literal_target = (frame, slot, path)
+        else:
+            self._fail()
+
+    def _open_container(
+        self,
+        char: str,
+        parent: _ReaderFrame | None,
+        slot: str | int | None,
+        path: str,
+        events: list[tuple[str, str, Any, str | None]],
+    ) -> None:
+        container: dict | list = {} if char == "{" else []
+        if parent is None:
+            self.root = container
+        else:
+            self._assign(parent, slot, container)
+        self._stack.append(_ReaderFrame(container, path, _OBJECT_KEY if char == "{" else _ARRAY_VALUE, slot))
+
+    def _close_container(self, events: list[tuple[str, str, Any, str | None]]) -> None:
+        frame = self._stack.pop()
+        if frame.path:
+            events.append(("done", frame.path, frame.container, None))
+        if not self._stack:
+            self.closed = True
+
+    def _assign(self, frame: _ReaderFrame, slot: str | int | None, value: Any) -> None:
+        container = frame.container
+        if isinstance(container, dict):
+            container[slot] = value
+            self._mark(container, slot if slot is not None else "")
+        elif isinstance(slot, int) and slot < len(container):
+            container[slot] = value
+            self._mark(container, slot)
+        else:
+            container.append(value)
+            self._mark(container, len(container) - 1)
+
+    def _read_string(
+        self,
+        text: str,
+        index: int,
+        events: list[tuple[str, str, Any, str | None]],
+    ) -> int:
+        string = self._string
+        assert string is not None
+        held = string.pending
+        source = held + text[index:] if held else text
+        start = 0 if held else index
+        end = _STRING_BODY.match(source, start).end()  # type: ignore[union-attr]
+        closed = end < len(source) and source[end] == '"'
+        raw = source[start:end]
+        if closed:
+            string.pending = ""
+            next_index = index + (end + 1 - len(held)) if held else end + 1
+        else:
+            hold = source[end:]
+            escape = _INCOMPLETE_ESCAPE.search(raw)
+            if escape is not None and _is_unescaped(raw, escape.start()):
+                if len(escape.group()) < 6 or _HIGH_SURROGATE_ESCAPE.search(raw) is not None:
+                    hold = raw[escape.start() :] + hold
+                    raw = raw[: escape.start()]
+            string.pending = hold
+            next_index = len(text)
+        try:
+            piece = _scan_string(raw + '"', 0, False)[0] if raw else ""
+        except ValueError:
+            return self._fail()
+        if piece:
+            string.parts.append(piece)
+        if string.path is None:
+            if closed:
+                string.frame.key = "".join(string.parts)
+                string.frame.state = _OBJECT_COLON
+                self._string = None
+            return next_index
+        if piece or closed:
+            value = "".join(string.parts)
+            string.parts = [value] if value else []
+            self._assign(string.frame, string.slot, value)
+            if piece:
+                events.append(("delta", string.path, value, piece))
+            if closed:
+                events.append(("done", string.path, value, None))
+        if closed:
+            self._string = None
+        return next_index
+
+    def _read_comment(self, text: str, index: int) -> int:
+        comment = self._comment
+        if comment == "/":
+            char = text[index]
+            if char == "/":
+                self._comment = "//"
+            elif char == "*":
+                self._comment = "/*"
+            else:
+                return self._fail()
+            return index + 1
+        if comment == "//":
+            match = _LINE_END.search(text, index)
+            if match is None:
+                return len(text)
+            self._comment = None
+            return match.end()
+        if comment == "/**" and text[index] == "/":
+            self._comment = None
+            return index + 1
+        end = text.find("*/", index)
+        if end < 0:
+            self._comment = "/**" if text.endswith("*") else "/*"
+            return len(text)
+        self._comment = None
+        return end + 2
+
+    def _commit_literal(
+        self,
+        events: list[tuple[str, str, Any, str | None]],
+        *,
+        emit_done: bool = True,
+    ) -> None:
+        token = "".join(self._literal or [])
+        target = self._literal_target
+        self._literal = None
+        self._literal_target = None
+        if target is None:
+            return
+        if token in _LITERAL_VALUES:
+            value = _LITERAL_VALUES[token]
+        else:
+            try:
+                value = json.loads(token)
+            except ValueError:
+                self._fail()
+                return
+            if not isinstance(value, (int, float)):
+                self._fail()
+                return
+        frame, slot, path = target
+        self._assign(frame, slot, value)
+        if value is not None:
+            events.append(("delta", path, value, str(value)))
+        if emit_done:
+            events.append(("done", path, value, None))
+
+
+def _is_unescaped(text: str, index: int) -> bool:
+    backslashes = 0
+    cursor = index - 1
+    while cursor >= 0 and text[cursor] == "\\":
+        backslashes += 1
+        cursor -= 1
+    return backslashes % 2 == 0
+
+
+class _ParsingPathIndex:
+    """Paths present in the parsed tree, indexed for O(1) completion checks.
+
+    Kept across compare passes and extended with the paths each pass adds;
+    completed subtrees are not walked again. Paths found in the schema parsing order
+    contribute to ``furthest_ordinal``; concrete array paths and dynamic keys
+    fall back to the length/lexical ordering of ``_is_array_path_before`` and
+    only need their longest length and greatest value tracked. Lists record
+    their highest item index so sibling checks do not scan every path.
+    """
+
+    __slots__ = (
+        "field_order",
+        "root_type",
+        "root_size",
+        "paths",
+        "furthest_path",
+        "furthest_ordinal",
+        "array_max_index",
+        "longest_unordered",
+        "greatest_unordered",
+        "longest",
+        "greatest",
+    )
+
+    def __init__(self, field_order: dict[str, int]):
+        self.field_order = field_order
+        self.root_type: type | None = None
+        self.root_size = 0
+        self.paths: set[str] = set()
+        self.furthest_path: str | None = None
+        self.furthest_ordinal = -1
+        self.array_max_index: dict[str, int] = {}
+        self.longest_unordered = -1
+        self.greatest_unordered: str | None = None
+        self.longest = -1
+        self.greatest: str | None = None
+
+    def covers(self, data: Any) -> bool:
+        """Return whether ``data`` can only have grown from the last indexed tree."""
+        size = len(data) if isinstance(data, (dict, list)) else 0
+        return self.root_type in (None, type(data)) and size >= self.root_size
+
+    def update(self, data: Any, completed: set[str]) -> None:
+        self.root_type = type(data)
+        self.root_size = len(data) if isinstance(data, (dict, list)) else 0
+        self.add_tree(data, completed=completed)
+
+    def add_tree(self, data: Any, path: str = "", completed: set[str] | None = None) -> None:
+        if path:
+            if path not in self.paths:
+                self.add(path)
+            elif completed is not None and path in completed:
+                # A completed field no longer changes and was indexed in full before it completed.
+                return
+        if isinstance(data, dict):
+            prefix = f"{ path }." if path else ""
+            for key, value in data.items():
+                # Same spelling as DataPathBuilder.build_dot_path
+                child_path = f"{ path }[*]" if str(key) in ("*", "[]", "[*]") else f"{ prefix }{ key }"
+                self.add_tree(value, child_path, completed)
+        elif isinstance(data, list):
+            if data:
+                self.array_max_index[path] = max(self.array_max_index.get(path, -1), len(data) - 1)
+            for index, item in enumerate(data):
+                self.add_tree(item, f"{ path }[{ index }]", completed)
+
+    def add(self, path: str) -> None:
+        self.paths.add(path)
+        if len(path) > self.longest:
+            self.longest = len(path)
+        if self.greatest is None or path > self.greatest:
+            self.greatest = path
+        ordinal = self.field_order.get(path)
+        if ordinal is None:
+            if len(path) > self.longest_unordered:
+                self.longest_unordered = len(path)
+            if self.greatest_unordered is None or path > self.greatest_unordered:
+                self.greatest_unordered = path
+        elif ordinal > self.furthest_ordinal:
+            self.furthest_ordinal = ordinal
+            self.furthest_path = path
+
+    def has_path_after(self, path: str) -> bool:
+        """Return whether any indexed path sorts after ``path``."""
+        ordinal = self.field_order.get(path)
+        if ordinal is None:
+            return self.longest > len(path) or (self.greatest is not None and self.greatest > path)
+        return (
+            self.furthest_ordinal > ordinal
+            or self.longest_unordered > len(path)
+            or (self.greatest_unordered is not None and self.greatest_unordered > path)
+        )
+
+
 class StreamingJSONParser:
     """
     AsyncStreamingJSONParser parses streamed JSON data chunk by chunk asynchronously, maintaining parsing state and emitting
@@ -33,10 +524,17 @@ class StreamingJSONParser:
     emit structured events as fields become available or finalized, allowing for responsive UI updates
     or downstream processing.
 
+    Strict JSON streams are read by an incremental reader that keeps its lexer state between chunks,
+    so each chunk costs time proportional to its own length instead of the whole buffer. When the
+    stream uses syntax the reader does not accept (JSON5 quotes, unquoted keys...), the parser falls
+    back to completing and re-parsing the accumulated buffer, guarded by
+    ``max_incomplete_parse_chars``.
+
     Attributes:
         schema (PromptOutputStructure): The schema describing the expected JSON structure.
     """
 
+    # Only applies to the full-buffer fallback used for non-strict JSON streams.
     DEFAULT_MAX_INCOMPLETE_PARSE_CHARS = 1024
 
     def __init__(
@@ -64,10 +562,16 @@ class StreamingJSONParser:
         self.string_values = {}  # Tracks current string values for fields
         self.last_complete_structure = {}  # Last complete structure for completion checks
         self._large_incremental_parse_deferred = False
+        self._reader: _IncrementalJSONReader | None = _IncrementalJSONReader()
+        self._unsynced_chunks: list[str] = []
 
         # Get the expected field parsing order and all possible paths
         self.expected_field_order = DataPathBuilder.extract_parsing_key_orders(schema, style="dot")
         self.all_possible_paths = DataPathBuilder.extract_possible_paths(schema, style="dot")
+        self._field_order_index = {path: ordinal for ordinal, path in enumerate(self.expected_field_order)}
+        self._parsing_path_index: _ParsingPathIndex | None = None
+        self._path_index: _ParsingPathIndex | None = None
+        self._indexed_path_parts: dict[str, tuple[str, int] | None] = {}
 
         self.current_parsing_position = 0  # Current position in parsing order
 
@@ -121,14 +625,65 @@ class StreamingJSONParser:
                     return not tail or tail.startswith("```")
         return False
 
+    def _raw_buffer(self) -> str:
+        # Chunks read by the incremental reader are joined into the completer
+        # buffer only when a full-buffer pass actually needs them.
+        if self._unsynced_chunks:
+            self.completer.append("".join(self._unsynced_chunks))
+            self._unsynced_chunks.clear()
+        return str(getattr(self.completer, "_buffer", "") or "")
+
+    def _leave_incremental_mode(self) -> None:
+        self._reader = None
+        self._raw_buffer()
+
+    def _reader_streaming_data(
+        self,
+        reader_events: list[tuple[str, str, Any, str | None]],
+    ) -> list[StreamingData]:
+        streaming_data: list[StreamingData] = []
+        reader = self._reader
+        for event_type, path, value, delta in reader_events:
+            if path in self.field_completion_status:
+                continue
+            if reader is not None and isinstance(value, (dict, list)):
+                value = reader.snapshot(value)
+            if event_type == "delta":
+                if isinstance(value, str):
+                    self.string_values[path] = value
+                streaming_data.append(
+                    StreamingData(
+                        path=path,
+                        value=value,
+                        delta=delta,
+                        is_complete=False,
+                        event_type="delta",
+                        full_data=self.current_data,
+                    )
+                )
+                continue
+            self.field_completion_status.add(path)
+            streaming_data.append(
+                StreamingData(
+                    path=path,
+                    value=value,
+                    delta=None,
+                    is_complete=True,
+                    event_type="done",
+                    full_data=self.current_data,
+                    completion_source="observed_boundary",
+                )
+            )
+        return streaming_data
+
     def _should_skip_large_incremental_parse(self) -> bool:
         if self.max_incomplete_parse_chars <= 0:
             return False
-        raw_buffer = str(getattr(self.completer, "_buffer", "") or "")
+        raw_buffer = self._raw_buffer()
         return len(raw_buffer) > self.max_incomplete_parse_chars
 
     def _large_incremental_parse_status(self) -> StreamingData:
-        raw_buffer = str(getattr(self.completer, "_buffer", "") or "")
+        raw_buffer = self._raw_buffer()
         self._large_incremental_parse_deferred = True
         return StreamingData(
             path="$status",
@@ -284,7 +839,7 @@ class StreamingJSONParser:
     async def _emit_observed_boundary_events(
         self,
     ) -> AsyncGenerator[StreamingData, None]:
-        raw_buffer = str(getattr(self.completer, "_buffer", "") or "")
+        raw_buffer = self._raw_buffer()
         for path, value in self._observed_complete_values(raw_buffer):
             if path in self.field_completion_status:
                 continue
@@ -389,28 +944,39 @@ class StreamingJSONParser:
 
         return keys
 
+    def _get_parsing_path_index(self) -> _ParsingPathIndex:
+        """
+        Return the path index of current_data, updating it when no compare pass holds one.
+        Returns:
+            _ParsingPathIndex: Paths currently present in current_data.
+        """
+        if self._parsing_path_index is not None:
+            return self._parsing_path_index
+        return self._update_path_index()
+
+    def _update_path_index(self) -> _ParsingPathIndex:
+        # Streamed data only grows between passes, so the index built by earlier
+        # passes is extended instead of rebuilt. A re-parse that lost paths
+        # starts a new index.
+        index = self._path_index
+        if index is None or not index.covers(self.current_data):
+            index = self._path_index = _ParsingPathIndex(self._field_order_index)
+        index.update(self.current_data, self.field_completion_status)
+        return index
+
+    def _split_indexed_path(self, path: str) -> tuple[str, int] | None:
+        if path not in self._indexed_path_parts:
+            match = _INDEXED_PATH.match(path)
+            self._indexed_path_parts[path] = (match.group(1), int(match.group(2))) if match else None
+        return self._indexed_path_parts[path]
+
     async def _get_current_parsing_paths(self) -> set[str]:
         """
         Get the set of all currently parsed paths in the current_data structure.
         Returns:
             set[str]: Set of dot-style paths currently present in current_data.
         """
-        current_paths = set()
-
-        async def collect_paths(data: Any, path_keys: List[str | int] = []):
-            path = DataPathBuilder.build_dot_path(path_keys)
-            if path:
-                current_paths.add(path)
-
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    await collect_paths(value, path_keys + [key])
-            elif isinstance(data, list):
-                for i, item in enumerate(data):
-                    await collect_paths(item, path_keys + [i])
-
-        await collect_paths(self.current_data)
-        return current_paths
+        return set(self._get_parsing_path_index().paths)
 
     async def _should_mark_field_complete(self, path: str, current_value: Any, previous_value: Any) -> bool:
         """
@@ -425,44 +991,30 @@ class StreamingJSONParser:
         if path in self.field_completion_status:
             return False
 
-        # Get all paths currently present in parsing
-        current_parsing_paths = await self._get_current_parsing_paths()
+        if current_value is None or current_value != previous_value:
+            return False
+
+        parsing_path_index = self._get_parsing_path_index()
 
         # Core logic: check the furthest path currently being parsed
         # If this path is before the furthest and value is stable, can mark as complete
-        furthest_parsing_path = await self._get_furthest_parsing_path(current_parsing_paths)
-
+        furthest_parsing_path = parsing_path_index.furthest_path
         if furthest_parsing_path and await self._is_path_before(path, furthest_parsing_path):
-            # This path is before the furthest one and value is stable
-            if current_value == previous_value and current_value is not None:
-                return True
+            return True
 
         # A later array sibling cannot begin until the previous item delimiter
         # has actually appeared in the provider text. This is a trustworthy
         # boundary even though the streaming completer also closes the
         # currently open outer list/object for incremental parsing.
-        if current_value == previous_value and current_value is not None:
-            import re
-
-            indexed_path = re.match(r"^(.*)\[(\d+)\](?:\.|$)", path)
-            if indexed_path is not None:
-                prefix = indexed_path.group(1)
-                index = int(indexed_path.group(2))
-                sibling_pattern = re.compile(
-                    rf"^{re.escape(prefix)}\[(\d+)\](?:\.|$)"
-                )
-                for parsing_path in current_parsing_paths:
-                    sibling = sibling_pattern.match(parsing_path)
-                    if sibling is not None and int(sibling.group(1)) > index:
-                        return True
+        indexed_path = self._split_indexed_path(path)
+        if indexed_path is not None:
+            prefix, index = indexed_path
+            if parsing_path_index.array_max_index.get(prefix, -1) > index:
+                return True
 
         # Special case: leaf fields with stable value and newer paths
-        if not isinstance(current_value, (dict, list)) and current_value is not None:
-            for parsing_path in current_parsing_paths:
-                if await self._is_path_before(path, parsing_path):
-                    if current_value == previous_value:
-                        return True
-                    break
+        if not isinstance(current_value, (dict, list)):
+            return parsing_path_index.has_path_after(path)
 
         return False
 
@@ -482,14 +1034,11 @@ class StreamingJSONParser:
         furthest_index = -1
 
         for path in current_parsing_paths:
-            try:
-                index = self.expected_field_order.index(path)
-                if index > furthest_index:
-                    furthest_index = index
-                    furthest_path = path
-            except ValueError:
-                # Path not in expected order (likely dynamic array)
-                continue
+            index = self._field_order_index.get(path)
+            # Paths missing from the expected order are likely dynamic array items
+            if index is not None and index > furthest_index:
+                furthest_index = index
+                furthest_path = path
 
         return furthest_path
 
@@ -505,13 +1054,12 @@ class StreamingJSONParser:
         if not path2:
             return False
 
-        try:
-            index1 = self.expected_field_order.index(path1)
-            index2 = self.expected_field_order.index(path2)
+        index1 = self._field_order_index.get(path1)
+        index2 = self._field_order_index.get(path2)
+        if index1 is not None and index2 is not None:
             return index1 < index2
-        except ValueError:
-            # special case: array path
-            return await self._is_array_path_before(path1, path2)
+        # special case: array path
+        return await self._is_array_path_before(path1, path2)
 
     async def _is_array_path_before(self, path1: str, path2: str) -> bool:
         """
@@ -652,8 +1200,14 @@ class StreamingJSONParser:
                         completion_source=completion_source,
                     )
 
-        async for event in traverse_and_compare(self.current_data, self.previous_data):
-            yield event
+        # Completion checks read one path index per pass instead of walking
+        # the whole tree for every field.
+        self._parsing_path_index = self._update_path_index()
+        try:
+            async for event in traverse_and_compare(self.current_data, self.previous_data):
+                yield event
+        finally:
+            self._parsing_path_index = None
 
     async def _extract_array_index(self, path: str) -> int:
         """
@@ -692,7 +1246,7 @@ class StreamingJSONParser:
             return
 
         if completion_source is None:
-            raw_buffer = str(getattr(self.completer, "_buffer", "") or "")
+            raw_buffer = self._raw_buffer()
             completion_source = (
                 "final_reconciliation"
                 if self._looks_structurally_complete(raw_buffer)
@@ -700,8 +1254,12 @@ class StreamingJSONParser:
             )
 
         if self.current_data != final_data:
+            # The trusted result replaces the reader-built tree, so any later
+            # work uses the full-buffer path.
+            self._leave_incremental_mode()
             self.previous_data = copy.deepcopy(self.current_data)
             self.current_data = final_data
+            self._path_index = None
             async for event in self._compare_and_generate_events(
                 completion_source=completion_source,
             ):
@@ -727,7 +1285,14 @@ class StreamingJSONParser:
         Yields:
             StreamingData: The completion event for each remaining field.
         """
-        raw_buffer = str(getattr(self.completer, "_buffer", "") or "")
+        reader = self._reader
+        if reader is not None:
+            reader_events = reader.finish()
+            if reader.root is not None:
+                self.current_data = reader.snapshot()
+            for event in self._reader_streaming_data(reader_events):
+                yield event
+        raw_buffer = self._raw_buffer()
         structurally_complete = self._looks_structurally_complete(raw_buffer)
         if completion_source is None:
             completion_source = (
@@ -735,11 +1300,17 @@ class StreamingJSONParser:
                 if structurally_complete
                 else "synthetic_repair"
             )
-        if raw_buffer and (not self.current_data or structurally_complete):
-            self._parse_buffer_once()
+        if reader is not None:
+            # The reader tree already holds every value observed in the
+            # stream and emitted each observed boundary as it arrived.
+            if raw_buffer and not self.current_data:
+                self._parse_buffer_once()
+        else:
+            if raw_buffer and (not self.current_data or structurally_complete):
+                self._parse_buffer_once()
 
-        async for event in self._emit_observed_boundary_events():
-            yield event
+            async for event in self._emit_observed_boundary_events():
+                yield event
 
         async def mark_all_complete(data: Any, path_keys: List[str | int] = []):
             path = DataPathBuilder.build_dot_path(path_keys)
@@ -805,6 +1376,9 @@ class StreamingJSONParser:
         self,
     ) -> AsyncGenerator[StreamingData, None]:
         """Emit only values closed by delimiters already present in raw bytes."""
+        if self._reader is not None:
+            # The incremental reader emits observed boundaries as they arrive.
+            return
         async for event in self._emit_observed_boundary_events():
             yield event
 
@@ -817,7 +1391,20 @@ class StreamingJSONParser:
         Yields:
             StreamingData: The event for each detected update or completion.
         """
-        self.completer.append(chunk)
+        reader = self._reader
+        if reader is not None:
+            self._unsynced_chunks.append(chunk)
+            reader_events = reader.feed(chunk)
+            if reader.root is not None:
+                # Each chunk's events share one snapshot; later chunks never change it.
+                self.current_data = reader.snapshot()
+            for event in self._reader_streaming_data(reader_events):
+                yield event
+            if not reader.failed:
+                return
+            self._leave_incremental_mode()
+        else:
+            self.completer.append(chunk)
         if self._should_skip_large_incremental_parse():
             if not self._large_incremental_parse_deferred:
                 yield self._large_incremental_parse_status()
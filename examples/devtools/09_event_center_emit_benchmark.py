@@ -0,0 +1,63 @@
+import argparse
+import asyncio
+import time
+from typing import Any
+
+from agently.core.runtime.EventCenter import EventCenter
+from agently.types.data import RunContext, RuntimeEvent
+
+EVENT_TYPE = "model.streaming"
+
+
+def register_hooks(event_center: EventCenter, count: int, kind: str):
+    async def async_hook(event: RuntimeEvent):
+        _ = event.payload
+
+    def sync_hook(event: RuntimeEvent):
+        _ = event.payload
+
+    for index in range(count):
+        event_center.register_hook(
+            async_hook if kind == "async" else sync_hook,
+            event_types=EVENT_TYPE,
+            hook_name=f"benchmark.{ kind }.{ index }",
+            delivery_policy={"dispatch": "inline"} if kind == "inline" else None,
+        )
+
+
+async def measure(hook_count: int, kind: str, emits: int) -> float:
+    event_center = EventCenter()
+    register_hooks(event_center, hook_count, kind)
+    run = RunContext.create(run_kind="model_request")
+    event: dict[str, Any] = {
+        "event_type": EVENT_TYPE,
+        "source": "Benchmark",
+        "payload": {"delta": "x", "response_id": "benchmark"},
+        "run": run,
+    }
+    started = time.perf_counter()
+    for _ in range(emits):
+        await event_center.async_emit(event)
+    elapsed = time.perf_counter() - started
+    await event_center.async_flush()
+    return emits / elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Measure Event Center emits/sec with 0, 1 and 5 hooks.")
+    parser.add_argument("--emits", type=int, default=20_000)
+    args = parser.parse_args()
+
+    results: dict[str, float] = {}
+    for kind in ("async", "sync", "inline"):
+        for hook_count in (0, 1, 5):
+            if hook_count == 0 and kind != "async":
+                continue
+            label = "no hooks" if hook_count == 0 else f"{ hook_count } { kind } hook(s)"
+            results[label] = await measure(hook_count, kind, args.emits)
+            print(f"{ label:<20} { results[label]:>12,.0f} emits/s")
+    return results
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+"""Benchmark pooled MCP sessions against one client session per tool call.
+
+Starts a local stdio MCP stand-in server (a FastMCP calculator written to a
+temp dir) and runs ``--calls`` tool calls through ``MCPActionExecutor``: first
+with ``session_pool.enabled=False`` (a new server process and handshake per
+call, how the executor worked before pooling), then with the shared session
+pool, sequentially and with ``--concurrency`` calls in flight.
+
+    python examples/mcp/mcp_session_pool_benchmark.py --calls 50
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from agently.base import mcp_session_pool
+from agently.builtins.plugins.ActionExecutor.MCPActionExecutor import MCPActionExecutor
+from agently.utils import Settings
+
+SERVER_SOURCE = '''
+from fastmcp import FastMCP
+
+app = FastMCP("calculator")
+
+
+@app.tool
+def add(first_number: float, second_number: float) -> float:
+    return round(first_number + second_number, 2)
+
+
+if __name__ == "__main__":
+    app.run(transport="stdio", show_banner=False)
+'''
+
+
+def executor_settings(enabled: bool, max_concurrency: int) -> Settings:
+    settings = Settings(name="MCPSessionPoolBenchmark")
+    settings.set(
+        "plugins.ActionExecutor.MCPActionExecutor.session_pool",
+        {"enabled": enabled, "max_concurrency": max_concurrency},
+    )
+    return settings
+
+
+async def run_calls(executor: MCPActionExecutor, settings: Settings, *, calls: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(index: int) -> Any:
+        async with semaphore:
+            result = await executor.execute(
+                spec={"action_id": "add"},
+                action_call={"action_input": {"first_number": index, "second_number": 1}},
+                policy={},
+                settings=settings,
+            )
+        assert result == {"result": index + 1}, result
+
+    started = time.perf_counter()
+    await asyncio.gather(*(call(index) for index in range(calls)))
+    return time.perf_counter() - started
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as temp_dir:
+        server_path = Path(temp_dir) / "calculator_server.py"
+        server_path.write_text(SERVER_SOURCE, encoding="utf-8")
+        executor = MCPActionExecutor(action_id="add", transport=Path(server_path))
+
+        rows = [
+            ("unpooled, sequential", False, 1),
+            ("pooled, sequential", True, 1),
+            ("pooled, concurrent", True, args.concurrency),
+        ]
+        for label, enabled, concurrency in rows:
+            settings = executor_settings(enabled, args.concurrency)
+            elapsed = await run_calls(executor, settings, calls=args.calls, concurrency=concurrency)
+            print(
+                f"{ label:<22} { args.calls } calls in { elapsed * 1000:8.1f} ms"
+                f"  ({ elapsed * 1000 / args.calls:6.1f} ms/call)"
+            )
+        await mcp_session_pool.aclose()
+        print("pool stats:", {key: value for key, value in mcp_session_pool.stats().items() if key != "sessions"})
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+"""Benchmark interactive request latency while a batch saturates one provider.
+
+A stand-in provider call holds a ``RequestScheduler`` slot for ``--service-ms``.
+``--batch`` requests are submitted at once (a bulk TaskBoard/for_each run) and
+``--interactive`` requests arrive every ``--interval-ms`` while the batch is
+queued. Latency is measured from submission to completion, so it includes the
+wait for a slot. Rows:
+
+- interactive only: the latency floor, no batch running
+- batch, FIFO: every request queues in the ``default`` class as one tenant
+  (how slots were handed out before priority classes)
+- batch, fair queuing: still one class, but the batch and each chat user are
+  separate tenants
+- batch, priority: the batch runs as ``priority="batch"`` and chat requests as
+  ``priority="interactive"``
+
+    python examples/model_configures/request_scheduler_priority_benchmark.py --batch 2000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from agently.utils.RequestScheduler import RequestScheduler
+
+
+async def call_provider(scheduler: RequestScheduler, service_seconds: float, **slot_options) -> float:
+    submitted = time.perf_counter()
+    async with scheduler.slot("provider", **slot_options):
+        await asyncio.sleep(service_seconds)
+    return time.perf_counter() - submitted
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def run(args: argparse.Namespace, *, batch: int, mode: str) -> tuple[list[float], float]:
+    scheduler = RequestScheduler().configure("provider", max_concurrency=args.concurrency)
+    service_seconds = args.service_ms / 1000
+    batch_options = {} if mode == "fifo" else {"tenant": "bulk-run"}
+    if mode == "priority":
+        batch_options["priority"] = "batch"
+    started = time.perf_counter()
+    batch_tasks = [
+        asyncio.create_task(call_provider(scheduler, service_seconds, **batch_options)) for _ in range(batch)
+    ]
+    await asyncio.sleep(0)
+    interactive_tasks = []
+    for index in range(args.interactive):
+        interactive_tasks.append(
+            asyncio.create_task(
+                call_provider(
+                    scheduler,
+                    service_seconds,
+                    priority="interactive" if mode == "priority" else "default",
+                    tenant=None if mode == "fifo" else f"user-{ index % 4 }",
+                )
+            )
+        )
+        await asyncio.sleep(args.interval_ms / 1000)
+    latencies = await asyncio.gather(*interactive_tasks)
+    await asyncio.gather(*batch_tasks)
+    return list(latencies), time.perf_counter() - started
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--interactive", type=int, default=50)
+    parser.add_argument("--interval-ms", type=float, default=20.0)
+    parser.add_argument("--service-ms", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    rows = [
+        ("interactive only", 0, "priority"),
+        ("batch, FIFO", args.batch, "fifo"),
+        ("batch, fair queuing", args.batch, "fair"),
+        ("batch, priority", args.batch, "priority"),
+    ]
+    for label, batch, mode in rows:
+        latencies, elapsed = await run(args, batch=batch, mode=mode)
+        print(
+            f"{ label:<20} interactive p50 { percentile(latencies, 0.5) * 1000:8.1f} ms"
+            f"  p99 { percentile(latencies, 0.99) * 1000:8.1f} ms"
+            f"  (batch of { batch } done in { elapsed:5.2f} s)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,159 @@
+"""Benchmark RecordStore.search on a synthetic local store.
+
+Builds a store with ``--records`` rows (1,000,000 by default) spread over many
+executions and sessions, indexes ``--indexed-ratio`` of them in the full-text
+index, then times the SQL-pushed-down search against a full Python scan of the
+same table (how search worked before filters moved into SQLite).
+
+    python examples/record_store/record_store_search_benchmark.py --records 1000000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Awaitable, Callable
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from agently.core.storage import RecordStore
+from agently.core.storage.LocalRecordStore import LocalRecordStore
+
+WORDS = ("alpha", "beta", "gamma", "delta", "invoice", "refund", "latency", "timeout", "deploy", "rollback")
+
+
+def populate(db_path: Path, *, records: int, indexed_ratio: float, seed: int) -> None:
+    rnd = random.Random(seed)
+    started = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    connection = sqlite3.connect(db_path)
+    try:
+        connection.execute("BEGIN")
+        batch: list[tuple[Any, ...]] = []
+        fts: list[tuple[str, str, str]] = []
+        for index in range(records):
+            record_id = f"rec_{ index:08d}"
+            content = " ".join(rnd.choice(WORDS) for _ in range(12)) + f" item-{ index }"
+            scope = {"execution_id": f"exec-{ index % 5000 }", "session_id": f"session-{ index % 200 }"}
+            batch.append(
+                (
+                    record_id,
+                    "evidence" if index % 3 else "notes",
+                    "observation",
+                    content,
+                    "text",
+                    None,
+                    None,
+                    len(content),
+                    "",
+                    json.dumps(scope, sort_keys=True, separators=(",", ":")),
+                    "{}",
+                    (started + timedelta(milliseconds=index)).isoformat(),
+                    "{}",
+                )
+            )
+            if rnd.random() < indexed_ratio:
+                fts.append((record_id, content, ""))
+            if len(batch) >= 50_000:
+                connection.executemany("INSERT INTO records VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", batch)
+                connection.executemany("INSERT INTO records_fts (id, content, summary) VALUES (?, ?, ?)", fts)
+                batch, fts = [], []
+        connection.executemany("INSERT INTO records VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", batch)
+        connection.executemany("INSERT INTO records_fts (id, content, summary) VALUES (?, ?, ?)", fts)
+        connection.execute("COMMIT")
+        connection.execute("ANALYZE")
+    finally:
+        connection.close()
+
+
+def python_scan(db_path: Path, query: str | None, filters: dict[str, Any], limit: int) -> int:
+    connection = sqlite3.connect(db_path)
+    connection.row_factory = sqlite3.Row
+    try:
+        rows = connection.execute("SELECT * FROM records ORDER BY created_at DESC, id DESC").fetchall()
+    finally:
+        connection.close()
+    needle = str(query or "").casefold()
+    matched = 0
+    for row in rows:
+        ref = LocalRecordStore._row_to_ref(row)
+        if needle and needle not in f"{ row['content'] }\n{ row['summary'] }".casefold():
+            continue
+        if not LocalRecordStore._matches_filters(ref, filters):
+            continue
+        matched += 1
+        if matched >= limit:
+            break
+    return matched
+
+
+async def timed(label: str, operation: Callable[[], Awaitable[Any]], repeat: int) -> float:
+    await operation()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await operation()
+    elapsed = (time.perf_counter() - started) / repeat * 1000
+    print(f"{ label:<48} { elapsed:10.2f} ms")
+    return elapsed
+
+
+async def main() -> dict[str, float]:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--indexed-ratio", type=float, default=0.2)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--skip-python-scan", action="store_true")
+    args = parser.parse_args()
+
+    with TemporaryDirectory(prefix="agently-record-store-search-benchmark-") as temp_dir:
+        store = RecordStore(temp_dir, mode="read_write")
+        backend = store.backend
+        # One real write creates the schema and indexes; the rest is bulk loaded.
+        await store.put("schema", collection="notes", indexed=True)
+        started = time.perf_counter()
+        populate(backend.db_path, records=args.records, indexed_ratio=args.indexed_ratio, seed=7)
+        print(f"populated { args.records } records in { time.perf_counter() - started:.1f} s")
+
+        scope_filters = {"scope.execution_id": "exec-42", "collection": "evidence"}
+        results = {
+            "scope_filter": await timed(
+                "scope.execution_id + collection filter",
+                lambda: store.search(filters=scope_filters, limit=args.limit),
+                args.repeat,
+            ),
+            "recent_page": await timed(
+                "newest page, no filter",
+                lambda: store.search_page(limit=args.limit),
+                args.repeat,
+            ),
+            "fts_query": await timed(
+                "query 'refund' (bm25 + substring fallback)",
+                lambda: store.search(
+                    "refund",
+                    filters={"scope.session_id": "session-7"},
+                    limit=args.limit,
+                    match="fulltext",
+                ),
+                args.repeat,
+            ),
+        }
+        if not args.skip_python_scan:
+            results["python_scan_scope_filter"] = await timed(
+                "full Python scan, scope filter",
+                lambda: asyncio.to_thread(python_scan, backend.db_path, None, scope_filters, args.limit),
+                1,
+            )
+        backend.close()
+        return results
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,97 @@
+"""Benchmark inherited ``Settings.get`` lookups on a 4-level chain.
+
+Builds global -> agent -> request -> plugin settings layers the way an Agent
+request does, then times ``--calls`` lookups (100,000 by default) of typical
+dot paths. The "full merge per call" row rebuilds the merged view of the whole
+chain for every lookup, which is how inherited reads worked before lookups
+were resolved per key and memoized per layer.
+
+    python examples/settings/settings_get_benchmark.py --calls 100000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from agently.utils import Settings
+
+KEYS = (
+    "plugins.ModelRequester.activate",
+    "plugins.ModelRequester.OpenAICompatible.model",
+    "runtime.show_model_logs",
+    "model_request.scheduler",
+    "debug",
+)
+
+
+def build_chain() -> Settings:
+    root = Settings(name="global")
+    root.load("yaml_file", str(ROOT / "agently" / "_default_settings.yaml"))
+    root.set("plugins.ModelRequester.OpenAICompatible", {"model": "gpt-4.1-mini", "options": {"temperature": 0.2}})
+    agent = Settings(name="agent", parent=root)
+    agent.set("plugins.ModelRequester.OpenAICompatible.model", "gpt-4.1")
+    agent.set("runtime.show_model_logs", "simple")
+    request = Settings(name="request", parent=agent)
+    request.set("model_request.scheduler", {"max_concurrency": 4})
+    plugin = Settings(name="plugin", parent=request)
+    plugin.set("debug", False)
+    return plugin
+
+
+def full_merge_get(settings: Settings, key: str):
+    current = settings._get_inherited_view(settings, {})
+    for part in key.split("."):
+        if not isinstance(current, dict) or part not in current:
+            return None
+        current = current[part]
+    return current
+
+
+def timed(label: str, calls: int, lookup) -> float:
+    started = time.perf_counter()
+    for index in range(calls):
+        lookup(KEYS[index % len(KEYS)])
+    elapsed = time.perf_counter() - started
+    print(f"{ label:<28} { elapsed * 1000:10.1f} ms  { calls / elapsed:>12,.0f} gets/s")
+    return elapsed
+
+
+def main() -> dict[str, float]:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=100_000)
+    parser.add_argument("--full-merge-calls", type=int, default=5_000)
+    args = parser.parse_args()
+
+    settings = build_chain()
+    for key in KEYS:
+        assert settings.get(key) == full_merge_get(settings, key), key
+
+    results = {
+        "settings_get": timed("settings.get (memoized)", args.calls, settings.get),
+        "full_merge": timed(
+            "full merge per call",
+            args.full_merge_calls,
+            lambda key: full_merge_get(settings, key),
+        )
+        * args.calls
+        / args.full_merge_calls,
+    }
+    request = settings.parent
+    assert request is not None
+
+    def get_after_write(key: str):
+        request.set("model_request.attempt", 1)
+        return settings.get(key)
+
+    results["write_then_get"] = timed("write + settings.get", args.calls, get_after_write)
+    print(f"full merge extrapolated to { args.calls } calls: { results['full_merge'] * 1000:.1f} ms")
+    return results
+
+
+if __name__ == "__main__":
+    main()
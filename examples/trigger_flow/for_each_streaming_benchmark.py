@@ -0,0 +1,86 @@
+"""Benchmark for_each memory with eager and pull-based item dispatch.
+
+Runs ``--items`` items through ``for_each(...).to(work).end_for_each(...)``
+and reports wall time and the tracemalloc peak for: a list without a
+concurrency limit (every result slot and send coroutine is created before any
+work starts), a list with ``--concurrency`` (items are pulled as permits
+free up), an async generator with ``--concurrency``, and the same generator
+with ``end_for_each(mode="stream")`` (results are emitted as they finish and
+never collected).
+
+    python examples/trigger_flow/for_each_streaming_benchmark.py --items 5000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from agently import TriggerFlow, TriggerFlowRuntimeData
+
+
+async def run(*, items: int, concurrency: int | None, lazy: bool, mode: str) -> tuple[float, float, int]:
+    received = 0
+
+    async def make_items(data: TriggerFlowRuntimeData):
+        if not lazy:
+            return list(range(data.value))
+
+        async def generate():
+            for index in range(data.value):
+                yield index
+
+        return generate()
+
+    async def work(data: TriggerFlowRuntimeData):
+        return data.value + 1
+
+    async def sink(data: TriggerFlowRuntimeData):
+        nonlocal received
+        received += len(data.value) if isinstance(data.value, list) else 1
+
+    flow = TriggerFlow(name="for-each-streaming-benchmark")
+    (
+        flow.to(make_items)
+        .for_each(concurrency=concurrency)
+        .to(work)
+        .end_for_each(mode=mode)  # type: ignore[arg-type]
+        .to(sink)
+    )
+    execution = flow.create_execution(auto_close=False)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    await execution.async_start(items)
+    await execution.async_close(timeout=600)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024, received
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    rows = [
+        ("list, unbounded", None, False, "list"),
+        ("list, concurrency", args.concurrency, False, "list"),
+        ("async gen, concurrency", args.concurrency, True, "list"),
+        ("async gen, stream", args.concurrency, True, "stream"),
+    ]
+    for label, concurrency, lazy, mode in rows:
+        elapsed, peak_mib, received = await run(items=args.items, concurrency=concurrency, lazy=lazy, mode=mode)
+        print(f"{ label:<24} { received } results in { elapsed:6.2f} s  (peak { peak_mib:7.1f} MiB)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -11,6 +11,7 @@ from agently.core.context import ContextSelection, TaskContext
 from agently.types.data import (
     ContextBudget,
     ContextReadIntent,
+    ContextSourceBindingSnapshot,
     ContextSourceDescriptor,
     ContextSourceDescriptorPage,
     ContextSourceChange,
@@ -619,3 +620,174 @@ async def test_change_feed_failure_records_explicit_full_rebuild_fallback() -> N
     assert facts["sync_fallbacks"] == (
         "RuntimeError: change feed unavailable",
     )
+
+
+async def _page_through_index(index, source, intent: ContextReadIntent, limit: int) -> list[str]:
+    binding = ContextSourceBindingSnapshot(
+        binding_id="binding:ranking",
+        source_id=source.source_id,
+        source_kind=source.source_kind,
+        source_revision=source.source_revision,
+    )
+    refs: list[str] = []
+    offset = 0
+    while True:
+        result = await index.async_query(
+            bindings=((binding, source),),
+            intent=intent,
+            offsets={binding.binding_id: offset},
+            limit=limit,
+        )
+        refs.extend(
+            match.descriptor.source_ref
+            for match in result.matches
+            if not match.descriptor.required
+        )
+        offset = result.next_offsets[binding.binding_id]
+        if result.source_coverage[binding.binding_id]["exhaustive"]:
+            return refs
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("strategy", ["hybrid", "lexical"])
+@pytest.mark.parametrize("vectorized", [True, False])
+async def test_windowed_ranking_pages_match_the_full_ranking(
+    monkeypatch: pytest.MonkeyPatch,
+    strategy: str,
+    vectorized: bool,
+) -> None:
+    from agently.core.context import _Index
+
+    if vectorized:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(_Index, "_numpy", None)
+    monkeypatch.setattr(_Index, "_PARTITION_CACHE", _Index._ContextIndexPartitionCache())
+    descriptors = [
+        replace(
+            descriptor(f"doc-{index:02d}", required=index == 7),
+            index_text=" ".join(
+                ["alpha"] * (index % 4) + ["beta"] * (index % 3) + ["gamma"]
+            ),
+            priority=index % 2,
+        )
+        for index in range(36)
+    ]
+    descriptors[11] = replace(descriptors[11], index_text="beta alpha release notes")
+    source = CountingDescriptorSource(descriptors)
+    index = _Index._ContextIndex(
+        profile=_Index._ContextIndexProfile(candidate_strategy=strategy),
+        embedding_provider=CountingEmbeddingProvider(),
+    )
+    intent = ContextReadIntent("beta alpha")
+    full_ranking, *_ = await index._rank_descriptors(
+        source.descriptors,
+        partition=await index._build_partition(
+            source,
+            ContextSourceBindingSnapshot(
+                binding_id="binding:reference",
+                source_id=source.source_id,
+                source_kind=source.source_kind,
+                source_revision=source.source_revision,
+            ),
+        ),
+        intent=intent,
+    )
+    expected = [item.source_ref for item in full_ranking if not item.required]
+
+    assert expected[0] == "doc-11"
+    assert await _page_through_index(index, source, intent, limit=5) == expected
+
+
+@pytest.mark.asyncio
+async def test_partition_cache_is_lru_bounded_and_keeps_latest_revision_only() -> None:
+    from agently.core.context import _Index
+
+    cache = _Index._ContextIndexPartitionCache(max_entries=2)
+
+    def partition(source_id: str, revision: str):
+        key = _Index._PartitionKey(
+            source_id=source_id,
+            source_revision=revision,
+            schema_version="context-index/v1",
+            projection_profile="default",
+            embedding_identity="none",
+        )
+        return key, _Index._Partition(key=key, descriptors=(descriptor(source_id),))
+
+    async def store(source_id: str, revision: str) -> bool:
+        key, value = partition(source_id, revision)
+
+        async def build():
+            return value
+
+        return (await cache.get_or_build(key, build))[1]
+
+    assert await store("a", "r1") is False
+    assert await store("b", "r1") is False
+    assert await store("a", "r1") is True
+    assert await store("c", "r1") is False
+
+    # "b" was least recently used once "a" was read again.
+    assert await store("a", "r1") is True
+    assert await store("b", "r1") is False
+    assert cache.stats()["evictions"] == 2
+
+    newer_key, _ = partition("b", "r2")
+    previous = await cache.find_compatible(newer_key)
+    assert previous is not None and previous.key.source_revision == "r1"
+    assert await store("b", "r2") is False
+    assert await cache.find_compatible(partition("b", "r3")[0]) is not None
+    assert await cache.find_compatible(newer_key) is None
+
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["superseded"] == 1
+    assert stats["hits"] == 2
+    assert stats["builds"] == 5
+
+    cache.configure(max_bytes=1)
+    assert cache.stats()["entries"] == 1
+    assert 0 < cache.stats()["bytes"] == _Index._estimate_partition_bytes(
+        partition("b", "r2")[1]
+    )
+    assert TaskContext.index_cache_stats()["max_entries"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_persistent_embedding_cache_skips_unchanged_texts_after_restart(
+    tmp_path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from agently.core.context import _Index
+    from agently.core.storage import SQLiteEmbeddingCache
+
+    source = CountingDescriptorSource(
+        [descriptor("alpha"), descriptor("beta"), descriptor("gamma")]
+    )
+
+    async def read_with_fresh_process_state(embedder: CountingEmbeddingProvider):
+        monkeypatch.setattr(_Index, "_PARTITION_CACHE", _Index._ContextIndexPartitionCache())
+        context = TaskContext("embedding-cache")
+        context.configure_index(
+            embedding_provider=embedder,
+            strategy="hybrid",
+            embedding_cache=SQLiteEmbeddingCache(tmp_path / "embeddings.db"),
+            embedding_batch_size=2,
+        )
+        context.attach(source)
+        return _index_diagnostic(await context.reader(consumer="worker").async_read("alpha"))
+
+    cold_embedder = CountingEmbeddingProvider()
+    cold = await read_with_fresh_process_state(cold_embedder)
+    warm_embedder = CountingEmbeddingProvider()
+    warm = await read_with_fresh_process_state(warm_embedder)
+
+    assert cold["embedding_build_texts"] == 3
+    assert cold["embedding_cache_misses"] == 3
+    # Three descriptor texts in batches of two, plus one query embedding.
+    assert cold_embedder.calls == 3
+    assert warm["cache"] == "miss"
+    assert warm["embedding_build_texts"] == 0
+    assert warm["embedding_cache_hits"] == 3
+    assert warm_embedder.embedded_texts == 1
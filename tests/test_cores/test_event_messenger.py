@@ -417,6 +417,169 @@ async def test_event_center_default_hook_dispatch_awaits_completion():
     assert completed == ["reliable"]
 
 
+@pytest.mark.asyncio
+async def test_event_center_skips_normalization_for_unrouted_event_types(monkeypatch):
+    import importlib
+
+    event_center_module = importlib.import_module("agently.core.runtime.EventCenter")
+    ec = EventCenter(idle_flush_seconds=None)
+    received: list[str] = []
+
+    def fail_inference():
+        raise AssertionError("source inference ran for an unrouted event")
+
+    async def hook(event: RuntimeEvent):
+        received.append(event.event_type)
+
+    monkeypatch.setattr(event_center_module, "_infer_runtime_source", fail_inference)
+    ec.register_hook(hook, event_types="runtime.info", hook_name="routed")
+
+    await ec.async_emit({"event_type": "model.streaming", "payload": {"delta": "x"}})
+    assert received == []
+
+    ec.register_hook(hook, event_types="model.streaming", hook_name="late")
+    with pytest.raises(AssertionError, match="source inference"):
+        await ec.async_emit({"event_type": "model.streaming", "payload": {"delta": "x"}})
+    await ec.async_emit({"event_type": "model.streaming", "source": "Test"})
+    assert received == ["model.streaming"]
+
+    ec.unregister_hook("late")
+    await ec.async_emit({"event_type": "model.streaming"})
+    assert received == ["model.streaming"]
+
+
+@pytest.mark.asyncio
+async def test_event_center_inline_dispatch_runs_sync_hooks_on_the_loop():
+    import threading
+
+    ec = EventCenter(idle_flush_seconds=None)
+    calls: list[tuple[str, int]] = []
+    loop_thread = threading.get_ident()
+
+    def inline_hook(event: RuntimeEvent):
+        calls.append(("inline", threading.get_ident()))
+
+    def failing_inline_hook(event: RuntimeEvent):
+        raise RuntimeError("inline hook failure stays inside Event Center")
+
+    def executor_hook(event: RuntimeEvent):
+        calls.append(("executor", threading.get_ident()))
+
+    ec.register_hook(inline_hook, hook_name="inline", delivery_policy={"dispatch": "inline"})
+    ec.register_hook(failing_inline_hook, hook_name="failing", delivery_policy={"dispatch": "inline"})
+    ec.register_hook(executor_hook, hook_name="executor")
+
+    await ec.async_emit({"event_type": "runtime.info", "source": "Test"})
+
+    assert ("inline", loop_thread) in calls
+    assert [name for name, thread in calls if thread != loop_thread] == ["executor"]
+
+
+@pytest.mark.asyncio
+async def test_event_center_logs_failing_hooks_by_name(monkeypatch):
+    from agently.base import logger
+
+    warnings: list[str] = []
+    monkeypatch.setattr(logger, "warning", lambda message, *args, **kwargs: warnings.append(message))
+    ec = EventCenter(idle_flush_seconds=None)
+
+    def failing_inline_hook(event: RuntimeEvent):
+        raise RuntimeError("inline failure")
+
+    async def failing_awaited_hook(event: RuntimeEvent):
+        raise RuntimeError("awaited failure")
+
+    async def failing_background_hook(event: RuntimeEvent):
+        raise RuntimeError("background failure")
+
+    ec.register_hook(failing_inline_hook, hook_name="inline", delivery_policy={"dispatch": "inline"})
+    ec.register_hook(failing_awaited_hook, hook_name="awaited")
+    ec.register_hook(failing_background_hook, hook_name="background", delivery_policy={"dispatch": "background"})
+
+    await ec.async_emit({"event_type": "runtime.info", "source": "Test"})
+    await ec.async_flush()
+
+    assert sorted(warnings) == [
+        "[EventCenter] Hook 'awaited' failed: RuntimeError('awaited failure')",
+        "[EventCenter] Hook 'background' failed: RuntimeError('background failure')",
+        "[EventCenter] Hook 'inline' failed: RuntimeError('inline failure')",
+    ]
+
+
+def test_event_center_is_observed_follows_hooks_and_sink_settings():
+    from agently.builtins.hookers.RuntimeStorageSinkHooker import RuntimeStorageSinkHooker
+
+    snapshot = _snapshot_runtime_log_settings()
+    ec = EventCenter(idle_flush_seconds=None)
+    try:
+        assert not ec.is_observed("model.streaming", "DEBUG")
+
+        ec.register_hooker_plugin(RuntimeConsoleSinkHooker)
+        ec.register_hooker_plugin(RuntimeStorageSinkHooker)
+        Agently.set_settings("runtime.show_model_logs", "off")
+        assert not ec.is_observed("model.streaming", "DEBUG")
+        assert not ec.is_observed("model.requesting", "INFO")
+        assert ec.is_observed("model.request_failed", "ERROR")
+
+        Agently.set_settings("runtime.show_model_logs", "simple")
+        assert ec.is_observed("model.requesting", "INFO")
+        assert not ec.is_observed("model.streaming", "DEBUG")
+        Agently.set_settings("runtime.show_model_logs", "detail")
+        assert ec.is_observed("model.streaming", "DEBUG")
+        Agently.set_settings("runtime.show_model_logs", "off")
+
+        ec.register_hook(lambda event: None, event_types="model.streaming", hook_name="plain")
+        assert ec.is_observed("model.streaming", "DEBUG")
+        assert not ec.is_observed("model.requesting", "INFO")
+        ec.unregister_hook("plain")
+        assert not ec.is_observed("model.streaming", "DEBUG")
+    finally:
+        ec.unregister_hooker_plugin(RuntimeConsoleSinkHooker)
+        ec.unregister_hooker_plugin("RuntimeStorageSinkHooker")
+        _restore_runtime_log_settings(snapshot)
+
+
+@pytest.mark.asyncio
+async def test_event_center_delivery_policy_samples_debug_events_per_type():
+    ec = EventCenter(idle_flush_seconds=None)
+    received: list[tuple[str, str]] = []
+
+    def hook(event: RuntimeEvent):
+        received.append((event.event_type, event.level))
+
+    ec.register_hook(
+        hook,
+        hook_name="sampled",
+        delivery_policy={"dispatch": "inline", "sample_every": 5},
+    )
+    for _ in range(10):
+        await ec.async_emit({"event_type": "model.streaming", "source": "Test", "level": "DEBUG"})
+        await ec.async_emit({"event_type": "triggerflow.signal", "source": "Test", "level": "DEBUG"})
+    await ec.async_emit({"event_type": "model.streaming", "source": "Test", "level": "ERROR"})
+
+    assert received.count(("model.streaming", "DEBUG")) == 2
+    assert received.count(("triggerflow.signal", "DEBUG")) == 2
+    assert ("model.streaming", "ERROR") in received
+
+    received.clear()
+    ec.register_hook(
+        hook,
+        hook_name="sampled",
+        delivery_policy={
+            "dispatch": "inline",
+            "max_per_second": 3,
+            "sample_levels": ["DEBUG", "INFO"],
+            "sample_event_types": ["model.streaming"],
+        },
+    )
+    for _ in range(10):
+        await ec.async_emit({"event_type": "model.streaming", "source": "Test"})
+        await ec.async_emit({"event_type": "runtime.info", "source": "Test"})
+
+    assert received.count(("model.streaming", "INFO")) == 3
+    assert received.count(("runtime.info", "INFO")) == 10
+
+
 @pytest.mark.asyncio
 async def test_event_center_infers_source_for_emitter_and_direct_emit():
     ec = EventCenter()
@@ -0,0 +1,208 @@
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+
+from agently import Agently
+from agently.base import request_hedger, request_scheduler
+from agently.core import ModelRequest, PluginManager
+from agently.types.data import AgentlyRequestData
+from agently.utils import Settings
+from agently.utils.ModelPool import reset_api_key_pool_stats
+
+_SCOPE = "MockHedgedRequester:mock-hedge-1"
+
+
+class MockHedgedRequester:
+    name = "MockHedgedRequester"
+    DEFAULT_SETTINGS: dict[str, Any] = {}
+    first_event_delays: dict[str, float] = {}
+    failing_keys: set[str] = set()
+    sent: list[str] = []
+    cancelled: list[str] = []
+
+    def __init__(self, prompt, settings):
+        self.prompt = prompt
+        self.settings = settings
+
+    @staticmethod
+    def _on_register():
+        pass
+
+    @staticmethod
+    def _on_unregister():
+        pass
+
+    def generate_request_data(self):
+        return AgentlyRequestData(
+            client_options={},
+            headers={},
+            data={"messages": self.prompt.to_messages()},
+            request_options={"model": "mock-hedge-1", "stream": True},
+            request_url="mock://hedged-requester",
+        )
+
+    async def request_model(self, request_data: AgentlyRequestData):
+        api_key = str(self.settings.get("plugins.ModelRequester.MockHedgedRequester.api_key"))
+        type(self).sent.append(api_key)
+        try:
+            await asyncio.sleep(type(self).first_event_delays[api_key])
+            if api_key in type(self).failing_keys:
+                yield "error", RuntimeError(f"{ api_key } failed")
+                return
+            yield "message", f"answer from { api_key }"
+        except asyncio.CancelledError:
+            type(self).cancelled.append(api_key)
+            raise
+
+    async def broadcast_response(self, response_generator: AsyncGenerator[tuple[str, Any], None]):
+        text = ""
+        async for event, data in response_generator:
+            if event == "error":
+                yield "status", {"status": "failed", "retry": False}
+                yield "error", data
+                return
+            text += str(data)
+            yield "delta", text
+        yield "tool_calls", [{"id": "call-1", "function": {"name": "charge_card", "arguments": "{}"}}]
+        yield "done", text
+        yield "meta", {"model": "mock-hedge-1"}
+
+
+def _create_request(**hedge_settings: Any):
+    settings = Settings(name="RequestHedgeTestSettings", parent=Agently.settings)
+    plugin_manager = PluginManager(settings, parent=Agently.plugin_manager, name="RequestHedgeTestPluginManager")
+    plugin_manager.register("ModelRequester", MockHedgedRequester, activate=True)
+    settings.set("model_pool", {"chat": "hedge-profile"})
+    settings.set(
+        "model_profiles",
+        {"hedge-profile": {"provider": "MockHedgedRequester", "model": "mock-hedge-1", "api_key_pool": "hedge"}},
+    )
+    settings.set(
+        "api_key_pools",
+        {"hedge": {"selection": "fixed", "keys": [{"id": "a", "value": "key-a"}, {"id": "b", "value": "key-b"}]}},
+    )
+    settings.set("model_request.hedge", {"enabled": True, **hedge_settings})
+    request = ModelRequest(plugin_manager, parent_settings=settings, model_key="chat")
+    request.input("Charge the card once.")
+    return request
+
+
+@pytest.fixture(autouse=True)
+def _reset_hedging():
+    MockHedgedRequester.first_event_delays = {"key-a": 0.01, "key-b": 0.01}
+    MockHedgedRequester.failing_keys = set()
+    MockHedgedRequester.sent = []
+    MockHedgedRequester.cancelled = []
+    request_hedger.reset()
+    reset_api_key_pool_stats()
+    yield
+    request_hedger.reset()
+    reset_api_key_pool_stats()
+    request_scheduler._configs.pop("MockHedgedRequester", None)
+    request_scheduler._clear_cached_primitives("MockHedgedRequester")
+
+
+async def _consume(request: ModelRequest) -> tuple[str, list[Any], float]:
+    started_at = time.perf_counter()
+    result = request.get_result()
+    tool_calls = [data async for event, data in result.get_async_generator(type="all") if event == "tool_calls"]
+    return await result.async_get_text(), tool_calls, time.perf_counter() - started_at
+
+
+@pytest.mark.asyncio
+async def test_slow_first_event_is_hedged_to_another_key_and_the_loser_is_cancelled():
+    MockHedgedRequester.first_event_delays["key-a"] = 1.0
+
+    text, tool_calls, elapsed = await _consume(_create_request(delay=0.05))
+
+    assert text == "answer from key-b"
+    assert elapsed < 0.5
+    assert MockHedgedRequester.sent == ["key-a", "key-b"]
+    assert MockHedgedRequester.cancelled == ["key-a"]
+    # Only the winning stream is broadcast, so its tool call is handed over once.
+    assert len(tool_calls) == 1
+    assert request_hedger.stats(_SCOPE) | {"samples": None} == {
+        "requests": 1,
+        "hedged": 1,
+        "hedge_wins": 1,
+        "skipped": 0,
+        "hedge_rate": 1.0,
+        "win_rate": 1.0,
+        "samples": None,
+    }
+
+    # A primary that answers within the delay is never hedged.
+    MockHedgedRequester.first_event_delays["key-a"] = 0.01
+    text, _, _ = await _consume(_create_request(delay=0.5))
+    assert text == "answer from key-a"
+    assert MockHedgedRequester.sent[2:] == ["key-a"]
+    assert request_hedger.stats(_SCOPE)["hedge_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_hedge_needs_a_free_scheduler_slot():
+    MockHedgedRequester.first_event_delays["key-a"] = 0.2
+    request = _create_request(delay=0.05)
+    request.settings.set("model_request.scheduler", {"max_concurrency": 1})
+
+    text, _, _ = await _consume(request)
+
+    assert text == "answer from key-a"
+    assert MockHedgedRequester.sent == ["key-a"]
+    assert request_hedger.stats(_SCOPE)["skipped"] == 1
+    assert request_scheduler.stats("MockHedgedRequester")["in_flight"] == 0
+
+    request = _create_request(delay=0.05)
+    request.settings.set("model_request.scheduler", {"max_concurrency": 2})
+    assert (await _consume(request))[0] == "answer from key-b"
+    assert request_scheduler.stats("MockHedgedRequester")["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_learned_delay_hedges_requests_slower_than_the_recent_p95():
+    for _ in range(5):
+        assert (await _consume(_create_request(min_samples=5)))[0] == "answer from key-a"
+    assert request_hedger.stats(_SCOPE)["hedged"] == 0
+
+    MockHedgedRequester.first_event_delays["key-a"] = 1.0
+    text, _, elapsed = await _consume(_create_request(min_samples=5))
+
+    assert text == "answer from key-b"
+    assert elapsed < 0.5
+    assert request_hedger.stats(_SCOPE)["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_primary_failing_before_any_content_leaves_the_race_to_the_hedge():
+    MockHedgedRequester.first_event_delays = {"key-a": 0.1, "key-b": 0.3}
+    MockHedgedRequester.failing_keys = {"key-a"}
+
+    text, _, _ = await _consume(_create_request(delay=0.05))
+
+    assert text == "answer from key-b"
+    assert MockHedgedRequester.cancelled == []
+    assert request_hedger.stats(_SCOPE)["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_primary_answer_is_not_held_back_while_the_hedge_waits_for_a_slot(monkeypatch):
+    from agently.core.model.ModelRequestRunner import ModelRequestRunner
+
+    start_hedge_request = ModelRequestRunner._start_hedge_request
+
+    async def slow_slot(self, *args: Any, **kwargs: Any):
+        await asyncio.sleep(1.0)
+        return await start_hedge_request(self, *args, **kwargs)
+
+    monkeypatch.setattr(ModelRequestRunner, "_start_hedge_request", slow_slot)
+    MockHedgedRequester.first_event_delays["key-a"] = 0.1
+
+    text, _, elapsed = await _consume(_create_request(delay=0.05))
+
+    assert text == "answer from key-a"
+    assert elapsed < 0.5
+    assert MockHedgedRequester.sent == ["key-a"]
+    assert request_hedger.stats(_SCOPE)["skipped"] == 1
@@ -0,0 +1,190 @@
+import asyncio
+import json
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+
+from agently import Agently
+from agently.base import request_scheduler, response_cache
+from agently.core import ModelRequest, PluginManager
+from agently.types.data import AgentlyRequestData
+from agently.utils import Settings
+from agently.utils.ResponseCache import ResponseCache
+
+
+class MockCachedRequester:
+    name = "MockCachedRequester"
+    DEFAULT_SETTINGS: dict[str, Any] = {}
+    sent = 0
+
+    def __init__(self, prompt, settings):
+        self.prompt = prompt
+        self.settings = settings
+
+    @staticmethod
+    def _on_register():
+        pass
+
+    @staticmethod
+    def _on_unregister():
+        pass
+
+    def generate_request_data(self):
+        return AgentlyRequestData(
+            client_options={},
+            headers={"Authorization": "Bearer not-part-of-the-key"},
+            data={"messages": self.prompt.to_messages()},
+            request_options={
+                "model": "mock-cache-1",
+                "temperature": self.settings.get("plugins.ModelRequester.MockCachedRequester.temperature", 0),
+                "stream": True,
+            },
+            request_url="mock://cached-requester",
+        )
+
+    async def request_model(self, request_data: AgentlyRequestData):
+        type(self).sent += 1
+        yield "message", json.dumps({"summary": f"answer #{ type(self).sent }", "reply": "done"})
+
+    async def broadcast_response(self, response_generator: AsyncGenerator[tuple[str, Any], None]):
+        text = ""
+        async for _event, data in response_generator:
+            text += str(data)
+        for index in range(0, len(text), 8):
+            yield "delta", text[index : index + 8]
+            await asyncio.sleep(0)
+        yield "tool_calls", [{"id": "call-1", "function": {"name": "lookup", "arguments": "{}"}}]
+        yield "done", text
+        yield "meta", {"model": "mock-cache-1", "usage": {"total_tokens": 12}}
+        yield "status", {"status": "completed"}
+
+
+def _create_request(**cache_settings: Any):
+    settings = Settings(name="ResponseCacheTestSettings", parent=Agently.settings)
+    plugin_manager = PluginManager(settings, parent=Agently.plugin_manager, name="ResponseCacheTestPluginManager")
+    plugin_manager.register("ModelRequester", MockCachedRequester, activate=True)
+    request = ModelRequest(
+        plugin_manager,
+        agent_name="response-cache-agent",
+        agent_id="agent-response-cache",
+        parent_settings=settings,
+    )
+    request.settings.set("model_request.cache", {"enabled": True, **cache_settings})
+    request.input("Summarize the cache design.")
+    request.output({"summary": (str,), "reply": (str,)}, format="json")
+    return request
+
+
+@pytest.fixture(autouse=True)
+def _reset_response_cache():
+    MockCachedRequester.sent = 0
+    response_cache.clear()
+    response_cache.reset_stats()
+    yield
+    response_cache.clear()
+    response_cache.reset_stats()
+
+
+async def _consume(request: ModelRequest):
+    result = request.get_result()
+    deltas = [delta async for delta in result.get_async_generator(type="delta")]
+    return deltas, await result.async_get_data(), await result.async_get_meta()
+
+
+@pytest.mark.asyncio
+async def test_identical_deterministic_request_replays_recorded_stream():
+    live = await _consume(_create_request())
+    replayed = await _consume(_create_request())
+
+    assert MockCachedRequester.sent == 1
+    assert replayed == live
+    assert live[1] == {"summary": "answer #1", "reply": "done"}
+    assert response_cache.stats() == {"hits": 1, "misses": 1, "stores": 1, "skips": 0}
+
+    # A different prompt is a different key.
+    other = _create_request()
+    other.input("Summarize something else.")
+    await _consume(other)
+    assert MockCachedRequester.sent == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_replays_without_waiting_for_a_scheduler_slot():
+    await _consume(_create_request())
+    try:
+        request_scheduler.configure("MockCachedRequester", max_concurrency=1)
+        async with request_scheduler.slot("MockCachedRequester"):
+            replayed = await asyncio.wait_for(_consume(_create_request()), timeout=1)
+            assert request_scheduler.stats("MockCachedRequester")["in_flight"] == 1
+    finally:
+        request_scheduler._configs.pop("MockCachedRequester", None)
+        request_scheduler._clear_cached_primitives("MockCachedRequester")
+
+    assert replayed[1] == {"summary": "answer #1", "reply": "done"}
+    assert MockCachedRequester.sent == 1
+
+
+@pytest.mark.asyncio
+async def test_response_cache_skips_opt_out_sampled_and_expired_requests():
+    await _consume(_create_request())
+    opted_out = _create_request()
+    opted_out.settings.set("model_request.cache.enabled", False)
+    await _consume(opted_out)
+    assert MockCachedRequester.sent == 2
+
+    for _ in range(2):
+        sampled = _create_request()
+        sampled.settings.set("plugins.ModelRequester.MockCachedRequester.temperature", 0.7)
+        await _consume(sampled)
+    assert MockCachedRequester.sent == 4
+    assert response_cache.stats()["skips"] == 2
+
+    for delay in (0, 0.1):
+        await asyncio.sleep(delay)
+        expiring = _create_request(ttl=0.05)
+        expiring.input("Summarize the expiry rule.")
+        await _consume(expiring)
+    assert MockCachedRequester.sent == 6
+
+
+@pytest.mark.asyncio
+async def test_validation_retry_bypasses_and_refreshes_cached_response():
+    request = _create_request()
+    await _consume(request)
+    retried = _create_request()
+    data = await retried.get_result().async_get_data(
+        validate_handler=lambda data, context: data["summary"] != "answer #1",
+        max_retries=1,
+    )
+
+    assert data["summary"] == "answer #2"
+    assert MockCachedRequester.sent == 2
+    # The rejected first answer is no longer replayed.
+    assert (await _consume(_create_request()))[1]["summary"] == "answer #3"
+
+
+@pytest.mark.asyncio
+async def test_sqlite_response_cache_survives_a_new_cache_instance(tmp_path):
+    path = tmp_path / "responses.sqlite3"
+    live = await _consume(_create_request(backend="sqlite", path=str(path)))
+    response_cache.close()
+
+    settings = Settings()
+    settings.set("model_request.cache", {"enabled": True, "backend": "sqlite", "path": str(path)})
+    cache = ResponseCache()
+    policy = cache.policy_from_settings(settings)
+    assert policy is not None
+    assert len(cache._backend(policy).get(next(iter(_keys(path))), now=0) or []) == len(live[0]) + 4
+    cache.close()
+
+    assert await _consume(_create_request(backend="sqlite", path=str(path))) == live
+    assert MockCachedRequester.sent == 1
+    response_cache.close()
+
+
+def _keys(path):
+    import sqlite3
+
+    with sqlite3.connect(str(path)) as connection:
+        return [row[0] for row in connection.execute("SELECT key FROM response_cache")]
@@ -1,3 +1,4 @@
+import sys
 from typing import Any
 import pytest
 from agently import Agently
@@ -5,6 +6,7 @@ from agently.core import PluginManager
 from agently.types.config import options_schema_registry, settings_schema_registry
 from agently.types.options import ExecutionOptions
 from agently.types.settings import OpenAICompatibleSettings
+from agently.utils import Settings
 
 
 def test_plugin_manager():
@@ -37,5 +39,75 @@ def test_plugin_manager():
     assert options_schema_registry.get("tests.plugin.options") is None
 
 
+def test_plugin_manager_imports_lazy_plugin_on_first_get(tmp_path, monkeypatch):
+    (tmp_path / "lazy_plugin_fixture.py").write_text(
+        "from agently.types.plugins import PromptGenerator\n"
+        "registered = []\n"
+        "class LazyPromptGenerator(PromptGenerator):\n"
+        "    name = 'LazyPrompt'\n"
+        "    DEFAULT_SETTINGS = {'mode': 'lazy'}\n"
+        "    @staticmethod\n"
+        "    def _on_register():\n"
+        "        registered.append(True)\n",
+        encoding="utf-8",
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    from agently.types.plugins import LazyPlugin
+
+    plugin_manager = PluginManager(Settings(parent=Agently.settings))
+    lazy_plugin = LazyPlugin(
+        "lazy_plugin_fixture:LazyPromptGenerator",
+        default_settings={"mode": "lazy"},
+        options_schemas={"tests.lazy_plugin.options": ExecutionOptions},
+    )
+    plugin_manager.register("PromptGenerator", lazy_plugin, activate=False)
+
+    assert "lazy_plugin_fixture" not in sys.modules
+    assert plugin_manager.get_plugin_list() == {"PromptGenerator": ["LazyPromptGenerator"]}
+    assert plugin_manager.settings.get("plugins.PromptGenerator.LazyPromptGenerator.mode") == "lazy"
+    assert options_schema_registry.get("tests.lazy_plugin.options") is ExecutionOptions
+    with pytest.raises(ValueError, match="LazyPrompt"):
+        plugin_manager.get_plugin("PromptGenerator", "LazyPromptGenerator")
+
+    plugin_manager.unregister("PromptGenerator", "LazyPromptGenerator")
+    assert options_schema_registry.get("tests.lazy_plugin.options") is None
+
+    # Defaults the reference does not declare would never reach the settings.
+    plugin_manager.register(
+        "PromptGenerator",
+        LazyPlugin("lazy_plugin_fixture:LazyPromptGenerator", name="LazyPrompt"),
+        activate=False,
+    )
+    with pytest.raises(ValueError, match="DEFAULT_SETTINGS"):
+        plugin_manager.get_plugin("PromptGenerator", "LazyPrompt")
+    plugin_manager.unregister("PromptGenerator", "LazyPrompt")
+
+    plugin_manager.register(
+        "PromptGenerator",
+        LazyPlugin("lazy_plugin_fixture:LazyPromptGenerator", name="LazyPrompt", default_settings={"mode": "lazy"}),
+        activate=False,
+    )
+    plugin_class = plugin_manager.get_plugin("PromptGenerator", "LazyPrompt")
+
+    fixture_module = sys.modules["lazy_plugin_fixture"]
+    assert plugin_class is fixture_module.LazyPromptGenerator
+    assert plugin_manager.get_plugin("PromptGenerator", "LazyPrompt") is plugin_class
+    assert fixture_module.registered == [True]
+
+    child_manager = PluginManager(plugin_manager.settings, parent=plugin_manager)
+    assert child_manager.get_plugin("PromptGenerator", "LazyPrompt") is plugin_class
+    assert fixture_module.registered == [True]
+
+
+
+def test_builtin_lazy_plugins_declare_the_metadata_of_their_classes():
+    from agently.types.plugins import LazyPlugin
+
+    for plugins in Agently.plugin_manager.plugins.values():
+        for plugin in plugins.values():
+            if isinstance(plugin, LazyPlugin):
+                assert plugin.load().name == plugin.name
+
+
 if __name__ == "__main__":
     test_plugin_manager()
@@ -282,6 +282,34 @@ async def test_trigger_flow_stream_and_result_events_include_origin_chunk():
         Agently.event_center.unregister_hook(hook_name)
 
 
+@pytest.mark.asyncio
+async def test_trigger_flow_skips_runtime_payloads_nobody_observes(monkeypatch):
+    from agently.core.orchestration.TriggerFlow.Execution import TriggerFlowExecution
+    from agently.core.orchestration.TriggerFlow.Signal import TriggerFlowSignal
+
+    if Agently.event_center.is_observed("triggerflow.signal", "DEBUG") or Agently.event_center.is_observed(
+        "chunk.completed"
+    ):
+        pytest.skip("runtime events are observed by hooks registered outside this test")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("built a runtime event payload nobody observes")
+
+    monkeypatch.setattr(TriggerFlowSignal, "to_debug_dict", fail)
+    monkeypatch.setattr(TriggerFlowExecution, "_serialize_runtime_value", fail)
+
+    flow = TriggerFlow(name="unobserved-flow")
+
+    async def emit_and_complete(data: TriggerFlowRuntimeData):
+        await data.async_put({"stage": "working"})
+        data.set_result({"answer": data.value})
+
+    flow.to(emit_and_complete).end()
+
+    result = await flow.async_start("done")
+    assert _compat_result(result) == {"answer": "done"}
+
+
 def test_trigger_flow_mermaid_shows_external_signal_and_declared_emit():
     flow = TriggerFlow(name="mermaid-signals")
 
@@ -439,6 +439,37 @@ def test_trigger_flow_signal_net_load_marks_nonterminal_attempts_interrupted():
     assert restored_state["signal_attempts"][0]["status"] == "interrupted"
 
 
+@pytest.mark.asyncio
+async def test_trigger_flow_signal_net_keeps_a_bounded_terminal_attempt_window():
+    flow = TriggerFlow(name="signal-net-attempt-retention")
+    seen: list[int] = []
+
+    async def record(data: TriggerFlowRuntimeData):
+        seen.append(data.value)
+
+    flow.when("tick").to(record)
+    execution = flow.create_execution(auto_close=False)
+    execution.set_signal_attempt_retention_policy(keep_terminal=3)
+    for index in range(10):
+        await execution.async_emit("tick", index)
+    signal_net_state = execution.save()["signal_net"]
+
+    assert len(seen) == 10
+    assert len(signal_net_state["signal_attempts"]) == 3
+    assert signal_net_state["accepted_signal_ids"] == []
+    assert signal_net_state["attempt_retention"] == {"keep_terminal": 3}
+    assert set(signal_net_state["evicted_attempt_counts"]) == {"completed"}
+    assert signal_net_state["evicted_attempt_counts"]["completed"] >= 7
+
+    restored_execution = flow.create_execution(auto_close=False)
+    restored_execution.load(execution.save())
+    restored_state = restored_execution.save()["signal_net"]
+
+    assert restored_state["attempt_retention"] == {"keep_terminal": 3}
+    assert restored_state["evicted_attempt_counts"] == signal_net_state["evicted_attempt_counts"]
+    assert len(restored_state["signal_attempts"]) == 3
+
+
 def test_trigger_flow_snapshot_records_definition_fingerprint_and_rejects_mismatch():
     flow = TriggerFlow(name="snapshot-fingerprint")
 
@@ -102,6 +102,71 @@ async def test_for_each_empty_sequence_completes_for_builder_and_loaded_config()
     assert await _run_empty_for_each(restored) == []
 
 
+@pytest.mark.asyncio
+async def test_for_each_pulls_async_iterable_input_within_concurrency():
+    flow = TriggerFlow(name="streaming-for-each")
+    pulled = 0
+    completed = 0
+    active = 0
+    peak = 0
+
+    async def make_items(data: TriggerFlowRuntimeData):
+        async def items():
+            nonlocal pulled
+            for index in range(data.value):
+                pulled += 1
+                # Items are pulled on demand: never more than `concurrency` ahead of finished work.
+                assert pulled - completed <= 3
+                yield index
+
+        return items()
+
+    async def scale(data: TriggerFlowRuntimeData):
+        nonlocal active, completed, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.001 * (data.value % 3))
+        active -= 1
+        completed += 1
+        return data.value * 10
+
+    flow.to(make_items).for_each(concurrency=3).to(scale).end_for_each().end()
+    execution = flow.create_execution(auto_close=False)
+    await execution.async_start(20)
+    snapshot = await execution.async_close(timeout=5)
+
+    assert _compat_result(snapshot) == [index * 10 for index in range(20)]
+    assert pulled == 20
+    assert peak == 3
+    assert execution._system_runtime_data.get("for_each_results", {}, inherit=False) == {}
+
+
+@pytest.mark.asyncio
+async def test_for_each_stream_mode_emits_results_in_completion_order_for_builder_and_loaded_config():
+    async def scale(data: TriggerFlowRuntimeData):
+        await asyncio.sleep(0.01 * (3 - data.value))
+        return data.value * 10
+
+    async def record(data: TriggerFlowRuntimeData):
+        data.set_state("seen", [*data.get_state("seen", []), data.value])
+
+    flow = TriggerFlow(name="stream-for-each")
+    flow.for_each(concurrency=3).to(scale).end_for_each(mode="stream").to(record)
+
+    restored = TriggerFlow()
+    restored.register_chunk_handler(scale)
+    restored.register_chunk_handler(record)
+    restored.load_flow_config(flow.get_flow_config())
+
+    for current in (flow, restored):
+        execution = current.create_execution(auto_close=False)
+        await execution.async_start([1, 2, 3])
+        await execution.async_close(timeout=5)
+
+        assert execution.get_state("seen") == [30, 20, 10]
+        assert execution._system_runtime_data.get("for_each_results", {}, inherit=False) == {}
+
+
 async def _run_match_without_hit(flow: TriggerFlow):
     execution = flow.create_execution(auto_close=False)
     await execution.async_start("actual")
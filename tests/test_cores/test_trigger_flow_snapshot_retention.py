@@ -257,3 +257,65 @@ async def test_trigger_flow_automatic_wait_snapshots_keep_latest_three_and_resto
 
     assert len(history) == 3
     assert set(restored.get_pending_interrupts()) == {"pause-5"}
+
+
+@pytest.mark.asyncio
+async def test_trigger_flow_incremental_snapshots_materialize_full_state_and_keep_their_chain(
+    tmp_path,
+) -> None:
+    store = RecordStore(
+        tmp_path,
+        mode="read_write",
+        snapshot_retention={"keep_last": None},
+    )
+    flow = TriggerFlow(name="snapshot-retention-incremental")
+    execution = flow.create_execution(
+        auto_close=False,
+        record_store=store,
+    )
+    execution.set_incremental_snapshot_policy(full_snapshot_interval=3)
+    execution.set_snapshot_retention_policy(keep_last=2)
+    await execution.async_set_state("payload", {"text": "x" * 4096})
+    await execution.async_set_state("scratch", [1, 2, 3])
+    for index in range(4):
+        await execution.async_set_state("index", index)
+        if index == 2:
+            await execution.async_del_state("scratch")
+        await execution.async_save(step_id=f"state-{index}")
+
+    history = await store.checkpoint_history(execution.run_id)
+    latest = await store.get_data(history[0])
+
+    assert [ref["kind"] for ref in history] == ["snapshot_delta", "snapshot_delta", "snapshot_delta", "snapshot"]
+    assert [path for path, _ in latest["set"] if path[0] == "runtime_data"] == [["runtime_data", "index"]]
+
+    materialized = await store.get_snapshot(execution.run_id)
+    assert materialized is not None
+    expected = execution.save()
+    for key in ("snapshot_id", "created_at"):
+        materialized.pop(key)
+        expected.pop(key)
+
+    assert materialized == expected
+    assert "scratch" not in materialized["runtime_data"]
+
+    await execution.async_set_state("index", 4)
+    await execution.async_save(step_id="state-4")
+    await execution.async_set_state("index", 5)
+    await execution.async_save(step_id="state-5")
+    history = await store.checkpoint_history(execution.run_id)
+
+    assert [ref["kind"] for ref in history] == ["snapshot_delta", "snapshot"]
+
+    restored = flow.create_execution(
+        auto_close=False,
+        record_store=store,
+    )
+    materialized = await store.get_snapshot(execution.run_id)
+    assert materialized is not None
+    restored.load(materialized)
+
+    assert restored.get_state("index") == 5
+    assert restored.get_state("payload") == {"text": "x" * 4096}
+    with pytest.raises(ValueError, match="snapshot delta"):
+        restored.load(await store.get_data(history[0]))
@@ -0,0 +1,52 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Registered as lazy plugin references; neither `import agently` nor creating
+# an agent should pull them in.
+DEFERRED_PLUGIN_PACKAGES = (
+    "agently.builtins.plugins.ExecutionResourceProvider",
+    "agently.builtins.plugins.Blocks",
+    "agently.builtins.plugins.AgentOrchestrator",
+    "agently.builtins.plugins.ActionExecutor",
+    "agently.builtins.plugins.CodeRuntimeAdapter",
+    "agently.builtins.plugins.SkillSourceProvider",
+)
+
+_SCRIPT = """
+import json, sys
+import agently
+imported = sorted(sys.modules)
+agently.Agently.create_agent()
+print(json.dumps({"import": imported, "create_agent": sorted(sys.modules)}))
+"""
+
+
+def _loaded_modules() -> dict[str, list[str]]:
+    # A fresh interpreter, so modules imported by other tests do not count.
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    completed = subprocess.run(
+        [sys.executable, "-c", _SCRIPT],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def test_import_agently_and_create_agent_defer_lazy_plugins():
+    loaded = _loaded_modules()
+
+    for stage, modules in loaded.items():
+        for package in DEFERRED_PLUGIN_PACKAGES:
+            assert not any(
+                module == package or module.startswith(f"{ package }.") for module in modules
+            ), f"{ package } was imported eagerly by { stage }"
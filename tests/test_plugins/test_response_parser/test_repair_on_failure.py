@@ -174,18 +174,53 @@ async def test_instant_async_generator_streams_valid_json_before_done(monkeypatc
 
 
 @pytest.mark.asyncio
-async def test_instant_async_generator_defers_large_json_delta_by_default(monkeypatch):
+async def test_instant_async_generator_streams_large_strict_json_delta_by_default(monkeypatch):
     monkeypatch.setattr(agently.base, "async_emit_runtime", _noop_async_emit_runtime)
 
     parser_module = importlib.import_module("agently.utils.StreamingJSONParser")
 
     def fail_if_called(_value):
-        raise AssertionError("large JSON deltas should not be parsed incrementally by default")
+        raise AssertionError("strict JSON deltas should not re-parse the buffer")
 
     monkeypatch.setattr(parser_module.json5, "loads", fail_if_called)
 
     async def response_generator():
         yield "delta", '{"report": "' + ("x" * 20000)
+        yield "delta", "y" * 20000
+
+    parser = AgentlyResponseParser(
+        agent_name="test-agent",
+        response_id="resp-large-json-delta",
+        prompt=cast(Any, DummyPrompt({"report": None})),
+        response_generator=response_generator(),
+        settings=Settings(),
+    )
+
+    generator = parser.get_async_generator(type="instant")
+    first_event = await asyncio.wait_for(anext(generator), timeout=1)
+    second_event = await asyncio.wait_for(anext(generator), timeout=1)
+
+    assert first_event.path == "report"
+    assert first_event.delta == "x" * 20000
+    assert second_event.path == "report"
+    assert second_event.delta == "y" * 20000
+
+    await generator.aclose()
+
+
+@pytest.mark.asyncio
+async def test_instant_async_generator_defers_large_json5_delta_by_default(monkeypatch):
+    monkeypatch.setattr(agently.base, "async_emit_runtime", _noop_async_emit_runtime)
+
+    parser_module = importlib.import_module("agently.utils.StreamingJSONParser")
+
+    def fail_if_called(_value):
+        raise AssertionError("large JSON5 deltas should not be parsed incrementally by default")
+
+    monkeypatch.setattr(parser_module.json5, "loads", fail_if_called)
+
+    async def response_generator():
+        yield "delta", "{'report': '" + ("x" * 20000)
 
     parser = AgentlyResponseParser(
         agent_name="test-agent",
@@ -217,7 +252,7 @@ async def test_instant_async_generator_defers_large_json_delta_when_setting_is_n
     monkeypatch.setattr(parser_module.json5, "loads", fail_if_called)
 
     async def response_generator():
-        yield "delta", '{"report": "' + ("x" * 20000)
+        yield "delta", "{'report': '" + ("x" * 20000)
 
     settings = Settings()
     settings.set("response.streaming_parse_max_incomplete_chars", None)
@@ -266,11 +301,9 @@ async def test_instant_large_complete_json_keeps_authoritative_trailing_false(
         events.append(event)
     parsed = await parser.async_get_data()
 
-    assert any(
-        event.path == "$status"
-        and event.value["status"] == "streaming_parse_deferred"
-        for event in events
-    )
+    assert not any(event.path == "$status" for event in events)
+    assert "".join(event.delta for event in events if event.path == "payload" and event.delta) == payload
+    assert any(event.path == "is_final" and event.event_type == "done" and event.value is False for event in events)
     assert parsed == {"payload": payload, "is_final": False}
 
 
@@ -325,3 +325,289 @@ async def test_record_store_context_source_enumerates_descriptors_without_intent
     assert source.source_kind == "record_store"
     assert [item.source_ref for item in page.descriptors] == [ref["id"]]
     assert readback.content == "Revenue increased"
+
+
+@pytest.mark.asyncio
+async def test_local_record_store_reuses_wal_connections(tmp_path, monkeypatch) -> None:
+    import sqlite3
+
+    sqlite_module = __import__("agently.core.storage._sqlite", fromlist=["sqlite3"])
+    opened: list[str] = []
+    original_connect = sqlite3.connect
+
+    def counting_connect(*args: Any, **kwargs: Any):
+        opened.append(str(args[0]))
+        return original_connect(*args, **kwargs)
+
+    monkeypatch.setattr(sqlite_module.sqlite3, "connect", counting_connect)
+    store = RecordStore(tmp_path, mode="read_write")
+
+    records = [await store.put(f"fact {index}", collection="evidence") for index in range(20)]
+    for record in records:
+        assert await store.get_data(record) == f"fact {records.index(record)}"
+    assert len(await store.search("fact")) == 20
+    # One writer plus at most the reader pool, not one connection per call.
+    assert len(opened) <= 3
+
+    database = tmp_path / ".agently" / "records" / "records.db"
+    with original_connect(database) as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+@pytest.mark.asyncio
+async def test_local_record_store_group_commit_coalesces_runtime_events(tmp_path) -> None:
+    import asyncio
+
+    store = RecordStore(
+        tmp_path,
+        mode="read_write",
+        db_store_options={"group_commit": {"window": 0.05, "max_batch": 64}},
+    )
+    await store.put("warm up", collection="evidence")
+    before = store.backend.engine_stats()
+
+    results = await asyncio.gather(
+        *(
+            store.append_runtime_event("exec-1", {"event_type": "test.tick", "payload": {"index": index}})
+            for index in range(20)
+        ),
+        store.append_runtime_event("exec-1", {"event_type": "test.conflict"}, expected_sequence=999),
+        return_exceptions=True,
+    )
+
+    failures = [item for item in results if isinstance(item, BaseException)]
+    assert len(failures) == 1 and "sequence conflict" in str(failures[0])
+    events = await store.query_runtime_events("exec-1")
+    assert [event["sequence"] for event in events] == list(range(1, 21))
+    after = store.backend.engine_stats()
+    assert after["writes"] - before["writes"] == 21
+    assert after["transactions"] - before["transactions"] < 21
+    assert after["largest_batch"] > 1
+
+
+@pytest.mark.asyncio
+async def test_sqlite_engine_keeps_writing_after_a_queued_write_is_cancelled(tmp_path) -> None:
+    import asyncio
+    import threading
+
+    from agently.core.storage._sqlite import SQLiteEngine
+
+    engine = SQLiteEngine(tmp_path / "records.db")
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking_write(connection):
+        connection.execute("CREATE TABLE IF NOT EXISTS items (value TEXT)")
+        started.set()
+        release.wait(5)
+        return "first"
+
+    first = asyncio.create_task(engine.write(blocking_write))
+    assert await asyncio.to_thread(started.wait, 5)
+    queued = asyncio.create_task(engine.write(lambda connection: connection.execute("INSERT INTO items VALUES ('x')")))
+    await asyncio.sleep(0)
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    release.set()
+
+    assert await first == "first"
+    count = await asyncio.wait_for(
+        engine.write(lambda connection: connection.execute("SELECT COUNT(*) FROM items").fetchone()[0]),
+        timeout=5,
+    )
+    assert count == 0
+    engine.close()
+
+
+@pytest.mark.asyncio
+async def test_local_record_store_search_pushes_filters_into_sql(tmp_path) -> None:
+    store = RecordStore(tmp_path, mode="read_write")
+    backend = store.backend
+    expected_ids: list[str] = []
+    for index in range(12):
+        ref = await store.put(
+            f"note {index}",
+            collection="evidence" if index % 2 else "notes",
+            scope={"execution_id": f"exec-{index % 3}", "flag": index % 4 == 0, "nested": {"k": 1}},
+            meta={"rank": index},
+        )
+        if index % 2 and index % 3 == 1:
+            expected_ids.append(ref["id"])
+
+    hits = await store.search(filters={"scope.execution_id": "exec-1", "collection": "evidence"})
+    assert [hit["id"] for hit in hits] == list(reversed(expected_ids))
+    assert [hit["meta"]["rank"] for hit in await store.search(filters={"meta.rank": [3, 5, 99]})] == [5, 3]
+    assert len(await store.search(filters={"scope.flag": True})) == 3
+    assert await store.search(filters={"scope.missing": "x"}) == []
+    assert len(await store.search(filters={"scope.missing": None})) == 12
+    # A JSON object is never equal to its text; dict values are filtered in Python.
+    assert await store.search(filters={"scope.nested": '{"k":1}'}) == []
+    assert len(await store.search(filters={"scope.nested": {"k": 1}})) == 12
+
+    def plan(connection: Any) -> str:
+        rows = connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM records WHERE json_extract(records.scope, '$.execution_id') = ?",
+            ("exec-1",),
+        ).fetchall()
+        return " ".join(str(row[-1]) for row in rows)
+
+    assert "records_scope_execution_id" in await backend._read(plan)
+
+
+@pytest.mark.asyncio
+async def test_local_record_store_search_keeps_substring_semantics_by_default(tmp_path) -> None:
+    store = RecordStore(tmp_path, mode="read_write")
+    await store.put("hello world 你好", collection="evidence", indexed=True)
+    await store.put("yellow world 你好世界", collection="evidence", indexed=True)
+    await store.put("世界 is not indexed", collection="evidence")
+    await store.put("unrelated", collection="evidence", indexed=True)
+
+    # Word tokens alone would miss substrings inside words and unsegmented CJK text.
+    for match in ("auto", "fulltext"):
+        assert len(await store.search("ell", match=match)) == 2
+        assert len(await store.search("世界", match=match)) == 2
+        assert len(await store.search("world 你好", match=match)) == 2
+        assert len(await store.search("World", match=match)) == 2
+    assert len(await store.search("你好")) == len(await store.grep("你好")) == 2
+
+
+@pytest.mark.asyncio
+async def test_local_record_store_search_ranks_full_text_hits_and_pages(tmp_path) -> None:
+    store = RecordStore(tmp_path, mode="read_write")
+    weak = await store.put("refund requested once", collection="evidence", indexed=True)
+    strong = await store.put("refund refund refund", collection="evidence", indexed=True)
+    plain = await store.put("Refunds are not indexed", collection="evidence")
+    prefund = await store.put("prefund is a token, not the word", collection="evidence", indexed=True)
+    await store.put("unrelated", collection="evidence")
+
+    hits = await store.search("refund", match="fulltext")
+    assert [hit["id"] for hit in hits] == [strong["id"], weak["id"], prefund["id"], plain["id"]]
+    assert [hit["id"] for hit in await store.search("refund")] == [
+        prefund["id"],
+        plain["id"],
+        strong["id"],
+        weak["id"],
+    ]
+    assert len(await store.grep("refund")) == 4
+    assert await store.search('refund" OR "x', match="fulltext") == []
+    with pytest.raises(ValueError, match="match"):
+        await store.search("refund", match="regex")
+
+    first = await store.search_page("refund", limit=2, match="fulltext")
+    assert [hit["id"] for hit in first["records"]] == [strong["id"], weak["id"]]
+    second = await store.search_page("refund", limit=2, cursor=first["next_cursor"], match="fulltext")
+    assert [hit["id"] for hit in second["records"]] == [prefund["id"], plain["id"]]
+    assert second["next_cursor"] is None
+
+    pages: list[str] = []
+    cursor = None
+    while True:
+        page = await store.search_page(limit=2, cursor=cursor)
+        pages.extend(hit["id"] for hit in page["records"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert pages == [hit["id"] for hit in await store.search()]
+    with pytest.raises(ValueError, match="cursor"):
+        await store.search_page("refund", limit=2, cursor=str(pages[0]))
+
+
+@pytest.mark.asyncio
+async def test_local_record_store_reuses_cached_embeddings_across_instances(tmp_path) -> None:
+    from agently.core.storage import LocalRecordStore, SQLiteVectorStoreProvider
+
+    embedded: list[str] = []
+
+    class Embedder:
+        name = "fixture"
+        model = "v1"
+
+        async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+            embedded.extend(texts)
+            return [[float(len(text)), 1.0] for text in texts]
+
+    def open_store() -> LocalRecordStore:
+        store = LocalRecordStore(tmp_path / "records")
+        vectors = SQLiteVectorStoreProvider(tmp_path / "vectors.db")
+        store.configure_component_loaders(
+            embedding_provider_loader=Embedder,
+            vector_store_provider_loader=lambda: (vectors, "sqlite", None),
+        )
+        return store
+
+    first = open_store()
+    await first.put("same fact", collection="evidence", vector=True)
+    await first.put("same fact", collection="evidence", vector=True)
+    second = open_store()
+    await second.put("same fact", collection="evidence", vector=True)
+    await second.put("new fact", collection="evidence", vector=True)
+
+    assert embedded == ["same fact", "new fact"]
+    assert second.embedding_cache.stats() == {"hits": 1, "misses": 1, "writes": 1}
+
+
+@pytest.mark.asyncio
+async def test_agent_embedding_cache_is_scoped_by_the_agent_model(tmp_path) -> None:
+    from agently.core.storage import AgentEmbeddingProvider, SQLiteEmbeddingCache
+    from agently.core.storage.Stores import embed_texts_cached, embedding_identity
+    from agently.utils import Settings
+
+    class EmbeddingAgent:
+        def __init__(self, dimension: float):
+            self.settings = Settings()
+            self.dimension = dimension
+
+        def input(self, texts: list[str]):
+            agent = self
+
+            class Execution:
+                async def async_start(self):
+                    return [[agent.dimension] for _ in texts]
+
+            return Execution()
+
+    cache = SQLiteEmbeddingCache(tmp_path / "embeddings.db")
+    unnamed = AgentEmbeddingProvider(EmbeddingAgent(1.0))
+    assert embedding_identity(unnamed) == "agent:default"
+    await embed_texts_cached(unnamed, ["fact"], cache=cache)
+    assert cache.stats()["writes"] == 0
+
+    agent = EmbeddingAgent(1.0)
+    agent.settings.set("plugins.ModelRequester.activate", "OpenAICompatible")
+    agent.settings.set("plugins.ModelRequester.OpenAICompatible", {"model": "embed-a", "base_url": "http://a/v1"})
+    provider = AgentEmbeddingProvider(agent)
+    assert embedding_identity(provider) == "agent:OpenAICompatible/embed-a@http://a/v1"
+    assert (await embed_texts_cached(provider, ["fact"], cache=cache))[0] == [[1.0]]
+
+    # A model change must not serve the previous model's vectors.
+    agent.settings.set("plugins.ModelRequester.OpenAICompatible.model", "embed-b")
+    agent.dimension = 2.0
+    vectors, stats = await embed_texts_cached(provider, ["fact"], cache=cache)
+    assert (vectors, stats["hits"]) == ([[2.0]], 0)
+
+
+@pytest.mark.asyncio
+async def test_record_identity_catalog_leases_blocks_and_batches_manifests(tmp_path) -> None:
+    import json
+
+    from agently.core.storage.Identity import RecordIdentityCatalog
+
+    def open_catalog() -> RecordIdentityCatalog:
+        return RecordIdentityCatalog(tmp_path, record_store_id="store", id_block_size=4, manifest_batch_size=3)
+
+    catalog = open_catalog()
+    state_path = catalog.state_path
+    identities = [await catalog.allocate("record") for _ in range(5)]
+
+    assert [identity.sequence for identity in identities] == [1, 2, 3, 4, 5]
+    assert json.loads(state_path.read_text(encoding="utf-8"))["high_water"] == "8"
+    assert len(list(catalog.root.glob("objects/*/*/*.json"))) == 3
+    assert (await catalog.resolve(identities[4].entity_id))["kind"] == "record"
+    assert len(list(catalog.root.glob("objects/*/*/*.json"))) == 5
+
+    pending = await catalog.allocate("link")
+    assert await catalog.discard([pending.entity_id]) == (pending.entity_id,)
+
+    # Another instance (or a restart after a crash) never reuses a leased block.
+    assert (await open_catalog().allocate("record")).sequence == 9
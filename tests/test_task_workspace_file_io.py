@@ -99,3 +99,138 @@ def test_agent_execution_inherits_task_workspace_file_io_extensions(
 
     assert "synthetic_export" in execution.task_workspace.list_file_io_handlers()
     assert execution.task_workspace.execution_id == execution.id
+
+
+@pytest.mark.asyncio
+async def test_task_workspace_text_reads_page_by_range_and_reuse_cached_digest(
+    tmp_path: Path,
+) -> None:
+    import hashlib
+    import os
+
+    from agently.core.TaskWorkspace import FileIO
+
+    text = "".join(f"line {index}: héllo wörld — ✓\n" for index in range(400))
+    raw = b"\xef\xbb\xbf" + text.encode("utf-8")
+    target = tmp_path / "large.log"
+    target.write_bytes(raw)
+    # Age the file past the racy window so its fingerprint may be reused.
+    os.utime(target, ns=(1_000_000_000_000_000_000, 1_000_000_000_000_000_000))
+    workspace = TaskWorkspace(tmp_path, mode="read_write")
+    scans_before = FileIO._FILE_INSPECTION_CACHE.scans
+
+    encoded = text.encode("utf-8")
+    for offset in range(0, len(encoded) + 700, 997):
+        page = await workspace.read_file("large.log", max_bytes=1000, offset=offset)
+        segment = encoded[offset : offset + 1000]
+        assert page.content == segment.decode("utf-8", errors="ignore")
+        assert page.truncated is (len(encoded) > offset + 1000)
+        assert page.total_bytes == len(raw)
+        assert page.encoding == "utf-8-sig"
+        assert page.sha256 == hashlib.sha256(raw).hexdigest()
+
+    assert FileIO._FILE_INSPECTION_CACHE.scans == scans_before + 1
+
+    target.write_bytes(b"\xff\xfe not utf-8")
+    os.utime(target, ns=(1_000_000_000_000_000_000, 1_000_000_000_000_000_001))
+    page = await workspace.read_file("large.log")
+    assert page.readable is False
+    assert page.sha256 == hashlib.sha256(b"\xff\xfe not utf-8").hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_task_workspace_pdf_extraction_is_cached_and_page_addressable(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import sys
+    import types
+
+    page_texts = [f"page {index} " + "ü" * 300 for index in range(1, 6)]
+    page_texts.insert(2, "   ")
+    extractions: list[int] = []
+
+    class _Page:
+        def __init__(self, index: int):
+            self.index = index
+
+        def extract_text(self):
+            extractions.append(self.index)
+            return page_texts[self.index]
+
+    class _PdfReader:
+        is_encrypted = False
+
+        def __init__(self, path: str):
+            self.pages = [_Page(index) for index in range(len(page_texts))]
+
+    monkeypatch.setitem(sys.modules, "pypdf", types.SimpleNamespace(PdfReader=_PdfReader))
+    (tmp_path / "report.pdf").write_bytes(b"%PDF-1.7\nsynthetic")
+    workspace = TaskWorkspace(tmp_path, mode="read_write")
+
+    joined = "\n\n".join(text for text in page_texts if text.strip()).encode("utf-8")
+    for offset in range(0, len(joined), 500):
+        page = await workspace.read_file("report.pdf", max_bytes=500, offset=offset)
+        assert page.content == joined[offset : offset + 500].decode("utf-8", errors="ignore")
+        assert page.truncated is (len(joined) > offset + 500)
+        assert page.extraction_method == "pypdf.extract_text"
+        assert page.source_units
+    first = await workspace.read_file("report.pdf", max_bytes=10)
+    assert first.source_units == ("page 1",)
+    assert len(extractions) == len(page_texts)
+    assert list((tmp_path / ".agently" / "extractions").rglob("*.pypdf.extract_text.json"))
+
+    # A fresh workspace seeks into the persisted text without parsing again.
+    monkeypatch.delitem(sys.modules, "pypdf")
+    reopened = TaskWorkspace(tmp_path, mode="read_only")
+    tail = await reopened.read_file("report.pdf", max_bytes=400, offset=len(joined) - 400)
+    assert tail.content == joined[-400:].decode("utf-8", errors="ignore")
+    assert tail.source_units == ("page 6",)
+    assert len(extractions) == len(page_texts)
+
+
+@pytest.mark.asyncio
+async def test_read_only_task_workspace_does_not_write_extractions(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import sys
+    import types
+
+    class _Page:
+        def extract_text(self):
+            return "read only page"
+
+    class _PdfReader:
+        is_encrypted = False
+
+        def __init__(self, path: str):
+            self.pages = [_Page()]
+
+    monkeypatch.setitem(sys.modules, "pypdf", types.SimpleNamespace(PdfReader=_PdfReader))
+    (tmp_path / "report.pdf").write_bytes(b"%PDF-1.7\nsynthetic")
+    workspace = TaskWorkspace(tmp_path, mode="read_only")
+
+    page = await workspace.read_file("report.pdf")
+
+    assert page.content == "read only page"
+    assert not (tmp_path / ".agently" / "extractions").exists()
+
+
+def test_task_workspace_extraction_cache_evicts_least_recently_used_texts(tmp_path: Path) -> None:
+    import os
+
+    from agently.core.TaskWorkspace.ExtractionCache import _TaskWorkspaceExtractionCache
+
+    cache = _TaskWorkspaceExtractionCache(tmp_path, max_memory_documents=1, max_disk_bytes=350)
+    for index, sha256 in enumerate(("aa01", "bb02", "cc03")):
+        cache._build(sha256=sha256, method="text", separator="", units=[("unit", str(index) * 100)])
+        os.utime(tmp_path / sha256[:2] / f"{sha256}.text.txt", (index, index))
+    # Reading a stored document makes it the most recently used one.
+    assert cache._load(sha256="aa01", method="text") is not None
+
+    cache._build(sha256="dd04", method="text", separator="", units=[("unit", "3" * 100)])
+
+    stored = sorted(path.name for path in tmp_path.rglob("*.txt"))
+    assert stored == ["aa01.text.txt", "cc03.text.txt", "dd04.text.txt"]
+    assert not list(tmp_path.rglob("bb02.text.json"))
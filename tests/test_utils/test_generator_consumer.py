@@ -146,3 +146,96 @@ async def test_generator_consumer_reuse_after_done():
 
     assert collected == [("x", 1), ("x", 2)]
     assert replayed == collected
+
+
+@pytest.mark.asyncio
+async def test_bounded_block_policy_backpressures_producer():
+    produced = []
+
+    async def original_gen():
+        for i in range(20):
+            produced.append(i)
+            yield "delta", str(i)
+
+    consumer = GeneratorConsumer(original_gen(), max_queue_size=2, overflow="block")
+    received = []
+    max_lag = 0
+    async for value in consumer.get_async_generator():
+        received.append(value)
+        max_lag = max(max_lag, len(produced) - len(received))
+        await asyncio.sleep(0)
+
+    assert received == [("delta", str(i)) for i in range(20)]
+    assert max_lag <= 3
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_and_coalesce_policies_keep_structural_events():
+    def original_gen():
+        for i in range(50):
+            yield "delta", str(i % 10)
+        yield "done", "end"
+
+    dropping = GeneratorConsumer(original_gen(), max_queue_size=4, overflow="drop_oldest")
+    stream = dropping.get_async_generator()
+    first = await stream.__anext__()
+    await asyncio.sleep(0.05)
+    dropped_stats = dropping.get_stats()
+    rest = [value async for value in stream]
+
+    assert first[0] == "delta"
+    assert rest[-1] == ("done", "end")
+    assert len(rest) < 50
+    assert dropped_stats["dropped"] > 0
+
+    coalescing = GeneratorConsumer(original_gen(), max_queue_size=4, overflow="coalesce")
+    stream = coalescing.get_async_generator()
+    first = await stream.__anext__()
+    await asyncio.sleep(0.05)
+    rest = [value async for value in stream]
+
+    text = first[1] + "".join(data for event, data in rest if event == "delta")
+    assert text == "0123456789" * 5
+    assert rest[-1] == ("done", "end")
+    assert len(rest) < 50
+
+
+@pytest.mark.asyncio
+async def test_history_policies_ring_buffer_and_none():
+    async def original_gen():
+        for i in range(10):
+            yield "value", i
+
+    ring = GeneratorConsumer(original_gen(), history=3)
+    assert await ring.get_result() == [("value", 7), ("value", 8), ("value", 9)]
+    assert [value async for value in ring.get_async_generator()] == [("value", 7), ("value", 8), ("value", 9)]
+
+    released = GeneratorConsumer(original_gen(), history="none", expected_listeners=2)
+    first = released.get_async_generator()
+    first_values = [await first.__anext__(), await first.__anext__()]
+    second_values = [value async for value in released.get_async_generator()]
+    first_values += [value async for value in first]
+
+    assert first_values == [("value", i) for i in range(10)]
+    assert second_values == [("value", i) for i in range(10)]
+    assert await released.get_result() == []
+    assert [value async for value in released.get_async_generator()] == []
+
+
+def test_sync_consumers_share_one_bridge_thread():
+    import threading
+
+    async def original_gen():
+        for i in range(5):
+            await asyncio.sleep(0.01)
+            yield "number", i
+
+    threads_before = threading.active_count()
+    consumers = [GeneratorConsumer(original_gen()) for _ in range(6)]
+    generators = [consumer.get_generator() for consumer in consumers]
+    first_values = [next(generator) for generator in generators]
+
+    assert first_values == [("number", 0)] * 6
+    assert threading.active_count() - threads_before <= 1
+    for generator in generators:
+        assert list(generator) == [("number", i) for i in range(1, 5)]
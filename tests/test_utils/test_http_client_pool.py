@@ -0,0 +1,181 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from agently import Agently
+from agently.builtins.plugins.ModelRequester.OpenAICompatible import OpenAICompatible
+from agently.core.model.Prompt import Prompt
+from agently.utils import Settings
+from agently.utils.HTTPClientPool import HTTPClientPool, HTTPClientPoolConfig
+
+
+_CHAT_BODY = json.dumps(
+    {
+        "id": "chatcmpl-1",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": "pong"}, "finish_reason": "stop"}],
+    }
+).encode()
+
+
+async def _start_keepalive_server():
+    accepted = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        accepted.append(writer)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.decode().split("\r\n"):
+                    if line.lower().startswith("content-length:"):
+                        length = int(line.split(":", 1)[1])
+                if length:
+                    await reader.readexactly(length)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(_CHAT_BODY)}\r\n\r\n".encode()
+                    + _CHAT_BODY
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}", accepted
+
+
+def test_build_key_groups_by_origin_and_timeout_profile():
+    config = HTTPClientPoolConfig()
+    key_a = HTTPClientPool.build_key(
+        "https://api.example.com/v1/chat/completions",
+        config,
+        {"timeout": httpx.Timeout(30.0), "trust_env": False},
+    )
+    key_b = HTTPClientPool.build_key(
+        "https://api.example.com/v1/embeddings",
+        config,
+        {"timeout": httpx.Timeout(30.0), "trust_env": False},
+    )
+    key_c = HTTPClientPool.build_key(
+        "https://api.example.com/v1/chat/completions",
+        config,
+        {"timeout": httpx.Timeout(30.0, read=None), "trust_env": False},
+    )
+    assert key_a == key_b
+    assert key_a != key_c
+    assert HTTPClientPool.build_key("https://api.example.com", config, {"transport": object()}) is None
+
+
+def test_config_from_settings_accepts_bool_and_mapping():
+    assert HTTPClientPoolConfig.from_settings(False).enabled is False
+    config = HTTPClientPoolConfig.from_settings({"max_connections": 8, "keepalive_expiry": 0})
+    assert config.enabled is True
+    assert config.max_connections == 8
+    assert config.keepalive_expiry == 0.0
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_client_and_keepalive_connection():
+    server, base_url, accepted = await _start_keepalive_server()
+    pool = HTTPClientPool()
+    try:
+        for _ in range(5):
+            async with pool.lease(f"{base_url}/v1/chat/completions", trust_env=False) as client:
+                response = await client.post(f"{base_url}/v1/chat/completions", json={})
+                assert response.status_code == 200
+        stats = pool.stats()
+        assert stats["clients_opened"] == 1
+        assert stats["hits"] == 4
+        assert stats["connections_opened"] == 1
+        assert stats["waiters"] == 0
+        assert len(accepted) == 1
+    finally:
+        await pool.aclose()
+        server.close()
+        await server.wait_closed()
+    assert pool.stats()["active_clients"] == 0
+    assert pool.stats()["clients_closed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_reports_waiters_when_connection_limit_is_reached():
+    release = asyncio.Event()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                await reader.readuntil(b"\r\n\r\n")
+                await release.wait()
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    base_url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+    pool = HTTPClientPool()
+    config = HTTPClientPoolConfig(max_connections=1)
+
+    async def call():
+        async with pool.lease(base_url, config, trust_env=False) as client:
+            return (await client.get(f"{base_url}/")).status_code
+
+    try:
+        tasks = [asyncio.create_task(call()) for _ in range(3)]
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if pool.stats()["waiters"] == 2:
+                break
+        assert pool.stats()["waiters"] == 2
+        release.set()
+        assert await asyncio.gather(*tasks) == [200, 200, 200]
+        assert pool.stats()["connections_opened"] == 1
+    finally:
+        await pool.aclose()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_openai_compatible_requests_share_pooled_client():
+    from agently.base import http_client_pool
+
+    server, base_url, accepted = await _start_keepalive_server()
+    try:
+        settings = Settings(parent=Agently.settings)
+        settings.update(
+            {
+                "plugins": {
+                    "ModelRequester": {
+                        "OpenAICompatible": {
+                            "base_url": f"{base_url}/v1",
+                            "model": "pool-test",
+                            "stream": False,
+                            "request_retry": {"max_attempts": 1},
+                        }
+                    }
+                }
+            }
+        )
+        before = http_client_pool.stats()
+        for _ in range(3):
+            prompt = Prompt(plugin_manager=Agently.plugin_manager, parent_settings=settings)
+            prompt.set("input", "ping")
+            plugin = OpenAICompatible(prompt, settings)
+            events = [event async for event, _ in plugin.request_model(plugin.generate_request_data())]
+            assert "error" not in events
+        after = http_client_pool.stats()
+        assert after["clients_opened"] - before["clients_opened"] == 1
+        assert after["hits"] - before["hits"] == 2
+        assert len(accepted) == 1
+    finally:
+        await http_client_pool.aclose()
+        server.close()
+        await server.wait_closed()
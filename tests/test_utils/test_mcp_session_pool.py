@@ -0,0 +1,208 @@
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from agently.utils.MCPSessionPool import MCPSessionPool, MCPSessionPoolConfig
+
+
+CAL_MCP_SERVER = Path(__file__).resolve().parents[1] / "test_cores" / "cal_mcp_server.py"
+
+
+class _FakeClient:
+    instances: list["_FakeClient"] = []
+
+    def __init__(self, transport: Any):
+        self.transport = transport
+        self.connected = False
+        self.healthy = True
+        self.pings = 0
+        self.closed = False
+        self.active = 0
+        self.peak_active = 0
+        _FakeClient.instances.append(self)
+
+    async def __aenter__(self):
+        await asyncio.sleep(0)
+        self.connected = True
+        return self
+
+    async def __aexit__(self, *args: Any):
+        self.connected = False
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def ping(self) -> bool:
+        self.pings += 1
+        if not self.healthy:
+            raise ConnectionError("server went away")
+        return True
+
+    async def close(self):
+        self.connected = False
+        self.closed = True
+
+    async def call(self):
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+
+
+def test_build_key_and_config_from_settings():
+    assert MCPSessionPool.build_key({"url": "http://a", "headers": {"b": "1", "a": "2"}}) == MCPSessionPool.build_key(
+        {"headers": {"a": "2", "b": "1"}, "url": "http://a"}
+    )
+    assert MCPSessionPool.build_key("server.py") != MCPSessionPool.build_key("other.py")
+    assert MCPSessionPool.build_key(object()) != MCPSessionPool.build_key(object())
+
+    assert MCPSessionPoolConfig.from_settings(False).enabled is False
+    config = MCPSessionPoolConfig.from_settings({"max_concurrency": 2, "idle_timeout": None, "health_check_interval": 0})
+    assert (config.max_concurrency, config.idle_timeout, config.health_check_interval) == (2, None, 0.0)
+    assert MCPSessionPoolConfig.from_settings({"max_concurrency": 0}).max_concurrency == 8
+
+
+def test_lazy_mcp_executor_registration_applies_session_pool_defaults():
+    from agently import Agently
+    from agently.builtins.plugins.ActionExecutor.MCPActionExecutor import MCPActionExecutor
+
+    session_pool = Agently.settings.get("plugins.ActionExecutor.MCPActionExecutor.session_pool")
+    assert session_pool == MCPActionExecutor.DEFAULT_SETTINGS["session_pool"]
+    assert MCPSessionPoolConfig.from_settings(session_pool) == MCPSessionPoolConfig()
+
+
+@pytest.mark.asyncio
+async def test_pool_shares_session_up_to_concurrency_limit_and_reconnects_failed_sessions():
+    _FakeClient.instances.clear()
+    pool = MCPSessionPool()
+    config = MCPSessionPoolConfig(max_concurrency=2, health_check_interval=None)
+
+    async def call(client: _FakeClient):
+        await client.call()
+        return client
+
+    await asyncio.gather(*(pool.call({"url": "http://mcp.local"}, _FakeClient, call, config) for _ in range(6)))
+
+    assert len(_FakeClient.instances) == 1
+    assert _FakeClient.instances[0].peak_active == 2
+    stats = pool.stats()
+    assert stats["sessions_opened"] == 1
+    assert stats["hits"] == 5
+    assert stats["sessions"][0]["calls"] == 6
+
+    checked = MCPSessionPoolConfig(health_check_interval=0)
+    _FakeClient.instances[0].healthy = False
+    client = await pool.call({"url": "http://mcp.local"}, _FakeClient, call, checked)
+    assert client is _FakeClient.instances[1]
+    assert _FakeClient.instances[0].closed is True
+    assert pool.stats()["health_check_failures"] == 1
+
+    async def broken_call(client: _FakeClient):
+        raise RuntimeError("transport broke")
+
+    with pytest.raises(RuntimeError):
+        await pool.call({"url": "http://mcp.local"}, _FakeClient, broken_call, config)
+    client = await pool.call({"url": "http://mcp.local"}, _FakeClient, call, config)
+    assert client is _FakeClient.instances[2]
+    assert pool.stats()["sessions"][0]["reconnects"] == 2
+
+    await pool.aclose()
+    assert _FakeClient.instances[2].closed is True
+    assert pool.stats()["active_sessions"] == 0
+    pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_evicts_idle_sessions_in_the_background():
+    _FakeClient.instances.clear()
+    pool = MCPSessionPool()
+    config = MCPSessionPoolConfig(idle_timeout=0.01)
+
+    async def noop(client: _FakeClient):
+        return None
+
+    await pool.call("idle.py", _FakeClient, noop, config)
+    await asyncio.sleep(0.05)
+
+    assert _FakeClient.instances[0].closed is True
+    assert pool.stats()["evictions"] == 1
+    assert pool.stats()["active_sessions"] == 0
+    pool.close()
+
+
+def test_mcp_executor_reuses_stdio_session_across_loops_until_resource_release():
+    from agently.base import mcp_session_pool
+    from agently.builtins.plugins.ActionExecutor.MCPActionExecutor import MCPActionExecutor
+    from agently.builtins.plugins.ExecutionResourceProvider.MCPExecutionResourceProvider import (
+        MCPExecutionResourceProvider,
+    )
+
+    transport = str(CAL_MCP_SERVER)
+    executor = MCPActionExecutor(action_id="add", transport=transport)
+    opened_before = mcp_session_pool.stats()["sessions_opened"]
+    try:
+        # Each execution runs on its own short-lived loop, like sync bridge calls.
+        for index in range(3):
+            result = asyncio.run(
+                executor.execute(
+                    spec={"action_id": "add"},
+                    action_call={"action_input": {"first_number": index, "second_number": 1}},
+                    policy={},
+                    settings=None,
+                )
+            )
+            assert result == {"result": index + 1}
+        assert mcp_session_pool.stats()["sessions_opened"] == opened_before + 1
+    finally:
+        provider = MCPExecutionResourceProvider()
+        asyncio.run(provider.async_release({"handle_id": "mcp:test", "resource": transport}))
+
+    key = MCPSessionPool.build_key(transport)
+    assert all(session["key"] != key for session in mcp_session_pool.stats()["sessions"])
+
+
+@pytest.mark.asyncio
+async def test_shared_session_stays_open_until_the_last_execution_releases_it():
+    from agently.base import mcp_session_pool
+    from agently.builtins.plugins.ExecutionResourceProvider.MCPExecutionResourceProvider import (
+        MCPExecutionResourceProvider,
+    )
+
+    _FakeClient.instances.clear()
+    transport = {"url": "http://shared.mcp.local"}
+    provider = MCPExecutionResourceProvider()
+    requirement: Any = {"config": {"transport": transport}}
+    first = await provider.async_ensure(requirement=requirement, policy={})
+    second = await provider.async_ensure(requirement=requirement, policy={})
+    started = asyncio.Event()
+    finish = asyncio.Event()
+    caller_loop = asyncio.get_running_loop()
+
+    async def slow_call(client: _FakeClient):
+        caller_loop.call_soon_threadsafe(started.set)
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(finish.wait(), caller_loop))
+        return client.is_connected()
+
+    in_flight = asyncio.create_task(mcp_session_pool.call(transport, _FakeClient, slow_call))
+    await started.wait()
+    # The second execution finishing leaves the first one's call connected.
+    await provider.async_release(second)
+    assert _FakeClient.instances[0].closed is False
+    finish.set()
+    assert await in_flight is True
+    assert _FakeClient.instances[0].closed is False
+
+    # The last holder releasing during a call closes the session once the call ends.
+    started.clear()
+    finish.clear()
+    in_flight = asyncio.create_task(mcp_session_pool.call(transport, _FakeClient, slow_call))
+    await started.wait()
+    await provider.async_release(first)
+    assert _FakeClient.instances[0].closed is False
+    finish.set()
+    assert await in_flight is True
+    assert _FakeClient.instances[0].closed is True
+    key = MCPSessionPool.build_key(transport)
+    assert all(session["key"] != key for session in mcp_session_pool.stats()["sessions"])
@@ -0,0 +1,278 @@
+import asyncio
+import json
+import time
+from typing import Any
+
+import httpx
+import pytest
+
+from agently.utils import Settings, SettingsNamespace
+from agently.utils.ModelPool import (
+    api_key_pool_stats,
+    record_api_key_outcome,
+    release_selected_api_key,
+    reset_api_key_pool_stats,
+    resolve_model_pool_settings,
+    select_hedge_api_key,
+)
+
+_CHAT_BODY = json.dumps(
+    {
+        "id": "chatcmpl-1",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": "pong"}, "finish_reason": "stop"}],
+    }
+).encode()
+
+
+@pytest.fixture(autouse=True)
+def _reset_key_health():
+    reset_api_key_pool_stats()
+    yield
+    reset_api_key_pool_stats()
+
+
+def _pool_settings(
+    keys: list[dict[str, Any]],
+    parent: Settings | None = None,
+    provider: str = "OpenAICompatible",
+    **selection: Any,
+) -> Settings:
+    settings = Settings(parent=parent)
+    settings.set("plugins.ModelRequester.activate", provider)
+    settings.set("model_pool", {"chat": "chat-profile"})
+    settings.set(
+        "model_profiles",
+        {"chat-profile": {"provider": provider, "model": "routing-test", "api_key_pool": "routing"}},
+    )
+    settings.set("api_key_pools", {"routing": {"selection": selection, "keys": keys}})
+    return settings
+
+
+def _select(settings: Settings) -> tuple[str, SettingsNamespace]:
+    request_settings = Settings(parent=settings)
+    resolve_model_pool_settings("chat", request_settings)
+    plugin_settings = SettingsNamespace(request_settings, "plugins.ModelRequester.OpenAICompatible")
+    runtime = plugin_settings.get("_api_key_pool_runtime")
+    assert isinstance(runtime, dict)
+    return str(runtime["selected_key_id"]), plugin_settings
+
+
+def test_least_outstanding_spreads_in_flight_requests_and_releases_them():
+    settings = _pool_settings(
+        [{"id": "a", "value": "key-a"}, {"id": "b", "value": "key-b"}],
+        strategy="least_outstanding",
+    )
+    held = [_select(settings) for _ in range(4)]
+
+    assert [key_id for key_id, _ in held] == ["a", "b", "a", "b"]
+    assert api_key_pool_stats("routing")["a"]["in_flight"] == 2
+    for _, plugin_settings in held:
+        release_selected_api_key(plugin_settings)
+        release_selected_api_key(plugin_settings)
+    assert {key: stats["in_flight"] for key, stats in api_key_pool_stats("routing").items()} == {"a": 0, "b": 0}
+
+
+def test_ejected_key_recovers_through_a_single_half_open_probe():
+    settings = _pool_settings(
+        [{"id": "a", "value": "key-a"}, {"id": "b", "value": "key-b"}],
+        strategy="least_outstanding",
+        eject_after_failures=2,
+        eject_seconds=0.05,
+    )
+    for outcome in (503, 200, TimeoutError("read timed out")):
+        key_id, plugin_settings = _select(settings)
+        assert key_id == ("b" if outcome == 200 else "a")
+        if isinstance(outcome, int):
+            record_api_key_outcome(plugin_settings, status_code=outcome, latency=0.01)
+        else:
+            record_api_key_outcome(plugin_settings, error=outcome)
+        release_selected_api_key(plugin_settings)
+    assert api_key_pool_stats("routing")["a"]["state"] == "ejected"
+    assert {_select(settings)[0] for _ in range(3)} == {"b"}
+
+    time.sleep(0.06)
+    probe_key, probe_settings = _select(settings)
+    assert probe_key == "a" and api_key_pool_stats("routing")["a"]["state"] == "half_open"
+    # Only one probe at a time; other requests keep going to the healthy key.
+    assert _select(settings)[0] == "b"
+    record_api_key_outcome(probe_settings, status_code=503)
+    stats = api_key_pool_stats("routing")["a"]
+    assert stats["state"] == "ejected" and stats["ejections"] == 2
+    assert stats["ejected_for"] > 0.05  # a failed probe doubles the ejection
+
+    time.sleep(0.11)
+    probe_key, probe_settings = _select(settings)
+    record_api_key_outcome(probe_settings, status_code=200, latency=0.001)
+    assert probe_key == "a" and api_key_pool_stats("routing")["a"]["state"] == "healthy"
+    assert _select(settings)[0] == "a"
+
+
+def test_hedge_key_is_another_key_with_its_own_reservation():
+    settings = _pool_settings(
+        [
+            {"id": "a", "value": "key-a", "base_url": "https://a.example/v1"},
+            {"id": "b", "value": "key-b", "base_url": "https://b.example/v1"},
+        ],
+        strategy="least_outstanding",
+    )
+    request_settings = Settings(parent=settings)
+    resolve_model_pool_settings("chat", request_settings)
+    plugin_settings = SettingsNamespace(request_settings, "plugins.ModelRequester.OpenAICompatible")
+    hedge_settings = SettingsNamespace(Settings(parent=request_settings), "plugins.ModelRequester.OpenAICompatible")
+
+    assert plugin_settings.get("base_url") == "https://a.example/v1" and select_hedge_api_key(hedge_settings) == "b"
+    assert (hedge_settings.get("api_key"), hedge_settings.get("base_url")) == ("key-b", "https://b.example/v1")
+    assert plugin_settings.get("api_key") == "key-a"
+    assert {key: stats["in_flight"] for key, stats in api_key_pool_stats("routing").items()} == {"a": 1, "b": 1}
+    release_selected_api_key(hedge_settings)
+    release_selected_api_key(plugin_settings)
+    assert {key: stats["in_flight"] for key, stats in api_key_pool_stats("routing").items()} == {"a": 0, "b": 0}
+
+
+async def _start_endpoint(*, delay: float, status: int = 200):
+    state = {"delay": delay, "status": status, "served": 0}
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.decode().split("\r\n"):
+                    if line.lower().startswith("content-length:"):
+                        length = int(line.split(":", 1)[1])
+                if length:
+                    await reader.readexactly(length)
+                state["served"] += 1
+                await asyncio.sleep(state["delay"])
+                if state["status"] != 200:
+                    writer.write(f"HTTP/1.1 { state['status'] } Unavailable\r\nContent-Length: 0\r\n\r\n".encode())
+                else:
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                        + f"Content-Length: { len(_CHAT_BODY) }\r\n\r\n".encode()
+                        + _CHAT_BODY
+                    )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, f"http://127.0.0.1:{ server.sockets[0].getsockname()[1] }/v1", state
+
+
+@pytest.mark.asyncio
+async def test_ewma_latency_shifts_traffic_to_the_healthy_endpoint():
+    from agently import Agently
+    from agently.base import http_client_pool
+    from agently.core import ModelRequest
+
+    endpoints = {
+        "slow": await _start_endpoint(delay=0.08),
+        "fast": await _start_endpoint(delay=0.005),
+        "broken": await _start_endpoint(delay=0.0, status=503),
+    }
+    settings = _pool_settings(
+        [{"id": name, "value": f"key-{ name }", "base_url": url} for name, (_, url, _) in endpoints.items()],
+        parent=Agently.settings,
+        strategy="ewma_latency",
+        eject_after_failures=1,
+        eject_seconds=1.0,
+    )
+    settings.set("plugins.ModelRequester.OpenAICompatible.stream", False)
+    settings.set("plugins.ModelRequester.OpenAICompatible.request_retry", {"max_attempts": 1})
+
+    async def run(requests: int):
+        semaphore = asyncio.Semaphore(3)
+
+        async def call():
+            async with semaphore:
+                request = ModelRequest(Agently.plugin_manager, parent_settings=settings, model_key="chat")
+                request.input("ping")
+                try:
+                    await request.async_get_text()
+                except Exception:
+                    pass
+
+        await asyncio.gather(*(call() for _ in range(requests)))
+
+    try:
+        await run(30)
+        served = {name: state["served"] for name, (_, _, state) in endpoints.items()}
+        stats = api_key_pool_stats("routing")
+        assert served["fast"] >= 22
+        assert served["slow"] <= 4
+        assert served["broken"] <= 2
+        assert stats["broken"]["state"] == "ejected" and stats["broken"]["failures"] == served["broken"]
+        assert stats["fast"]["ewma_latency"] < stats["slow"]["ewma_latency"]
+        assert all(key_stats["in_flight"] == 0 for key_stats in stats.values())
+
+        # Once the endpoint recovers, a single probe after the ejection brings it back.
+        endpoints["broken"][2].update(status=200, delay=0.005)
+        await asyncio.sleep(1.0)
+        await run(6)
+        assert api_key_pool_stats("routing")["broken"]["state"] == "healthy"
+    finally:
+        await http_client_pool.aclose()
+        for server, _, _ in endpoints.values():
+            server.close()
+            await server.wait_closed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("provider", ["OpenAICompatible", "AnthropicCompatible", "OpenAIResponsesCompatible"])
+async def test_rejected_streaming_request_records_one_outcome_per_attempt(provider: str):
+    from httpx_sse import SSEError
+
+    from agently import Agently
+    from agently.base import http_client_pool
+    from agently.core import ModelRequest
+    from agently.core.model.Prompt import Prompt
+
+    server, url, state = await _start_endpoint(delay=0.0, status=429)
+    settings = _pool_settings(
+        [{"id": "a", "value": "key-a", "base_url": url}],
+        parent=Agently.settings,
+        provider=provider,
+        strategy="least_outstanding",
+        eject_after_failures=3,
+    )
+    settings.set(f"plugins.ModelRequester.{ provider }.stream", True)
+    settings.set(f"plugins.ModelRequester.{ provider }.request_retry", {"max_attempts": 1})
+
+    async def call():
+        request = ModelRequest(Agently.plugin_manager, parent_settings=settings, model_key="chat")
+        request.input("ping")
+        try:
+            await request.async_get_text()
+        except Exception:
+            pass
+
+    try:
+        await call()
+        stats = api_key_pool_stats("routing")["a"]
+        assert (stats["failures"], stats["consecutive_failures"], stats["state"]) == (1, 1, "healthy")
+
+        # The 429 response is observed first; the SSEError raised for its
+        # non-event-stream body belongs to the same attempt.
+        request_settings = Settings(parent=settings)
+        resolve_model_pool_settings("chat", request_settings)
+        plugin_class: Any = Agently.plugin_manager.get_plugin("ModelRequester", provider)
+        prompt = Prompt(plugin_manager=Agently.plugin_manager, parent_settings=request_settings)
+        plugin = plugin_class(prompt, request_settings)
+        plugin._provider_request_started_at = time.perf_counter()
+        plugin._observe_provider_response(httpx.Response(429))
+        plugin._observe_provider_error(SSEError("Expected response header Content-Type to contain 'text/event-stream'"))
+        stats = api_key_pool_stats("routing")["a"]
+        assert (stats["failures"], stats["consecutive_failures"]) == (2, 2)
+
+        # A rejected request says nothing about the key's health and is recorded once.
+        state["status"] = 401
+        await call()
+        stats = api_key_pool_stats("routing")["a"]
+        assert (stats["successes"], stats["failures"], stats["consecutive_failures"]) == (1, 2, 0)
+    finally:
+        await http_client_pool.aclose()
+        server.close()
+        await server.wait_closed()
@@ -1,8 +1,9 @@
 import asyncio
+import json
 
 import pytest
 
-from agently.utils.RequestScheduler import RequestScheduler
+from agently.utils.RequestScheduler import RequestScheduler, RequestShedError, rate_limit_delay
 from agently.utils import Settings
 
 
@@ -91,3 +92,285 @@ async def test_configure_from_settings_reads_provider_override():
     # Provider override (1) is applied, not the global default (4).
     config = scheduler._configs["OpenAICompatible"]
     assert config.max_concurrency == 1
+
+
+def test_rate_limit_delay_reads_retry_after_and_exhausted_reset_headers():
+    assert rate_limit_delay({"Retry-After": "2"}) == 2.0
+    assert rate_limit_delay({"retry-after-ms": "250"}) == 0.25
+    assert rate_limit_delay({"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "1m0.5s"}) == 60.5
+    assert rate_limit_delay({"x-ratelimit-remaining-requests": "3", "x-ratelimit-reset-requests": "20ms"}) is None
+    assert rate_limit_delay({"x-ratelimit-reset-tokens": "20ms"}, status_code=429) == 0.02
+    assert rate_limit_delay(None) is None
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limit_grows_additively_and_halves_once_per_congestion_event():
+    scheduler = RequestScheduler().configure("p", adaptive=True, max_concurrency=16, initial_concurrency=4)
+    for _ in range(8):
+        scheduler.observe_response("p", status_code=200)
+    assert scheduler.stats("p")["limit"] == 4  # an idle limit does not grow
+
+    release = asyncio.Event()
+
+    async def hold():
+        async with scheduler.slot("p"):
+            await release.wait()
+
+    holders = [asyncio.create_task(hold()) for _ in range(4)]
+    await asyncio.sleep(0)
+    for _ in range(8):
+        scheduler.observe_response("p", status_code=200)
+    release.set()
+    await asyncio.gather(*holders)
+    assert scheduler.stats("p")["limit"] == 5
+
+    for _ in range(3):
+        scheduler.observe_response("p", status_code=429, headers={"Retry-After": "0.05"})
+    stats = scheduler.stats("p")
+    assert stats["limit"] == 2  # 5.5 halved once, not three times
+    assert stats["overloads"] == 3
+    assert stats["paused_for"] > 0
+
+    # Re-applying the same settings on the next request keeps the learned limit.
+    scheduler.configure("p", adaptive=True, max_concurrency=16, initial_concurrency=4)
+    assert scheduler.stats("p")["limit"] == 2
+    started = asyncio.get_running_loop().time()
+    async with scheduler.slot("p"):
+        assert asyncio.get_running_loop().time() - started >= 0.03
+
+
+_CHAT_BODY = json.dumps(
+    {
+        "id": "chatcmpl-1",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": "pong"}, "finish_reason": "stop"}],
+    }
+).encode()
+
+
+async def _start_throttling_server(*, capacity: int):
+    """Serve at most ``capacity`` concurrent requests; answer the rest 429 with Retry-After."""
+    state = {"in_flight": 0, "throttled": 0, "served": 0}
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.decode().split("\r\n"):
+                    if line.lower().startswith("content-length:"):
+                        length = int(line.split(":", 1)[1])
+                if length:
+                    await reader.readexactly(length)
+                if state["in_flight"] >= capacity:
+                    state["throttled"] += 1
+                    writer.write(b"HTTP/1.1 429 Too Many Requests\r\nRetry-After: 0.05\r\nContent-Length: 0\r\n\r\n")
+                else:
+                    state["in_flight"] += 1
+                    await asyncio.sleep(0.02)
+                    state["in_flight"] -= 1
+                    state["served"] += 1
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                        + f"Content-Length: { len(_CHAT_BODY) }\r\n\r\n".encode()
+                        + _CHAT_BODY
+                    )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, f"http://127.0.0.1:{ server.sockets[0].getsockname()[1] }", state
+
+
+async def _run_throttled_workload(monkeypatch, scheduler: RequestScheduler, *, requests: int = 16):
+    import agently.base
+
+    from agently import Agently
+    from agently.builtins.plugins.ModelRequester.OpenAICompatible import OpenAICompatible
+    from agently.core.model.Prompt import Prompt
+
+    monkeypatch.setattr(agently.base, "request_scheduler", scheduler)
+    server, base_url, state = await _start_throttling_server(capacity=2)
+    settings = Settings(parent=Agently.settings)
+    settings.update(
+        {
+            "plugins": {
+                "ModelRequester": {
+                    "OpenAICompatible": {
+                        "base_url": f"{ base_url }/v1",
+                        "model": "throttle-test",
+                        "stream": False,
+                        "request_retry": {"max_attempts": 1},
+                    }
+                }
+            }
+        }
+    )
+
+    async def call():
+        for _ in range(200):
+            async with scheduler.slot("OpenAICompatible"):
+                prompt = Prompt(plugin_manager=Agently.plugin_manager, parent_settings=settings)
+                prompt.set("input", "ping")
+                plugin = OpenAICompatible(prompt, settings)
+                events = [event async for event, _ in plugin.request_model(plugin.generate_request_data())]
+            if "error" not in events:
+                return True
+        return False
+
+    try:
+        assert all(await asyncio.gather(*(call() for _ in range(requests))))
+    finally:
+        await agently.base.http_client_pool.aclose()
+        server.close()
+        await server.wait_closed()
+    return state
+
+
+@pytest.mark.asyncio
+async def test_adaptive_scheduler_backs_off_a_throttling_provider(monkeypatch):
+    static = await _run_throttled_workload(
+        monkeypatch,
+        RequestScheduler().configure("OpenAICompatible", max_concurrency=8),
+    )
+    adaptive_scheduler = RequestScheduler().configure(
+        "OpenAICompatible",
+        adaptive=True,
+        max_concurrency=8,
+        initial_concurrency=8,
+    )
+    adaptive = await _run_throttled_workload(monkeypatch, adaptive_scheduler)
+
+    stats = adaptive_scheduler.stats("OpenAICompatible")
+    assert static["served"] == adaptive["served"] == 16
+    assert adaptive["throttled"] < static["throttled"]
+    assert stats["limit"] < 8
+    assert stats["overloads"] == adaptive["throttled"]
+    assert stats["queued"] > 0 and stats["wait_seconds_max"] > 0
+    assert stats["in_flight"] == 0 and stats["queue_depth"] == 0
+
+
+async def _queue_behind_held_slot(scheduler: RequestScheduler, provider: str, requests: list[dict], order: list[str]):
+    release = asyncio.Event()
+
+    async def hold():
+        async with scheduler.slot(provider):
+            await release.wait()
+
+    async def request(name: str, **options):
+        async with scheduler.slot(provider, **options):
+            order.append(name)
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    tasks = []
+    for options in requests:
+        options = dict(options)
+        tasks.append(asyncio.create_task(request(options.pop("name"), **options)))
+        await asyncio.sleep(0)
+    return holder, release, tasks
+
+
+@pytest.mark.asyncio
+async def test_slots_go_to_higher_priority_then_fairly_across_tenants():
+    scheduler = RequestScheduler().configure("p", max_concurrency=1)
+    order: list[str] = []
+    requests = [{"name": f"a{ index }", "priority": "batch", "tenant": "a"} for index in range(4)]
+    requests += [{"name": f"b{ index }", "priority": "batch", "tenant": "b", "weight": 2} for index in range(4)]
+    requests += [{"name": "chat", "priority": "interactive", "tenant": "user"}, {"name": "plain"}]
+    holder, release, tasks = await _queue_behind_held_slot(scheduler, "p", requests, order)
+
+    assert scheduler.stats("p")["queue_depth_by_priority"] == {"interactive": 1, "default": 1, "batch": 8}
+    release.set()
+    await asyncio.gather(holder, *tasks)
+
+    assert order[:2] == ["chat", "plain"]
+    # Tenant b has twice a's weight, so it gets two slots for each of a's while both are backlogged.
+    assert order[2:8] == ["a0", "b0", "b1", "a1", "b2", "b3"]
+    assert order[8:] == ["a2", "a3"]
+    with pytest.raises(ValueError):
+        async with scheduler.slot("p", priority="urgent"):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_sheds_lowest_priority_and_deadline_waiters():
+    scheduler = RequestScheduler().configure("p", max_concurrency=1, max_queue=2)
+    order: list[str] = []
+    requests = [{"name": f"batch{ index }", "priority": "batch"} for index in range(2)]
+    requests.append({"name": "chat", "priority": "interactive"})
+    holder, release, tasks = await _queue_behind_held_slot(scheduler, "p", requests, order)
+
+    # The interactive request took the place of the newest batch request.
+    with pytest.raises(RequestShedError) as displaced:
+        await tasks[1]
+    assert displaced.value.reason == "queue_full" and displaced.value.priority == "batch"
+    # A full queue with nothing of lower priority sheds the newcomer itself.
+    with pytest.raises(RequestShedError) as rejected:
+        async with scheduler.slot("p", priority="batch"):
+            pass
+    assert rejected.value.reason == "queue_full"
+
+    release.set()
+    await asyncio.gather(holder, tasks[0], tasks[2])
+    assert order == ["chat", "batch0"]
+    stats = scheduler.stats("p")
+    assert (stats["in_flight"], stats["queue_depth"], stats["shed"]) == (0, 0, 2)
+
+
+@pytest.mark.asyncio
+async def test_deadline_waiters_are_shed_and_release_their_place():
+    scheduler = RequestScheduler().configure("p", max_concurrency=1)
+    order: list[str] = []
+    holder, release, tasks = await _queue_behind_held_slot(scheduler, "p", [{"name": "queued"}], order)
+    with pytest.raises(RequestShedError) as late:
+        async with scheduler.slot("p", priority="interactive", max_wait=0.05):
+            pass
+    assert late.value.reason == "deadline" and late.value.waited >= 0.04
+    assert scheduler.stats("p")["queue_depth"] == 1
+    release.set()
+    await asyncio.gather(holder, *tasks)
+    assert order == ["queued"]
+
+    # Once hold times are known, a request that cannot start within max_wait is shed without waiting.
+    holder, release, tasks = await _queue_behind_held_slot(scheduler, "p", [{"name": "queued"}], order)
+    with pytest.raises(RequestShedError) as early:
+        async with scheduler.slot("p", max_wait=0.001):
+            pass
+    assert early.value.waited == 0
+    release.set()
+    await asyncio.gather(holder, *tasks)
+    stats = scheduler.stats("p")
+    assert (stats["in_flight"], stats["queue_depth"], stats["shed"]) == (0, 0, 2)
+
+
+@pytest.mark.asyncio
+async def test_rate_only_limit_serves_waiters_by_priority_and_sheds_by_deadline():
+    scheduler = RequestScheduler().configure("p", rate_per_second=20)  # 50ms per start
+    order: list[str] = []
+
+    async def request(name: str, **options):
+        async with scheduler.slot("p", **options):
+            order.append(name)
+
+    batch = [asyncio.create_task(request(f"batch{ index }", priority="batch")) for index in range(10)]
+    await asyncio.sleep(0.01)
+    assert scheduler.stats("p")["queue_depth_by_priority"]["batch"] == 9
+
+    # An interactive request waits for the next token only, not behind the whole batch.
+    started_at = asyncio.get_running_loop().time()
+    await request("chat", priority="interactive", max_wait=0.3)
+    assert asyncio.get_running_loop().time() - started_at < 0.2
+    assert order[:2] == ["batch0", "chat"]
+
+    # A batch request cannot get a token within max_wait behind eight others and is shed at once.
+    with pytest.raises(RequestShedError) as shed:
+        await request("late", priority="batch", max_wait=0.1)
+    assert shed.value.reason == "deadline" and shed.value.waited == 0
+
+    await asyncio.gather(*batch)
+    assert order[2:] == [f"batch{ index }" for index in range(1, 10)]
+    stats = scheduler.stats("p")
+    assert (stats["limit"], stats["in_flight"], stats["queue_depth"], stats["shed"]) == (None, 0, 0, 1)
@@ -15,6 +15,37 @@ def test_settings():
     assert child_settings.get() == {"test": 1}
 
 
+def test_settings_memoized_reads_follow_ancestor_writes():
+    root_settings = Settings({"model": {"name": "base", "options": {"temperature": 0.1}}, "tags": ["root"]})
+    agent_settings = Settings({"tags": ["agent"]}, parent=root_settings)
+    request_settings = Settings({"model": {"options": {"top_p": 0.9}}}, parent=agent_settings)
+
+    assert request_settings.get("model.name") == "base"
+    assert request_settings.get("model.options") == {"temperature": 0.1, "top_p": 0.9}
+    assert request_settings.get("tags") == ["agent", "root"]
+
+    root_settings.set("model.name", "changed")
+    agent_settings.set("model.options.temperature", 0.5)
+    assert request_settings.get("model.name") == "changed"
+    assert request_settings.get("model.options") == {"temperature": 0.5, "top_p": 0.9}
+
+    returned = request_settings.get("model.options")
+    assert isinstance(returned, dict)
+    returned["top_p"] = 0
+    assert request_settings.get("model.options.top_p") == 0.9
+    assert agent_settings.get("tags", inherit=False) == ["agent"]
+
+    snapshot = request_settings.snapshot()
+    assert snapshot is request_settings.snapshot()
+    assert snapshot["model"]["options"]["top_p"] == 0.9
+    assert snapshot["tags"] == ("agent", "root")
+    with pytest.raises(TypeError):
+        snapshot["model"]["name"] = "mutated"  # type: ignore[index]
+    request_settings.parent = root_settings
+    assert request_settings.snapshot()["tags"] == ("root",)
+    assert "model" in request_settings and "missing" not in request_settings
+
+
 def test_settings_accepts_typed_settings_model():
     settings = Settings()
 
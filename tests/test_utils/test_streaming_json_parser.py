@@ -1,4 +1,6 @@
+import copy
 import importlib
+from collections import Counter
 
 import pytest
 from agently.utils.StreamingJSONParser import StreamingJSONParser
@@ -254,7 +256,7 @@ async def test_streaming_json_parser_skips_large_incomplete_parse(monkeypatch):
     monkeypatch.setattr(parser_module.json5, "loads", fail_if_called)
 
     events = []
-    async for item in parser.parse_chunk('{"report": "' + ("x" * 128)):
+    async for item in parser.parse_chunk("{'report': '" + ("x" * 128)):
         events.append(item)
 
     assert len(events) == 1
@@ -275,7 +277,7 @@ async def test_streaming_json_parser_treats_none_threshold_as_default(monkeypatc
     monkeypatch.setattr(parser_module.json5, "loads", fail_if_called)
 
     events = []
-    async for item in parser.parse_chunk('{"report": "' + ("x" * 20000)):
+    async for item in parser.parse_chunk("{'report': '" + ("x" * 20000)):
         events.append(item)
 
     assert len(events) == 1
@@ -295,7 +297,7 @@ async def test_streaming_json_parser_emits_large_deferred_status_once(monkeypatc
     monkeypatch.setattr(parser_module.json5, "loads", fail_if_called)
 
     events = []
-    for chunk in ['{"report": "' + ("x" * 128), "more text", "even more text"]:
+    for chunk in ["{'report': '" + ("x" * 128), "more text", "even more text"]:
         async for item in parser.parse_chunk(chunk):
             events.append(item)
 
@@ -341,10 +343,195 @@ async def test_streaming_json_parser_parses_large_complete_payload_after_thresho
     parser = StreamingJSONParser(schema, max_incomplete_parse_chars=32)
 
     events = []
-    async for item in parser.parse_chunk('{"report": "' + ("x" * 128) + '"}'):
+    async for item in parser.parse_chunk("{'report': '" + ("x" * 128) + "'}"):
         events.append(item)
     async for item in parser.finalize():
         events.append(item)
 
     assert any(item.path == "$status" for item in events)
     assert any(item.path == "report" and item.event_type == "done" for item in events)
+
+
+@pytest.mark.asyncio
+async def test_streaming_json_parser_streams_large_strict_json_without_reparsing(monkeypatch):
+    schema = {"report": (str,), "sections": [{"title": (str,), "body": (str,)}]}
+    parser = StreamingJSONParser(schema, max_incomplete_parse_chars=32)
+
+    def fail_if_called(_value):
+        raise AssertionError("strict JSON should be read incrementally")
+
+    parser_module = importlib.import_module("agently.utils.StreamingJSONParser")
+    monkeypatch.setattr(parser_module.json5, "loads", fail_if_called)
+
+    body = "y" * 50000
+    raw = (
+        '{"report": "' + ("x" * 50000) + '", "sections": ['
+        + ", ".join('{"title": "t%d", "body": "%s"}' % (index, body) for index in range(4))
+        + "]}"
+    )
+    events = []
+    for start in range(0, len(raw), 97):
+        async for item in parser.parse_chunk(raw[start : start + 97]):
+            events.append(item)
+
+    assert not [item for item in events if item.path == "$status"]
+    report_deltas = [item for item in events if item.path == "report" and item.event_type == "delta"]
+    assert len(report_deltas) > 500
+    assert "".join(item.delta for item in report_deltas) == "x" * 50000
+    section_body = [item for item in events if item.path == "sections[3].body" and item.event_type == "delta"]
+    assert "".join(item.delta for item in section_body) == body
+    done_paths = [item.path for item in events if item.event_type == "done"]
+    assert done_paths[-1] == "sections"
+    assert all(
+        item.completion_source == "observed_boundary"
+        for item in events
+        if item.event_type == "done"
+    )
+    assert isinstance(parser.current_data, dict)
+    assert parser.current_data["sections"][2] == {"title": "t2", "body": body}
+
+
+@pytest.mark.asyncio
+async def test_streaming_json_parser_reads_escapes_split_across_chunks():
+    parser = StreamingJSONParser({"text": (str,), "count": (int,)})
+    chunks = ['```json\n{"text": "a\\', 'nb \\u00', 'e9 \\ud83d', '\\ude00", // note\n "count": 1', "2}\n```"]
+    events = []
+    for chunk in chunks:
+        async for item in parser.parse_chunk(chunk):
+            events.append(item)
+    async for item in parser.finalize():
+        events.append(item)
+
+    text_deltas = [item.delta for item in events if item.path == "text" and item.event_type == "delta"]
+    assert "".join(text_deltas) == "a\nb \u00e9 \U0001F600"
+    count_events = [item for item in events if item.path == "count"]
+    assert [(item.event_type, item.value) for item in count_events] == [("delta", 12), ("done", 12)]
+    assert parser.current_data == {"text": "a\nb \u00e9 \U0001F600", "count": 12}
+
+
+@pytest.mark.asyncio
+async def test_streaming_json_parser_events_keep_their_own_snapshot():
+    parser = StreamingJSONParser({"name": (str,), "profile": {"tags": [(str,)]}, "note": (str,)})
+    chunks = ['{"name": "Al', 'ice", "profile": {"tags": ["x"', ', "y"]}, "note": "o', 'k"}']
+    per_chunk: list[tuple[list, list]] = []
+    for chunk in chunks:
+        events = [item async for item in parser.parse_chunk(chunk)]
+        per_chunk.append((events, [copy.deepcopy(item.full_data) for item in events]))
+
+    for events, expected in per_chunk:
+        assert [item.full_data for item in events] == expected
+    assert per_chunk[0][0][-1].full_data == {"name": "Al"}
+    tags_done = next(item for item in per_chunk[2][0] if item.path == "profile.tags" and item.event_type == "done")
+    assert tags_done.value == ["x", "y"]
+    # Unchanged branches are shared between snapshots instead of copied again.
+    assert per_chunk[2][0][-1].full_data["profile"] is per_chunk[3][0][-1].full_data["profile"]
+    assert per_chunk[2][0][-1].full_data is not per_chunk[3][0][-1].full_data
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [50, 500])
+async def test_streaming_json_parser_snapshots_only_the_changed_tail(monkeypatch, size):
+    parser_module = importlib.import_module("agently.utils.StreamingJSONParser")
+    snapshotted = []
+    original_snapshot_value = parser_module._IncrementalJSONReader._snapshot_value
+
+    def counting_snapshot_value(self, value):
+        snapshotted.append(value)
+        return original_snapshot_value(self, value)
+
+    monkeypatch.setattr(parser_module._IncrementalJSONReader, "_snapshot_value", counting_snapshot_value)
+    parser = StreamingJSONParser({"items": [{"title": (str,)}]})
+    items = ", ".join(f'{{"title": "item { index }"}}' for index in range(size))
+    _ = [item async for item in parser.parse_chunk(f'{{"items": [{ items }, {{"title": "la')]
+    snapshotted.clear()
+
+    events = [item async for item in parser.parse_chunk('st"}, {"title": "ne')]
+
+    # Root, the list, the closed item, the new item and their strings; no earlier item is visited.
+    assert len(snapshotted) == 7
+    assert events[-1].full_data["items"][-2:] == [{"title": "last"}, {"title": "ne"}]
+    assert len(events[-1].full_data["items"]) == size + 2
+
+
+@pytest.mark.asyncio
+async def test_streaming_json_parser_falls_back_for_json5_syntax():
+    parser = StreamingJSONParser({"name": (str,), "tags": [(str,)]})
+    events = []
+    for chunk in ['{"name": "Al', "ice\", tags: ['x'", ", 'y']}"]:
+        async for item in parser.parse_chunk(chunk):
+            events.append(item)
+    async for item in parser.finalize():
+        events.append(item)
+
+    name_deltas = [item.delta for item in events if item.path == "name" and item.event_type == "delta"]
+    assert "".join(name_deltas) == "Alice"
+    tags_done = next(item for item in events if item.path == "tags" and item.event_type == "done")
+    assert tags_done.value == ["x", "y"]
+
+
+def _wide_schema_and_data(size: int):
+    schema = {f"field_{ index }": (str,) for index in range(size)}
+    data = {f"field_{ index }": f"value { index }" for index in range(size)}
+    return schema, data
+
+
+def _deep_schema_and_data(size: int):
+    schema = {"sections": [{"title": (str,), "tags": [(str,)], "meta": {"a": (str,), "b": (int,)}}]}
+    data = {
+        "sections": [
+            {"title": f"t{ index }", "tags": ["x", "y"], "meta": {"a": "q", "b": index}}
+            for index in range(size)
+        ]
+    }
+    return schema, data
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("build", [_wide_schema_and_data, _deep_schema_and_data], ids=["wide", "deep"])
+async def test_streaming_json_parser_completion_checks_index_each_path_once(monkeypatch, build):
+    parser_module = importlib.import_module("agently.utils.StreamingJSONParser")
+    indexed_paths = []
+    original_add = parser_module._ParsingPathIndex.add
+
+    def counting_add(self, path):
+        indexed_paths.append(path)
+        return original_add(self, path)
+
+    monkeypatch.setattr(parser_module._ParsingPathIndex, "add", counting_add)
+
+    for size in (50, 200):
+        schema, data = build(size)
+        parser = StreamingJSONParser(schema)
+        parser.current_data = data
+        parser.previous_data = copy.deepcopy(data)
+        indexed_paths.clear()
+
+        done_paths = [item.path async for item in parser._compare_and_generate_events() if item.event_type == "done"]
+
+        # One compare pass indexes every present path exactly once, no matter
+        # how many fields are checked for completion.
+        assert done_paths
+        assert set(Counter(indexed_paths).values()) == {1}
+        assert set(indexed_paths) == await parser._get_current_parsing_paths()
+
+        # Later passes only index the paths they add.
+        indexed_paths.clear()
+        grown = copy.deepcopy(data)
+        grown["extra"] = {"note": "n"}
+        parser.previous_data = parser.current_data
+        parser.current_data = grown
+        _ = [item async for item in parser._compare_and_generate_events()]
+        assert Counter(indexed_paths) == Counter({"extra": 1, "extra.note": 1})
+
+
+@pytest.mark.asyncio
+async def test_streaming_json_parser_marks_array_items_done_when_sibling_starts():
+    parser = StreamingJSONParser({"items": [{"name": (str,)}], "tail": (str,)})
+    events = []
+    for chunk in ["{'items': [{'name': 'a'}", ", {'name': 'b'", "}], 'tail': 'z'}"]:
+        async for item in parser.parse_chunk(chunk):
+            events.append((item.path, item.event_type))
+
+    assert events.index(("items[0].name", "done")) < events.index(("items[1].name", "delta"))
+    assert ("items[1]", "done") in events
+    assert events.index(("items", "done")) < events.index(("tail", "delta"))